@@ -0,0 +1,208 @@
+"""
+ATLAS Event Loop
+
+One long-lived asyncio loop on a daemon thread, for services driven from
+synchronous code (the voice bridge's command loop) whose work is async:
+intent handlers, LLM streaming, Garmin sync, XP awards.
+
+asyncio.run() per call builds and closes a loop every time. Besides the
+setup/teardown cost on every handler, async clients (httpx) created on
+one of those loops are bound to it and break once it closes. Here every
+coroutine runs on the same loop, and blocking work (STT, TTS, SQLite)
+goes to the loop's executor via asyncio.to_thread().
+
+Per-turn trace: LoopThread.turn() starts a TurnTrace, and span() records
+how long each awaited step took (offset from the start of the turn and
+duration). The trace follows the work onto the loop (LoopThread.run()
+carries it over), so spans inside handlers land in the caller's turn.
+
+Usage:
+    from atlas.aio import LoopThread, span
+
+    loop = LoopThread("atlas-bridge")
+    with loop.turn("PROCESS") as trace:
+        result = loop.run(handle(text))
+
+    async def handle(text):
+        with span("stt"):
+            transcript = await asyncio.to_thread(stt.transcribe, audio)
+        ...
+
+    print(trace.format())  # PROCESS 812ms: stt 210ms @0ms | dispatch ...
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed step of a turn."""
+    name: str
+    start_ms: float  # offset from the start of the turn
+    duration_ms: float
+
+
+class TurnTrace:
+    """Timed spans of one turn (a voice command, a UI button press)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.ended: Optional[float] = None
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()  # spans can end on executor threads
+
+    def add(self, name: str, start: float, end: float) -> None:
+        """Record a span from perf_counter() start/end times."""
+        with self._lock:
+            self.spans.append(Span(name, (start - self.started) * 1000, (end - start) * 1000))
+
+    def finish(self) -> None:
+        if self.ended is None:
+            self.ended = time.perf_counter()
+
+    @property
+    def total_ms(self) -> float:
+        return ((self.ended or time.perf_counter()) - self.started) * 1000
+
+    def span_ms(self, name: str) -> float:
+        """Total time spent in spans called name."""
+        return sum(s.duration_ms for s in self.spans if s.name == name)
+
+    def format(self) -> str:
+        """One line: turn total, then each span in start order."""
+        spans = sorted(self.spans, key=lambda s: s.start_ms)
+        parts = [f"{s.name} {s.duration_ms:.0f}ms @{s.start_ms:.0f}ms" for s in spans]
+        return f"{self.name} {self.total_ms:.0f}ms: " + (" | ".join(parts) or "no spans")
+
+
+_current_trace: contextvars.ContextVar[Optional[TurnTrace]] = contextvars.ContextVar(
+    "atlas_turn_trace", default=None
+)
+
+
+def current_trace() -> Optional[TurnTrace]:
+    """The trace of the turn in progress (None outside a turn)."""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time the enclosed block as a span of the current turn.
+
+    Works around awaits (it measures wall time) and is a no-op outside a
+    turn, so library code can use it unconditionally.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, start, time.perf_counter())
+
+
+class LoopThread:
+    """A long-lived event loop running on its own daemon thread."""
+
+    def __init__(self, name: str = "atlas-loop", workers: int = EXECUTOR_WORKERS):
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{name}-worker")
+        self.loop.set_default_executor(self.executor)
+        self.last_trace: Optional[TurnTrace] = None
+        self._thread = threading.Thread(target=self._run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]) -> Future:
+        """Schedule a coroutine on the loop without waiting (a concurrent Future)."""
+        return asyncio.run_coroutine_threadsafe(self._with_trace(coro, _current_trace.get()), self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits forever)
+
+        Raises:
+            RuntimeError: Called from the loop thread itself (await instead;
+                blocking here would deadlock the loop)
+        """
+        if self.in_loop_thread():
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError(f"{self.name}: run() called on the loop thread; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    @staticmethod
+    async def _with_trace(coro: Awaitable[T], trace: Optional[TurnTrace]) -> T:
+        token = _current_trace.set(trace)
+        try:
+            return await coro
+        finally:
+            _current_trace.reset(token)
+
+    @contextmanager
+    def turn(self, name: str) -> Iterator[TurnTrace]:
+        """Trace one turn; spans recorded inside (on any thread via run()) are collected."""
+        trace = TurnTrace(name)
+        token = _current_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(token)
+            trace.finish()
+            self.last_trace = trace
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Cancel outstanding tasks, stop the loop and its executor."""
+        if self.loop.is_closed():
+            return
+
+        async def _cancel_pending():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_pending(), self.loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"{self.name}: pending tasks did not finish: {e}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+        self.executor.shutdown(wait=False)
+        if not self.loop.is_running():
+            self.loop.close()
+
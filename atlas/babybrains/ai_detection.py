@@ -528,6 +528,47 @@ def check_em_dashes(text: str) -> list[dict[str, str]]:
     return issues
 
 
+# ============================================
+# CONVERSATIONAL AI TELLS (D112)
+# ============================================
+
+# The BANNED PATTERNS the activity pipeline's rewrite feedback lists
+# (ActivityConversionPipeline._format_issue_feedback); keep the two in step
+CONVERSATIONAL_AI_PATTERNS = [
+    re.compile(r"\bhere['\u2019]s\s+the\s+thing\b", re.IGNORECASE),
+    re.compile(r"\bhere['\u2019]s\s+what\s+you\s+need\s+to\s+know\b", re.IGNORECASE),
+    re.compile(
+        r"\bhere['\u2019]s\s+something\s+worth\s+(?:knowing|trying|considering)\b", re.IGNORECASE
+    ),
+    re.compile(r"\bwhen\s+it\s+comes\s+to\b", re.IGNORECASE),
+    re.compile(r"\bthink\s+of\s+it\s+as\b", re.IGNORECASE),
+    re.compile(r"\bthe\s+(?:reality|truth)\s+is\b", re.IGNORECASE),
+    re.compile(r"\bnot\s+just\s+[^.!?]{1,60}?,?\s+but\b", re.IGNORECASE),
+    re.compile(r"\b(?:key\s+insight|bottom\s+line|the\s+takeaway)\s*:", re.IGNORECASE),
+]
+
+
+def check_conversational_ai_tells(text: str) -> list[dict[str, str]]:
+    """
+    Check for fake-casual framing phrases ("Here's the thing", "When it comes to").
+
+    Not part of check_ai_tells(); the activity pipeline runs it on its own
+    as the AI smell audit. Every match is reported.
+
+    Returns list of issues with code SCRIPT_CONVERSATIONAL_AI_TELL.
+    """
+    issues = []
+
+    for pattern in CONVERSATIONAL_AI_PATTERNS:
+        for match in pattern.finditer(text):
+            issues.append({
+                "code": "SCRIPT_CONVERSATIONAL_AI_TELL",
+                "msg": f"Conversational AI tell detected: '{match.group(0)}'",
+            })
+
+    return issues
+
+
 # ============================================
 # MAIN API
 # ============================================
@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import connect, get_connection
 from atlas.babybrains.models import (
     BBAccount,
     ContentBrief,
@@ -50,28 +51,28 @@ def init_bb_tables(conn: sqlite3.Connection) -> None:
     logger.info("Baby Brains tables initialized")
 
 
-def get_bb_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+def get_bb_connection(
+    db_path: Optional[Path] = None, dedicated: bool = False
+) -> sqlite3.Connection:
     """
     Get a standalone BB database connection.
 
     Prefers using the ATLAS shared database. Falls back to ~/.atlas/atlas.db.
-    Enables WAL mode for concurrent access.
+    By default returns this thread's pooled connection (see atlas.db), shared
+    with other code on the thread: use it for one unit of work on this
+    thread, then close() it.
 
     Args:
         db_path: Optional explicit database path
+        dedicated: Open a private connection instead, for services that keep
+            it (their commits and rollbacks then stay their own)
 
     Returns:
         SQLite connection with row_factory set and WAL mode enabled
     """
-    if db_path is None:
-        db_path = Path.home() / ".atlas" / "atlas.db"
-
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    # Enable WAL mode for concurrent access (must be set after connect, before use)
-    conn.execute("PRAGMA journal_mode=WAL;")
-    return conn
+    if dedicated:
+        return connect(db_path)
+    return get_connection(db_path)
 
 
 # ============================================
@@ -70,7 +70,7 @@ class TrendService:
         Initialize TrendService.
 
         Args:
-            conn: SQLite connection. Falls back to get_bb_connection().
+            conn: SQLite connection. Falls back to a dedicated get_bb_connection().
             grok_client: GrokClient instance. Created if not provided.
             config_dir: Path to config/babybrains/ for safety/fallback files.
         """
@@ -85,7 +85,7 @@ class TrendService:
     def _get_conn(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = db.get_bb_connection()
+            self._conn = db.get_bb_connection(dedicated=True)
             db.init_bb_tables(self._conn)
             db.run_trends_migration(self._conn)
         return self._conn
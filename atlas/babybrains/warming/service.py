@@ -80,7 +80,7 @@ class WarmingService:
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = db.get_bb_connection(self._db_path)
+            self._conn = db.get_bb_connection(self._db_path, dedicated=True)
             db.init_bb_tables(self._conn)
         return self._conn
 
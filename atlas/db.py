@@ -0,0 +1,229 @@
+"""
+ATLAS SQLite Connection Manager
+
+Per-thread cached connections to atlas.db (and the other ATLAS databases)
+with one set of pragmas:
+- WAL journal with synchronous=NORMAL
+- 256MB mmap, 64MB page cache, in-memory temp storage
+- 10s busy timeout, 256-entry prepared statement cache
+- Separate read-only connections (PRAGMA query_only) for the read side
+
+Usage:
+    from atlas.db import get_connection
+
+    conn = get_connection(db_path)
+    try:
+        conn.execute("INSERT INTO ...", params)
+        conn.commit()
+    finally:
+        conn.close()  # returns it to the pool
+
+    rows = get_connection(db_path, readonly=True).execute("SELECT ...").fetchall()
+
+close() on a pooled connection only ends the caller's checkout. When the
+last checkout on a thread ends, a transaction left open is rolled back,
+matching what closing a private connection used to do. Set
+ATLAS_DB_POOL=0 to get a fresh connection per call instead.
+
+A pooled connection is shared by everything on its thread, so it is for
+short units of work on that thread only. Objects that keep a connection
+for their lifetime, or hand it to other threads, use connect() to get
+a private one with the same pragmas. A thread's pooled connections are
+closed when the thread exits.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / ".atlas" / "atlas.db"
+
+BUSY_TIMEOUT_S = 10.0
+STATEMENT_CACHE_SIZE = 256
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",  # 256MB mmap
+    "PRAGMA cache_size = -64000",  # 64MB cache
+    "PRAGMA temp_store = MEMORY",
+)
+
+RowFactory = Optional[Callable[[sqlite3.Cursor, tuple], Any]]
+
+
+def pooling_enabled() -> bool:
+    """False when ATLAS_DB_POOL=0 (one connection per call, as before)."""
+    return os.environ.get("ATLAS_DB_POOL", "1") != "0"
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection whose close() hands it back to the manager."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pooled = False
+        self.checkouts = 0
+
+    def close(self) -> None:
+        if not self.pooled:
+            super().close()
+            return
+        self.checkouts = max(self.checkouts - 1, 0)
+        if self.checkouts == 0 and self.in_transaction:
+            self.rollback()
+
+    def close_pooled(self) -> None:
+        """Really close (used by ConnectionManager.close_all)."""
+        self.pooled = False
+        super().close()
+
+
+def _open(db_path: str, readonly: bool, row_factory: RowFactory) -> PooledConnection:
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT_S,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+        factory=PooledConnection,
+    )
+    conn.row_factory = row_factory
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def _resolve(db_path: str | Path | None) -> str:
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+    path = str(db_path)
+    if path == ":memory:":
+        return path
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def connect(
+    db_path: str | Path | None = None,
+    readonly: bool = False,
+    row_factory: RowFactory = sqlite3.Row,
+) -> sqlite3.Connection:
+    """
+    Open a private (non-pooled) connection with the standard pragmas.
+
+    For long-lived holders: commits, rollbacks and executescript() on it
+    cannot affect other code on the same thread. close() really closes it.
+    """
+    return _open(_resolve(db_path), readonly, row_factory)
+
+
+class _ThreadConnections:
+    """One thread's pooled connections, freed with the thread's local data."""
+
+    def __init__(self):
+        self.conns: dict[tuple, PooledConnection] = {}
+
+
+class ConnectionManager:
+    """
+    Hands out one cached connection per (thread, database, mode, row factory).
+
+    Thread-safe: each thread gets its own connections. Callers must not
+    pass them to other threads (use connect() for that). When a thread
+    exits, its connections are closed.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: list[PooledConnection] = []
+
+    def _thread_connections(self) -> dict[tuple, PooledConnection]:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = self._local.holder = _ThreadConnections()
+            # Runs when the thread exits (or close_all drops the local)
+            weakref.finalize(holder, self._release, holder.conns)
+        return holder.conns
+
+    def _release(self, conns: dict[tuple, PooledConnection]) -> None:
+        """Close the connections of a thread that has exited."""
+        released = {id(conn) for conn in conns.values()}
+        with self._lock:
+            self._open = [conn for conn in self._open if id(conn) not in released]
+        for conn in conns.values():
+            try:
+                conn.close_pooled()
+            except sqlite3.Error:
+                pass
+
+    def get(
+        self,
+        db_path: str | Path | None = None,
+        readonly: bool = False,
+        row_factory: RowFactory = sqlite3.Row,
+    ) -> PooledConnection:
+        """
+        Get this thread's connection to db_path.
+
+        Args:
+            db_path: Database file (default: ~/.atlas/atlas.db)
+            readonly: Use the read-only connection (writes raise)
+            row_factory: Row factory for the connection (default sqlite3.Row)
+
+        Returns:
+            Connection to close() when done (it stays open for reuse)
+        """
+        path = _resolve(db_path)
+        if path == ":memory:" or not pooling_enabled():
+            return _open(path, readonly, row_factory)
+
+        key = (path, readonly, row_factory)
+        conns = self._thread_connections()
+        conn = conns.get(key)
+        if conn is None:
+            conn = _open(path, readonly, row_factory)
+            conn.pooled = True
+            conns[key] = conn
+            with self._lock:
+                self._open.append(conn)
+            logger.debug(f"Opened {'read' if readonly else 'write'} connection to {path}")
+        conn.checkouts += 1
+        return conn
+
+    def close_all(self) -> None:
+        """Close every pooled connection (all threads)."""
+        with self._lock:
+            conns, self._open = self._open, []
+        for conn in conns:
+            try:
+                conn.close_pooled()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+_manager = ConnectionManager()
+
+
+def get_connection(
+    db_path: str | Path | None = None,
+    readonly: bool = False,
+    row_factory: RowFactory = sqlite3.Row,
+) -> PooledConnection:
+    """Get this thread's pooled connection (see ConnectionManager.get)."""
+    return _manager.get(db_path, readonly=readonly, row_factory=row_factory)
+
+
+def close_all() -> None:
+    """Close all pooled connections."""
+    _manager.close_all()
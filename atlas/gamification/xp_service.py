@@ -31,6 +31,7 @@ Usage:
     result = service.award_xp("mobility", 50, "morning_routine")
 """
 
+import asyncio
 import logging
 import sqlite3
 import threading
@@ -41,6 +42,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, List, Tuple, Callable
 
+from atlas.aio import span
+from atlas.db import connect
 from atlas.gamification.level_calculator import (
     level_for_xp,
     xp_for_level,
@@ -417,16 +420,16 @@ class XPService:
         self.db_path = db_path or Path.home() / ".atlas" / "atlas.db"
         self._local = threading.local()
         self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="xp_")
+        self._pending_awards: set[asyncio.Task] = set()  # awards made from a running loop
         self._level_up_callback: Optional[Callable[[XPAwardResult], None]] = None
         self._ensure_tables()
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.db_path, timeout=10.0)
-            self._local.conn.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrency
-            self._local.conn.execute("PRAGMA journal_mode = WAL")
+            # Kept for the thread's lifetime, so a private connection rather than
+            # the shared pooled one (WAL and busy timeout set by atlas.db)
+            self._local.conn = connect(self.db_path)
         return self._local.conn
 
     def _ensure_tables(self):
@@ -803,7 +806,10 @@ class XPService:
         Award XP asynchronously (non-blocking).
 
         For use in voice pipeline where latency matters.
-        Failures are logged but don't propagate.
+        Failures are logged but don't propagate. Called from a coroutine
+        (the voice bridge's event loop), the award becomes a task on that
+        loop, traced as an "xp_award" span; the database write itself
+        still runs on the XP executor.
 
         Args:
             skill_name: Target skill
@@ -817,7 +823,19 @@ class XPService:
             except Exception as e:
                 logger.error(f"Async XP award failed: {e}")
 
-        self._executor.submit(_do_award)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._executor.submit(_do_award)
+            return
+
+        task = loop.create_task(self._award_on_loop(_do_award))
+        self._pending_awards.add(task)  # the loop only keeps a weak reference
+        task.add_done_callback(self._pending_awards.discard)
+
+    async def _award_on_loop(self, do_award: Callable[[], None]) -> None:
+        with span("xp_award"):
+            await asyncio.get_running_loop().run_in_executor(self._executor, do_award)
 
     def get_skill(self, skill_name: str) -> Optional[Skill]:
         """Get a single skill's current state."""
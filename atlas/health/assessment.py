@@ -12,6 +12,8 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import get_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,9 +83,7 @@ class AssessmentService:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     def _ensure_schema(self) -> None:
         """Ensure database schema is up to date (add protocol_run if missing)."""
@@ -19,6 +19,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Any
 
+from atlas.db import get_connection
 from atlas.voice.number_parser import (
     parse_spoken_number,
     parse_boolean,
@@ -104,9 +105,7 @@ class AssessmentProtocolRunner:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     # ========================================
     # Session Control
@@ -43,6 +43,7 @@ Examples:
     atlas-health phase start                     # Start Phase 1
     atlas-health garmin status                   # Check Garmin connection
     atlas-health garmin sync                     # Sync today's Garmin data
+    atlas-health garmin backfill --days 90       # Backfill daily metrics
 
 Usage:
     python -m atlas.health.cli daily
@@ -1663,6 +1664,21 @@ def cmd_garmin(args: argparse.Namespace) -> None:
             print("Sync failed. Check logs for details.")
             sys.exit(1)
 
+    elif args.action == "backfill":
+        if not service.is_configured():
+            print("Not configured. Run: python scripts/garmin_auth_setup.py")
+            sys.exit(1)
+
+        from datetime import timedelta
+        end = date.today()
+        start = end - timedelta(days=args.days - 1)
+        print(f"Backfilling Garmin data {start.isoformat()} to {end.isoformat()}...")
+        results = asyncio.run(service.sync_range(start, end))
+
+        synced = [m for m in results if m.sync_status != "no_data"]
+        print(f"  {len(synced)} days synced, {len(results) - len(synced)} without data")
+        print("  Days already complete are skipped; re-run to retry failures")
+
     elif args.action == "setup":
         print_setup_instructions()
 
@@ -1812,9 +1828,10 @@ Examples:
         "action",
         nargs="?",
         default="status",
-        choices=["status", "sync", "setup"],
-        help="Action: check status, sync data, or show setup instructions",
+        choices=["status", "sync", "backfill", "setup"],
+        help="Action: check status, sync data, backfill a range, or show setup instructions",
     )
+    garmin.add_argument("--days", type=int, default=30, help="Days to backfill (default 30)")
 
     # atlas-health cardio
     cardio = subparsers.add_parser("cardio", help="Cardio session logging")
@@ -32,16 +32,21 @@ Usage:
     metrics = await service.sync_today()
     if metrics:
         print(f"Sleep: {metrics.sleep_hours}h, HRV: {metrics.hrv_status}")
+
+    # Backfill daily_metrics (concurrent fetches, batched writes, skips
+    # days already complete)
+    await service.sync_range(date(2025, 1, 1), date.today())
 """
 
 import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -52,6 +57,19 @@ AEST = ZoneInfo("Australia/Sydney")
 # Session token storage location (managed by garth)
 GARTH_HOME = Path.home() / ".garth"
 
+GARMIN_API_BASE = "https://connectapi.garmin.com"
+
+# Request scheduling (shared by every fetch in a sync)
+MAX_CONCURRENCY = 4  # Requests in flight
+REQUESTS_PER_SECOND = 5.0  # Request starts per second (Garmin answers bursts with 429)
+FETCH_RETRIES = 3  # Attempts per request (429, 5xx, network errors)
+RETRY_BASE_DELAY = 2.0  # Seconds, doubled each retry
+
+# Range sync
+BATCH_DAYS = 14  # daily_metrics rows per transaction
+# A stored day with all of these is complete and skipped by sync_range
+COMPLETE_FIELDS = ("sleep_hours", "resting_hr", "hrv_status", "body_battery")
+
 
 # =============================================================================
 # Custom Exceptions
@@ -75,7 +93,14 @@ class GarminAuthError(GarminAPIError):
 class GarminRateLimitError(GarminAPIError):
     """Raised when rate limited by Garmin."""
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        self.retry_after = retry_after  # Seconds, from the Retry-After header
+        super().__init__(message, status_code)
 
 
 class GarminNoDataError(GarminAPIError):
@@ -195,6 +220,177 @@ class GarminMetrics:
     # Missing fields tracking (for logging)
     missing_fields: list = field(default_factory=list)
 
+    def to_daily_metrics(self):
+        """daily_metrics row for this day (Blueprint API)."""
+        from atlas.memory.blueprint import DailyMetrics
+
+        return DailyMetrics(
+            date=self.date,
+            sleep_hours=self.sleep_hours,
+            sleep_score=self.sleep_score,
+            deep_sleep_minutes=self.deep_sleep_minutes,
+            rem_sleep_minutes=self.rem_sleep_minutes,
+            resting_hr=self.resting_hr,
+            hrv_avg=self.hrv_avg,
+            hrv_morning=self.hrv_morning,
+            hrv_status=self.hrv_status,
+            body_battery=self.body_battery,
+        )
+
+
+# =============================================================================
+# Concurrent Fetcher
+# =============================================================================
+
+
+def _garth_token() -> str:
+    """OAuth2 access token from the resumed garth session."""
+    import garth
+
+    return garth.client.oauth2_token.access_token
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart (one event loop)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class GarminFetcher:
+    """
+    Bounded-concurrency Garmin Connect client.
+
+    One httpx session (connection pool) for all requests, at most
+    max_concurrency in flight, request starts spaced by a shared rate
+    limiter, and retries with exponential backoff for rate limits (429,
+    honouring Retry-After), server errors and network errors.
+
+    Usage:
+        async with GarminFetcher(token) as fetcher:
+            results = await fetcher.fetch_many({"hrv": "/hrv-service/hrv/2025-01-15", ...})
+    """
+
+    def __init__(
+        self,
+        token: Callable[[], str] = _garth_token,
+        api_base: str = GARMIN_API_BASE,
+        max_concurrency: int = MAX_CONCURRENCY,
+        requests_per_second: float = REQUESTS_PER_SECOND,
+        retries: int = FETCH_RETRIES,
+        retry_base_delay: float = RETRY_BASE_DELAY,
+        timeout: float = 15.0,
+    ):
+        self._token = token
+        self.api_base = api_base
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.retry_base_delay = retry_base_delay
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limiter = RateLimiter(requests_per_second)
+        self._client = None
+        self.requests = 0
+        self.retried = 0
+
+    async def __aenter__(self) -> "GarminFetcher":
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    async def fetch(self, endpoint: str) -> Optional[Any]:
+        """
+        GET an endpoint (path and query) with retries.
+
+        Returns:
+            Decoded JSON, or None for an empty body or 404
+
+        Raises:
+            GarminAuthError: 401/403 (not retried)
+            GarminRateLimitError: Still rate limited after all retries
+            GarminAPIError: Other failures
+        """
+        for attempt in range(self.retries):
+            try:
+                return await self._request(endpoint)
+            except GarminAuthError:
+                raise
+            except GarminAPIError as e:
+                retryable = isinstance(e, GarminRateLimitError) or e.status_code is None or e.status_code >= 500
+                if not retryable or attempt == self.retries - 1:
+                    raise
+                delay = getattr(e, "retry_after", None)
+                if delay is None:
+                    delay = self.retry_base_delay * (2**attempt)
+                self.retried += 1
+                logger.warning(
+                    f"API error on {endpoint.split('?')[0]} (attempt {attempt + 1}/{self.retries}): {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+        return None  # retries < 1
+
+    async def fetch_many(self, endpoints: dict[str, str]) -> dict[str, Optional[Any]]:
+        """Fetch several endpoints concurrently, keyed like the input."""
+        results = await asyncio.gather(*(self.fetch(e) for e in endpoints.values()))
+        return dict(zip(endpoints, results))
+
+    async def _request(self, endpoint: str) -> Optional[Any]:
+        import httpx
+
+        async with self._semaphore:
+            await self._limiter.wait()
+            self.requests += 1
+            try:
+                resp = await self._client.get(
+                    endpoint,
+                    headers={
+                        "Authorization": f"Bearer {self._token()}",
+                        "Accept": "application/json",
+                    },
+                )
+            except httpx.HTTPError as e:
+                raise GarminAPIError(f"API request failed: {e}")
+
+        if resp.status_code == 429:
+            retry_after = resp.headers.get("Retry-After")
+            raise GarminRateLimitError(
+                "Rate limited by Garmin API",
+                status_code=429,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        if resp.status_code in (401, 403):
+            raise GarminAuthError(f"Authentication failed: HTTP {resp.status_code}", resp.status_code)
+        if resp.status_code == 404:
+            logger.debug(f"Endpoint not found: {endpoint}")
+            return None
+        if resp.status_code >= 400:
+            raise GarminAPIError(f"API request failed: HTTP {resp.status_code}", resp.status_code)
+        try:
+            return resp.json() if resp.content else None
+        except ValueError as e:
+            raise GarminAPIError(f"Invalid JSON from {endpoint}: {e}")
+
 
 # =============================================================================
 # Garmin Service
@@ -207,10 +403,33 @@ class GarminService:
 
     Uses session tokens from ~/.garth/ for authentication.
     Run scripts/garmin_auth_setup.py for initial setup.
+
+    Requests made during a sync share one GarminFetcher (connection pool,
+    concurrency limit, rate limit and retries).
     """
 
-    def __init__(self):
-        """Initialize Garmin service and load session if available."""
+    def __init__(
+        self,
+        api_base: str = GARMIN_API_BASE,
+        token: Optional[Callable[[], str]] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        requests_per_second: float = REQUESTS_PER_SECOND,
+    ):
+        """
+        Initialize Garmin service and load session if available.
+
+        Args:
+            api_base: Garmin Connect API base URL
+            token: Access token provider (default: the garth session;
+                set for other servers, e.g. a local fake)
+            max_concurrency: Requests in flight during a sync
+            requests_per_second: Request rate limit during a sync
+        """
+        self.api_base = api_base
+        self._token = token
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self._fetcher: Optional[GarminFetcher] = None
         self._session_valid = False
         self._load_session()
 
@@ -246,6 +465,44 @@ class GarminService:
             return False
         return self._session_valid
 
+    def _ready(self) -> bool:
+        """Check a sync can authenticate (logs setup instructions if not)."""
+        if self._token is not None:
+            return True
+
+        if not self.is_configured():
+            logger.warning(
+                "Garmin not configured. Run: python scripts/garmin_auth_setup.py"
+            )
+            return False
+
+        if not self._session_valid:
+            if not self._load_session():
+                logger.error(
+                    "No valid Garmin session. Run: python scripts/garmin_auth_setup.py"
+                )
+                return False
+        return True
+
+    @asynccontextmanager
+    async def fetcher(self) -> AsyncIterator[GarminFetcher]:
+        """Shared fetcher for the requests of one sync (reused when nested)."""
+        if self._fetcher is not None:
+            yield self._fetcher
+            return
+
+        async with GarminFetcher(
+            token=self._token or _garth_token,
+            api_base=self.api_base,
+            max_concurrency=self.max_concurrency,
+            requests_per_second=self.requests_per_second,
+        ) as fetcher:
+            self._fetcher = fetcher
+            try:
+                yield fetcher
+            finally:
+                self._fetcher = None
+
     async def _get_display_name(self) -> Optional[str]:
         """
         Get user's display name for API endpoints that require it.
@@ -463,66 +720,120 @@ class GarminService:
 
         Uses direct HTTP requests to connectapi.garmin.com with OAuth2 token.
         This is more reliable than garth.connectapi() which can return empty.
+        Inside a sync the request goes through the sync's shared fetcher.
         """
-        import garth
-        import requests
+        async with self.fetcher() as fetcher:
+            try:
+                return await fetcher.fetch(endpoint)
+            except GarminAPIError:
+                raise
+            except Exception as e:
+                raise GarminAPIError(f"Unexpected error: {e}")
+
+    async def _fetch_day(
+        self, day: date, sleep_date: date, display_name: Optional[str]
+    ) -> GarminMetrics:
+        """Fetch one day's sleep, HRV and stress endpoints concurrently."""
+        # Use dailySleepData endpoint (works with new accounts, sleep-service doesn't)
+        if display_name:
+            sleep_endpoint = (
+                f"/wellness-service/wellness/dailySleepData/{display_name}"
+                f"?date={sleep_date.isoformat()}&nonSleepBufferMinutes=60"
+            )
+        else:
+            # Fallback to old endpoint (likely to return empty)
+            sleep_endpoint = f"/sleep-service/sleep/{sleep_date.isoformat()}"
 
-        try:
-            # Get OAuth2 token from garth
-            token = garth.client.oauth2_token.access_token
-            headers = {
-                'Authorization': f'Bearer {token}',
-                'Accept': 'application/json',
-            }
+        sleep_raw, hrv_raw, stress_raw = await asyncio.gather(
+            self._fetch_endpoint(sleep_endpoint),
+            self._fetch_endpoint(f"/hrv-service/hrv/{day.isoformat()}"),
+            # Stress endpoint includes some body battery data
+            self._fetch_endpoint(f"/wellness-service/wellness/dailyStress/{day.isoformat()}"),
+        )
+        return self._build_metrics(day, sleep_raw, hrv_raw, stress_raw)
+
+    def _build_metrics(
+        self,
+        day: date,
+        sleep_raw: Optional[dict],
+        hrv_raw: Optional[dict],
+        stress_raw: Optional[dict],
+    ) -> GarminMetrics:
+        """Combine parsed endpoint responses into one day's GarminMetrics."""
+        sleep = self._parse_sleep(sleep_raw)
+        hrv = self._parse_hrv(hrv_raw)
+        battery = self._parse_stress_for_body_battery(stress_raw)
+
+        # Determine overall sync status
+        all_no_data = all(
+            d.get("sync_status") == "no_data" for d in [sleep, hrv, battery]
+        )
+        any_no_data = any(
+            d.get("sync_status") == "no_data" for d in [sleep, hrv, battery]
+        )
 
-            # Build full URL
-            url = f'https://connectapi.garmin.com{endpoint}'
-
-            # Make request in thread pool
-            def do_request():
-                resp = requests.get(url, headers=headers, timeout=15)
-                resp.raise_for_status()
-                return resp.json() if resp.text else None
-
-            return await asyncio.to_thread(do_request)
-
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None:
-                if e.response.status_code == 429:
-                    raise GarminRateLimitError("Rate limited by Garmin API")
-                elif e.response.status_code in (401, 403):
-                    raise GarminAuthError(f"Authentication failed: {e}")
-                elif e.response.status_code == 404:
-                    logger.debug(f"Endpoint not found: {endpoint}")
-                    return None
-            raise GarminAPIError(f"API request failed: {e}")
-        except Exception as e:
-            raise GarminAPIError(f"Unexpected error: {e}")
+        if all_no_data:
+            sync_status = "no_data"
+            logger.warning(
+                f"No Garmin data available for {day.isoformat()} - watch may not have synced yet"
+            )
+        elif any_no_data:
+            sync_status = "partial"
+        else:
+            sync_status = "success"
+
+        # Collect all missing fields
+        all_missing = (
+            sleep.get("missing", [])
+            + hrv.get("missing", [])
+            + battery.get("missing", [])
+        )
+
+        if all_missing:
+            logger.warning(
+                "Partial data returned",
+                extra={"date": day.isoformat(), "missing_fields": all_missing},
+            )
+
+        # Prefer data from sleep endpoint (dailySleepData has more complete data)
+        return GarminMetrics(
+            date=day,
+            sync_status=sync_status,
+            # Sleep
+            sleep_hours=sleep.get("sleep_hours"),
+            sleep_score=sleep.get("sleep_score"),
+            deep_sleep_minutes=sleep.get("deep_sleep_minutes"),
+            rem_sleep_minutes=sleep.get("rem_sleep_minutes"),
+            light_sleep_minutes=sleep.get("light_sleep_minutes"),
+            awake_minutes=sleep.get("awake_minutes"),
+            # Heart (prefer sleep endpoint, fallback to hrv endpoint)
+            resting_hr=sleep.get("resting_hr"),
+            hrv_status=sleep.get("hrv_status") or hrv.get("hrv_status"),
+            hrv_avg=sleep.get("hrv_avg") or hrv.get("hrv_avg"),
+            hrv_morning=hrv.get("hrv_morning"),
+            # Recovery
+            body_battery=battery.get("body_battery"),
+            body_battery_charged=battery.get("body_battery_charged"),
+            body_battery_drained=battery.get("body_battery_drained"),
+            stress_avg=battery.get("stress_avg"),
+            # Tracking
+            missing_fields=all_missing,
+        )
 
-    @retry_with_backoff(max_retries=3, base_delay=5.0)
     async def sync_today(self) -> Optional[GarminMetrics]:
         """
         Sync today's metrics from Garmin Connect.
 
-        Fetches sleep, HRV, and body battery data, combining into
-        a single GarminMetrics object.
+        Fetches sleep, HRV, and body battery data concurrently, combining
+        into a single GarminMetrics object. Failed requests are retried
+        individually by the fetcher.
 
         Returns:
             GarminMetrics with today's data, or None on failure
         """
-        if not self.is_configured():
-            logger.warning(
-                "Garmin not configured. Run: python scripts/garmin_auth_setup.py"
-            )
+        if not self._ready():
             return None
 
-        if not self._session_valid:
-            if not self._load_session():
-                logger.error(
-                    "No valid Garmin session. Run: python scripts/garmin_auth_setup.py"
-                )
-                return None
-
         today = date.today()
 
         # Sleep data is from previous night - if before noon, use yesterday's date
@@ -535,92 +846,14 @@ class GarminService:
         )
 
         try:
-            # Get display name for wellness endpoint (required for dailySleepData)
-            display_name = await self._get_display_name()
-            if not display_name:
-                logger.warning("Could not get display name for sleep API")
-
-            # Fetch all endpoints - using connectapi.garmin.com directly
-            # Use dailySleepData endpoint (works with new accounts, sleep-service doesn't)
-            if display_name:
-                sleep_raw = await self._fetch_endpoint(
-                    f"/wellness-service/wellness/dailySleepData/{display_name}"
-                    f"?date={sleep_date.isoformat()}&nonSleepBufferMinutes=60"
-                )
-            else:
-                # Fallback to old endpoint (likely to return empty)
-                sleep_raw = await self._fetch_endpoint(
-                    f"/sleep-service/sleep/{sleep_date.isoformat()}"
-                )
-            hrv_raw = await self._fetch_endpoint(
-                f"/hrv-service/hrv/{today.isoformat()}"
-            )
-            # Stress endpoint includes some body battery data
-            stress_raw = await self._fetch_endpoint(
-                f"/wellness-service/wellness/dailyStress/{today.isoformat()}"
-            )
-
-            # Parse responses
-            sleep = self._parse_sleep(sleep_raw)
-            hrv = self._parse_hrv(hrv_raw)
-            battery = self._parse_stress_for_body_battery(stress_raw)
-
-            # Determine overall sync status
-            all_no_data = all(
-                d.get("sync_status") == "no_data" for d in [sleep, hrv, battery]
-            )
-            any_no_data = any(
-                d.get("sync_status") == "no_data" for d in [sleep, hrv, battery]
-            )
-
-            if all_no_data:
-                sync_status = "no_data"
-                logger.warning(
-                    "No Garmin data available - watch may not have synced yet"
-                )
-            elif any_no_data:
-                sync_status = "partial"
-            else:
-                sync_status = "success"
+            async with self.fetcher():
+                # Get display name for wellness endpoint (required for dailySleepData)
+                display_name = await self._get_display_name()
+                if not display_name:
+                    logger.warning("Could not get display name for sleep API")
 
-            # Collect all missing fields
-            all_missing = (
-                sleep.get("missing", [])
-                + hrv.get("missing", [])
-                + battery.get("missing", [])
-            )
-
-            if all_missing:
-                logger.warning(
-                    "Partial data returned",
-                    extra={"missing_fields": all_missing},
-                )
-
-            # Build metrics object
-            # Prefer data from sleep endpoint (dailySleepData has more complete data)
-            metrics = GarminMetrics(
-                date=today,
-                sync_status=sync_status,
-                # Sleep
-                sleep_hours=sleep.get("sleep_hours"),
-                sleep_score=sleep.get("sleep_score"),
-                deep_sleep_minutes=sleep.get("deep_sleep_minutes"),
-                rem_sleep_minutes=sleep.get("rem_sleep_minutes"),
-                light_sleep_minutes=sleep.get("light_sleep_minutes"),
-                awake_minutes=sleep.get("awake_minutes"),
-                # Heart (prefer sleep endpoint, fallback to hrv endpoint)
-                resting_hr=sleep.get("resting_hr"),
-                hrv_status=sleep.get("hrv_status") or hrv.get("hrv_status"),
-                hrv_avg=sleep.get("hrv_avg") or hrv.get("hrv_avg"),
-                hrv_morning=hrv.get("hrv_morning"),
-                # Recovery
-                body_battery=battery.get("body_battery"),
-                body_battery_charged=battery.get("body_battery_charged"),
-                body_battery_drained=battery.get("body_battery_drained"),
-                stress_avg=battery.get("stress_avg"),
-                # Tracking
-                missing_fields=all_missing,
-            )
+                metrics = await self._fetch_day(today, sleep_date, display_name)
+            sync_status = metrics.sync_status
 
             logger.info(
                 "Garmin sync completed",
@@ -665,26 +898,105 @@ class GarminService:
         return await self.sync_today()
 
     async def sync_range(
-        self, start: date, end: date
+        self,
+        start: date,
+        end: date,
+        blueprint=None,
+        skip_complete: bool = True,
+        batch_days: int = BATCH_DAYS,
     ) -> list[GarminMetrics]:
         """
-        Sync metrics for a date range.
+        Sync metrics for a date range into daily_metrics (backfill).
+
+        Days are fetched concurrently through one shared fetcher (bounded
+        by max_concurrency and requests_per_second) and written as they
+        arrive, batch_days rows per transaction. Each day's sleep is the
+        night ending that morning.
 
         Args:
             start: Start date (inclusive)
             end: End date (inclusive)
+            blueprint: BlueprintAPI to write to (default: the shared instance)
+            skip_complete: Skip days already stored with all COMPLETE_FIELDS
+            batch_days: Rows per write transaction
 
         Returns:
-            List of GarminMetrics for each day
+            GarminMetrics for each fetched day, oldest first (days without
+            data are returned but not written; failed days are logged)
+
+        Raises:
+            GarminAuthError: Session expired (the sync stops)
         """
-        results = []
-        current = start
-        while current <= end:
-            # TODO: Implement per-date sync
-            # For now, this is a placeholder
-            logger.warning("Range sync not yet fully implemented")
-            current += timedelta(days=1)
-        return results
+        if end < start or not self._ready():
+            return []
+
+        if blueprint is None:
+            from atlas.memory.blueprint import get_blueprint_api
+
+            blueprint = get_blueprint_api()
+
+        days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+        if skip_complete:
+            complete = {
+                m.date
+                for m in blueprint.get_daily_metrics_range(start, end)
+                if all(getattr(m, f) is not None for f in COMPLETE_FIELDS)
+            }
+            days = [d for d in days if d not in complete]
+            if complete:
+                logger.info(f"Garmin range sync: {len(complete)} complete days skipped")
+        if not days:
+            return []
+
+        started = time.monotonic()
+        results: list[GarminMetrics] = []
+        pending = []
+        written = 0
+        failed = 0
+
+        async def fetch(day: date) -> tuple[date, Any]:
+            try:
+                return day, await self._fetch_day(day, day, display_name)
+            except GarminAuthError:
+                raise
+            except GarminAPIError as e:
+                return day, e
+
+        async with self.fetcher() as fetcher:
+            display_name = await self._get_display_name()
+            if not display_name:
+                logger.warning("Could not get display name for sleep API")
+
+            # The fetcher bounds the requests actually in flight; completed
+            # days are written while later ones are still being fetched
+            tasks = [asyncio.create_task(fetch(day)) for day in days]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    day, outcome = await next_done
+                    if isinstance(outcome, GarminAPIError):
+                        failed += 1
+                        logger.warning(f"Garmin range sync: {day.isoformat()} failed: {outcome}")
+                        continue
+                    results.append(outcome)
+                    if outcome.sync_status != "no_data":
+                        pending.append(outcome.to_daily_metrics())
+                    if len(pending) >= batch_days:
+                        written += blueprint.log_daily_metrics_batch(pending)
+                        pending = []
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                written += blueprint.log_daily_metrics_batch(pending)
+            requests = fetcher.requests
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        logger.info(
+            f"Garmin range sync: {len(results)} days fetched ({written} written, "
+            f"{failed} failed) in {elapsed:.1f}s - {len(days) / elapsed:.1f} days/s, "
+            f"{requests} requests"
+        )
+        return sorted(results, key=lambda m: m.date)
 
     async def get_activities(self, days: int = 7) -> list[dict]:
         """
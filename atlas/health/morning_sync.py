@@ -118,9 +118,8 @@ def get_morning_status(force_sync: bool = False) -> dict:
         Morning status dict with traffic_light, workout, metrics
     """
     if not force_sync:
-        cached = load_cached_status()
-        if cached and not is_cache_stale(cached):
-            logger.debug("Using cached morning status")
+        cached = _fresh_cached_status()
+        if cached:
             return cached
 
     # Sync fresh
@@ -130,6 +129,37 @@ def get_morning_status(force_sync: bool = False) -> dict:
     return status
 
 
+async def get_morning_status_async(force_sync: bool = False) -> dict:
+    """
+    Async get_morning_status(), for callers already on an event loop
+    (the voice bridge), where asyncio.run() is not allowed.
+
+    Args:
+        force_sync: Force fresh sync even if cache is valid
+
+    Returns:
+        Morning status dict with traffic_light, workout, metrics
+    """
+    if not force_sync:
+        cached = _fresh_cached_status()
+        if cached:
+            return cached
+
+    logger.info("Syncing fresh morning status")
+    status = await _sync_morning_status()
+    save_morning_status(status)
+    return status
+
+
+def _fresh_cached_status() -> Optional[dict]:
+    """Cached status if present and not stale."""
+    cached = load_cached_status()
+    if cached and not is_cache_stale(cached):
+        logger.debug("Using cached morning status")
+        return cached
+    return None
+
+
 async def _sync_morning_status() -> dict:
     """Internal sync function."""
     if not is_garmin_auth_valid():
@@ -18,6 +18,8 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import get_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,9 +102,7 @@ class PainService:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     def log_pain(
         self,
@@ -312,47 +312,87 @@ class PainService:
                 ORDER BY date ASC
             """, (body_part, cutoff))
 
-            rows = cursor.fetchall()
-            if len(rows) < 2:
-                return None  # Need at least 2 points for trend
-
-            # Convert to day numbers (0 = oldest day in range)
-            base_date = date.fromisoformat(rows[0]["date"])
-            points = []
-            for row in rows:
-                row_date = date.fromisoformat(row["date"])
-                day_num = (row_date - base_date).days
-                points.append((day_num, row["pain_level"]))
-
-            # Simple linear regression: slope = Cov(x,y) / Var(x)
-            n = len(points)
-            sum_x = sum(p[0] for p in points)
-            sum_y = sum(p[1] for p in points)
-            sum_xy = sum(p[0] * p[1] for p in points)
-            sum_x2 = sum(p[0] ** 2 for p in points)
-
-            mean_x = sum_x / n
-            mean_y = sum_y / n
-
-            # Avoid division by zero (all same day)
-            var_x = sum_x2 / n - mean_x ** 2
-            if var_x == 0:
-                slope = 0.0
-            else:
-                cov_xy = sum_xy / n - mean_x * mean_y
-                slope = cov_xy / var_x
-
-            return PainTrend(
-                body_part=body_part,
-                slope=round(slope, 3),
-                avg_pain=round(mean_y, 1),
-                days_analyzed=days,
-                trending_up=slope > 0.5,
-                data_points=n,
-            )
+            return self._trend_from_rows(body_part, cursor.fetchall(), days)
+        finally:
+            conn.close()
+
+    def get_trends(self, body_parts: list[str], days: int = 7) -> dict[str, Optional[PainTrend]]:
+        """
+        Calculate pain trends for several body parts with one query.
+
+        Args:
+            body_parts: Body parts to analyze
+            days: Number of days to look back
+
+        Returns:
+            Dict of body_part -> PainTrend (None if insufficient data)
+        """
+        body_parts = list(dict.fromkeys(body_parts))
+        if not body_parts:
+            return {}
+
+        conn = self._get_conn()
+        try:
+            cutoff = (date.today() - timedelta(days=days)).isoformat()
+            placeholders = ",".join("?" * len(body_parts))
+            cursor = conn.execute(f"""
+                SELECT body_part, date, pain_level
+                FROM pain_log
+                WHERE body_part IN ({placeholders}) AND date >= ? AND pain_level IS NOT NULL
+                ORDER BY date ASC
+            """, (*body_parts, cutoff))
+
+            rows_by_part: dict[str, list] = {part: [] for part in body_parts}
+            for row in cursor.fetchall():
+                rows_by_part[row["body_part"]].append(row)
+            return {
+                part: self._trend_from_rows(part, rows, days)
+                for part, rows in rows_by_part.items()
+            }
         finally:
             conn.close()
 
+    @staticmethod
+    def _trend_from_rows(body_part: str, rows: list, days: int) -> Optional[PainTrend]:
+        """Linear regression over (date, pain_level) rows, oldest first."""
+        if len(rows) < 2:
+            return None  # Need at least 2 points for trend
+
+        # Convert to day numbers (0 = oldest day in range)
+        base_date = date.fromisoformat(rows[0]["date"])
+        points = []
+        for row in rows:
+            row_date = date.fromisoformat(row["date"])
+            day_num = (row_date - base_date).days
+            points.append((day_num, row["pain_level"]))
+
+        # Simple linear regression: slope = Cov(x,y) / Var(x)
+        n = len(points)
+        sum_x = sum(p[0] for p in points)
+        sum_y = sum(p[1] for p in points)
+        sum_xy = sum(p[0] * p[1] for p in points)
+        sum_x2 = sum(p[0] ** 2 for p in points)
+
+        mean_x = sum_x / n
+        mean_y = sum_y / n
+
+        # Avoid division by zero (all same day)
+        var_x = sum_x2 / n - mean_x ** 2
+        if var_x == 0:
+            slope = 0.0
+        else:
+            cov_xy = sum_xy / n - mean_x * mean_y
+            slope = cov_xy / var_x
+
+        return PainTrend(
+            body_part=body_part,
+            slope=round(slope, 3),
+            avg_pain=round(mean_y, 1),
+            days_analyzed=days,
+            trending_up=slope > 0.5,
+            data_points=n,
+        )
+
     def get_max_recent_pain(self, body_parts: Optional[list[str]] = None, days: int = 1) -> int:
         """
         Get maximum pain level across body parts in recent period.
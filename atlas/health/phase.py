@@ -13,6 +13,7 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import get_connection
 from atlas.health.assessment import AssessmentService
 
 logger = logging.getLogger(__name__)
@@ -90,9 +91,7 @@ class PhaseService:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     def get_all_phases(self) -> list[PhaseInfo]:
         """Get all defined training phases."""
@@ -14,6 +14,9 @@ Usage:
     service = ProgressionService()
     rec = service.get_recommendation("goblet_squat")
     # Returns: ProgressionRecommendation with weight, basis, voice prompt
+
+    recs = service.get_recommendations_for_session(protocol)
+    # Returns: {exercise_id: ProgressionRecommendation} from a fixed number of queries
 """
 
 import json
@@ -22,7 +25,9 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from atlas.db import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -106,9 +111,7 @@ class ProgressionService:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     def _round_to_increment(self, weight: float, increment: float = 2.5) -> float:
         """Round weight to nearest increment (default 2.5kg)."""
@@ -139,12 +142,23 @@ class ProgressionService:
             (weight_kg, basis, staleness_warning) tuple
             staleness_warning is a string if baseline is >28 days old, else None
         """
+        return self._starting_weight(
+            exercise_id, self._get_baseline_value, self.blueprint.get_last_performance
+        )
+
+    def _starting_weight(
+        self,
+        exercise_id: str,
+        baseline_for: Callable[[str], Optional[dict]],
+        last_performance_for: Callable[[str], Optional[object]],
+    ) -> tuple[Optional[float], str, Optional[str]]:
+        """get_starting_weight with the baseline and history lookups passed in."""
         exercises = self.config.get("exercises", {})
         mapping = exercises.get(exercise_id)
 
         if not mapping:
             # Unknown exercise - check history
-            last_perf = self.blueprint.get_last_performance(exercise_id)
+            last_perf = last_performance_for(exercise_id)
             if last_perf and last_perf.weight_kg:
                 return last_perf.weight_kg, "last_workout", None
             return None, "no_mapping", None
@@ -155,13 +169,13 @@ class ProgressionService:
 
         # 1. Check for direct baseline assessment
         if mapping.get("assessment_id"):
-            baseline = self._get_baseline_value(mapping["assessment_id"])
+            baseline = baseline_for(mapping["assessment_id"])
             if baseline:
                 intensity = mapping.get("intensity", 0.70)
                 increment = mapping.get("increment_kg", 2.5)
 
                 # Check staleness (>28 days old)
-                staleness_warning = self._check_baseline_staleness(mapping["assessment_id"])
+                staleness_warning = self._baseline_staleness(baseline)
 
                 # Check if baseline is already a calculated 1RM (from protocol tests with calculate: "1rm_brzycki")
                 # or if it needs conversion from raw weight+reps
@@ -179,7 +193,9 @@ class ProgressionService:
         # 2. Check for derived ratio
         if mapping.get("derived_from"):
             base_exercise = mapping["derived_from"]
-            base_weight, base_basis, base_staleness = self.get_starting_weight(base_exercise)
+            base_weight, base_basis, base_staleness = self._starting_weight(
+                base_exercise, baseline_for, last_performance_for
+            )
             if base_weight:
                 ratio = mapping.get("ratio", 1.0)
                 derived = base_weight * ratio
@@ -188,7 +204,7 @@ class ProgressionService:
                 return self._round_to_increment(derived, increment), f"derived:{base_exercise}", base_staleness
 
         # 3. Check workout history
-        last_perf = self.blueprint.get_last_performance(exercise_id)
+        last_perf = last_performance_for(exercise_id)
         if last_perf and last_perf.weight_kg:
             return last_perf.weight_kg, "last_workout", None
 
@@ -215,9 +231,33 @@ class ProgressionService:
         finally:
             conn.close()
 
+    def _get_baseline_values(self, assessment_ids: list[str]) -> dict[str, dict]:
+        """Latest baseline value per assessment, in one query."""
+        assessment_ids = list(dict.fromkeys(assessment_ids))
+        if not assessment_ids:
+            return {}
+        conn = self._get_conn()
+        try:
+            placeholders = ",".join("?" * len(assessment_ids))
+            cursor = conn.execute(f"""
+                SELECT name, value, date FROM (
+                    SELECT at.name, a.value, a.date,
+                           ROW_NUMBER() OVER (PARTITION BY at.name ORDER BY a.date DESC) AS rn
+                    FROM assessments a
+                    JOIN assessment_types at ON a.assessment_type_id = at.id
+                    WHERE at.name IN ({placeholders})
+                ) WHERE rn = 1
+            """, assessment_ids)
+            return {row["name"]: {"value": row["value"], "date": row["date"]} for row in cursor.fetchall()}
+        finally:
+            conn.close()
+
     def _check_baseline_staleness(self, assessment_id: str) -> Optional[str]:
         """Check if baseline is stale (>28 days old)."""
-        baseline = self._get_baseline_value(assessment_id)
+        return self._baseline_staleness(self._get_baseline_value(assessment_id))
+
+    def _baseline_staleness(self, baseline: Optional[dict]) -> Optional[str]:
+        """Staleness warning for a baseline row (None if fresh or missing)."""
         if not baseline:
             return None
 
@@ -245,6 +285,77 @@ class ProgressionService:
         Returns:
             ProgressionRecommendation with all context
         """
+        return self._recommend(
+            exercise_id,
+            deload_status=self.check_deload,
+            last_performance_for=self.blueprint.get_last_performance,
+            pain_trend_for=lambda body_part: self.pain_service.get_trend(body_part, days=7),
+            baseline_for=self._get_baseline_value,
+        )
+
+    def get_recommendations_for_session(self, protocol) -> dict[str, ProgressionRecommendation]:
+        """
+        Get recommendations for every exercise in a session.
+
+        Same rules as get_recommendation, but history, pain, baseline and
+        deload/phase data are loaded with a fixed number of set-based
+        queries (not several per exercise) and the recommendations are
+        computed in memory.
+
+        Args:
+            protocol: WorkoutProtocol (or any object with .exercises), or a
+                list of exercises / exercise ids
+
+        Returns:
+            Dict of exercise_id -> ProgressionRecommendation, in session order
+        """
+        items = getattr(protocol, "exercises", protocol)
+        exercise_ids = list(dict.fromkeys(
+            item if isinstance(item, str) else item.id for item in items
+        ))
+        if not exercise_ids:
+            return {}
+
+        exercises = self.config.get("exercises", {})
+        history_ids = []
+        assessment_ids = []
+        body_parts = []
+        for exercise_id in exercise_ids:
+            body_parts.extend(self._get_exercise_body_parts(exercise_id))
+            # Derived exercises fall back to their base exercise's baseline/history
+            chain_id = exercise_id
+            while chain_id and chain_id not in history_ids:
+                history_ids.append(chain_id)
+                mapping = exercises.get(chain_id, {})
+                if mapping.get("assessment_id"):
+                    assessment_ids.append(mapping["assessment_id"])
+                chain_id = mapping.get("derived_from")
+
+        deload = self.check_deload()
+        last_performances = self.blueprint.get_last_performances(history_ids)
+        pain_trends = self.pain_service.get_trends(body_parts, days=7)
+        baselines = self._get_baseline_values(assessment_ids)
+
+        return {
+            exercise_id: self._recommend(
+                exercise_id,
+                deload_status=lambda: deload,
+                last_performance_for=last_performances.get,
+                pain_trend_for=pain_trends.get,
+                baseline_for=baselines.get,
+            )
+            for exercise_id in exercise_ids
+        }
+
+    def _recommend(
+        self,
+        exercise_id: str,
+        deload_status: Callable[[], DeloadStatus],
+        last_performance_for: Callable[[str], Optional[object]],
+        pain_trend_for: Callable[[str], Optional[object]],
+        baseline_for: Callable[[str], Optional[dict]],
+    ) -> ProgressionRecommendation:
+        """Recommendation for one exercise from the given data lookups."""
         exercises = self.config.get("exercises", {})
         mapping = exercises.get(exercise_id, {})
 
@@ -258,10 +369,10 @@ class ProgressionService:
             )
 
         # Check deload status first
-        deload = self.check_deload()
+        deload = deload_status()
         if deload.should_deload and not deload.cooldown_active:
             # Get last weight and reduce
-            last_perf = self.blueprint.get_last_performance(exercise_id)
+            last_perf = last_performance_for(exercise_id)
             if last_perf and last_perf.weight_kg:
                 deload_weight = self._round_to_increment(last_perf.weight_kg * 0.70)
                 return ProgressionRecommendation(
@@ -277,16 +388,18 @@ class ProgressionService:
         pain_warning = None
         relevant_body_parts = self._get_exercise_body_parts(exercise_id)
         for body_part in relevant_body_parts:
-            trend = self.pain_service.get_trend(body_part, days=7)
+            trend = pain_trend_for(body_part)
             if trend and trend.trending_up:
                 pain_warning = f"{body_part.replace('_', ' ')} pain trending up"
                 break
 
         # Get starting/current weight (now includes staleness check)
-        starting_weight, basis, staleness_warning = self.get_starting_weight(exercise_id)
+        starting_weight, basis, staleness_warning = self._starting_weight(
+            exercise_id, baseline_for, last_performance_for
+        )
 
         # Get last performance
-        last_perf = self.blueprint.get_last_performance(exercise_id)
+        last_perf = last_performance_for(exercise_id)
 
         # If no history, use starting weight
         if not last_perf:
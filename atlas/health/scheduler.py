@@ -24,6 +24,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import get_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,9 +81,7 @@ class WorkoutScheduler:
         self._ensure_tables()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_connection(self.db_path)
 
     def _ensure_tables(self):
         """Create tables if they don't exist."""
@@ -3,16 +3,26 @@ ATLAS LLM Cost Tracker
 
 SQLite-based usage logging with budget enforcement.
 Implements soft/hard limits and graceful degradation.
+
+Budget checks read running daily/monthly counters held in memory, and
+usage rows are written by a background thread, so neither touches SQLite
+on the time-to-first-token path.
 """
 
-import sqlite3
 import hashlib
-from datetime import datetime, date
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, date
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 from contextlib import contextmanager
 
+from atlas.db import get_connection
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class UsageRecord:
@@ -60,6 +70,13 @@ class CostTracker:
     Budget levels:
     - Soft limit (80%): Enable "thrifty mode" - prefer local
     - Hard limit (100%): API blocked, local-only mode
+
+    Spend is tracked in running counters (loaded from the llm_usage_daily
+    rollup at startup, reset on UTC day/month rollover), so
+    get_budget_status() is an in-memory read. log_usage() bumps the
+    counters and queues the insert for a background writer; a trigger
+    keeps the rollup in step with llm_usage. Usage logged by another
+    process is picked up by refresh().
     """
 
     SCHEMA = """
@@ -92,70 +109,136 @@ class CostTracker:
     );
 
     INSERT OR IGNORE INTO budget_config (id) VALUES (1);
+
+    -- Spend per UTC day, maintained on insert into llm_usage
+    CREATE TABLE IF NOT EXISTS llm_usage_daily (
+        day DATE PRIMARY KEY,
+        requests INTEGER NOT NULL DEFAULT 0,
+        cost_usd REAL NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS llm_usage_daily_ai AFTER INSERT ON llm_usage BEGIN
+        INSERT INTO llm_usage_daily (day, requests, cost_usd)
+        VALUES (DATE(new.timestamp), 1, new.cost_usd)
+        ON CONFLICT(day) DO UPDATE SET
+            requests = requests + 1,
+            cost_usd = cost_usd + excluded.cost_usd;
+    END;
     """
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or Path.home() / ".atlas" / "cost_tracker.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cost_tracker_")
         self._init_db()
+        self.refresh()
 
     def _init_db(self):
         with self._get_conn() as conn:
+            had_rollup = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'llm_usage_daily'"
+            ).fetchone() is not None
             conn.executescript(self.SCHEMA)
+            if not had_rollup:
+                # Existing databases: build the rollup once from llm_usage
+                conn.execute("""
+                    INSERT OR REPLACE INTO llm_usage_daily (day, requests, cost_usd)
+                    SELECT DATE(timestamp), COUNT(*), SUM(cost_usd)
+                    FROM llm_usage GROUP BY DATE(timestamp)
+                """)
 
     @contextmanager
-    def _get_conn(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _get_conn(self, readonly: bool = False):
+        conn = get_connection(self.db_path, readonly=readonly)
         try:
             yield conn
             conn.commit()
         finally:
             conn.close()
 
-    def log_usage(self, record: UsageRecord, query: str = "") -> None:
-        """Log an API usage record."""
-        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16] if query else ""
-
-        with self._get_conn() as conn:
-            conn.execute("""
-                INSERT INTO llm_usage
-                (query_hash, tier, model, input_tokens, output_tokens,
-                 cost_usd, latency_ms, routing_confidence, category)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                query_hash, record.tier, record.model,
-                record.input_tokens, record.output_tokens,
-                record.cost_usd, record.latency_ms,
-                record.confidence, record.category
-            ))
+    @staticmethod
+    def _today() -> date:
+        # DATE('now') in SQLite is UTC
+        return datetime.now(UTC).date()
 
-    def get_budget_status(self) -> BudgetStatus:
-        """Get current budget status."""
-        with self._get_conn() as conn:
-            # Get config
+    def refresh(self) -> None:
+        """Reload limits and spend counters from the database."""
+        self.flush()
+        today = self._today()
+        with self._get_conn(readonly=True) as conn:
             config = conn.execute(
                 "SELECT daily_limit_usd, monthly_limit_usd FROM budget_config WHERE id = 1"
             ).fetchone()
+            daily = conn.execute(
+                "SELECT COALESCE(SUM(cost_usd), 0) FROM llm_usage_daily WHERE day = ?",
+                (today.isoformat(),),
+            ).fetchone()[0]
+            monthly = conn.execute(
+                "SELECT COALESCE(SUM(cost_usd), 0) FROM llm_usage_daily WHERE day >= ?",
+                (today.replace(day=1).isoformat(),),
+            ).fetchone()[0]
+
+        with self._lock:
+            self._day = today
+            self._daily_spend = daily
+            self._monthly_spend = monthly
+            self._daily_limit = config["daily_limit_usd"]
+            self._monthly_limit = config["monthly_limit_usd"]
+
+    def _roll_over(self) -> None:
+        """Reset counters when the UTC day or month has changed (lock held)."""
+        today = self._today()
+        if today != self._day:
+            if (today.year, today.month) != (self._day.year, self._day.month):
+                self._monthly_spend = 0.0
+            self._daily_spend = 0.0
+            self._day = today
 
-            # Get daily spend
-            daily = conn.execute("""
-                SELECT COALESCE(SUM(cost_usd), 0) as total
-                FROM llm_usage WHERE DATE(timestamp) = DATE('now')
-            """).fetchone()['total']
+    def log_usage(self, record: UsageRecord, query: str = "") -> None:
+        """Log an API usage record (counters now, row in the background)."""
+        with self._lock:
+            self._roll_over()
+            self._daily_spend += record.cost_usd
+            self._monthly_spend += record.cost_usd
+        self._writer.submit(self._write_usage, record, query)
+
+    def _write_usage(self, record: UsageRecord, query: str) -> None:
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16] if query else ""
 
-            # Get monthly spend
-            monthly = conn.execute("""
-                SELECT COALESCE(SUM(cost_usd), 0) as total
-                FROM llm_usage
-                WHERE strftime('%Y-%m', timestamp) = strftime('%Y-%m', 'now')
-            """).fetchone()['total']
+        try:
+            with self._get_conn() as conn:
+                conn.execute("""
+                    INSERT INTO llm_usage
+                    (query_hash, tier, model, input_tokens, output_tokens,
+                     cost_usd, latency_ms, routing_confidence, category)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    query_hash, record.tier, record.model,
+                    record.input_tokens, record.output_tokens,
+                    record.cost_usd, record.latency_ms,
+                    record.confidence, record.category
+                ))
+        except Exception as e:
+            logger.error(f"Failed to log usage: {e}")
+
+    def flush(self) -> None:
+        """Wait until queued usage rows are written."""
+        self._writer.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Write queued usage rows and stop the background writer."""
+        self._writer.shutdown(wait=True)
 
+    def get_budget_status(self) -> BudgetStatus:
+        """Get current budget status (in-memory, no database access)."""
+        with self._lock:
+            self._roll_over()
             return BudgetStatus(
-                daily_spend=daily,
-                monthly_spend=monthly,
-                daily_limit=config['daily_limit_usd'],
-                monthly_limit=config['monthly_limit_usd'],
+                daily_spend=self._daily_spend,
+                monthly_spend=self._monthly_spend,
+                daily_limit=self._daily_limit,
+                monthly_limit=self._monthly_limit,
             )
 
     def set_budget(self, daily: Optional[float] = None, monthly: Optional[float] = None):
@@ -171,10 +254,16 @@ class CostTracker:
                     "UPDATE budget_config SET monthly_limit_usd = ? WHERE id = 1",
                     (monthly,)
                 )
+        with self._lock:
+            if daily is not None:
+                self._daily_limit = daily
+            if monthly is not None:
+                self._monthly_limit = monthly
 
     def get_daily_summary(self, days: int = 7) -> list[dict]:
         """Get daily usage summary for last N days."""
-        with self._get_conn() as conn:
+        self.flush()
+        with self._get_conn(readonly=True) as conn:
             rows = conn.execute("""
                 SELECT
                     DATE(timestamp) as date,
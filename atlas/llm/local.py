@@ -3,14 +3,28 @@ ATLAS Local LLM Client
 
 Wrapper for Ollama with Qwen2.5-3B-Instruct model.
 Qwen2.5 has no thinking mode - content streams immediately.
+
+Every call goes through /api/chat, so a fixed system prompt is formatted
+the same way each time and Ollama can reuse its cached prefix. Requests
+carry keep_alive to hold the model in memory between voice turns, and
+warm_up() loads it (and the system prompt) before the first real query.
 """
 
+import asyncio
+import json
 import time
+import weakref
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
 import httpx
 
+# How long Ollama keeps the model loaded after a request (its default is 5m)
+DEFAULT_KEEP_ALIVE = "30m"
+
+# Idle connections kept open to the Ollama server, per client
+KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0)
+
 
 @dataclass
 class LLMResponse:
@@ -57,19 +71,67 @@ class OllamaClient:
         host: str = "http://localhost:11434",
         model: str = "atlas",
         timeout: float = 60.0,
+        keep_alive: Optional[str] = DEFAULT_KEEP_ALIVE,
     ):
         self.host = host.rstrip("/")
         self.model = model
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-        self._async_client: Optional[httpx.AsyncClient] = None
+        self.keep_alive = keep_alive  # None leaves it to the server
+        self._client = httpx.Client(timeout=timeout, limits=KEEPALIVE_LIMITS)
+        # One pooled async client per event loop: an httpx.AsyncClient's
+        # connections belong to the loop that opened them
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
 
     @property
     def async_client(self) -> httpx.AsyncClient:
-        """Get or create async client."""
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._async_client
+        """Pooled async client for the running event loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=self.timeout, limits=KEEPALIVE_LIMITS)
+            self._async_clients[loop] = client
+        return client
+
+    def _chat_payload(
+        self,
+        prompt: Optional[str],
+        system: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+    ) -> dict:
+        """Request body for /api/chat (every call uses the chat endpoint)."""
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        if prompt is not None:
+            messages.append({"role": "user", "content": prompt})
+
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": stream,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def _parse_response(self, data: dict) -> LLMResponse:
+        return LLMResponse(
+            content=data.get("message", {}).get("content", "").strip(),
+            model=data.get("model", self.model),
+            total_duration_ms=data.get("total_duration", 0) / 1_000_000,
+            load_duration_ms=data.get("load_duration", 0) / 1_000_000,
+            prompt_eval_count=data.get("prompt_eval_count", 0),
+            eval_count=data.get("eval_count", 0),
+            eval_duration_ms=data.get("eval_duration", 0) / 1_000_000,
+        )
 
     def generate(
         self,
@@ -90,36 +152,13 @@ class OllamaClient:
         Returns:
             LLMResponse with content and timing metrics
         """
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
-
-        if system:
-            payload["system"] = system
-
-        start = time.perf_counter()
+        payload = self._chat_payload(prompt, system, temperature, max_tokens, stream=False)
         response = self._client.post(
-            f"{self.host}/api/generate",
+            f"{self.host}/api/chat",
             json=payload,
         )
         response.raise_for_status()
-        data = response.json()
-
-        return LLMResponse(
-            content=data.get("response", "").strip(),
-            model=data.get("model", self.model),
-            total_duration_ms=data.get("total_duration", 0) / 1_000_000,
-            load_duration_ms=data.get("load_duration", 0) / 1_000_000,
-            prompt_eval_count=data.get("prompt_eval_count", 0),
-            eval_count=data.get("eval_count", 0),
-            eval_duration_ms=data.get("eval_duration", 0) / 1_000_000,
-        )
+        return self._parse_response(response.json())
 
     async def agenerate(
         self,
@@ -129,35 +168,13 @@ class OllamaClient:
         max_tokens: int = 256,
     ) -> LLMResponse:
         """Generate a response asynchronously."""
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
-
-        if system:
-            payload["system"] = system
-
+        payload = self._chat_payload(prompt, system, temperature, max_tokens, stream=False)
         response = await self.async_client.post(
-            f"{self.host}/api/generate",
+            f"{self.host}/api/chat",
             json=payload,
         )
         response.raise_for_status()
-        data = response.json()
-
-        return LLMResponse(
-            content=data.get("response", "").strip(),
-            model=data.get("model", self.model),
-            total_duration_ms=data.get("total_duration", 0) / 1_000_000,
-            load_duration_ms=data.get("load_duration", 0) / 1_000_000,
-            prompt_eval_count=data.get("prompt_eval_count", 0),
-            eval_count=data.get("eval_count", 0),
-            eval_duration_ms=data.get("eval_duration", 0) / 1_000_000,
-        )
+        return self._parse_response(response.json())
 
     async def stream(
         self,
@@ -174,41 +191,48 @@ class OllamaClient:
 
         Uses /api/chat for proper message formatting.
         Qwen2.5-3B has no thinking mode - content streams immediately.
+        The connection comes from the loop's pooled client and is
+        released when the stream ends (or the consumer stops early).
         """
-        import json as json_module
+        payload = self._chat_payload(prompt, system, temperature, max_tokens, stream=True)
+        async with self.async_client.stream(
+            "POST",
+            f"{self.host}/api/chat",
+            json=payload,
+        ) as response:
+            response.raise_for_status()
 
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+            async for line in response.aiter_lines():
+                if line:
+                    data = json.loads(line)
+                    # Get content from message (chat API)
+                    content = data.get("message", {}).get("content")
+                    if content:
+                        yield content
 
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": True,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+    def warm_up(self, system: Optional[str] = None) -> Optional[float]:
+        """
+        Load the model (and prefill the system prompt) ahead of the first query.
+
+        With a system prompt this is a one-token chat, so the prompt's
+        prefix is already evaluated when the first real turn arrives;
+        without one, an empty chat just loads the model. Either way the
+        request's keep_alive holds it in memory.
 
-        # Use fresh client for streaming to avoid connection reuse issues
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.host}/api/chat",
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if line:
-                        data = json_module.loads(line)
-                        # Get content from message (chat API)
-                        if "message" in data and "content" in data["message"]:
-                            content = data["message"]["content"]
-                            if content:
-                                yield content
+        Returns:
+            Milliseconds taken, or None if the server is unreachable or
+            the request failed
+        """
+        payload = self._chat_payload(
+            "Hi" if system else None, system, temperature=0.0, max_tokens=1, stream=False
+        )
+        start = time.perf_counter()
+        try:
+            response = self._client.post(f"{self.host}/api/chat", json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        return (time.perf_counter() - start) * 1000
 
     def is_available(self) -> bool:
         """Check if Ollama server is running."""
@@ -229,11 +253,14 @@ class OllamaClient:
             return []
 
     def close(self) -> None:
-        """Close HTTP clients."""
+        """Close the sync HTTP client (async clients: see aclose())."""
         self._client.close()
-        if self._async_client is not None:
-            # Note: In async context, use await self._async_client.aclose()
-            pass
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
     def __enter__(self):
         return self
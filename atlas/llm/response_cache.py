@@ -0,0 +1,299 @@
+"""
+ATLAS Semantic Response Cache
+
+Answers to repeated voice queries ("how did I sleep", greetings,
+definitions) without another LLM call. Entries are keyed by the query's
+embedding: a new query hits when its cosine similarity to a cached query
+is at least the threshold (and the system prompt is the same).
+
+Freshness:
+- Per-tier TTL (local answers age faster than Haiku's; Agent SDK answers
+  are not cached)
+- Tags for the data an answer depends on ("health" for the daily health
+  snapshot, "schedule" for the training plan). invalidate(tag) drops
+  them when that data changes; tagged answers also lapse at midnight.
+- Time-sensitive or context-dependent queries (time, weather, timers,
+  follow-ups like "what about tomorrow") are never cached.
+
+A hit can carry the TTS audio synthesized for it, so a repeated answer
+skips synthesis too. stats() reports hit rate and time saved.
+
+Usage:
+    from atlas.llm.response_cache import ResponseCache
+
+    cache = ResponseCache()
+    entry = cache.lookup(query, embedding, context=system_prompt)
+    if entry is None:
+        response = ...  # ask the LLM
+        cache.store(query, embedding, response, tier="haiku", llm_ms=850, context=system_prompt)
+    cache.invalidate("health")  # after the morning Garmin sync
+"""
+
+import hashlib
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+
+from atlas.patterns import PatternMatcher
+
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_MAX_ENTRIES = 256
+
+# Seconds a response stays valid, by tier that produced it (0 = never cache)
+DEFAULT_TTLS = {
+    "local": 60 * 60,
+    "haiku": 6 * 60 * 60,
+    "agent_sdk": 0,  # planning/analysis answers are personal and long
+}
+
+# Tags whose data changes daily: those answers lapse at midnight
+DAILY_TAGS = frozenset({"health", "schedule"})
+
+TAG_PATTERNS = {
+    "health": [
+        r"\b(sleep|slept|hrv|recovery|readiness|body battery|resting heart|heart rate|stress)",
+        r"\b(workout|training|exercise|steps|weight|calories|nutrition|supplements?)\b",
+    ],
+    "schedule": [r"\b(today|tonight|tomorrow|this week|schedule|calendar|plan for)\b"],
+}
+
+# Never cached: the answer depends on the moment or on the conversation
+NO_CACHE_PATTERNS = [
+    r"\b(time|date|day is it|weather|temperature|rain|timer|alarm|remind)",
+    r"^(and|so|but|what about|how about|why|then)\b",
+    r"\b(it|that|this|those|them|he|she|they)\s*\??$",
+    r"\b(remember|note|log|save|record)\b",
+]
+
+
+def _build_matcher() -> PatternMatcher:
+    matcher = PatternMatcher()
+    for tag, patterns in TAG_PATTERNS.items():
+        matcher.add(tag, patterns)
+    matcher.add("no_cache", NO_CACHE_PATTERNS)
+    return matcher
+
+
+def _context_key(context: Optional[str]) -> str:
+    return hashlib.sha256((context or "").encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CacheEntry:
+    """One cached answer."""
+    id: int
+    query: str
+    response: str
+    tier: str
+    tags: frozenset[str]
+    context: str
+    expires_at: float  # time.time()
+    llm_ms: float  # what producing it took (saved on every hit)
+    hits: int = 0
+    audio: dict[str, tuple[np.ndarray, int, float]] = field(default_factory=dict)  # voice -> (audio, rate, tts_ms)
+
+    def audio_for(self, voice: str) -> Optional[tuple[np.ndarray, int, float]]:
+        return self.audio.get(voice)
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters since startup."""
+    lookups: int = 0
+    hits: int = 0
+    stores: int = 0
+    invalidated: int = 0
+    saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate, 3),
+            "saved_ms": int(self.saved_ms),
+        }
+
+
+class ResponseCache:
+    """Embedding-keyed cache of LLM responses."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttls: Optional[dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.threshold = threshold
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self._entries: list[CacheEntry] = []
+        self._matrix: Optional[np.ndarray] = None  # one normalized row per entry
+        self._vectors: list[np.ndarray] = []
+        self._ids = itertools.count(1)
+        self._matcher = _build_matcher()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def cacheable(self, query: str) -> bool:
+        """False for time-sensitive or context-dependent queries."""
+        return "no_cache" not in self._matcher.match(query)
+
+    def tags_for(self, query: str) -> frozenset[str]:
+        """Data tags an answer to query depends on."""
+        return self._matcher.match(query) - {"no_cache"}
+
+    def lookup(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        context: Optional[str] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        The cached entry most similar to the query, if close enough and fresh.
+
+        Args:
+            query: The user's words (for the cacheable check)
+            embedding: Query embedding
+            context: System prompt the answer must have been produced under
+
+        Returns:
+            CacheEntry on a hit, None otherwise
+        """
+        if not self.cacheable(query):
+            return None
+        vector = _normalize(embedding)
+        context_key = _context_key(context)
+        with self._lock:
+            self._stats.lookups += 1
+            self._expire()
+            if not self._entries:
+                return None
+            if self._matrix is None:
+                self._matrix = np.vstack(self._vectors)
+            scores = self._matrix @ vector
+            for index in np.argsort(scores)[::-1]:
+                if scores[index] < self.threshold:
+                    break
+                entry = self._entries[index]
+                if entry.context == context_key:
+                    entry.hits += 1
+                    self._stats.hits += 1
+                    self._stats.saved_ms += entry.llm_ms
+                    return entry
+            return None
+
+    def store(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        response: str,
+        tier: str,
+        llm_ms: float = 0.0,
+        context: Optional[str] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Cache a response (skipped for uncacheable queries and tiers with no TTL).
+
+        Returns:
+            The new entry, or None if not cached
+        """
+        ttl = self.ttls.get(tier, 0)
+        if ttl <= 0 or not response.strip() or not self.cacheable(query):
+            return None
+
+        tags = self.tags_for(query)
+        expires_at = time.time() + ttl
+        if tags & DAILY_TAGS:
+            midnight = datetime.combine(datetime.now().date() + timedelta(days=1), datetime.min.time())
+            expires_at = min(expires_at, midnight.timestamp())
+
+        entry = CacheEntry(
+            id=next(self._ids),
+            query=query,
+            response=response,
+            tier=tier,
+            tags=tags,
+            context=_context_key(context),
+            expires_at=expires_at,
+            llm_ms=llm_ms,
+        )
+        with self._lock:
+            self._entries.append(entry)
+            self._vectors.append(_normalize(embedding))
+            self._matrix = None
+            self._stats.stores += 1
+            if len(self._entries) > self.max_entries:
+                # Drop the least used of the oldest half
+                half = self._entries[: len(self._entries) // 2]
+                victim = min(range(len(half)), key=lambda i: half[i].hits)
+                self._remove([victim])
+        return entry
+
+    def entry_for(self, query: str, context: Optional[str] = None) -> Optional[CacheEntry]:
+        """The newest fresh entry stored for exactly this query (no stats)."""
+        context_key = _context_key(context)
+        now = time.time()
+        with self._lock:
+            for entry in reversed(self._entries):
+                if entry.query == query and entry.context == context_key and entry.expires_at > now:
+                    return entry
+        return None
+
+    def attach_audio(self, entry: CacheEntry, voice: str, audio: np.ndarray, sample_rate: int, tts_ms: float) -> None:
+        """Keep the TTS audio synthesized for an entry's response."""
+        entry.audio[voice] = (audio, sample_rate, tts_ms)
+
+    def note_saved(self, ms: float) -> None:
+        """Add time saved outside the LLM (e.g. reused TTS audio)."""
+        with self._lock:
+            self._stats.saved_ms += ms
+
+    def invalidate(self, tag: Optional[str] = None) -> int:
+        """
+        Drop entries tagged with tag (all entries when tag is None).
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            doomed = [i for i, e in enumerate(self._entries) if tag is None or tag in e.tags]
+            self._remove(doomed)
+            self._stats.invalidated += len(doomed)
+            return len(doomed)
+
+    def stats(self) -> CacheStats:
+        """Counters since startup (a copy)."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self) -> None:
+        now = time.time()
+        expired = [i for i, e in enumerate(self._entries) if e.expires_at <= now]
+        if expired:
+            self._remove(expired)
+
+    def _remove(self, indexes: list[int]) -> None:
+        if not indexes:
+            return
+        drop = set(indexes)
+        self._entries = [e for i, e in enumerate(self._entries) if i not in drop]
+        self._vectors = [v for i, v in enumerate(self._vectors) if i not in drop]
+        self._matrix = None
+
+
+def _normalize(embedding: Sequence[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
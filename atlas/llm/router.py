@@ -2,13 +2,26 @@
 ATLAS Semantic Router
 
 Three-stage classification:
-1. Reflex: Regex patterns (<1ms)
+1. Reflex: Regex patterns, one combined match (<1ms)
 2. Router: Embedding similarity (~20ms)
 3. Safety: Perplexity check on local response (optional)
 
 Routes to: local, haiku, or agent_sdk
+
+Hedged routing (RouterConfig.enable_hedging, off by default): an
+uncertain HAIKU decision starts the local and Haiku streams together and
+commits to whichever delivers an acceptable first sentence first within
+the latency budget (local_latency_max + haiku_latency_max). The other
+stream is cancelled, and only the committed one is logged to the
+CostTracker. Win rates per category are kept in hedge_stats().
+
+Response cache (RouterConfig.enable_response_cache): route_and_stream()
+stores finished answers under a cache_key, and lookup_cached() serves
+semantically matching repeats without an LLM call (see response_cache.py).
 """
 
+import asyncio
+import logging
 import re
 import time
 from dataclasses import dataclass
@@ -16,10 +29,25 @@ from enum import Enum
 from typing import Optional, AsyncIterator
 import numpy as np
 
+from atlas.patterns import PatternMatcher
+
 from .local import OllamaClient
 from .api import AnthropicClient, get_haiku_client
 from .cloud import ClaudeAgentClient
 from .cost_tracker import get_cost_tracker, UsageRecord
+from .response_cache import CacheEntry, ResponseCache, DEFAULT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# A first sentence is complete at terminal punctuation followed by space
+# (or when the stream ends)
+SENTENCE_END = re.compile(r"[.!?][\"')\]]*\s")
+
+# Local first sentences that mean the small model is out of its depth
+HEDGE_REJECT_PATTERNS = re.compile(
+    r"\b(i'?m not sure|i am not sure|i don'?t know|i do not know|as an ai|"
+    r"i can'?t|i cannot|i'?m unable|i am unable|sorry)\b"
+)
 
 
 class Tier(Enum):
@@ -40,10 +68,11 @@ class RoutingDecision:
 @dataclass
 class RouterConfig:
     """Router configuration."""
-    # Thresholds
-    local_confidence: float = 0.65
-    haiku_confidence: float = 0.82
-    agent_confidence: float = 0.88
+    # Thresholds: cosine similarity on BGE-small-en-v1.5, which scores
+    # unrelated short utterances around 0.5-0.6 (scripts/calibrate_router.py)
+    local_confidence: float = 0.83
+    haiku_confidence: float = 0.90
+    agent_confidence: float = 0.93
 
     # Latency budgets (ms)
     local_latency_max: int = 200
@@ -54,6 +83,84 @@ class RouterConfig:
     enable_embeddings: bool = True
     enable_perplexity_check: bool = False  # Not yet implemented
 
+    # Hedged routing: race local against Haiku for uncertain HAIKU decisions
+    enable_hedging: bool = False
+    hedge_confidence_max: float = 0.5  # Hedge at or below this ("default" bucket)
+    hedge_min_words: int = 3  # Shortest acceptable local first sentence
+
+    # Semantic response cache (needs the embedding model)
+    enable_response_cache: bool = True
+    cache_threshold: float = DEFAULT_THRESHOLD  # Cosine similarity for a hit
+
+    @property
+    def hedge_budget_ms(self) -> int:
+        """How long to wait for a first sentence before committing to Haiku."""
+        return self.local_latency_max + self.haiku_latency_max
+
+
+@dataclass
+class HedgeStats:
+    """Outcomes of hedged races for one routing category."""
+    races: int = 0
+    local_wins: int = 0
+    haiku_wins: int = 0
+    local_rejected: int = 0  # local first sentence failed the acceptability check
+    budget_expired: int = 0  # no acceptable sentence in time; committed to Haiku
+
+    @property
+    def local_win_rate(self) -> float:
+        return self.local_wins / self.races if self.races else 0.0
+
+
+class _HedgeLeg:
+    """One side of a hedged race: buffers a stream until it is committed or cancelled."""
+
+    def __init__(self, tier: Tier, stream: AsyncIterator[str]):
+        self.tier = tier
+        self.stream = stream
+        self.text = ""
+        self.queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self.sentence = asyncio.Event()  # first sentence complete (or stream over)
+        self.error: Optional[BaseException] = None
+        self.task = asyncio.create_task(self._pump())
+
+    async def _pump(self) -> None:
+        try:
+            async for token in self.stream:
+                self.text += token
+                self.queue.put_nowait(token)
+                if not self.sentence.is_set() and SENTENCE_END.search(self.text):
+                    self.sentence.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.sentence.set()
+            self.queue.put_nowait(None)
+
+    @property
+    def ok(self) -> bool:
+        """Finished its first sentence without failing."""
+        return self.sentence.is_set() and self.error is None and bool(self.text.strip())
+
+    async def cancel(self) -> None:
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        await self.stream.aclose()
+
+    async def tokens(self) -> AsyncIterator[str]:
+        """Everything buffered so far, then the rest of the stream."""
+        while (token := await self.queue.get()) is not None:
+            yield token
+        if self.error is not None:
+            raise self.error
+
+
+
 
 class ATLASRouter:
     """
@@ -159,10 +266,10 @@ class ATLASRouter:
         self.config = config or RouterConfig()
         self.system_prompt = system_prompt
 
-        # Compile regex patterns
-        self._local_re = [re.compile(p, re.IGNORECASE) for p in self.LOCAL_PATTERNS]
-        self._agent_re = [re.compile(p, re.IGNORECASE) for p in self.AGENT_PATTERNS]
-        self._safety_re = [re.compile(p, re.IGNORECASE) for p in self.SAFETY_PATTERNS]
+        # Reflex patterns as one combined regex. The voice bridge swaps in
+        # a copy extended with its intent patterns, so a turn's utterance is
+        # scanned once for both routing and intent detection.
+        self.matcher = self.build_matcher()
 
         # LLM clients (lazy init)
         self._local_client: Optional[OllamaClient] = None
@@ -176,18 +283,38 @@ class ATLASRouter:
         # Cost tracker
         self._cost_tracker = get_cost_tracker()
 
+        # Hedged race outcomes by routing category
+        self._hedge_stats: dict[str, HedgeStats] = {}
+
+        # Answers to repeated queries
+        self.response_cache: Optional[ResponseCache] = (
+            ResponseCache(threshold=self.config.cache_threshold)
+            if self.config.enable_response_cache else None
+        )
+
+    @classmethod
+    def build_matcher(cls) -> PatternMatcher:
+        """Matcher with the "safety", "local" and "agent" reflex labels."""
+        matcher = PatternMatcher()
+        matcher.add("safety", cls.SAFETY_PATTERNS)
+        matcher.add("local", cls.LOCAL_PATTERNS)
+        matcher.add("agent", cls.AGENT_PATTERNS)
+        return matcher
+
     def _get_embedder(self):
-        """Lazy load embedding model."""
+        """Lazy load the shared embedding service (same model as memory)."""
         if self._embedder is None and self.config.enable_embeddings:
             try:
-                from sentence_transformers import SentenceTransformer
-                # Load on CPU to save VRAM for Qwen
-                self._embedder = SentenceTransformer('all-MiniLM-L6-v2', device='cpu')
+                from atlas.memory.embeddings import get_embedding_service
+                # Shared with MemoryStore; runs on CPU to save VRAM for Qwen
+                embedder = get_embedding_service()
+                embedder.ensure_loaded()
 
-                # Pre-compute prototype embeddings
+                # Pre-compute prototype embeddings (one batched encode)
                 self._prototype_embeddings = {}
                 for tier, queries in self.TIER_PROTOTYPES.items():
-                    self._prototype_embeddings[tier] = self._embedder.encode(queries)
+                    self._prototype_embeddings[tier] = np.asarray(embedder.embed_many(queries))
+                self._embedder = embedder
             except ImportError:
                 pass  # sentence-transformers not installed
         return self._embedder
@@ -197,6 +324,10 @@ class ATLASRouter:
             self._local_client = OllamaClient(model="qwen2.5:3b-instruct")
         return self._local_client
 
+    def warm_up_local(self) -> Optional[float]:
+        """Load the local model with this router's system prompt (see OllamaClient.warm_up)."""
+        return self._get_local_client().warm_up(system=self.system_prompt)
+
     def _get_haiku_client(self) -> AnthropicClient:
         if self._haiku_client is None:
             self._haiku_client = get_haiku_client(system_prompt=self.system_prompt)
@@ -216,38 +347,37 @@ class ATLASRouter:
         2. Embedding similarity - ~20ms
         3. Default to HAIKU if uncertain
         """
-        query_lower = query.lower().strip()
         token_count = len(query.split())
 
+        # Stage 1: every reflex label in one pass; precedence is applied here
+        reflex = self.matcher.match(query)
+
         # Stage 1a: Safety patterns -> AGENT_SDK
-        for pattern in self._safety_re:
-            if pattern.search(query_lower):
-                return RoutingDecision(
-                    tier=Tier.AGENT_SDK,
-                    confidence=1.0,
-                    category="safety",
-                    bypass_reason="safety_keyword"
-                )
+        if "safety" in reflex:
+            return RoutingDecision(
+                tier=Tier.AGENT_SDK,
+                confidence=1.0,
+                category="safety",
+                bypass_reason="safety_keyword"
+            )
 
         # Stage 1b: Local patterns (simple commands)
-        for pattern in self._local_re:
-            if pattern.search(query_lower):
-                return RoutingDecision(
-                    tier=Tier.LOCAL,
-                    confidence=0.95,
-                    category="command",
-                    bypass_reason="pattern_match"
-                )
+        if "local" in reflex:
+            return RoutingDecision(
+                tier=Tier.LOCAL,
+                confidence=0.95,
+                category="command",
+                bypass_reason="pattern_match"
+            )
 
         # Stage 1c: Agent patterns (complex tasks)
-        for pattern in self._agent_re:
-            if pattern.search(query_lower):
-                return RoutingDecision(
-                    tier=Tier.AGENT_SDK,
-                    confidence=0.85,
-                    category="complex",
-                    bypass_reason="pattern_match"
-                )
+        if "agent" in reflex:
+            return RoutingDecision(
+                tier=Tier.AGENT_SDK,
+                confidence=0.85,
+                category="complex",
+                bypass_reason="pattern_match"
+            )
 
         # Stage 1d: Very short queries -> LOCAL
         if token_count <= 3:
@@ -268,23 +398,9 @@ class ATLASRouter:
             )
 
         # Stage 2: Embedding classification
-        embedder = self._get_embedder()
-        if embedder is not None and self._prototype_embeddings:
-            query_embedding = embedder.encode([query])[0]
-
-            best_tier = Tier.HAIKU
-            best_score = -1.0
-
-            for tier, prototypes in self._prototype_embeddings.items():
-                # Cosine similarity to each prototype
-                similarities = np.dot(prototypes, query_embedding) / (
-                    np.linalg.norm(prototypes, axis=1) * np.linalg.norm(query_embedding)
-                )
-                max_sim = float(np.max(similarities))
-
-                if max_sim > best_score:
-                    best_score = max_sim
-                    best_tier = tier
+        nearest = self.nearest_tier(query)
+        if nearest is not None:
+            best_tier, best_score = nearest
 
             # Apply confidence thresholds
             if best_tier == Tier.LOCAL and best_score >= self.config.local_confidence:
@@ -301,16 +417,110 @@ class ATLASRouter:
             category="default"
         )
 
+    def nearest_tier(self, query: str) -> Optional[tuple[Tier, float]]:
+        """
+        The tier with the most similar prototype, and that cosine similarity.
+
+        Returns:
+            (tier, score), or None without the embedding model
+        """
+        embedder = self._get_embedder()
+        if embedder is None or not self._prototype_embeddings:
+            return None
+        query_embedding = np.asarray(embedder.embed(query))
+
+        best_tier = Tier.HAIKU
+        best_score = -1.0
+
+        for tier, prototypes in self._prototype_embeddings.items():
+            # Cosine similarity to each prototype
+            similarities = np.dot(prototypes, query_embedding) / (
+                np.linalg.norm(prototypes, axis=1) * np.linalg.norm(query_embedding)
+            )
+            max_sim = float(np.max(similarities))
+
+            if max_sim > best_score:
+                best_score = max_sim
+                best_tier = tier
+
+        return best_tier, best_score
+
+    def _query_embedding(self, text: str) -> Optional[np.ndarray]:
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        return np.asarray(embedder.embed(text))
+
+    def lookup_cached(self, query: str, system: Optional[str] = None) -> Optional[CacheEntry]:
+        """
+        A cached answer to a semantically matching earlier query.
+
+        Args:
+            query: The user's words (the same text passed as cache_key)
+            system: System prompt override (defaults to the router's)
+
+        Returns:
+            CacheEntry on a hit, None on a miss or without the cache/embeddings
+        """
+        if self.response_cache is None or not self.response_cache.cacheable(query):
+            return None
+        embedding = self._query_embedding(query)
+        if embedding is None:
+            return None
+        return self.response_cache.lookup(query, embedding, context=system or self.system_prompt)
+
+    def cached_entry(self, query: str, system: Optional[str] = None) -> Optional[CacheEntry]:
+        """The entry stored for exactly this cache_key, if any (not counted as a lookup)."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.entry_for(query, context=system or self.system_prompt)
+
     async def route_and_stream(
         self,
         query: str,
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 256,
+        cache_key: Optional[str] = None,
     ) -> AsyncIterator[str]:
         """
         Classify query, route to appropriate tier, and stream response.
+
+        Args:
+            cache_key: Store the finished response in the response cache
+                under this text (the user's own words). Leave it unset when
+                query carries context the answer depends on, such as earlier
+                turns. Cached answers are read with lookup_cached().
         """
+        if cache_key is None or self.response_cache is None or not self.response_cache.cacheable(cache_key):
+            async for token in self._route_and_stream(query, system, temperature, max_tokens, {}):
+                yield token
+            return
+
+        start = time.perf_counter()
+        served: dict = {}
+        parts = []
+        async for token in self._route_and_stream(query, system, temperature, max_tokens, served):
+            parts.append(token)
+            yield token
+
+        # Only reached when the stream finished cleanly
+        embedding = self._query_embedding(cache_key)
+        if embedding is not None:
+            self.response_cache.store(
+                cache_key, embedding, "".join(parts), tier=served["tier"],
+                llm_ms=(time.perf_counter() - start) * 1000, context=system or self.system_prompt,
+            )
+
+    async def _route_and_stream(
+        self,
+        query: str,
+        system: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        served: dict,
+    ) -> AsyncIterator[str]:
+        """route_and_stream() without caching; served["tier"] is the tier that answered."""
         # Check budget
         budget = self._cost_tracker.get_budget_status()
 
@@ -339,6 +549,12 @@ class ATLASRouter:
         start = time.perf_counter()
         first_token_time = None
         token_count = 0
+        served["tier"] = decision.tier.value
+
+        if self._should_hedge(decision):
+            async for token in self._hedged_stream(query, sys_prompt, temperature, max_tokens, decision, served):
+                yield token
+            return
 
         # Route to appropriate client
         if decision.tier == Tier.LOCAL:
@@ -366,31 +582,147 @@ class ATLASRouter:
                 yield token
 
         # Log usage (for API tiers)
-        end = time.perf_counter()
-        if decision.tier in (Tier.HAIKU, Tier.AGENT_SDK):
-            # Estimate tokens (actual count from API response would be better)
-            input_tokens = len(query.split()) * 1.3  # Rough estimate
-            output_tokens = token_count
-
-            # Haiku pricing
-            if decision.tier == Tier.HAIKU:
-                cost = (input_tokens / 1_000_000) * 1.0 + (output_tokens / 1_000_000) * 5.0
-            else:
-                cost = 0  # Agent SDK is free via Max Plan
-
-            self._cost_tracker.log_usage(
-                UsageRecord(
-                    tier=decision.tier.value,
-                    model="haiku" if decision.tier == Tier.HAIKU else "agent_sdk",
-                    input_tokens=int(input_tokens),
-                    output_tokens=output_tokens,
-                    cost_usd=cost,
-                    latency_ms=(end - start) * 1000,
-                    category=decision.category,
-                    confidence=decision.confidence,
-                ),
-                query=query,
-            )
+        self._log_usage(decision.tier, decision, query, token_count, (time.perf_counter() - start) * 1000)
+
+    def _log_usage(
+        self,
+        tier: Tier,
+        decision: RoutingDecision,
+        query: str,
+        output_tokens: int,
+        latency_ms: float,
+    ) -> None:
+        """Record API usage for the tier that actually answered (LOCAL is free)."""
+        if tier not in (Tier.HAIKU, Tier.AGENT_SDK):
+            return
+
+        # Estimate tokens (actual count from API response would be better)
+        input_tokens = len(query.split()) * 1.3  # Rough estimate
+
+        # Haiku pricing
+        if tier == Tier.HAIKU:
+            cost = (input_tokens / 1_000_000) * 1.0 + (output_tokens / 1_000_000) * 5.0
+        else:
+            cost = 0  # Agent SDK is free via Max Plan
+
+        self._cost_tracker.log_usage(
+            UsageRecord(
+                tier=tier.value,
+                model="haiku" if tier == Tier.HAIKU else "agent_sdk",
+                input_tokens=int(input_tokens),
+                output_tokens=output_tokens,
+                cost_usd=cost,
+                latency_ms=latency_ms,
+                category=decision.category,
+                confidence=decision.confidence,
+            ),
+            query=query,
+        )
+
+    # =========================================================================
+    # Hedged routing
+    # =========================================================================
+
+    def _should_hedge(self, decision: RoutingDecision) -> bool:
+        """Race local against Haiku only for uncertain HAIKU decisions."""
+        return (
+            self.config.enable_hedging
+            and decision.tier == Tier.HAIKU
+            and decision.confidence <= self.config.hedge_confidence_max
+        )
+
+    def _acceptable_local(self, text: str) -> bool:
+        """A local first sentence worth committing to."""
+        first = text.strip().lower()
+        return len(first.split()) >= self.config.hedge_min_words and not HEDGE_REJECT_PATTERNS.search(first)
+
+    async def _hedged_stream(
+        self,
+        query: str,
+        sys_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        decision: RoutingDecision,
+        served: dict,
+    ) -> AsyncIterator[str]:
+        """Stream from whichever of local and Haiku commits first (see module docstring)."""
+        start = time.perf_counter()
+        local = _HedgeLeg(Tier.LOCAL, self._get_local_client().stream(query, sys_prompt, temperature, max_tokens))
+        haiku = _HedgeLeg(Tier.HAIKU, self._get_haiku_client().stream(query, sys_prompt, temperature, max_tokens))
+        stats = self._hedge_stats.setdefault(decision.category, HedgeStats())
+        stats.races += 1
+
+        winner = None
+        try:
+            winner, outcome = await self._race(local, haiku)
+        finally:
+            for leg in (local, haiku):
+                if leg is not winner:
+                    await leg.cancel()
+
+        if outcome == "budget":
+            stats.budget_expired += 1
+        if winner is local:
+            stats.local_wins += 1
+        else:
+            stats.haiku_wins += 1
+            if local.ok and not self._acceptable_local(local.text):
+                stats.local_rejected += 1
+        served["tier"] = winner.tier.value
+        logger.info(
+            f"Hedged route ({decision.category}): {winner.tier.value} after "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms ({outcome})"
+        )
+
+        token_count = 0
+        try:
+            async for token in winner.tokens():
+                token_count += 1
+                yield token
+        finally:
+            if not winner.task.done():  # consumer stopped early (timeout, error)
+                await winner.cancel()
+
+        # Only the committed stream is billed
+        self._log_usage(winner.tier, decision, query, token_count, (time.perf_counter() - start) * 1000)
+
+    async def _race(self, local: _HedgeLeg, haiku: _HedgeLeg) -> tuple[_HedgeLeg, str]:
+        """Wait for the first acceptable first sentence; Haiku when the budget runs out."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.hedge_budget_ms / 1000
+        while True:
+            if local.ok and self._acceptable_local(local.text):
+                return local, "local_sentence"
+            if haiku.ok:
+                return haiku, "haiku_sentence"
+            if haiku.sentence.is_set() and local.sentence.is_set():
+                # Haiku failed and local was unacceptable: local beats nothing,
+                # unless it failed too (then Haiku's error surfaces)
+                return (local, "haiku_failed") if local.ok else (haiku, "both_failed")
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                if haiku.error is not None and local.ok:
+                    return local, "haiku_failed"
+                return haiku, "budget"
+            waiters = [asyncio.ensure_future(leg.sentence.wait()) for leg in (local, haiku) if not leg.sentence.is_set()]
+            try:
+                await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def hedge_stats(self) -> dict[str, HedgeStats]:
+        """Hedged race outcomes per routing category since startup."""
+        return dict(self._hedge_stats)
+
+    def format_hedge_stats(self) -> str:
+        """One line per category: races and local win rate."""
+        return "\n".join(
+            f"{category}: {st.races} races, local {st.local_wins} ({st.local_win_rate:.0%}), "
+            f"haiku {st.haiku_wins}, local rejected {st.local_rejected}, budget expired {st.budget_expired}"
+            for category, st in sorted(self._hedge_stats.items())
+        )
 
 
 # Convenience function
@@ -17,7 +17,6 @@ except ImportError:
     FastMCP = None
 
 from atlas.memory.store import MemoryStore, get_store
-from atlas.memory.embeddings import get_embedder
 
 
 # Default database path
@@ -111,7 +110,8 @@ def create_server(db_path: Optional[Path] = None) -> "FastMCP":
         """
         Search ATLAS's memories using hybrid semantic + full-text search.
 
-        Uses BGE embeddings (384-dim) with RRF fusion (60% vector, 40% FTS).
+        Uses BGE embeddings (384-dim) with RRF fusion (60% vector, 40% FTS),
+        re-ranked by importance, recency and access frequency.
         This is the recommended search method for natural language queries.
 
         Args:
@@ -122,12 +122,13 @@ def create_server(db_path: Optional[Path] = None) -> "FastMCP":
             Dictionary with semantically matching memories
         """
         try:
-            embedder = get_embedder()
-            query_embedding = embedder.embed_query(query)
+            # Persistent embedding cache first, then the model
+            query_embedding = store.embed_query(query)
             results = store.search_hybrid(
                 query=query,
                 embedding=query_embedding,
                 limit=limit,
+                salience=True,
             )
             return {
                 "query": query,
@@ -1,6 +1,13 @@
 """Memory subsystem with SQLite + sqlite-vec + FTS5."""
 
-from .store import MemoryStore, Memory, SearchResult, get_store
+from .store import (
+    BulkIngestReport,
+    MemoryStore,
+    Memory,
+    SalienceWeights,
+    SearchResult,
+    get_store,
+)
 from .embeddings import BGEEmbedder, EmbeddingResult, get_embedder
 from .blueprint import (
     BlueprintAPI,
@@ -43,6 +50,8 @@ __all__ = [
     "MemoryStore",
     "Memory",
     "SearchResult",
+    "SalienceWeights",
+    "BulkIngestReport",
     "get_store",
     "get_memory_store",
     # Embeddings
@@ -302,28 +302,93 @@ class BlueprintAPI:
             LIMIT ?
         """, (start_date.isoformat(), days))
 
-        results = []
-        for row in cursor.fetchall():
-            results.append(DailyMetrics(
-                id=row["id"],
-                date=date.fromisoformat(row["date"]),
-                sleep_hours=row["sleep_hours"],
-                sleep_score=row["sleep_score"],
-                deep_sleep_minutes=row["deep_sleep_minutes"],
-                rem_sleep_minutes=row["rem_sleep_minutes"],
-                resting_hr=row["resting_hr"],
-                hrv_avg=row["hrv_avg"],
-                hrv_morning=row["hrv_morning"],
-                hrv_status=row["hrv_status"] if "hrv_status" in row.keys() else None,
-                body_battery=row["body_battery"] if "body_battery" in row.keys() else None,
-                weight_kg=row["weight_kg"],
-                body_fat_pct=row["body_fat_pct"],
-                energy_level=row["energy_level"],
-                mood=row["mood"],
-                stress_level=row["stress_level"],
-                notes=row["notes"]
-            ))
-        return results
+        return [self._row_to_daily_metrics(row) for row in cursor.fetchall()]
+
+    def get_daily_metrics_range(self, start: date, end: date) -> list[DailyMetrics]:
+        """
+        Get daily metrics between two dates (inclusive).
+
+        Returns:
+            List of DailyMetrics, oldest first
+        """
+        cursor = self.store.conn.execute("""
+            SELECT * FROM daily_metrics
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date
+        """, (start.isoformat(), end.isoformat()))
+        return [self._row_to_daily_metrics(row) for row in cursor.fetchall()]
+
+    def log_daily_metrics_batch(self, metrics_list: list[DailyMetrics]) -> int:
+        """
+        Log or update daily metrics for many dates in one transaction.
+
+        Same merge rules as log_daily_metrics (None keeps the stored value).
+
+        Returns:
+            Number of rows written
+        """
+        if not metrics_list:
+            return 0
+        conn = self.store.conn
+        with conn:
+            conn.executemany("""
+                INSERT INTO daily_metrics (
+                    date, sleep_hours, sleep_score, deep_sleep_minutes,
+                    rem_sleep_minutes, resting_hr, hrv_avg, hrv_morning,
+                    hrv_status, body_battery,
+                    weight_kg, body_fat_pct, energy_level, mood,
+                    stress_level, notes
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    sleep_hours = COALESCE(excluded.sleep_hours, sleep_hours),
+                    sleep_score = COALESCE(excluded.sleep_score, sleep_score),
+                    deep_sleep_minutes = COALESCE(excluded.deep_sleep_minutes, deep_sleep_minutes),
+                    rem_sleep_minutes = COALESCE(excluded.rem_sleep_minutes, rem_sleep_minutes),
+                    resting_hr = COALESCE(excluded.resting_hr, resting_hr),
+                    hrv_avg = COALESCE(excluded.hrv_avg, hrv_avg),
+                    hrv_morning = COALESCE(excluded.hrv_morning, hrv_morning),
+                    hrv_status = COALESCE(excluded.hrv_status, hrv_status),
+                    body_battery = COALESCE(excluded.body_battery, body_battery),
+                    weight_kg = COALESCE(excluded.weight_kg, weight_kg),
+                    body_fat_pct = COALESCE(excluded.body_fat_pct, body_fat_pct),
+                    energy_level = COALESCE(excluded.energy_level, energy_level),
+                    mood = COALESCE(excluded.mood, mood),
+                    stress_level = COALESCE(excluded.stress_level, stress_level),
+                    notes = COALESCE(excluded.notes, notes),
+                    updated_at = CURRENT_TIMESTAMP
+            """, [(
+                m.date.isoformat(),
+                m.sleep_hours, m.sleep_score,
+                m.deep_sleep_minutes, m.rem_sleep_minutes,
+                m.resting_hr, m.hrv_avg, m.hrv_morning,
+                m.hrv_status, m.body_battery,
+                m.weight_kg, m.body_fat_pct,
+                m.energy_level, m.mood, m.stress_level,
+                m.notes
+            ) for m in metrics_list])
+        return len(metrics_list)
+
+    @staticmethod
+    def _row_to_daily_metrics(row) -> DailyMetrics:
+        return DailyMetrics(
+            id=row["id"],
+            date=date.fromisoformat(row["date"]),
+            sleep_hours=row["sleep_hours"],
+            sleep_score=row["sleep_score"],
+            deep_sleep_minutes=row["deep_sleep_minutes"],
+            rem_sleep_minutes=row["rem_sleep_minutes"],
+            resting_hr=row["resting_hr"],
+            hrv_avg=row["hrv_avg"],
+            hrv_morning=row["hrv_morning"],
+            hrv_status=row["hrv_status"] if "hrv_status" in row.keys() else None,
+            body_battery=row["body_battery"] if "body_battery" in row.keys() else None,
+            weight_kg=row["weight_kg"],
+            body_fat_pct=row["body_fat_pct"],
+            energy_level=row["energy_level"],
+            mood=row["mood"],
+            stress_level=row["stress_level"],
+            notes=row["notes"]
+        )
 
     # ==================== SUPPLEMENTS ====================
 
@@ -570,7 +635,63 @@ class BlueprintAPI:
             ORDER BY w.date DESC, wes.set_number ASC
         """, (exercise_id, f"-{days} days"))
 
-        rows = cursor.fetchall()
+        return self._performance_from_rows(exercise_id, cursor.fetchall())
+
+    def get_last_performances(
+        self,
+        exercise_ids: list[str],
+        days: int = 30
+    ) -> dict[str, ExercisePerformance]:
+        """
+        Get the most recent performance for several exercises in one query.
+
+        Same rules as get_last_performance, for building a whole session.
+
+        Args:
+            exercise_ids: Exercise identifiers
+            days: How far back to look
+
+        Returns:
+            Dict of exercise_id -> ExercisePerformance (exercises without data omitted)
+        """
+        exercise_ids = list(dict.fromkeys(exercise_ids))
+        if not exercise_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(exercise_ids))
+        cursor = self.store.conn.execute(f"""
+            SELECT
+                we.exercise_id,
+                w.date,
+                we.weight_kg as exercise_weight,
+                we.id as workout_exercise_id,
+                w.id as workout_id,
+                wes.weight_kg as set_weight,
+                wes.reps_actual,
+                wes.reps_target,
+                wes.set_number
+            FROM workout_exercises we
+            JOIN workouts w ON we.workout_id = w.id
+            LEFT JOIN workout_exercise_sets wes ON wes.workout_exercise_id = we.id
+            WHERE we.exercise_id IN ({placeholders})
+            AND w.date >= date('now', ?)
+            ORDER BY we.exercise_id, w.date DESC, wes.set_number ASC
+        """, (*exercise_ids, f"-{days} days"))
+
+        rows_by_exercise: dict[str, list] = {}
+        for row in cursor.fetchall():
+            rows_by_exercise.setdefault(row["exercise_id"], []).append(row)
+
+        performances = {}
+        for exercise_id, rows in rows_by_exercise.items():
+            perf = self._performance_from_rows(exercise_id, rows)
+            if perf:
+                performances[exercise_id] = perf
+        return performances
+
+    @staticmethod
+    def _performance_from_rows(exercise_id: str, rows: list) -> Optional[ExercisePerformance]:
+        """Summarize the most recent workout in rows (newest first, sets in order)."""
         if not rows:
             return None
 
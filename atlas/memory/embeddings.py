@@ -4,6 +4,20 @@ ATLAS Embeddings Module
 BGE-small-en-v1.5 embeddings via sentence-transformers ONNX backend.
 384-dimension embeddings optimized for CPU inference.
 
+One process-wide EmbeddingService owns the model. Router prototypes,
+memory writes and memory queries all go through it, so the bridge keeps a
+single transformer resident and pays a single cold start. Concurrent
+embed() calls are coalesced into one encode() call, and repeated texts
+are served from an LRU cache keyed by normalized text.
+
+Model selection: ATLAS_EMBEDDING_MODEL (default BAAI/bge-small-en-v1.5).
+The vec_semantic table is float[384], so replacements must be 384-dim.
+
+Embeddings also persist across restarts in the embedding_cache table of
+atlas.db (content hash -> float32 vector, tagged with the model version).
+MemoryStore checks it before calling the model. Rows written by another
+model are dropped on open, and the table is bounded by LRU eviction.
+
 Usage:
     from atlas.memory.embeddings import get_embedder
 
@@ -11,15 +25,33 @@ Usage:
     result = embedder.embed("User prefers morning workouts")
     print(result.embedding)  # 384-dim vector
     print(result.duration_ms)  # ~10-15ms
+
+    from atlas.memory.embeddings import get_embedding_service
+    print(get_embedding_service().stats.as_dict())  # cache hits, batch sizes
+
+    # Embed every memory missing from the persistent cache / vector index
+    python scripts/warm_embedding_cache.py --batch-size 256
 """
 
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
 import time
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
 # Lazy imports to avoid loading heavy dependencies at module import
 _SentenceTransformer = None
 
+DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
+
+# Bump when text preprocessing changes so cached vectors are invalidated
+EMBEDDING_CACHE_VERSION = 1
+
 
 def _get_sentence_transformer():
     """Lazy import sentence_transformers."""
@@ -30,6 +62,29 @@ def _get_sentence_transformer():
     return _SentenceTransformer
 
 
+def normalize_text(text: str) -> str:
+    """Cache key for a text: surrounding and repeated whitespace removed."""
+    return " ".join(text.split())
+
+
+def content_hash(text: str) -> str:
+    """Persistent cache key for a text (sha256 of the normalized text)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def pack_vector(embedding: list[float]) -> bytes:
+    """Serialize an embedding as native float32 (same layout as sqlite-vec)."""
+    packed = array("f", embedding)
+    if packed.itemsize != 4:  # pragma: no cover - every supported platform has 4-byte floats
+        raise ValueError("float32 array type unavailable")
+    return packed.tobytes()
+
+
+def unpack_vector(blob: bytes) -> list[float]:
+    """Inverse of pack_vector."""
+    return array("f", blob).tolist()
+
+
 @dataclass
 class EmbeddingResult:
     """Result from embedding generation."""
@@ -38,12 +93,272 @@ class EmbeddingResult:
     text_length: int
 
 
+@dataclass
+class EmbeddingStats:
+    """Counters for the shared embedding service."""
+    cache_hits: int = 0
+    cache_misses: int = 0
+    batches: int = 0
+    texts_encoded: int = 0
+    max_batch_size: int = 0
+    encode_ms: float = 0.0
+    load_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.texts_encoded / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "batches": self.batches,
+            "texts_encoded": self.texts_encoded,
+            "mean_batch_size": round(self.mean_batch_size, 2),
+            "max_batch_size": self.max_batch_size,
+            "encode_ms": round(self.encode_ms, 1),
+            "load_ms": round(self.load_ms, 1),
+        }
+
+
+class _EmbedRequest:
+    """One pending text in the batching queue."""
+
+    __slots__ = ("text", "done", "embedding", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.embedding: Optional[list[float]] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingService:
+    """
+    Process-wide embedding model with request coalescing and an LRU cache.
+
+    embed() is safe to call from any thread. Cache misses are queued; a
+    worker thread drains everything queued within batch_window_ms (up to
+    max_batch_size texts) and encodes it in one call.
+
+    Usage:
+        service = get_embedding_service()
+        vector = service.embed("what's my workout")
+        vectors = service.embed_many(["text1", "text2"])
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        device: str = "cpu",
+        cache_size: int = 2048,
+        max_batch_size: int = 64,
+        batch_window_ms: float = 2.0,
+    ):
+        """
+        Initialize the embedding service (model loads on first use).
+
+        Args:
+            model_name: sentence-transformers model (default: ATLAS_EMBEDDING_MODEL or BGE-small)
+            device: Device to run on ('cpu' recommended to preserve GPU for LLM/TTS)
+            cache_size: Maximum cached texts (LRU)
+            max_batch_size: Maximum texts per encode() call
+            batch_window_ms: How long the worker waits for more requests to coalesce
+        """
+        self.model_name = model_name or os.environ.get("ATLAS_EMBEDDING_MODEL", DEFAULT_MODEL_NAME)
+        self.device = device
+        self.cache_size = cache_size
+        self.max_batch_size = max_batch_size
+        self.batch_window_s = batch_window_ms / 1000
+        self.stats = EmbeddingStats()
+
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._queue: queue.Queue[_EmbedRequest] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def query_instruction(self) -> str:
+        """Retrieval prefix for queries (BGE models only)."""
+        if "bge" in self.model_name.lower():
+            return BGEEmbedder.QUERY_INSTRUCTION
+        return ""
+
+    def ensure_loaded(self) -> None:
+        """Load the model (idempotent, thread-safe)."""
+        if self._model is not None:
+            return
+        with self._load_lock:
+            if self._model is not None:
+                return
+            SentenceTransformer = _get_sentence_transformer()
+            start = time.perf_counter()
+            # Load with ONNX backend for efficiency
+            self._model = SentenceTransformer(
+                self.model_name,
+                device=self.device,
+                backend="onnx",
+            )
+            self.stats.load_ms = (time.perf_counter() - start) * 1000
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> Optional[list[float]]:
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is None:
+                self.stats.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.stats.cache_hits += 1
+            return embedding
+
+    def _cache_put(self, key: str, embedding: list[float]) -> None:
+        with self._cache_lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    # -------------------------------------------------------------------------
+    # Encoding
+    # -------------------------------------------------------------------------
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        """Encode one batch directly on the model and record batch stats."""
+        self.ensure_loaded()
+        start = time.perf_counter()
+        embeddings = self._model.encode(texts, normalize_embeddings=True).tolist()
+        self.stats.encode_ms += (time.perf_counter() - start) * 1000
+        self.stats.batches += 1
+        self.stats.texts_encoded += len(texts)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(texts))
+        return embeddings
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._worker_loop, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.batch_window_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Identical texts in one batch are encoded once
+            unique = list(dict.fromkeys(r.text for r in batch))
+            try:
+                by_text = dict(zip(unique, self._encode(unique)))
+            except BaseException as e:  # Surface to every waiting caller
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            for text, embedding in by_text.items():
+                self._cache_put(text, embedding)
+            for request in batch:
+                request.embedding = by_text[request.text]
+                request.done.set()
+
+    def embed(self, text: str) -> list[float]:
+        """
+        Embed one text (cached, coalesced with concurrent callers).
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Normalized embedding vector
+        """
+        key = normalize_text(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        request = _EmbedRequest(key)
+        self._ensure_worker()
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.embedding
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed many texts: cache hits are reused, misses encoded in batches.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in input order
+        """
+        keys = [normalize_text(t) for t in texts]
+        results: dict[str, list[float]] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            cached = self._cache_get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                results[key] = cached
+
+        for i in range(0, len(missing), self.max_batch_size):
+            chunk = missing[i:i + self.max_batch_size]
+            for key, embedding in zip(chunk, self._encode(chunk)):
+                self._cache_put(key, embedding)
+                results[key] = embedding
+
+        return [results[key] for key in keys]
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a retrieval query (adds the model's instruction prefix)."""
+        return self.embed(f"{self.query_instruction}{query}")
+
+    @property
+    def embedding_dim(self) -> int:
+        if self._model is not None:
+            return self._model.get_sentence_embedding_dimension()
+        return BGEEmbedder.EMBEDDING_DIM
+
+
 class BGEEmbedder:
     """
     BGE-small-en-v1.5 embeddings via sentence-transformers ONNX.
 
     Uses ONNX backend for efficient CPU inference.
-    384 dimensions, ~10-15ms per embedding.
+    384 dimensions, ~10-15ms per embedding. Backed by the shared
+    EmbeddingService, so all embedders share one model and cache.
 
     Usage:
         embedder = BGEEmbedder()
@@ -59,33 +374,24 @@ class BGEEmbedder:
         query_embedding = embedder.embed_query("best workout routine")
     """
 
-    MODEL_NAME = "BAAI/bge-small-en-v1.5"
+    MODEL_NAME = DEFAULT_MODEL_NAME
     EMBEDDING_DIM = 384
     QUERY_INSTRUCTION = "Represent this sentence for searching relevant passages: "
 
-    def __init__(self, device: str = "cpu"):
+    def __init__(self, device: str = "cpu", service: Optional[EmbeddingService] = None):
         """
         Initialize BGE embedder.
 
         Args:
             device: Device to run on ('cpu' recommended to preserve GPU for LLM/TTS)
+            service: Embedding service (default: process-wide shared service)
         """
         self.device = device
-        self._model = None
+        self.service = service or get_embedding_service()
 
     def _ensure_loaded(self) -> None:
         """Lazy-load model on first use."""
-        if self._model is not None:
-            return
-
-        SentenceTransformer = _get_sentence_transformer()
-
-        # Load with ONNX backend for efficiency
-        self._model = SentenceTransformer(
-            self.MODEL_NAME,
-            device=self.device,
-            backend="onnx",
-        )
+        self.service.ensure_loaded()
 
     def embed(self, text: str) -> EmbeddingResult:
         """
@@ -97,14 +403,12 @@ class BGEEmbedder:
         Returns:
             EmbeddingResult with 384-dim embedding and timing info
         """
-        self._ensure_loaded()
-
         start = time.perf_counter()
-        embedding = self._model.encode(text, normalize_embeddings=True)
+        embedding = self.service.embed(text)
         duration_ms = (time.perf_counter() - start) * 1000
 
         return EmbeddingResult(
-            embedding=embedding.tolist(),
+            embedding=embedding,
             duration_ms=duration_ms,
             text_length=len(text),
         )
@@ -119,10 +423,7 @@ class BGEEmbedder:
         Returns:
             List of 384-dim embeddings
         """
-        self._ensure_loaded()
-
-        embeddings = self._model.encode(texts, normalize_embeddings=True)
-        return embeddings.tolist()
+        return self.service.embed_many(texts)
 
     def embed_query(self, query: str) -> list[float]:
         """
@@ -137,8 +438,7 @@ class BGEEmbedder:
         Returns:
             384-dim embedding optimized for retrieval
         """
-        prefixed = f"{self.QUERY_INSTRUCTION}{query}"
-        return self.embed(prefixed).embedding
+        return self.service.embed_query(query)
 
     def is_available(self) -> bool:
         """Check if sentence-transformers is available."""
@@ -154,10 +454,240 @@ class BGEEmbedder:
         return self.EMBEDDING_DIM
 
 
-# Singleton instance
+class EmbeddingCache:
+    """
+    Persistent content-hash -> float32 vector cache in atlas.db.
+
+    Rows are keyed by (content_hash, model), where model is the model name
+    plus EMBEDDING_CACHE_VERSION. init() deletes rows written by any other
+    model version, so switching ATLAS_EMBEDDING_MODEL never serves stale
+    vectors. Past max_entries the least recently used rows are evicted down
+    to 90% of the bound.
+
+    Lookups never write: hits are remembered in memory and their last_used
+    is updated together with the next put().
+
+    Usage:
+        cache = EmbeddingCache(store.conn, model_name=service.model_name)
+        cache.init()
+        vector = cache.get("User prefers morning workouts")
+        if vector is None:
+            cache.put("User prefers morning workouts", service.embed(...))
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS embedding_cache (
+        content_hash TEXT NOT NULL,
+        model TEXT NOT NULL,
+        dim INTEGER NOT NULL,
+        vector BLOB NOT NULL,
+        last_used REAL NOT NULL,
+        PRIMARY KEY (content_hash, model)
+    );
+    CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used
+        ON embedding_cache(model, last_used);
+    """
+
+    # SQLite's default host-parameter limit is 999 on older builds
+    _LOOKUP_CHUNK = 500
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        model_name: Optional[str] = None,
+        max_entries: int = 50_000,
+    ):
+        """
+        Initialize the cache on an open atlas.db connection.
+
+        Args:
+            conn: SQLite connection (shared with MemoryStore)
+            model_name: Embedding model the vectors come from
+            max_entries: Row bound before LRU eviction (~1.5KB per 384-dim row)
+        """
+        self.conn = conn
+        self.model_name = model_name or os.environ.get("ATLAS_EMBEDDING_MODEL", DEFAULT_MODEL_NAME)
+        self.model_version = f"{self.model_name}@v{EMBEDDING_CACHE_VERSION}"
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._size = 0
+        self._touched: set[str] = set()
+        self._lock = threading.Lock()
+
+    def init(self) -> int:
+        """
+        Create the table and drop vectors from other model versions.
+
+        Returns:
+            Number of invalidated rows
+        """
+        with self._lock:
+            self.conn.executescript(self.SCHEMA)
+            cursor = self.conn.execute(
+                "DELETE FROM embedding_cache WHERE model != ?", (self.model_version,)
+            )
+            self.conn.commit()
+            self._size = self._count()
+            return cursor.rowcount
+
+    def _count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM embedding_cache WHERE model = ?", (self.model_version,)
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def get(self, text: str) -> Optional[list[float]]:
+        """Cached embedding for text, or None."""
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """
+        Look up many texts in one query per chunk.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Embedding or None per text, in input order
+        """
+        hashes = [content_hash(t) for t in texts]
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for i in range(0, len(unique), self._LOOKUP_CHUNK):
+                chunk = unique[i:i + self._LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"""
+                    SELECT content_hash, vector FROM embedding_cache
+                    WHERE model = ? AND content_hash IN ({placeholders})
+                    """,
+                    [self.model_version, *chunk],
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = unpack_vector(row[1])
+            self._touched.update(found)
+            self.hits += sum(1 for h in hashes if h in found)
+            self.misses += sum(1 for h in hashes if h not in found)
+        return [found.get(h) for h in hashes]
+
+    def put(self, text: str, embedding: list[float]) -> None:
+        """Store one embedding."""
+        self.put_many([(text, embedding)])
+
+    def put_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """
+        Store embeddings in one transaction (also flushes pending hit times).
+
+        Args:
+            items: (text, embedding) pairs
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (content_hash(text), self.model_version, len(embedding), pack_vector(embedding), now)
+            for text, embedding in items
+        ]
+        with self._lock:
+            touched, self._touched = self._touched, set()
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache
+                    (content_hash, model, dim, vector, last_used)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            if touched:
+                self.conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE content_hash = ? AND model = ?",
+                    [(now, h, self.model_version) for h in touched],
+                )
+            # Upper bound (replacements are counted too); evict() recounts exactly
+            self._size += len(rows)
+            if self._size > self.max_entries:
+                self._evict()
+            self.conn.commit()
+
+    def evict(self) -> int:
+        """
+        Evict least recently used rows if the cache is over its bound.
+
+        Returns:
+            Number of evicted rows
+        """
+        with self._lock:
+            removed = self._evict()
+            self.conn.commit()
+            return removed
+
+    def _evict(self) -> int:
+        self._size = self._count()
+        if self._size <= self.max_entries:
+            return 0
+        excess = self._size - int(self.max_entries * 0.9)
+        self.conn.execute(
+            """
+            DELETE FROM embedding_cache WHERE rowid IN (
+                SELECT rowid FROM embedding_cache
+                WHERE model = ?
+                ORDER BY last_used
+                LIMIT ?
+            )
+            """,
+            (self.model_version, excess),
+        )
+        self._size -= excess
+        self.evicted += excess
+        return excess
+
+    def clear(self) -> None:
+        """Delete every cached vector."""
+        with self._lock:
+            self.conn.execute("DELETE FROM embedding_cache")
+            self.conn.commit()
+            self._size = 0
+            self._touched.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        return {
+            "model": self.model_version,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
+
+
+# Singleton instances
+_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
 _embedder: Optional[BGEEmbedder] = None
 
 
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get the process-wide embedding service.
+
+    Returns:
+        EmbeddingService shared by the router and memory store
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = EmbeddingService()
+    return _service
+
+
 def get_embedder() -> BGEEmbedder:
     """
     Get singleton embedder instance.
@@ -169,3 +699,4 @@ def get_embedder() -> BGEEmbedder:
     if _embedder is None:
         _embedder = BGEEmbedder()
     return _embedder
+
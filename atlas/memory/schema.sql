@@ -44,11 +44,44 @@ CREATE TRIGGER IF NOT EXISTS semantic_memory_ad AFTER DELETE ON semantic_memory
     INSERT INTO fts_memory(fts_memory, rowid, content) VALUES('delete', old.id, old.content);
 END;
 
-CREATE TRIGGER IF NOT EXISTS semantic_memory_au AFTER UPDATE ON semantic_memory BEGIN
+-- Only content changes re-index; access-count and importance updates skip FTS
+CREATE TRIGGER IF NOT EXISTS semantic_memory_au AFTER UPDATE OF content ON semantic_memory BEGIN
     INSERT INTO fts_memory(fts_memory, rowid, content) VALUES('delete', old.id, old.content);
     INSERT INTO fts_memory(rowid, content) VALUES (new.id, new.content);
 END;
 
+-- Retrieval decay inputs, maintained by triggers on insert and access so
+-- salience-ranked searches score candidates without scanning history.
+-- touched_at: unix time of the last write or access
+-- frequency: access_count / (access_count + 4), saturating towards 1
+CREATE TABLE IF NOT EXISTS memory_decay (
+    memory_id INTEGER PRIMARY KEY,
+    touched_at INTEGER NOT NULL,
+    frequency REAL NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS memory_decay_ai AFTER INSERT ON semantic_memory BEGIN
+    INSERT OR REPLACE INTO memory_decay (memory_id, touched_at, frequency)
+    VALUES (
+        new.id,
+        CAST(strftime('%s', COALESCE(new.created_at, 'now')) AS INTEGER),
+        COALESCE(new.access_count, 0) / (COALESCE(new.access_count, 0) + 4.0)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS memory_decay_au AFTER UPDATE OF access_count ON semantic_memory BEGIN
+    INSERT OR REPLACE INTO memory_decay (memory_id, touched_at, frequency)
+    VALUES (
+        new.id,
+        CAST(strftime('%s', 'now') AS INTEGER),
+        new.access_count / (new.access_count + 4.0)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS memory_decay_ad AFTER DELETE ON semantic_memory BEGIN
+    DELETE FROM memory_decay WHERE memory_id = old.id;
+END;
+
 -- ============================================
 -- BLUEPRINT TRACKING (health/fitness data)
 -- ============================================
@@ -5,13 +5,22 @@ SQLite-based memory system with:
 - sqlite-vec for vector similarity search
 - FTS5 for full-text search
 - Hybrid RRF ranking (60% vector, 40% FTS)
+- Optional salience ranking (RRF blended with importance, recency, access frequency)
+- Persistent embedding cache (see atlas.memory.embeddings.EmbeddingCache)
+- Write-behind access counting for get_memory (see AccessTracker)
 """
 
+import atexit
+import math
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 try:
     import sqlite_vec
@@ -40,6 +49,221 @@ class SearchResult:
     match_type: str  # 'vector', 'fts', 'hybrid'
 
 
+@dataclass
+class BulkIngestReport:
+    """IDs and throughput for one add_memories_bulk call."""
+    ids: list[int] = field(default_factory=list)
+    batches: int = 0
+    embedded: int = 0
+    embed_ms: float = 0.0
+    write_ms: float = 0.0
+    duration_ms: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return len(self.ids)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / (self.duration_ms / 1000) if self.duration_ms else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "embedded": self.embedded,
+            "embed_ms": round(self.embed_ms, 1),
+            "write_ms": round(self.write_ms, 1),
+            "duration_ms": round(self.duration_ms, 1),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+@dataclass(frozen=True)
+class SalienceWeights:
+    """Blend weights for salience-ranked hybrid search."""
+    relevance: float = 0.6  # RRF score, scaled to [0, 1]
+    importance: float = 0.2
+    recency: float = 0.15  # halves every half_life_days since last write/access
+    frequency: float = 0.05  # saturating access count (memory_decay.frequency)
+    half_life_days: float = 30.0
+
+
+# Highest RRF score a memory can get (rank 1 in both lists, weights summing to 1)
+_RRF_MAX = 1.0 / 61
+
+# Salience mode re-ranks this many times `limit` fused candidates
+_SALIENCE_POOL = 4
+
+# Filtered hybrid searches fetch this many times more KNN neighbours
+# (capped at sqlite-vec's k limit) before applying the filters
+_FILTER_OVERFETCH = 8
+_MAX_KNN = 4096
+
+
+def _timestamp(value: datetime | date | str) -> str:
+    """Format a bound in created_at's storage format (YYYY-MM-DD HH:MM:SS)."""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _memory_filters(
+    memory_type: Optional[str],
+    min_importance: Optional[float],
+    created_after: Optional[datetime | date | str],
+    created_before: Optional[datetime | date | str],
+) -> tuple[str, dict[str, Any]]:
+    """SQL conditions on semantic_memory m (each prefixed with AND) and their parameters."""
+    clauses = []
+    params: dict[str, Any] = {}
+    if memory_type is not None:
+        clauses.append("m.memory_type = :memory_type")
+        params["memory_type"] = memory_type
+    if min_importance is not None:
+        clauses.append("m.importance >= :min_importance")
+        params["min_importance"] = min_importance
+    if created_after is not None:
+        clauses.append("m.created_at >= :created_after")
+        params["created_after"] = _timestamp(created_after)
+    if created_before is not None:
+        clauses.append("m.created_at < :created_before")
+        params["created_before"] = _timestamp(created_before)
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def _salience_score(
+    weights: SalienceWeights,
+    row: sqlite3.Row,
+    memory: Memory,
+    now: float,
+) -> float:
+    """Blend a fused row's RRF score with its importance and decay factors."""
+    touched_at = row["touched_at"]
+    if touched_at is None:  # no memory_decay row yet
+        touched_at = memory.created_at.replace(tzinfo=timezone.utc).timestamp()
+    age_days = max(now - touched_at, 0.0) / 86400
+    recency = math.pow(0.5, age_days / weights.half_life_days)
+    return (
+        weights.relevance * row["score"] / _RRF_MAX
+        + weights.importance * memory.importance
+        + weights.recency * recency
+        + weights.frequency * (row["frequency"] or 0.0)
+    )
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to size items without materializing the input."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class AccessTracker:
+    """
+    Write-behind buffer for get_memory access counts.
+
+    Accesses are counted in memory and written in one transaction when
+    max_pending accesses have accumulated, when the oldest pending access
+    is flush_interval seconds old (checked on the next access), on
+    MemoryStore.close() and at interpreter exit. A crash loses at most
+    max_pending - 1 increments.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 64):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._counts: dict[int, int] = {}
+        self._last_accessed: dict[int, str] = {}
+        self._total = 0
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, memory_id: int) -> int:
+        """Count one access. Returns the unflushed accesses for memory_id."""
+        with self._lock:
+            count = self._counts.get(memory_id, 0) + 1
+            self._counts[memory_id] = count
+            self._last_accessed[memory_id] = datetime.now().isoformat()
+            self._total += 1
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            return count
+
+    def pending(self, memory_id: int) -> int:
+        """Unflushed accesses for memory_id."""
+        with self._lock:
+            return self._counts.get(memory_id, 0)
+
+    def discard(self, memory_id: int) -> None:
+        """Forget pending accesses of a deleted memory."""
+        with self._lock:
+            self._total -= self._counts.pop(memory_id, 0)
+            self._last_accessed.pop(memory_id, None)
+
+    @property
+    def due(self) -> bool:
+        """True when the threshold or the interval has been reached."""
+        with self._lock:
+            if self._oldest is None:
+                return False
+            return (
+                self._total >= self.max_pending
+                or time.monotonic() - self._oldest >= self.flush_interval
+            )
+
+    def flush(self, conn: sqlite3.Connection) -> int:
+        """Apply pending increments in one transaction. Returns rows updated."""
+        with self._lock:
+            if not self._counts:
+                return 0
+            updates = [
+                (count, self._last_accessed[memory_id], memory_id)
+                for memory_id, count in self._counts.items()
+            ]
+            self._counts = {}
+            self._last_accessed = {}
+            self._total = 0
+            self._oldest = None
+
+        try:
+            conn.executemany(
+                """
+                UPDATE semantic_memory
+                SET access_count = access_count + ?, last_accessed = ?
+                WHERE id = ?
+                """,
+                updates,
+            )
+            conn.commit()
+        except sqlite3.Error:
+            # Keep the increments for the next flush
+            with self._lock:
+                for count, last_accessed, memory_id in updates:
+                    self._counts[memory_id] = self._counts.get(memory_id, 0) + count
+                    self._last_accessed.setdefault(memory_id, last_accessed)
+                    self._total += count
+                if self._oldest is None:
+                    self._oldest = time.monotonic()
+            raise
+        return len(updates)
+
+
+# Stores with possibly unflushed access counts, flushed at interpreter exit
+_open_stores: "weakref.WeakSet[MemoryStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_stores() -> None:
+    for store in list(_open_stores):
+        try:
+            store.flush_access_counts()
+        except sqlite3.Error:
+            pass
+
+
 class MemoryStore:
     """
     SQLite-based memory store with vector and full-text search.
@@ -51,16 +275,27 @@ class MemoryStore:
         # Add a memory (auto-generates embedding if not provided)
         store.add_memory("User prefers morning workouts", importance=0.8)
 
+        # Bulk import (batched embedding + one transaction per batch)
+        report = store.add_memories_bulk(lines, batch_size=500)
+        print(report.ids[:3], report.rows_per_sec)
+
         # Search memories
         results = store.search_hybrid("workout preferences", limit=5)
     """
 
-    def __init__(self, db_path: str | Path | None = None):
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        access_tracker: Optional[AccessTracker] = None,
+    ):
         if db_path is None:
             db_path = Path.home() / ".atlas" / "atlas.db"
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: Optional[sqlite3.Connection] = None
+        self._embedding_cache = None
+        self.access_tracker = access_tracker or AccessTracker()
+        _open_stores.add(self)
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -89,10 +324,138 @@ class MemoryStore:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
+        had_decay = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_decay'"
+        ).fetchone() is not None
+
+        # Older databases re-index FTS on every UPDATE (including access
+        # counts); the schema recreates the trigger as UPDATE OF content
+        fts_update = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'semantic_memory_au'"
+        ).fetchone()
+        if fts_update is not None and "UPDATE OF content" not in fts_update[0]:
+            self.conn.execute("DROP TRIGGER semantic_memory_au")
+
         schema = schema_path.read_text()
         self.conn.executescript(schema)
+
+        if not had_decay:
+            # Databases created before memory_decay: seed it once from the
+            # columns the triggers would have tracked
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO memory_decay (memory_id, touched_at, frequency)
+                SELECT
+                    id,
+                    CAST(strftime('%s', COALESCE(last_accessed, created_at, 'now')) AS INTEGER),
+                    COALESCE(access_count, 0) / (COALESCE(access_count, 0) + 4.0)
+                FROM semantic_memory
+                """
+            )
         self.conn.commit()
 
+    @property
+    def embedding_cache(self):
+        """Persistent embedding cache in this database (created on first use)."""
+        if self._embedding_cache is None:
+            from .embeddings import EmbeddingCache, get_embedding_service
+            cache = EmbeddingCache(self.conn, model_name=get_embedding_service().model_name)
+            cache.init()
+            self._embedding_cache = cache
+        return self._embedding_cache
+
+    def embed_content(self, content: str) -> list[float]:
+        """
+        Embed memory content, checking the persistent cache first.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed (cache miss)
+        """
+        embedding = self.embedding_cache.get(content)
+        if embedding is None:
+            from .embeddings import get_embedding_service
+            embedding = get_embedding_service().embed(content)
+            self.embedding_cache.put(content, embedding)
+        return embedding
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a search query (with the model's retrieval prefix), cache first."""
+        from .embeddings import get_embedding_service
+        return self.embed_content(f"{get_embedding_service().query_instruction}{query}")
+
+    def _embed_many_cached(self, texts: list[str]) -> tuple[list[list[float]], int]:
+        """Embed texts through the persistent cache. Returns (embeddings, newly_embedded)."""
+        from .embeddings import get_embedding_service
+
+        cache = self.embedding_cache
+        embeddings = cache.get_many(texts)
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing:
+            fresh = get_embedding_service().embed_many([texts[i] for i in missing])
+            cache.put_many([(texts[i], e) for i, e in zip(missing, fresh)])
+            for i, embedding in zip(missing, fresh):
+                embeddings[i] = embedding
+        return embeddings, len(missing)
+
+    def warm_embeddings(
+        self,
+        batch_size: int = 256,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """
+        Embed every memory missing from the embedding cache, in batches.
+
+        Memories without a vec_semantic row (added while embeddings were
+        unavailable) are indexed on the way.
+
+        Args:
+            batch_size: Memories per encode() call
+            progress: Optional callback(done, total) after each batch
+
+        Returns:
+            Report with scanned, cached, embedded, indexed counts and duration_ms
+        """
+        start = time.perf_counter()
+        total = self.conn.execute("SELECT COUNT(*) FROM semantic_memory").fetchone()[0]
+        indexed_ids: set[int] = set()
+        if SQLITE_VEC_AVAILABLE:
+            indexed_ids = {row[0] for row in self.conn.execute("SELECT memory_id FROM vec_semantic")}
+
+        report = {"scanned": 0, "cached": 0, "embedded": 0, "indexed": 0}
+        last_id = 0
+        while True:
+            rows = self.conn.execute(
+                "SELECT id, content FROM semantic_memory WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            embeddings, embedded = self._embed_many_cached([row["content"] for row in rows])
+
+            if SQLITE_VEC_AVAILABLE:
+                unindexed = [
+                    (row["id"], sqlite_vec.serialize_float32(embedding))
+                    for row, embedding in zip(rows, embeddings)
+                    if row["id"] not in indexed_ids
+                ]
+                if unindexed:
+                    self.conn.executemany(
+                        "INSERT INTO vec_semantic (memory_id, embedding) VALUES (?, ?)",
+                        unindexed,
+                    )
+                    self.conn.commit()
+                report["indexed"] += len(unindexed)
+
+            report["scanned"] += len(rows)
+            report["embedded"] += embedded
+            report["cached"] += len(rows) - embedded
+            if progress is not None:
+                progress(report["scanned"], total)
+
+        report["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return report
+
     def add_memory(
         self,
         content: str,
@@ -117,8 +480,7 @@ class MemoryStore:
         # Auto-generate embedding if not provided and sqlite-vec is available
         if embedding is None and SQLITE_VEC_AVAILABLE:
             try:
-                from .embeddings import get_embedder
-                embedding = get_embedder().embed(content).embedding
+                embedding = self.embed_content(content)
             except ImportError:
                 pass  # Graceful degradation if embeddings not available
 
@@ -141,6 +503,128 @@ class MemoryStore:
         self.conn.commit()
         return memory_id
 
+    def add_memories_bulk(
+        self,
+        memories: Iterable[str | dict],
+        batch_size: int = 500,
+    ) -> BulkIngestReport:
+        """
+        Add many memories with per-batch embedding and writes.
+
+        The input is consumed lazily, batch_size items at a time. Each batch
+        is embedded in one call (through the persistent cache) and written
+        in one transaction with executemany. The FTS insert trigger is
+        dropped for the duration of the transaction and fts_memory is filled
+        with a single INSERT ... SELECT instead; the trigger is restored
+        before commit, so other connections never see it missing.
+
+        Args:
+            memories: Content strings, or dicts with content and optional
+                importance, memory_type, source and embedding keys
+            batch_size: Memories per embedding call and transaction
+
+        Returns:
+            BulkIngestReport with IDs in input order and throughput
+        """
+        start = time.perf_counter()
+        report = BulkIngestReport()
+
+        for batch in _batched(memories, batch_size):
+            rows = [
+                {"content": m} if isinstance(m, str) else dict(m)
+                for m in batch
+            ]
+
+            pending = [r for r in rows if r.get("embedding") is None]
+            if pending and SQLITE_VEC_AVAILABLE:
+                embed_start = time.perf_counter()
+                try:
+                    embeddings, embedded = self._embed_many_cached([r["content"] for r in pending])
+                except ImportError:
+                    pass  # Graceful degradation if embeddings not available
+                else:
+                    for row, embedding in zip(pending, embeddings):
+                        row["embedding"] = embedding
+                    report.embedded += embedded
+                report.embed_ms += (time.perf_counter() - embed_start) * 1000
+
+            write_start = time.perf_counter()
+            report.ids.extend(self._write_batch(rows))
+            report.write_ms += (time.perf_counter() - write_start) * 1000
+            report.batches += 1
+
+        report.duration_ms = (time.perf_counter() - start) * 1000
+        return report
+
+    def _write_batch(self, rows: list[dict]) -> list[int]:
+        """Insert one batch in a single transaction. Returns the new IDs."""
+        conn = self.conn
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            trigger = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'semantic_memory_ai'"
+            ).fetchone()
+            if trigger is not None:
+                conn.execute("DROP TRIGGER semantic_memory_ai")
+
+            # IDs are assigned explicitly (AUTOINCREMENT rules: past both the
+            # largest live id and the largest ever used), so they are known
+            # without a round trip per row. The write lock makes this safe.
+            last_id = conn.execute(
+                """
+                SELECT MAX(
+                    COALESCE((SELECT MAX(id) FROM semantic_memory), 0),
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'semantic_memory'), 0)
+                )
+                """
+            ).fetchone()[0]
+            ids = list(range(last_id + 1, last_id + 1 + len(rows)))
+
+            conn.executemany(
+                """
+                INSERT INTO semantic_memory (id, content, importance, memory_type, source)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        memory_id,
+                        row["content"],
+                        row.get("importance", 0.5),
+                        row.get("memory_type", "general"),
+                        row.get("source"),
+                    )
+                    for memory_id, row in zip(ids, rows)
+                ],
+            )
+
+            if SQLITE_VEC_AVAILABLE:
+                conn.executemany(
+                    "INSERT INTO vec_semantic (memory_id, embedding) VALUES (?, ?)",
+                    [
+                        (memory_id, sqlite_vec.serialize_float32(row["embedding"]))
+                        for memory_id, row in zip(ids, rows)
+                        if row.get("embedding") is not None
+                    ],
+                )
+
+            if trigger is not None:
+                conn.execute(
+                    """
+                    INSERT INTO fts_memory (rowid, content)
+                    SELECT id, content FROM semantic_memory WHERE id BETWEEN ? AND ?
+                    """,
+                    (ids[0], ids[-1]),
+                )
+                conn.execute(trigger[0])
+
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return ids
+
     def search_fts(self, query: str, limit: int = 10) -> list[SearchResult]:
         """Search memories using FTS5 full-text search."""
         cursor = self.conn.execute(
@@ -152,7 +636,7 @@ class MemoryStore:
             FROM fts_memory
             JOIN semantic_memory m ON fts_memory.rowid = m.id
             WHERE fts_memory MATCH ?
-            ORDER BY score
+            ORDER BY score, m.id
             LIMIT ?
             """,
             (query, limit),
@@ -235,8 +719,8 @@ class MemoryStore:
                 match_type="vector",
             ))
 
-        # Sort by score (similarity) descending to preserve ranking
-        results.sort(key=lambda r: r.score, reverse=True)
+        # Sort by score (similarity) descending to preserve ranking, ties by id
+        results.sort(key=lambda r: (-r.score, r.memory.id))
         return results
 
     def search_hybrid(
@@ -245,11 +729,161 @@ class MemoryStore:
         embedding: Optional[list[float]] = None,
         limit: int = 10,
         vector_weight: float = 0.6,
+        memory_type: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        created_after: Optional[datetime | date | str] = None,
+        created_before: Optional[datetime | date | str] = None,
+        salience: bool | SalienceWeights = False,
     ) -> list[SearchResult]:
         """
         Hybrid search using RRF (Reciprocal Rank Fusion).
 
         Combines vector similarity (60%) and FTS (40%) by default.
+        Pass embedding=store.embed_query(query) to reuse cached query vectors.
+
+        FTS ranking, KNN ranking and fusion run as one SQL statement; only
+        the final `limit` rows are loaded into Memory objects. Without
+        filters the ranking matches the two-query path (_search_hybrid_python).
+
+        With salience, the top fused candidates are re-scored with importance,
+        recency of last write/access and access frequency. The decay inputs
+        come from the trigger-maintained memory_decay table, so the extra
+        cost is one joined row per candidate.
+
+        Args:
+            query: FTS5 query
+            embedding: Query embedding (FTS only if None)
+            limit: Maximum results
+            vector_weight: RRF weight of the vector ranking (FTS gets the rest)
+            memory_type: Only memories of this type
+            min_importance: Only memories with importance >= this
+            created_after: Only memories created at or after this time
+            created_before: Only memories created before this time
+            salience: True (default weights) or SalienceWeights to rank by
+                the blended salience score instead of plain RRF
+
+        Returns:
+            Results ordered by fused (or salience) score
+        """
+        if salience is True:
+            salience = SalienceWeights()
+        candidates = limit * 2
+        filters, filter_params = _memory_filters(
+            memory_type, min_importance, created_after, created_before
+        )
+        params: dict[str, Any] = {
+            "query": query,
+            "candidates": candidates,
+            "limit": limit * _SALIENCE_POOL if salience else limit,
+            "fts_weight": 1.0 - vector_weight,
+            "vec_weight": float(vector_weight),
+            **filter_params,
+        }
+
+        if embedding is not None and SQLITE_VEC_AVAILABLE:
+            # vec_semantic has no metadata columns, so filtered searches
+            # over-fetch neighbours and filter them after the KNN
+            params["embedding"] = sqlite_vec.serialize_float32(embedding)
+            params["k"] = min(candidates * _FILTER_OVERFETCH, _MAX_KNN) if filters else candidates
+            vec_cte = f"""
+                vec AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY similarity DESC, id) AS rank
+                    FROM (
+                        SELECT m.id AS id, 1.0 - knn.distance AS similarity
+                        FROM (
+                            SELECT memory_id, distance FROM vec_semantic
+                            WHERE embedding MATCH :embedding AND k = :k
+                        ) knn
+                        JOIN semantic_memory m ON m.id = knn.memory_id
+                        WHERE 1 = 1 {filters}
+                        ORDER BY similarity DESC, m.id
+                        LIMIT :candidates
+                    )
+                )"""
+        else:
+            vec_cte = "vec AS (SELECT NULL AS id, NULL AS rank WHERE 0)"
+
+        cursor = self.conn.execute(
+            f"""
+            WITH
+                fts AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY score, id) AS rank
+                    FROM (
+                        SELECT m.id AS id, bm25(fts_memory) AS score
+                        FROM fts_memory
+                        JOIN semantic_memory m ON m.id = fts_memory.rowid
+                        WHERE fts_memory MATCH :query {filters}
+                        ORDER BY score, m.id
+                        LIMIT :candidates
+                    )
+                ),
+                {vec_cte},
+                fused AS (
+                    SELECT
+                        id,
+                        MAX(fts_rank) AS fts_rank,
+                        COALESCE(:fts_weight / (60 + MAX(fts_rank)), 0)
+                            + COALESCE(:vec_weight / (60 + MAX(vec_rank)), 0) AS score,
+                        -- Python fusion tie order: FTS hits by FTS rank, then vector-only hits
+                        COALESCE(MAX(fts_rank), :candidates + MAX(vec_rank)) AS tiebreak
+                    FROM (
+                        SELECT id, rank AS fts_rank, NULL AS vec_rank FROM fts
+                        UNION ALL
+                        SELECT id, NULL, rank FROM vec
+                    )
+                    GROUP BY id
+                ),
+                top AS (
+                    SELECT id, score, tiebreak FROM fused
+                    ORDER BY score DESC, tiebreak
+                    LIMIT :limit
+                )
+            SELECT
+                m.id, m.content, m.importance, m.memory_type,
+                m.source, m.created_at, m.access_count, top.score,
+                d.touched_at, d.frequency
+            FROM top
+            JOIN semantic_memory m ON m.id = top.id
+            LEFT JOIN memory_decay d ON d.memory_id = top.id
+            ORDER BY top.score DESC, top.tiebreak
+            """,
+            params,
+        )
+
+        now = time.time()
+        results = []
+        for row in cursor.fetchall():
+            memory = Memory(
+                id=row["id"],
+                content=row["content"],
+                importance=row["importance"],
+                memory_type=row["memory_type"],
+                source=row["source"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                access_count=row["access_count"],
+            )
+            score = row["score"]
+            if salience:
+                score = _salience_score(salience, row, memory, now)
+            results.append(SearchResult(memory=memory, score=score, match_type="hybrid"))
+
+        if salience:
+            # Stable sort keeps RRF order among equal salience scores
+            results.sort(key=lambda r: -r.score)
+            del results[limit:]
+        return results
+
+    def _search_hybrid_python(
+        self,
+        query: str,
+        embedding: Optional[list[float]] = None,
+        limit: int = 10,
+        vector_weight: float = 0.6,
+    ) -> list[SearchResult]:
+        """
+        Reference hybrid search: FTS and vector queries fused in Python.
+
+        Kept for benchmarks and equivalence tests of search_hybrid.
         """
         fts_results = self.search_fts(query, limit=limit * 2)
 
@@ -290,7 +924,12 @@ class MemoryStore:
         return results
 
     def get_memory(self, memory_id: int) -> Optional[Memory]:
-        """Get a specific memory by ID."""
+        """
+        Get a specific memory by ID.
+
+        The access is counted by access_tracker and written later in a
+        batch; the returned access_count already includes it.
+        """
         cursor = self.conn.execute(
             """
             SELECT id, content, importance, memory_type, source, created_at, access_count
@@ -304,12 +943,9 @@ class MemoryStore:
         if row is None:
             return None
 
-        # Update access count
-        self.conn.execute(
-            "UPDATE semantic_memory SET access_count = access_count + 1, last_accessed = ? WHERE id = ?",
-            (datetime.now().isoformat(), memory_id),
-        )
-        self.conn.commit()
+        pending = self.access_tracker.record(memory_id)
+        if self.access_tracker.due:
+            self.flush_access_counts()
 
         return Memory(
             id=row["id"],
@@ -318,11 +954,19 @@ class MemoryStore:
             memory_type=row["memory_type"],
             source=row["source"],
             created_at=datetime.fromisoformat(row["created_at"]),
-            access_count=row["access_count"] + 1,
+            access_count=row["access_count"] + pending,
         )
 
+    def flush_access_counts(self) -> int:
+        """Write pending get_memory access counts now. Returns rows updated."""
+        if self._conn is None:
+            return 0
+        return self.access_tracker.flush(self._conn)
+
     def delete_memory(self, memory_id: int) -> bool:
         """Delete a memory by ID."""
+        self.access_tracker.discard(memory_id)
+
         # Delete from vector table first
         if SQLITE_VEC_AVAILABLE:
             self.conn.execute("DELETE FROM vec_semantic WHERE memory_id = ?", (memory_id,))
@@ -410,10 +1054,12 @@ class MemoryStore:
         return cursor.rowcount
 
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending access counts and close the database connection."""
         if self._conn is not None:
+            self.flush_access_counts()
             self._conn.close()
             self._conn = None
+            self._embedding_cache = None
 
     def __enter__(self):
         return self
@@ -41,6 +41,14 @@ Usage:
 
     if not result.passed:
         print(f"Hook blocked: {result.issues}")
+
+    # In-process, concurrent QC (stdin hooks that are atlas modules are
+    # called via run_hook() instead of spawning an interpreter each)
+    runner = HookRunner(execution=HookExecution.IN_PROCESS, max_concurrency=4)
+    results = await runner.run_all_for_timing(
+        "babybrains_content", HookTiming.POST_EXECUTION, input_data={...}
+    )
+    print([(r.hook_name, r.duration_ms) for r in results])  # Per-hook wall time
 """
 
 from dataclasses import dataclass, field
@@ -48,9 +56,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Any
 import asyncio
+import importlib
 import json
 import logging
 import subprocess
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +71,12 @@ class HookTiming(Enum):
     POST_EXECUTION = "post"  # After skill completes (validate outputs)
 
 
+class HookExecution(Enum):
+    """How hook commands are executed."""
+    SUBPROCESS = "subprocess"  # Spawn the configured command (default)
+    IN_PROCESS = "in_process"  # Call run_hook() of `python -m atlas.*` stdin hooks directly
+
+
 @dataclass
 class HookIssue:
     """Single issue from a hook."""
@@ -79,6 +95,7 @@ class HookResult:
     raw_output: str = ""
     exit_code: int = 0
     hook_name: str = ""  # Which hook produced this result
+    duration_ms: float = 0.0  # Wall time of this hook
 
     @property
     def blocking_issues(self) -> list[HookIssue]:
@@ -99,6 +116,13 @@ class HookRunner:
     - Accepts input via stdin (JSON) or file argument
     - Returns exit code 0 for pass, non-zero for fail
     - Outputs structured result (JSON preferred)
+
+    With HookExecution.IN_PROCESS, stdin hooks whose command is
+    `python -m atlas.<module>` are run by calling the module's
+    run_hook(input_json) in a worker thread instead (same JSON in/out,
+    no interpreter startup or atlas imports per hook). Other hooks still
+    spawn their command. max_concurrency > 1 lets run_all_for_timing run
+    hooks concurrently.
     """
 
     # Hook definitions: repo -> hook_name -> config
@@ -317,9 +341,21 @@ class HookRunner:
         },
     }
 
-    def __init__(self):
-        """Initialize the hook runner."""
-        pass
+    def __init__(
+        self,
+        execution: HookExecution = HookExecution.SUBPROCESS,
+        max_concurrency: int = 1,
+    ):
+        """
+        Initialize the hook runner.
+
+        Args:
+            execution: SUBPROCESS (spawn every hook) or IN_PROCESS
+            max_concurrency: Hooks run at once by run_all_for_timing (1 = sequential)
+        """
+        self.execution = execution
+        self.max_concurrency = max(1, max_concurrency)
+        self._modules: dict[str, Any] = {}
 
     def get_available_hooks(self, repo: str) -> list[str]:
         """Get list of available hooks for a repo."""
@@ -396,15 +432,23 @@ class HookRunner:
             Empty list if no hooks match the timing.
 
         Behavior:
-            - Hooks run sequentially in definition order
+            - Hooks run sequentially in definition order (max_concurrency=1),
+              or up to max_concurrency at once
             - Each result includes hook_name for identification
             - If stop_on_block=True and a blocking hook fails, remaining hooks are skipped
             - Each hook uses its configured timeout unless overridden
 
+        Concurrent runs return the same list as a sequential run: results
+        are collected in definition order and, with stop_on_block, end at
+        the first blocking failure (hooks after it are cancelled).
+
         Note:
             Hooks with input_mode="args" require individual run() calls with cli_args.
         """
         hook_names = self.get_hooks_by_timing(repo, timing)
+        if self.max_concurrency > 1 and len(hook_names) > 1:
+            return await self._run_concurrently(repo, hook_names, input_data, stop_on_block, timeout)
+
         results = []
 
         for hook_name in hook_names:
@@ -418,6 +462,35 @@ class HookRunner:
 
         return results
 
+    async def _run_concurrently(
+        self,
+        repo: str,
+        hook_names: list[str],
+        input_data: Optional[dict],
+        stop_on_block: bool,
+        timeout: Optional[int],
+    ) -> list[HookResult]:
+        """run_all_for_timing with up to max_concurrency hooks in flight."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(hook_name: str) -> HookResult:
+            async with semaphore:
+                return await self.run(repo, hook_name, input_data=input_data, timeout=timeout)
+
+        tasks = [asyncio.create_task(run_one(hook_name)) for hook_name in hook_names]
+        results = []
+        try:
+            for task in tasks:
+                result = await task
+                results.append(result)
+                if stop_on_block and result.blocking and not result.passed:
+                    break
+        finally:
+            for task in tasks[len(results):]:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
     async def run(
         self,
         repo: str,
@@ -472,6 +545,106 @@ class HookRunner:
             # Append CLI arguments to command
             cmd.extend(cli_args)
 
+        started = time.perf_counter()
+        module = self._in_process_module(hook_config)
+        if module is not None:
+            outcome = await self._run_in_process(
+                repo, hook_name, module, stdin_data, effective_timeout, blocking
+            )
+        else:
+            outcome = await self._run_subprocess(
+                repo, hook_name, cmd, cwd, stdin_data, effective_timeout, blocking
+            )
+
+        if isinstance(outcome, HookResult):
+            hook_result = outcome
+        elif output_format == "json":
+            hook_result = self._parse_json_result(outcome, hook_config)
+        else:
+            hook_result = self._parse_text_result(outcome, hook_config)
+        hook_result.hook_name = hook_name  # ONE place, can't miss
+        hook_result.duration_ms = (time.perf_counter() - started) * 1000
+        return hook_result
+
+    def _in_process_module(self, config: dict) -> Optional[Any]:
+        """
+        Hook module to call in process, or None to spawn the command.
+
+        Only stdin hooks run as `python -m atlas.<module>` whose module
+        defines run_hook(input_json) -> dict qualify.
+        """
+        if self.execution != HookExecution.IN_PROCESS or config["input_mode"] != "stdin":
+            return None
+        cmd = config["cmd"]
+        if not (len(cmd) == 3 and cmd[0].startswith("python") and cmd[1] == "-m"
+                and cmd[2].startswith("atlas.")):
+            return None
+
+        name = cmd[2]
+        if name not in self._modules:
+            try:
+                module = importlib.import_module(name)
+            except Exception as e:
+                logger.warning(f"Cannot load hook module {name} in process, spawning instead: {e}")
+                module = None
+            self._modules[name] = module if callable(getattr(module, "run_hook", None)) else None
+        return self._modules[name]
+
+    async def _run_in_process(
+        self,
+        repo: str,
+        hook_name: str,
+        module: Any,
+        stdin_data: Optional[str],
+        effective_timeout: int,
+        blocking: bool,
+    ) -> "subprocess.CompletedProcess | HookResult":
+        """
+        Call module.run_hook() in a worker thread.
+
+        Returns the JSON line the module's main() would print, as a
+        CompletedProcess (exit code 0 if pass), or a HookResult on
+        timeout/error. A timed-out hook's thread is left to finish.
+        """
+        def _run_hook():
+            output = module.run_hook(stdin_data or "")
+            return subprocess.CompletedProcess(
+                args=[module.__name__], returncode=0 if output.get("pass") else 1,
+                stdout=json.dumps(output) + "\n", stderr="",  # As main() prints it
+            )
+
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(_run_hook), timeout=effective_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Hook {repo}/{hook_name} timed out after {effective_timeout}s (in process)")
+            return HookResult(
+                passed=False,
+                blocking=blocking,
+                message=f"Hook timed out after {effective_timeout}s",
+                issues=[HookIssue(code="TIMEOUT", message="Hook execution timed out")],
+                hook_name=hook_name,
+            )
+        except Exception as e:
+            logger.exception(f"Unexpected error in hook {repo}/{hook_name} (in process)")
+            return HookResult(
+                passed=False,
+                blocking=blocking,
+                message=f"Hook execution failed: {e}",
+                issues=[HookIssue(code="EXECUTION_ERROR", message=str(e))],
+                hook_name=hook_name,
+            )
+
+    async def _run_subprocess(
+        self,
+        repo: str,
+        hook_name: str,
+        cmd: list[str],
+        cwd: str,
+        stdin_data: Optional[str],
+        effective_timeout: int,
+        blocking: bool,
+    ) -> "subprocess.CompletedProcess | HookResult":
+        """Spawn the hook command; HookResult on timeout/error."""
         # Run the command with proper process cleanup on timeout
         # D109: Use Popen + proc.kill() instead of subprocess.run() to prevent
         # orphan processes when asyncio.wait_for cancels the thread.
@@ -493,7 +666,7 @@ class HookRunner:
                     stdout=stdout, stderr=stderr,
                 )
 
-            result = await asyncio.wait_for(
+            return await asyncio.wait_for(
                 asyncio.to_thread(_run_hook),
                 timeout=effective_timeout + 5,  # Grace margin for thread cleanup
             )
@@ -541,14 +714,6 @@ class HookRunner:
                 except Exception:
                     pass
 
-        # Parse output and set hook_name
-        if output_format == "json":
-            hook_result = self._parse_json_result(result, hook_config)
-        else:
-            hook_result = self._parse_text_result(result, hook_config)
-        hook_result.hook_name = hook_name  # ONE place, can't miss
-        return hook_result
-
     def _parse_json_result(self, result: subprocess.CompletedProcess, config: dict) -> HookResult:
         """Parse JSON output from hook."""
         try:
@@ -676,6 +841,9 @@ Examples:
   python -m atlas.orchestrator.hooks babybrains --timing post
   python -m atlas.orchestrator.hooks babybrains --timing pre
 
+  # In process, 4 hooks at a time
+  python -m atlas.orchestrator.hooks babybrains_content --timing post --input brief.json --in-process --jobs 4
+
   # List available hooks
   python -m atlas.orchestrator.hooks babybrains --list
   python -m atlas.orchestrator.hooks babybrains --list --timing pre
@@ -689,6 +857,10 @@ Examples:
                             help="Input JSON file")
         parser.add_argument("--list", action="store_true", dest="list_hooks",
                             help="List available hooks")
+        parser.add_argument("--in-process", action="store_true",
+                            help="Call atlas stdin hooks in process instead of spawning them")
+        parser.add_argument("--jobs", type=int, default=1,
+                            help="Hooks to run concurrently with --timing (default: 1)")
 
         args = parser.parse_args()
 
@@ -700,7 +872,10 @@ Examples:
             print("Error: Cannot specify both hook_name and --list", file=sys.stderr)
             sys.exit(1)
 
-        runner = HookRunner()
+        runner = HookRunner(
+            execution=HookExecution.IN_PROCESS if args.in_process else HookExecution.SUBPROCESS,
+            max_concurrency=args.jobs,
+        )
 
         # Load input data if provided
         input_data = None
@@ -727,7 +902,7 @@ Examples:
 
             all_passed = True
             for result in results:
-                print(f"\n--- {result.hook_name} ---")
+                print(f"\n--- {result.hook_name} ({result.duration_ms:.0f}ms) ---")
                 print_result(result)
                 if not result.passed:
                     all_passed = False
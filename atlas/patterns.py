@@ -0,0 +1,198 @@
+"""
+ATLAS Pattern Matcher
+
+Answers "which labels match this text?" in one call, replacing loops of
+separately checked regexes and substrings (router reflexes, voice intent
+predicates).
+
+Two compiled stages:
+- Literal phrases (contains/prefix/exact) from every label go into one
+  trie-shaped regex, scanned once with a lookahead at each position. At a
+  given position the trie reports the longest phrase; every shorter
+  phrase matching there is a prefix of it, so each phrase carries the
+  labels of all its prefixes. One scan therefore finds every phrase
+  label, overlapping ones included ("stop timer" is both a pause command
+  and a stop phrase).
+- Regex labels are compiled once as a single alternation per label.
+  (Chaining them into one lookahead regex was measured slower: it loses
+  re.search's literal-prefix skipping.)
+
+Match kinds:
+- search:   regex anywhere in the text (re.search)
+- contains: literal substring anywhere (p in text)
+- prefix:   literal at the start (text.startswith(p))
+- exact:    the whole text equals one of the literals
+
+Text is lowercased and stripped before matching, so patterns are written
+in lowercase (as the router and intent predicates already were).
+
+Usage:
+    from atlas.patterns import PatternMatcher
+
+    matcher = PatternMatcher()
+    matcher.add("safety", [r"(symptom|medication|drug|dosage)"])
+    matcher.add("meal", ["log meal", "just ate"], kind="prefix")
+    labels = matcher.match("Log meal: eggs")  # frozenset({"meal"})
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Iterable
+
+KINDS = ("search", "contains", "prefix", "exact")
+
+
+def trie_regex(phrases: Iterable[str]) -> str:
+    """
+    Regex source matching any of phrases, shaped as a trie.
+
+    Alternatives at each node start with distinct characters and optional
+    tails are greedy, so the regex matches the longest phrase at a position.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+@dataclass(frozen=True)
+class _Compiled:
+    """Compiled form of a matcher's rules."""
+    phrases: re.Pattern | None  # trie scan over all literal phrases
+    anywhere: dict[str, frozenset[str]]  # longest phrase -> contains labels
+    at_start: dict[str, frozenset[str]]  # longest phrase at 0 -> prefix labels
+    exact: dict[str, frozenset[str]]  # whole text -> exact labels
+    regexes: tuple[tuple[str, re.Pattern], ...]  # (label, alternation)
+
+
+class PatternMatcher:
+    """Labelled patterns compiled for single-call matching."""
+
+    def __init__(self):
+        self._rules: dict[str, tuple[str, tuple[str, ...]]] = {}
+        self._compiled: _Compiled | None = None
+        self._lock = threading.Lock()
+        # Last (text, labels): the router and the intent dispatcher look
+        # at the same utterance, so the second caller gets it for free
+        self._last: tuple[str, frozenset[str]] | None = None
+
+    def add(self, label: str, patterns: Iterable[str], kind: str = "search") -> None:
+        """
+        Add (or replace) a label.
+
+        Args:
+            label: Name reported by match()
+            patterns: Regexes (kind="search") or literal phrases
+            kind: "search", "contains", "prefix" or "exact"
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown match kind {kind!r} (expected one of {KINDS})")
+        with self._lock:
+            self._rules[label] = (kind, tuple(patterns))
+            self._compiled = None
+            self._last = None
+
+    def copy(self) -> "PatternMatcher":
+        """A new matcher with the same labels (extend it without touching this one)."""
+        other = PatternMatcher()
+        other._rules = dict(self._rules)
+        return other
+
+    @property
+    def labels(self) -> list[str]:
+        """All labels, in the order they were added."""
+        return list(self._rules)
+
+    def rule(self, label: str) -> tuple[str, tuple[str, ...]]:
+        """(kind, patterns) registered for a label."""
+        return self._rules[label]
+
+    def compile(self) -> _Compiled:
+        """Build (or return) the compiled matcher."""
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = self._build()
+            return self._compiled
+
+    def _build(self) -> _Compiled:
+        contains: dict[str, set[str]] = {}
+        prefix: dict[str, set[str]] = {}
+        exact: dict[str, set[str]] = {}
+        regexes = []
+        for label, (kind, patterns) in self._rules.items():
+            if not patterns:
+                continue
+            if kind == "search":
+                regexes.append((label, re.compile("|".join(f"(?:{p})" for p in patterns))))
+                continue
+            target = {"contains": contains, "prefix": prefix, "exact": exact}[kind]
+            for phrase in patterns:
+                if phrase:
+                    target.setdefault(phrase, set()).add(label)
+
+        # Each scanned phrase also carries the labels of its prefixes
+        scanned = set(contains) | set(prefix)
+        anywhere = {}
+        at_start = {}
+        for phrase in scanned:
+            anywhere[phrase] = frozenset().union(*(labels for p, labels in contains.items() if phrase.startswith(p)))
+            at_start[phrase] = frozenset().union(*(labels for p, labels in prefix.items() if phrase.startswith(p)))
+
+        return _Compiled(
+            phrases=re.compile(f"(?=({trie_regex(scanned)}))") if scanned else None,
+            anywhere=anywhere,
+            at_start=at_start,
+            exact={phrase: frozenset(labels) for phrase, labels in exact.items()},
+            regexes=tuple(regexes),
+        )
+
+    def match(self, text: str) -> frozenset[str]:
+        """
+        Every label whose patterns match text.
+
+        Args:
+            text: Raw text (lowercased and stripped here)
+
+        Returns:
+            Set of matching labels
+        """
+        last = self._last
+        if last is not None and last[0] == text:
+            return last[1]
+
+        compiled = self._compiled or self.compile()
+        text_lower = text.lower().strip()
+        labels = set(compiled.exact.get(text_lower, ()))
+        if compiled.phrases is not None:
+            for m in compiled.phrases.finditer(text_lower):
+                phrase = m.group(1)
+                labels.update(compiled.anywhere[phrase])
+                if m.start() == 0:
+                    labels.update(compiled.at_start[phrase])
+        for label, regex in compiled.regexes:
+            if regex.search(text_lower):
+                labels.add(label)
+
+        result = frozenset(labels)
+        self._last = (text, result)
+        return result
+
+    def first(self, text: str, labels: Iterable[str]) -> str | None:
+        """The first of labels (in the given order) that matches text."""
+        hits = self.match(text)
+        for label in labels:
+            if label in hits:
+                return label
+        return None
@@ -23,9 +23,13 @@ Usage:
 
     # Batch mode (use only after skills reliably produce Grade A)
     python -m atlas.pipelines.activity_conversion --batch --limit 10
+
+    # Concurrent batch: 4 activities in flight, at most 4 skill subprocesses
+    python -m atlas.pipelines.activity_conversion --batch --auto-approve --workers 4
 """
 
 import asyncio
+import copy
 import fcntl
 import json
 import logging
@@ -115,6 +119,119 @@ class BatchResult:
     results: list[ConversionResult] = field(default_factory=list)
 
 
+class RunState(Enum):
+    """State of one activity in a concurrent batch."""
+
+    QUEUED = "queued"              # Waiting for a worker (first attempt)
+    CONVERTING = "converting"      # Attempt running on a worker
+    REFLECTING = "reflecting"      # Building retry feedback from the failed attempt
+    RETRY_QUEUED = "retry_queued"  # Back of the queue, behind activities already waiting
+    FINISHED = "finished"          # Final result known, waiting for its turn to be recorded
+    RECORDED = "recorded"          # Progress written and counted in the BatchResult
+
+
+_RUN_TRANSITIONS: dict[RunState, set[RunState]] = {
+    RunState.QUEUED: {RunState.CONVERTING},
+    RunState.CONVERTING: {RunState.REFLECTING, RunState.FINISHED},
+    RunState.REFLECTING: {RunState.RETRY_QUEUED, RunState.FINISHED},
+    RunState.RETRY_QUEUED: {RunState.CONVERTING},
+    RunState.FINISHED: {RunState.RECORDED},
+    RunState.RECORDED: set(),
+}
+
+
+@dataclass
+class ActivityRun:
+    """
+    One activity moving through a concurrent batch.
+
+    A worker holds the run for a single attempt. Retries rejoin the back
+    of the queue, so one activity failing repeatedly cannot hold a worker
+    while others wait for their first attempt.
+    """
+
+    index: int
+    raw_id: str
+    max_retries: int
+    state: RunState = RunState.QUEUED
+    attempt: int = 0
+    feedback: Optional[str] = None
+    cached_transform: Optional[dict] = None
+    result: Optional[ConversionResult] = None
+    history: list[RunState] = field(default_factory=list)
+
+    def advance(self, state: RunState) -> None:
+        """Move to the next state, rejecting transitions the batch never makes."""
+        if state not in _RUN_TRANSITIONS[self.state]:
+            raise RuntimeError(
+                f"{self.raw_id}: invalid transition {self.state.value} -> {state.value}"
+            )
+        self.history.append(self.state)
+        self.state = state
+
+
+class SkillCallLimiter:
+    """
+    Global limit on skill subprocesses shared by all batch workers.
+
+    Every skill, sub-agent and hook call is a subprocess on the same
+    subscription. At most max_concurrent run at once (waiters are served
+    in FIFO order), and starts are spaced to stay under calls_per_minute.
+    """
+
+    def __init__(self, max_concurrent: int, calls_per_minute: Optional[float] = None):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._min_interval = 60.0 / calls_per_minute if calls_per_minute else 0.0
+        self._next_start = 0.0
+        self._start_lock = asyncio.Lock()
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __aenter__(self) -> "SkillCallLimiter":
+        await self._slots.acquire()
+        try:
+            if self._min_interval:
+                async with self._start_lock:
+                    now = time.monotonic()
+                    if self._next_start > now:
+                        await asyncio.sleep(self._next_start - now)
+                    self._next_start = max(now, self._next_start) + self._min_interval
+        except BaseException:
+            self._slots.release()
+            raise
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.active -= 1
+        self._slots.release()
+
+
+class _RateLimited:
+    """Executor proxy that runs the named async methods under a SkillCallLimiter."""
+
+    def __init__(self, target: Any, limiter: SkillCallLimiter, methods: tuple[str, ...]):
+        self._target = target
+        self._limiter = limiter
+        self._methods = methods
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name not in self._methods:
+            return attr
+
+        async def limited(*args, **kwargs):
+            async with self._limiter:
+                return await attr(*args, **kwargs)
+
+        return limited
+
+
 class ActivityConversionPipeline:
     """
     Orchestrates the conversion of raw activities to canonical format.
@@ -167,6 +284,17 @@ class ActivityConversionPipeline:
         "quality_audit": 900,  # 15 min - voice rubric grading
     }
 
+    # Concurrent batch (run_batch with workers > 1)
+    # Skill subprocesses allowed at once across all workers, and start rate
+    MAX_SKILL_SUBPROCESSES = 4
+    SKILL_CALLS_PER_MINUTE = 30
+    # Executor methods that spawn a subprocess, per pipeline attribute
+    RATE_LIMITED_CALLS = {
+        "skill_executor": ("execute",),
+        "sub_executor": ("spawn", "verify_adversarially"),
+        "hook_runner": ("run",),
+    }
+
     # Valid domains for activities
     # Includes both raw source domains and canonical output domains
     VALID_DOMAINS = {
@@ -235,6 +363,8 @@ class ActivityConversionPipeline:
 
         # Graceful shutdown: track current activity for signal handler
         self._current_activity_id: Optional[str] = None
+        # Concurrent batch: activities in flight (several IN_PROGRESS at once)
+        self._active_activity_ids: set[str] = set()
         self._setup_signal_handlers()
 
         # Load source data
@@ -259,11 +389,16 @@ class ActivityConversionPipeline:
                 sys.exit(1)
 
         def _cleanup_on_exit():
-            """Reset current activity to PENDING if interrupted."""
-            if self._current_activity_id and self._shutdown_requested:
+            """Reset current (and concurrent batch) activities to PENDING if interrupted."""
+            if not self._shutdown_requested:
+                return
+            interrupted = set(self._active_activity_ids)
+            if self._current_activity_id:
+                interrupted.add(self._current_activity_id)
+            for raw_id in sorted(interrupted):
                 try:
                     self._update_progress_file(
-                        self._current_activity_id, ActivityStatus.PENDING,
+                        raw_id, ActivityStatus.PENDING,
                         "Reset: interrupted by signal"
                     )
                 except Exception:
@@ -3604,127 +3739,199 @@ If ANY of these appear, rewrite that sentence before outputting.
         if max_retries < 0:
             raise ValueError("max_retries must be non-negative")
 
-        last_result: Optional[ConversionResult] = None
         feedback: Optional[str] = None
-        cached_transform: Optional[dict] = None  # D78: Cache for retries
+        cached_transform = self._load_cached_transform(raw_id)
+        last_result: Optional[ConversionResult] = None
 
-        # D78+: Reload cached transform from disk if available (persists across runs)
+        for attempt in range(max_retries + 1):
+            result, cached_transform = await self._convert_attempt(
+                raw_id, attempt, max_retries, feedback, cached_transform
+            )
+            last_result = result
+
+            if not self._should_retry(raw_id, result, attempt, max_retries):
+                return result
+
+            feedback = await self._retry_feedback(result, attempt)
+
+        return last_result or ConversionResult(
+            activity_id=raw_id,
+            status=ActivityStatus.FAILED,
+            error="No result from conversion attempts",
+        )
+
+    def _load_cached_transform(self, raw_id: str) -> Optional[dict]:
+        """
+        D78+: Reload cached transform output from disk (persists across runs).
+
+        Args:
+            raw_id: Activity ID
+
+        Returns:
+            Dict with canonical_yaml, canonical_id, file_path, or None if
+            there is no complete cached transform
+        """
         # Sanitize raw_id to prevent path traversal (defense-in-depth)
         safe_id = re.sub(r'[^a-zA-Z0-9_-]', '_', raw_id)
         scratch_path = Path.home() / ".atlas" / "scratch" / f"convert_{safe_id}.json"
-        if scratch_path.exists():
-            disk_pad = ScratchPad.from_file(scratch_path)
-            if disk_pad is not None:
-                transform_output = disk_pad.get("transform_output")
+        if not scratch_path.exists():
+            return None
+
+        disk_pad = ScratchPad.from_file(scratch_path)
+        if disk_pad is None:
+            return None
+
+        transform_output = disk_pad.get("transform_output")
+        if transform_output and isinstance(transform_output, dict):
+            candidate = {
+                "canonical_yaml": transform_output.get("canonical_yaml", ""),
+                "canonical_id": transform_output.get("canonical_id", ""),
+                "file_path": transform_output.get("file_path", ""),
+            }
+            if all(candidate.values()):
+                logger.info(
+                    f"[D78+] Resuming from cached transform (disk): {scratch_path.name}"
+                )
+                return candidate
+        return None
+
+    async def _convert_attempt(
+        self,
+        raw_id: str,
+        attempt: int,
+        max_retries: int,
+        feedback: Optional[str],
+        cached_transform: Optional[dict],
+    ) -> tuple[ConversionResult, Optional[dict]]:
+        """
+        Run one conversion attempt, from cached transform output when available.
+
+        Args:
+            raw_id: Activity ID to convert
+            attempt: Attempt number (0 = first attempt)
+            max_retries: Max retry attempts for this activity
+            feedback: Reflection feedback from the previous attempt
+            cached_transform: Cached transform output, or None to run stages 1-3
+
+        Returns:
+            Tuple of (result, cached transform for later attempts)
+        """
+        if attempt > 0:
+            logger.info(f"Retry attempt {attempt}/{max_retries} for {raw_id}")
+            print(f"\nApplying 'Wait' pattern reflection...")
+            print(f"Retry attempt {attempt}/{max_retries} with learned context\n")
+
+        # D28: Mark final attempt for extended timeout in quality audit
+        is_final = (attempt >= max_retries)
+
+        # D78+: Use cached transform if available (from disk or prior attempt)
+        if cached_transform is None:
+            # Full pipeline - stages 1-7
+            result = await self.convert_activity(raw_id, feedback=feedback, is_final_attempt=is_final)
+
+            # Cache transform output for potential retries
+            if self.scratch_pad:
+                transform_output = self.scratch_pad.get("transform_output")
                 if transform_output and isinstance(transform_output, dict):
-                    candidate = {
+                    cached_transform = {
                         "canonical_yaml": transform_output.get("canonical_yaml", ""),
                         "canonical_id": transform_output.get("canonical_id", ""),
                         "file_path": transform_output.get("file_path", ""),
                     }
-                    if all(candidate.values()):
-                        cached_transform = candidate
-                        logger.info(
-                            f"[D78+] Resuming from cached transform (disk): {scratch_path.name}"
-                        )
+                    # Only cache if all fields present
+                    if not all(cached_transform.values()):
+                        cached_transform = None
+                    else:
+                        logger.info(f"[D78] Cached transform output for retries")
+        else:
+            # D78: Cached retry - stages 4-7 only (skips INGEST/RESEARCH/TRANSFORM)
+            logger.info(f"[D78] Using cached transform - skipping stages 1-3")
+            result = await self._convert_from_cached_transform(
+                raw_id, cached_transform, feedback=feedback, is_final_attempt=is_final
+            )
 
-        for attempt in range(max_retries + 1):
+        return result, cached_transform
+
+    def _should_retry(
+        self, raw_id: str, result: ConversionResult, attempt: int, max_retries: int
+    ) -> bool:
+        """
+        Decide whether an attempt's result gets another attempt.
+
+        Only quality failures (REVISION_NEEDED, QC_FAILED) are retried, and
+        only while attempts remain.
+        """
+        # Success - Grade A achieved
+        if result.status == ActivityStatus.DONE:
             if attempt > 0:
-                logger.info(f"Retry attempt {attempt}/{max_retries} for {raw_id}")
-                print(f"\nApplying 'Wait' pattern reflection...")
-                print(f"Retry attempt {attempt}/{max_retries} with learned context\n")
-
-            # D28: Mark final attempt for extended timeout in quality audit
-            is_final = (attempt >= max_retries)
-
-            # D78+: Use cached transform if available (from disk or prior attempt)
-            if cached_transform is None:
-                # Full pipeline - stages 1-7
-                result = await self.convert_activity(raw_id, feedback=feedback, is_final_attempt=is_final)
-
-                # Cache transform output for potential retries
-                if self.scratch_pad:
-                    transform_output = self.scratch_pad.get("transform_output")
-                    if transform_output and isinstance(transform_output, dict):
-                        cached_transform = {
-                            "canonical_yaml": transform_output.get("canonical_yaml", ""),
-                            "canonical_id": transform_output.get("canonical_id", ""),
-                            "file_path": transform_output.get("file_path", ""),
-                        }
-                        # Only cache if all fields present
-                        if not all(cached_transform.values()):
-                            cached_transform = None
-                        else:
-                            logger.info(f"[D78] Cached transform output for retries")
-            else:
-                # D78: Cached retry - stages 4-7 only (skips INGEST/RESEARCH/TRANSFORM)
-                logger.info(f"[D78] Using cached transform - skipping stages 1-3")
-                result = await self._convert_from_cached_transform(
-                    raw_id, cached_transform, feedback=feedback, is_final_attempt=is_final
-                )
+                logger.info(f"Succeeded on attempt {attempt + 1}")
+                print(f"\nSucceeded on attempt {attempt + 1}!")
+            return False
 
-            last_result = result
+        # Check if this is a retryable quality issue
+        retryable_statuses = {ActivityStatus.REVISION_NEEDED, ActivityStatus.QC_FAILED}
+        if result.status not in retryable_statuses:
+            logger.info(f"Status {result.status.value} - not retrying")
+            return False
 
-            # Success - Grade A achieved
-            if result.status == ActivityStatus.DONE:
-                if attempt > 0:
-                    logger.info(f"Succeeded on attempt {attempt + 1}")
-                    print(f"\nSucceeded on attempt {attempt + 1}!")
-                return result
+        # Max retries exhausted
+        if attempt >= max_retries:
+            logger.warning(f"Max retries ({max_retries}) reached for {raw_id}")
+            return False
 
-            # Check if this is a retryable quality issue
-            retryable_statuses = {ActivityStatus.REVISION_NEEDED, ActivityStatus.QC_FAILED}
-            if result.status not in retryable_statuses:
-                logger.info(f"Status {result.status.value} - not retrying")
-                return result
+        return True
 
-            # Max retries exhausted
-            if attempt >= max_retries:
-                logger.warning(f"Max retries ({max_retries}) reached for {raw_id}")
-                return result
+    async def _retry_feedback(self, result: ConversionResult, attempt: int) -> str:
+        """
+        Apply "Wait" pattern reflection to a failed attempt.
 
-            # Apply "Wait" pattern reflection for intelligent retry
-            # Use QC issues if QC failed, otherwise use quality audit issues
-            if result.status == ActivityStatus.QC_FAILED and result.qc_issues:
-                # Convert QC issues to audit format for reflection
-                # D113: qc_issues may contain dicts (from _audit_ai_patterns)
-                # or strings (from QC hook). Normalize to audit format.
-                issues = []
-                for issue in result.qc_issues:
-                    if isinstance(issue, dict):
-                        # Already structured — pass through directly
-                        issues.append(issue)
-                    else:
-                        issues.append({"category": "QC", "issue": str(issue), "fix": "Review and fix"})
-                grade = "QC_FAILED"
-            else:
-                # Get audit results from scratch pad
-                audit = self.scratch_pad.get("quality_audit") if self.scratch_pad else {}
-                if not audit:
-                    audit = {"issues": [], "grade": "Unknown"}
-                issues = audit.get("issues", [])
-                grade = audit.get("grade", "Unknown")
-
-            feedback = await self.reflect_on_failure(
-                failed_yaml=result.elevated_yaml or "",
-                issues=issues,
-                grade=grade,
-            )
+        Must run on the same instance as the attempt: quality audit issues
+        are read from its scratch pad.
 
-            logger.info("Will retry with reflection feedback")
-            # Show issues from either QC or quality audit
-            display_issues = result.qc_issues if result.qc_issues else result.qc_warnings
-            if display_issues:
-                print(f"Issues from attempt {attempt + 1}:")
-                for issue in display_issues[:5]:
-                    print(f"  - {_format_display_issue(issue)}")
+        Args:
+            result: Result of the failed attempt
+            attempt: Attempt number that failed
 
-        return last_result or ConversionResult(
-            activity_id=raw_id,
-            status=ActivityStatus.FAILED,
-            error="No result from conversion attempts",
+        Returns:
+            Reflection feedback for the next attempt
+        """
+        # Use QC issues if QC failed, otherwise use quality audit issues
+        if result.status == ActivityStatus.QC_FAILED and result.qc_issues:
+            # Convert QC issues to audit format for reflection
+            # D113: qc_issues may contain dicts (from _audit_ai_patterns)
+            # or strings (from QC hook). Normalize to audit format.
+            issues = []
+            for issue in result.qc_issues:
+                if isinstance(issue, dict):
+                    # Already structured — pass through directly
+                    issues.append(issue)
+                else:
+                    issues.append({"category": "QC", "issue": str(issue), "fix": "Review and fix"})
+            grade = "QC_FAILED"
+        else:
+            # Get audit results from scratch pad
+            audit = self.scratch_pad.get("quality_audit") if self.scratch_pad else {}
+            if not audit:
+                audit = {"issues": [], "grade": "Unknown"}
+            issues = audit.get("issues", [])
+            grade = audit.get("grade", "Unknown")
+
+        feedback = await self.reflect_on_failure(
+            failed_yaml=result.elevated_yaml or "",
+            issues=issues,
+            grade=grade,
         )
 
+        logger.info("Will retry with reflection feedback")
+        # Show issues from either QC or quality audit
+        display_issues = result.qc_issues if result.qc_issues else result.qc_warnings
+        if display_issues:
+            print(f"Issues from attempt {attempt + 1}:")
+            for issue in display_issues[:5]:
+                print(f"  - {_format_display_issue(issue)}")
+
+        return feedback
+
     def present_for_review(
         self, result: ConversionResult, yaml_content: str
     ) -> str:
@@ -4278,18 +4485,38 @@ If ANY of these appear, rewrite that sentence before outputting.
         return result
 
     async def run_batch(
-        self, limit: int = 10, auto_approve: bool = False
+        self,
+        limit: int = 10,
+        auto_approve: bool = False,
+        workers: int = 1,
+        max_skill_calls: Optional[int] = None,
+        skill_calls_per_minute: Optional[float] = None,
     ) -> BatchResult:
         """
         Process a batch of pending activities.
 
+        With workers > 1, activities convert concurrently (see
+        _run_batch_concurrent). Progress and results are still recorded
+        in pending order, one activity at a time.
+
         Args:
             limit: Maximum number of activities to process
             auto_approve: If True, auto-approve all passing activities
+            workers: Activities converted at once (1 = sequential)
+            max_skill_calls: Skill subprocesses at once across all workers
+                (default MAX_SKILL_SUBPROCESSES)
+            skill_calls_per_minute: Skill subprocess start rate
+                (default SKILL_CALLS_PER_MINUTE, 0 = no spacing)
 
         Returns:
             BatchResult with statistics
+
+        Raises:
+            ValueError: If workers is less than 1
         """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
         pending = self.get_pending_activities()[:limit]
 
         if not pending:
@@ -4306,126 +4533,307 @@ If ANY of these appear, rewrite that sentence before outputting.
             revision_needed=0,
         )
 
-        for i, raw_id in enumerate(pending, 1):
-            print(f"\n[{i}/{len(pending)}] Processing: {raw_id}")
+        if workers > 1:
+            limiter = SkillCallLimiter(
+                max_skill_calls or self.MAX_SKILL_SUBPROCESSES,
+                skill_calls_per_minute if skill_calls_per_minute is not None
+                else self.SKILL_CALLS_PER_MINUTE,
+            )
+            await self._run_batch_concurrent(
+                pending, batch_result, auto_approve, workers, limiter
+            )
+        else:
+            for i, raw_id in enumerate(pending, 1):
+                print(f"\n[{i}/{len(pending)}] Processing: {raw_id}")
 
-            # Update progress to in_progress
-            self._update_progress_file(raw_id, ActivityStatus.IN_PROGRESS)
+                # Update progress to in_progress
+                self._update_progress_file(raw_id, ActivityStatus.IN_PROGRESS)
 
-            # Run conversion with retry logic (D85: batch mode now uses retry)
-            result = await self.convert_with_retry(raw_id, max_retries=2)
+                # Run conversion with retry logic (D85: batch mode now uses retry)
+                result = await self.convert_with_retry(raw_id, max_retries=2)
 
-            # Handle based on status
-            if result.status == ActivityStatus.SKIPPED:
-                self._update_progress_file(
-                    raw_id, ActivityStatus.SKIPPED, result.skip_reason or "Skipped"
-                )
-                batch_result.skipped += 1
-                batch_result.results.append(result)
-                print(f"  -> Skipped: {result.skip_reason}")
+                if not await self._record_batch_result(raw_id, result, batch_result, auto_approve):
+                    break
+
+        # Print summary
+        print("\n" + "=" * 65)
+        print("BATCH SUMMARY")
+        print("=" * 65)
+        print(f"Total processed: {batch_result.total}")
+        print(f"Completed:       {batch_result.completed}")
+        print(f"Skipped:         {batch_result.skipped}")
+        print(f"Failed:          {batch_result.failed}")
+        print(f"Revision needed: {batch_result.revision_needed}")
+        print("=" * 65)
 
-            elif result.status == ActivityStatus.FAILED:
+        return batch_result
+
+    async def _record_batch_result(
+        self,
+        raw_id: str,
+        result: ConversionResult,
+        batch_result: BatchResult,
+        auto_approve: bool,
+    ) -> bool:
+        """
+        Write progress for a finished activity and count it in the batch.
+
+        Review prompts run in a thread so concurrent workers keep going
+        while the user decides.
+
+        Returns:
+            False if the user quit the batch, True otherwise
+        """
+        if result.status == ActivityStatus.SKIPPED:
+            self._update_progress_file(
+                raw_id, ActivityStatus.SKIPPED, result.skip_reason or "Skipped"
+            )
+            batch_result.skipped += 1
+            batch_result.results.append(result)
+            print(f"  -> Skipped: {result.skip_reason}")
+
+        elif result.status == ActivityStatus.FAILED:
+            self._update_progress_file(
+                raw_id, ActivityStatus.FAILED, result.error or "Failed"
+            )
+            batch_result.failed += 1
+            batch_result.results.append(result)
+            print(f"  -> Failed: {result.error}")
+
+        elif result.status == ActivityStatus.REVISION_NEEDED:
+            self._update_progress_file(
+                raw_id, ActivityStatus.REVISION_NEEDED, result.error or "Needs revision"
+            )
+            batch_result.revision_needed += 1
+            batch_result.results.append(result)
+            print(f"  -> Revision needed: {result.error}")
+
+        elif result.status == ActivityStatus.QC_FAILED:
+            if auto_approve:
+                # Skip QC failures in auto mode
                 self._update_progress_file(
-                    raw_id, ActivityStatus.FAILED, result.error or "Failed"
+                    raw_id, ActivityStatus.QC_FAILED, "QC failed (auto mode)"
                 )
                 batch_result.failed += 1
-                batch_result.results.append(result)
-                print(f"  -> Failed: {result.error}")
-
-            elif result.status == ActivityStatus.REVISION_NEEDED:
-                self._update_progress_file(
-                    raw_id, ActivityStatus.REVISION_NEEDED, result.error or "Needs revision"
+            else:
+                # Present for review
+                decision = await asyncio.to_thread(
+                    self.present_for_review, result, result.elevated_yaml or ""
                 )
-                batch_result.revision_needed += 1
-                batch_result.results.append(result)
-                print(f"  -> Revision needed: {result.error}")
-
-            elif result.status == ActivityStatus.QC_FAILED:
-                if auto_approve:
-                    # Skip QC failures in auto mode
+                if decision == "approve":
+                    if self.write_canonical_file(result):
+                        self._update_progress_file(
+                            raw_id, ActivityStatus.DONE, "QC override"
+                        )
+                        batch_result.completed += 1
+                    else:
+                        batch_result.failed += 1
+                elif decision == "quit":
+                    self._update_progress_file(raw_id, ActivityStatus.PENDING)
+                    return False
+                else:
                     self._update_progress_file(
-                        raw_id, ActivityStatus.QC_FAILED, "QC failed (auto mode)"
+                        raw_id, ActivityStatus.QC_FAILED, "QC failed"
                     )
                     batch_result.failed += 1
+
+            batch_result.results.append(result)
+
+        elif result.status == ActivityStatus.DONE:
+            if auto_approve:
+                # Auto-approve
+                if self.write_canonical_file(result):
+                    self._update_progress_file(raw_id, ActivityStatus.DONE, "Auto-approved")
+                    batch_result.completed += 1
+                    print(f"  -> Auto-approved: {result.canonical_id}")
                 else:
-                    # Present for review
-                    decision = self.present_for_review(
-                        result, result.elevated_yaml or ""
+                    self._update_progress_file(
+                        raw_id, ActivityStatus.FAILED, "Write failed"
                     )
-                    if decision == "approve":
-                        if self.write_canonical_file(result):
-                            self._update_progress_file(
-                                raw_id, ActivityStatus.DONE, "QC override"
-                            )
-                            batch_result.completed += 1
-                        else:
-                            batch_result.failed += 1
-                    elif decision == "quit":
-                        self._update_progress_file(raw_id, ActivityStatus.PENDING)
-                        break
-                    else:
-                        self._update_progress_file(
-                            raw_id, ActivityStatus.QC_FAILED, "QC failed"
-                        )
-                        batch_result.failed += 1
-
-                batch_result.results.append(result)
+                    batch_result.failed += 1
+                    print(f"  -> Failed to write file")
+            else:
+                # Present for review
+                decision = await asyncio.to_thread(
+                    self.present_for_review, result, result.elevated_yaml or ""
+                )
 
-            elif result.status == ActivityStatus.DONE:
-                if auto_approve:
-                    # Auto-approve
+                if decision == "approve":
                     if self.write_canonical_file(result):
-                        self._update_progress_file(raw_id, ActivityStatus.DONE, "Auto-approved")
+                        self._update_progress_file(
+                            raw_id, ActivityStatus.DONE, "Converted"
+                        )
                         batch_result.completed += 1
-                        print(f"  -> Auto-approved: {result.canonical_id}")
                     else:
                         self._update_progress_file(
                             raw_id, ActivityStatus.FAILED, "Write failed"
                         )
                         batch_result.failed += 1
-                        print(f"  -> Failed to write file")
-                else:
-                    # Present for review
-                    decision = self.present_for_review(
-                        result, result.elevated_yaml or ""
+                elif decision == "reject":
+                    self._update_progress_file(
+                        raw_id, ActivityStatus.REVISION_NEEDED, "Rejected"
                     )
+                    batch_result.revision_needed += 1
+                elif decision == "skip":
+                    self._update_progress_file(raw_id, ActivityStatus.PENDING)
+                elif decision == "quit":
+                    self._update_progress_file(raw_id, ActivityStatus.PENDING)
+                    return False
 
-                    if decision == "approve":
-                        if self.write_canonical_file(result):
-                            self._update_progress_file(
-                                raw_id, ActivityStatus.DONE, "Converted"
-                            )
-                            batch_result.completed += 1
-                        else:
-                            self._update_progress_file(
-                                raw_id, ActivityStatus.FAILED, "Write failed"
-                            )
-                            batch_result.failed += 1
-                    elif decision == "reject":
-                        self._update_progress_file(
-                            raw_id, ActivityStatus.REVISION_NEEDED, "Rejected"
-                        )
-                        batch_result.revision_needed += 1
-                    elif decision == "skip":
-                        self._update_progress_file(raw_id, ActivityStatus.PENDING)
-                    elif decision == "quit":
-                        self._update_progress_file(raw_id, ActivityStatus.PENDING)
-                        break
+            batch_result.results.append(result)
 
-                batch_result.results.append(result)
+        return True
 
-        # Print summary
-        print("\n" + "=" * 65)
-        print("BATCH SUMMARY")
-        print("=" * 65)
-        print(f"Total processed: {batch_result.total}")
-        print(f"Completed:       {batch_result.completed}")
-        print(f"Skipped:         {batch_result.skipped}")
-        print(f"Failed:          {batch_result.failed}")
-        print(f"Revision needed: {batch_result.revision_needed}")
-        print("=" * 65)
+    def _activity_view(self, limiter: SkillCallLimiter) -> "ActivityConversionPipeline":
+        """
+        Shallow copy of the pipeline for one batch worker.
 
-        return batch_result
+        convert_activity keeps the scratch pad and session on the instance,
+        so each worker converts through its own view. Source data, the
+        progress cache and config stay shared; executors are wrapped so
+        every subprocess goes through the batch's limiter.
+        """
+        view = copy.copy(self)
+        view.scratch_pad = None
+        view.session = SessionManager(session_dir=self.session.session_dir)
+        view._current_activity_id = None
+        for name, methods in self.RATE_LIMITED_CALLS.items():
+            setattr(view, name, _RateLimited(getattr(self, name), limiter, methods))
+        return view
+
+    async def _advance_run(
+        self,
+        view: "ActivityConversionPipeline",
+        run: ActivityRun,
+        queue: "asyncio.Queue[ActivityRun]",
+    ) -> None:
+        """
+        Run one attempt of an activity on a worker's view.
+
+        Leaves the run FINISHED, or RETRY_QUEUED at the back of the queue
+        with reflection feedback for its next attempt.
+        """
+        if run.state is RunState.QUEUED:
+            self._update_progress_file(run.raw_id, ActivityStatus.IN_PROGRESS)
+            self._active_activity_ids.add(run.raw_id)
+            run.cached_transform = self._load_cached_transform(run.raw_id)
+
+        run.advance(RunState.CONVERTING)
+        logger.info(f"[BATCH] {run.raw_id}: attempt {run.attempt + 1}/{run.max_retries + 1}")
+        try:
+            run.result, run.cached_transform = await view._convert_attempt(
+                run.raw_id, run.attempt, run.max_retries, run.feedback, run.cached_transform
+            )
+        except Exception as e:
+            logger.exception(f"Unexpected error converting {run.raw_id}")
+            run.result = ConversionResult(
+                activity_id=run.raw_id,
+                status=ActivityStatus.FAILED,
+                error=f"Unexpected error: {e}",
+            )
+
+        if not view._should_retry(run.raw_id, run.result, run.attempt, run.max_retries):
+            run.advance(RunState.FINISHED)
+            return
+
+        run.advance(RunState.REFLECTING)
+        try:
+            run.feedback = await view._retry_feedback(run.result, run.attempt)
+        except Exception as e:
+            logger.warning(f"Reflection failed for {run.raw_id}, keeping last result: {e}")
+            run.advance(RunState.FINISHED)
+            return
+
+        run.attempt += 1
+        run.advance(RunState.RETRY_QUEUED)
+        queue.put_nowait(run)
+
+    async def _run_batch_concurrent(
+        self,
+        pending: list[str],
+        batch_result: BatchResult,
+        auto_approve: bool,
+        workers: int,
+        limiter: SkillCallLimiter,
+    ) -> None:
+        """
+        Convert activities on several workers, recording results in order.
+
+        Workers take single attempts from a FIFO queue; an activity needing
+        a retry goes to the back, behind activities still waiting. The
+        limiter caps skill subprocesses across all workers. A recorder
+        writes progress and BatchResult entries in pending order as soon as
+        the next activity in line finishes, so the progress file and
+        results do not depend on which conversion finished first.
+
+        If the user quits during review, or the batch is interrupted,
+        activities that started but were not recorded are reset to PENDING.
+        """
+        runs = [
+            ActivityRun(index=i, raw_id=raw_id, max_retries=2)
+            for i, raw_id in enumerate(pending)
+        ]
+        queue: asyncio.Queue[ActivityRun] = asyncio.Queue()
+        for run in runs:
+            queue.put_nowait(run)
+        finished = asyncio.Event()
+
+        async def worker() -> None:
+            view = self._activity_view(limiter)
+            while True:
+                run = await queue.get()
+                try:
+                    await self._advance_run(view, run, queue)
+                finally:
+                    queue.task_done()
+                if run.state is RunState.FINISHED:
+                    finished.set()
+
+        async def recorder() -> None:
+            for run in runs:
+                while run.state is not RunState.FINISHED:
+                    finished.clear()
+                    await finished.wait()
+                print(f"\n[{run.index + 1}/{len(runs)}] {run.raw_id}")
+                self._active_activity_ids.discard(run.raw_id)
+                recorded = await self._record_batch_result(
+                    run.raw_id, run.result, batch_result, auto_approve
+                )
+                run.advance(RunState.RECORDED)
+                if not recorded:
+                    return
+
+        worker_tasks = [
+            asyncio.create_task(worker()) for _ in range(min(workers, len(runs)))
+        ]
+        recording = asyncio.create_task(recorder())
+        try:
+            done, _ = await asyncio.wait(
+                [recording, *worker_tasks], return_when=asyncio.FIRST_COMPLETED
+            )
+            if recording not in done:
+                # Workers only stop on an unexpected error
+                recording.cancel()
+                next(iter(done)).result()
+            else:
+                recording.result()
+        finally:
+            for task in [recording, *worker_tasks]:
+                task.cancel()
+            await asyncio.gather(recording, *worker_tasks, return_exceptions=True)
+
+            # Started but not recorded (quit or error): back to PENDING
+            for run in runs:
+                if run.raw_id in self._active_activity_ids:
+                    self._update_progress_file(
+                        run.raw_id, ActivityStatus.PENDING, "Reset: batch stopped"
+                    )
+                    self._active_activity_ids.discard(run.raw_id)
+
+        logger.info(
+            f"[BATCH] {limiter.calls} skill calls, peak {limiter.peak} concurrent "
+            f"({workers} workers)"
+        )
 
 
 async def main():
@@ -4452,6 +4860,9 @@ Examples:
   # Batch mode (use only after skills reliably produce Grade A)
   python -m atlas.pipelines.activity_conversion --batch --limit 10
 
+  # Concurrent batch (results are still recorded in pending order)
+  python -m atlas.pipelines.activity_conversion --batch --auto-approve --workers 4
+
 Note: Uses CLI mode (Max subscription). No ANTHROPIC_API_KEY needed.
 Quality audit requires Grade A to proceed to human review.
 """,
@@ -4509,6 +4920,15 @@ Quality audit requires Grade A to proceed to human review.
         "--auto-approve", action="store_true",
         help="Auto-approve passing activities (batch mode)"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Activities converted at once in batch mode (default: 1)"
+    )
+    parser.add_argument(
+        "--max-skill-calls", type=int, default=None,
+        help=f"Skill subprocesses at once across batch workers "
+             f"(default: {ActivityConversionPipeline.MAX_SKILL_SUBPROCESSES})"
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true",
         help="Verbose logging"
@@ -4890,7 +5310,10 @@ Quality audit requires Grade A to proceed to human review.
         print("=" * 60 + "\n")
 
         result = await pipeline.run_batch(
-            limit=args.limit, auto_approve=args.auto_approve
+            limit=args.limit,
+            auto_approve=args.auto_approve,
+            workers=args.workers,
+            max_skill_calls=args.max_skill_calls,
         )
         if result.failed > 0:
             sys.exit(1)
@@ -0,0 +1,227 @@
+"""
+ATLAS Timer Announcements
+
+The fixed phrases the bridge speaks on its own during routines and
+workouts (timer prompts, "next exercise" announcements, form cues). The
+bridge builds its prompts with these functions, and prerender_phrases()
+enumerates every phrase the current configs can produce, so the TTS audio
+cache (atlas/voice/audio_cache.py) can synthesize them ahead of time and
+the spoken text matches the cached text exactly.
+
+Usage:
+    from atlas.voice.announcements import prerender_phrases, rest_done
+
+    rest_done(2)          # "Rest done. Set 2. Say ready when you're set."
+    prerender_phrases()   # every announcement for the current phase
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+FORM_GUIDES_PATH = CONFIG_DIR / "exercises" / "routine_form_guides.json"
+EXERCISES_PATH = CONFIG_DIR / "exercises.json"
+
+# Fixed timer prompts (no parameters)
+SWITCH_SIDES = "Switch sides."
+EXERCISE_COMPLETE = "Exercise complete."
+SWITCH_TO_RIGHT = "Switch sides. Right leg. Begin."
+LAST_SET_COMPLETE = "Last set complete. Moving to next exercise."
+FIXED_PROMPTS = (SWITCH_SIDES, EXERCISE_COMPLETE, SWITCH_TO_RIGHT, LAST_SET_COMPLETE)
+
+
+def rest_done(next_set: int) -> str:
+    return f"Rest done. Set {next_set}. Say ready when you're set."
+
+
+def set_begin(set_number: int, per_side: bool = False) -> str:
+    if per_side:
+        return f"Set {set_number}. Left side. Begin."
+    return f"Set {set_number}. Begin."
+
+
+def set_complete_rest(set_number: int, rest_seconds: int) -> str:
+    return f"Set {set_number} complete. Rest {rest_seconds} seconds."
+
+
+def routine_go(duration: int, per_side: bool = False) -> str:
+    """Spoken when a routine exercise timer starts."""
+    if per_side:
+        return f"Go. Left side. {duration // 2} seconds."
+    return f"Go. {duration} seconds."
+
+
+def no_timer_needed(name: str) -> str:
+    return f"{name}. No timer needed. Say finished or skip."
+
+
+def setup_tip(form_guides: dict, exercise_id: str, exercise_name: str) -> Optional[str]:
+    """Setup line from the routine form guides (by id, then name or alias)."""
+    if not form_guides:
+        return None
+
+    ex_id = exercise_id.lower()
+    ex_name = exercise_name.lower()
+
+    # Try exact ID match first
+    if ex_id in form_guides:
+        return form_guides[ex_id].get('setup', '')
+
+    # Try matching by name or aliases
+    for guide in form_guides.values():
+        guide_name = guide.get('name', '').lower()
+        aliases = [a.lower() for a in guide.get('aliases', [])]
+
+        if (ex_name in guide_name or guide_name in ex_name or
+                any(alias in ex_name or ex_name in alias for alias in aliases)):
+            return guide.get('setup', '')
+
+    return None
+
+
+def next_exercise_announcement(
+    name: str,
+    tip: Optional[str],
+    cues: Optional[list[str]] = None,
+    next_section: Optional[str] = None,
+) -> str:
+    """
+    "Get ready. Next exercise: Cat-Cow. Get on all fours."
+
+    Args:
+        name: Next exercise name
+        tip: Setup tip from the form guides (preferred over cues)
+        cues: The exercise's own cues (first one used without a tip)
+        next_section: Section name when the next exercise starts a new section
+    """
+    if next_section:
+        message = f"Section complete. Next section: {next_section}. Get ready. Next exercise: {name}."
+        if tip:
+            return f"{message} {tip}"
+        elif cues:
+            return f"{message} {cues[0]}"
+        return message
+
+    if tip:
+        return f"Get ready. Next exercise: {name}. {tip}"
+    elif cues:
+        return f"Get ready. Next exercise: {name}. {cues[0]}"
+    return f"Get ready. Next exercise: {name}."
+
+
+def workout_exercise_intro(ex: dict) -> str:
+    """Announcement for the next workout exercise (bridge current_exercise dict)."""
+    if ex.get('is_continuous'):
+        duration_mins = ex.get('duration_minutes', 50)
+        response = f"Next: {ex['name']}. {duration_mins} minutes continuous. "
+        if ex.get('notes'):
+            response += f"{ex['notes']} "
+        response += "Say ready to begin, done when finished."
+        return response
+
+    response = f"Next: {ex['name']}. {ex['sets']} sets"
+    if ex.get('reps'):
+        response += f" of {ex['reps']}"
+        if ex.get('per_side'):
+            response += " each side"
+    elif ex.get('duration_seconds'):
+        response += f" for {ex['duration_seconds']} seconds"
+        if ex.get('per_side'):
+            response += " each side"
+        else:
+            response += " each"
+    if ex.get('per_direction'):
+        response += " each direction"
+    if ex.get('hold_seconds'):
+        response += f". Hold {ex['hold_seconds']} seconds each rep"
+    if ex.get('notes'):
+        # Notes are curated form cues - don't truncate
+        response += f". {ex['notes']}"
+    response += ". Say ready when set up."
+    return response
+
+
+def load_form_guides() -> dict:
+    """Routine form guides by exercise id ({} if missing or unreadable)."""
+    try:
+        with open(FORM_GUIDES_PATH) as f:
+            return json.load(f).get('exercises', {})
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load routine form guides: {e}")
+        return {}
+
+
+def _routine_phrases(sections, form_guides: dict) -> Iterable[str]:
+    """Every routine prompt, walking sections in order like the auto-advance flow."""
+    for section_idx, section in enumerate(sections):
+        for exercise_idx, ex in enumerate(section.exercises):
+            if exercise_idx > 0:
+                yield next_exercise_announcement(ex.name, setup_tip(form_guides, ex.id, ex.name), ex.cues)
+            elif section_idx > 0:
+                yield next_exercise_announcement(
+                    ex.name, setup_tip(form_guides, ex.id, ex.name), ex.cues, next_section=section.name
+                )
+            if ex.duration_seconds or ex.reps:
+                yield routine_go(ex.get_total_duration(), ex.per_side)
+            else:
+                yield no_timer_needed(ex.name)
+            yield from ex.cues or []
+
+
+def _workout_phrases(protocols: dict) -> Iterable[str]:
+    """Intros and set/rest prompts for every exercise in the workout protocols."""
+    for protocol in protocols.values():
+        for raw in protocol.get('exercises', []):
+            if not raw.get('name'):
+                continue
+            is_continuous = raw.get('duration_minutes') is not None and raw.get('reps') is None
+            ex = {**raw, 'sets': 1 if is_continuous else raw.get('sets'), 'is_continuous': is_continuous}
+            yield workout_exercise_intro(ex)
+            sets = ex.get('sets') or 0
+            rest = raw.get('rest_seconds')
+            for set_number in range(1, sets + 1):
+                if set_number < sets:
+                    if rest:
+                        yield set_complete_rest(set_number, rest)
+                    yield rest_done(set_number + 1)
+                if set_number > 1:
+                    yield set_begin(set_number, raw.get('per_side', False))
+
+
+def prerender_phrases(
+    routine_config=None,
+    protocols: Optional[dict] = None,
+    form_guides: Optional[dict] = None,
+) -> list[str]:
+    """
+    Every phrase the timer flows can speak for the given (default: current) configs.
+
+    Covers the fixed timer prompts, routine announcements, "Go" prompts and
+    cues, workout intros and set/rest prompts, routine form-guide cues, and
+    the exercise library names. Order is stable and duplicates are removed.
+    """
+    if routine_config is None:
+        from atlas.health.routine_runner import load_routine_config
+        routine_config = load_routine_config()
+    if protocols is None:
+        from atlas.health.workout_lookup import get_workout_config
+        protocols = (get_workout_config() or {}).get('protocols', {})
+    if form_guides is None:
+        form_guides = load_form_guides()
+
+    phrases: list[str] = list(FIXED_PROMPTS)
+    phrases.extend(_routine_phrases(routine_config.sections, form_guides))
+    phrases.extend(_workout_phrases(protocols))
+    for guide in form_guides.values():
+        phrases.extend(guide.get('cues', []))
+    try:
+        with open(EXERCISES_PATH) as f:
+            phrases.extend(ex['name'] for ex in json.load(f).get('exercises', []) if ex.get('name'))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load exercise names: {e}")
+
+    return list(dict.fromkeys(p.strip() for p in phrases if p and p.strip()))
@@ -0,0 +1,225 @@
+"""
+ATLAS TTS Audio Cache
+
+Content-addressed store of synthesized speech for phrases the bridge says
+over and over ("Rest done. Set 2...", exercise announcements, form cues).
+Each entry is float32 PCM in a .npy file named by the SHA-256 of
+(voice, speed, text) and the sample rate; hits are memory-mapped, so a
+cached prompt plays without synthesis and without touching the GPU.
+
+Eviction is least-recently-used by total size. File mtimes are the LRU
+clock (touched on every hit), so order survives restarts without an index.
+
+Usage:
+    from atlas.voice.audio_cache import AudioCache
+
+    cache = AudioCache()
+    result = cache.synthesize(tts, "Rest done. Set 2. Say ready when you're set.")
+    play_audio(result.audio, result.sample_rate)
+
+    # Ahead of time (see scripts/prerender_tts.py)
+    from atlas.voice.announcements import prerender_phrases
+    cache.prerender(tts, prerender_phrases())
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from atlas.voice.tts import SynthesisResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".atlas" / "tts_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # ~45 minutes of 24kHz float32
+
+
+@dataclass
+class AudioCacheStats:
+    """Counters since startup."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "entries": self.entries,
+            "mb": round(self.bytes / (1024 * 1024), 1),
+        }
+
+
+class AudioCache:
+    """On-disk LRU cache of synthesized phrases, keyed by text, voice and speed."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats = AudioCacheStats()
+        # key -> (path, sample_rate, size), least recently used first
+        self._index: OrderedDict[str, tuple[Path, int, int]] = OrderedDict()
+        self._bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def key(text: str, voice: str, speed: float = 1.0) -> str:
+        """Content address of a phrase."""
+        return hashlib.sha256(f"{voice}\0{speed:.3f}\0{text.strip()}".encode("utf-8")).hexdigest()
+
+    def _load_index(self) -> None:
+        files = []
+        for path in self.cache_dir.glob("*.npy"):
+            key, _, rate = path.stem.partition("_")
+            try:
+                stat = path.stat()
+                files.append((stat.st_mtime, key, path, int(rate), stat.st_size))
+            except (OSError, ValueError):
+                continue
+        for _, key, path, rate, size in sorted(files):
+            self._index[key] = (path, rate, size)
+            self._bytes += size
+
+    def get(self, text: str, voice: str, speed: float = 1.0) -> Optional[tuple[np.ndarray, int]]:
+        """
+        Cached audio for a phrase.
+
+        Returns:
+            (audio, sample_rate) with audio memory-mapped read-only, or None
+        """
+        key = self.key(text, voice, speed)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            path, rate, _ = entry
+            try:
+                audio = np.load(path, mmap_mode="r")
+                os.utime(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[TTS-CACHE] Dropping unreadable entry {path.name}: {e}")
+                self._drop(key)
+                self._stats.misses += 1
+                return None
+            self._index.move_to_end(key)
+            self._stats.hits += 1
+            return audio, rate
+
+    def put(self, text: str, voice: str, audio: np.ndarray, sample_rate: int, speed: float = 1.0) -> None:
+        """Store a phrase's audio, evicting least recently used entries over max_bytes."""
+        key = self.key(text, voice, speed)
+        path = self.cache_dir / f"{key}_{sample_rate}.npy"
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(audio, dtype=np.float32))
+        os.replace(tmp, path)  # readers never see a partial file
+        size = path.stat().st_size
+        with self._lock:
+            if key in self._index:
+                self._bytes -= self._index[key][2]
+            self._index[key] = (path, sample_rate, size)
+            self._index.move_to_end(key)
+            self._bytes += size
+            self._stats.stores += 1
+            while self._bytes > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._drop(oldest)
+                self._stats.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        path, _, size = self._index.pop(key)
+        self._bytes -= size
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def synthesize(self, tts, text: str, voice: Optional[str] = None, speed: float = 1.0) -> SynthesisResult:
+        """
+        tts.synthesize() through the cache.
+
+        Args:
+            tts: KokoroTTS or Qwen3TTS
+            text: Phrase to speak
+            voice: Voice ID (default: the engine's voice)
+            speed: Speech speed multiplier
+
+        Returns:
+            SynthesisResult (duration_ms is the lookup time on a hit)
+        """
+        voice = voice or tts.voice
+        start = time.perf_counter()
+        cached = self.get(text, voice, speed)
+        if cached is not None:
+            audio, rate = cached
+            return SynthesisResult(
+                audio=audio,
+                sample_rate=rate,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                text_length=len(text),
+            )
+        result = tts.synthesize(text, voice=voice, speed=speed)
+        try:
+            self.put(text, voice, result.audio, result.sample_rate, speed)
+        except OSError as e:
+            logger.warning(f"[TTS-CACHE] Store failed: {e}")
+        return result
+
+    def prerender(
+        self,
+        tts,
+        phrases: Iterable[str],
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """
+        Synthesize every phrase not already cached.
+
+        Returns:
+            {"phrases", "rendered", "cached", "duration_ms"}
+        """
+        voice = voice or tts.voice
+        phrases = list(phrases)
+        start = time.perf_counter()
+        rendered = 0
+        for done, text in enumerate(phrases, 1):
+            if self.key(text, voice, speed) not in self._index:
+                result = tts.synthesize(text, voice=voice, speed=speed)
+                self.put(text, voice, result.audio, result.sample_rate, speed)
+                rendered += 1
+            if progress:
+                progress(done, len(phrases))
+        return {
+            "phrases": len(phrases),
+            "rendered": rendered,
+            "cached": len(phrases) - rendered,
+            "duration_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    def stats(self) -> AudioCacheStats:
+        with self._lock:
+            return AudioCacheStats(**{**vars(self._stats), "entries": len(self._index), "bytes": self._bytes})
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,206 @@
+"""
+ATLAS Audio Output Scheduler
+
+One thread owns autonomous speech (timer prompts, announcements, replies
+to Command Centre buttons). Messages wait in a priority queue instead of
+each getting its own thread, so overlapping prompts no longer race on the
+audio and status outputs.
+
+- Priority: RESPONSE (replies to the user's button presses) plays ahead
+  of PROMPT (timer prompts). Nothing starts while a voice response is in
+  progress (response() context); queued prompts follow it.
+- Coalescing: a message with a key ("workout", "routine") drops queued
+  prompts with the same key that it supersedes, and prompts older than
+  STALE_AFTER_S are dropped instead of played late.
+- Completion: after writing a prompt the scheduler waits for the client's
+  PLAYBACK_DONE command (playback_done()). Clients that never ack (the
+  file protocol) fall back to the audio duration plus a short buffer.
+
+Usage:
+    output = AudioOutput(synthesize, transport.write_audio, transport.write_status)
+    output.speak("Rest done. Set 2.", key="workout")
+    output.speak("Skipping to Cat-Cow.", priority=RESPONSE, key="routine")
+
+    with output.response():       # voice reply in progress
+        ...
+    output.playback_done()         # on PLAYBACK_DONE from the client
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Priorities (lower plays first)
+RESPONSE = 0
+PROMPT = 1
+
+STALE_AFTER_S = 15.0  # Timer prompts queued longer than this are dropped
+ACK_TIMEOUT_S = 2.0  # Extra wait for PLAYBACK_DONE beyond the audio duration
+NO_ACK_BUFFER_S = 0.5  # Buffer for clients that do not ack (file protocol)
+
+
+@dataclass(order=True)
+class SpeechItem:
+    """One queued message."""
+    priority: int
+    seq: int
+    text: str = field(compare=False)
+    key: Optional[str] = field(default=None, compare=False)
+    queued_at: float = field(default_factory=time.monotonic, compare=False)
+    dropped: bool = field(default=False, compare=False)
+
+
+class AudioOutput:
+    """Single-threaded, prioritized output of autonomous speech."""
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], object],
+        write_audio: Callable[[np.ndarray, int], None],
+        write_status: Callable[[str], None],
+        name: str = "atlas-audio",
+    ):
+        """
+        Args:
+            synthesize: text -> SynthesisResult (audio, sample_rate)
+            write_audio: Delivers audio to the client
+            write_status: Writes a client status ("speaking", "DONE")
+            name: Worker thread name
+        """
+        self._synthesize = synthesize
+        self._write_audio = write_audio
+        self._write_status = write_status
+        self._queue: list[SpeechItem] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._responses = 0
+        self._playing: Optional[SpeechItem] = None
+        self._played = threading.Event()
+        self._closed = False
+        self.acks_seen = False  # Client sends PLAYBACK_DONE
+        self.spoken = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def speak(self, text: str, priority: int = PROMPT, key: Optional[str] = None) -> SpeechItem:
+        """
+        Queue a message (returns immediately).
+
+        Args:
+            text: Text to speak
+            priority: RESPONSE or PROMPT
+            key: Activity the message belongs to; queued prompts with the
+                same key are superseded by it
+        """
+        item = SpeechItem(priority, next(self._seq), text, key)
+        with self._cond:
+            if key is not None:
+                for queued in self._queue:
+                    if queued.key == key and queued.priority >= PROMPT and not queued.dropped:
+                        queued.dropped = True
+                        self.dropped += 1
+                        logger.info(f"[AUDIO-OUT] Superseded: {queued.text[:60]}")
+            heapq.heappush(self._queue, item)
+            self._cond.notify_all()
+        return item
+
+    @contextmanager
+    def response(self) -> Iterator[None]:
+        """Hold queued messages while a voice response is being produced."""
+        with self._cond:
+            self._responses += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._responses -= 1
+                self._cond.notify_all()
+
+    def playback_done(self) -> None:
+        """The client finished playing everything it was sent."""
+        self.acks_seen = True
+        self._played.set()
+
+    def pending(self) -> int:
+        """Messages queued or playing."""
+        with self._cond:
+            return sum(1 for i in self._queue if not i.dropped) + (self._playing is not None)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is queued or playing. False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._playing is not None or any(not i.dropped for i in self._queue):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stop the worker (queued messages are discarded)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._played.set()
+        self._thread.join(timeout)
+
+    def _next(self) -> Optional[SpeechItem]:
+        with self._cond:
+            while True:
+                while not self._closed and (self._responses or not self._queue):
+                    self._cond.wait()
+                if self._closed:
+                    return None
+                item = heapq.heappop(self._queue)
+                if item.dropped:
+                    continue
+                if item.priority >= PROMPT and time.monotonic() - item.queued_at > STALE_AFTER_S:
+                    self.dropped += 1
+                    logger.info(f"[AUDIO-OUT] Stale, dropped: {item.text[:60]}")
+                    continue
+                self._playing = item
+                return item
+
+    def _run(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            try:
+                self._play(item)
+            except Exception as e:
+                logger.error(f"[AUDIO-OUT] Failed to speak {item.text[:60]!r}: {e}")
+            finally:
+                with self._cond:
+                    self._playing = None
+                    self._cond.notify_all()
+
+    def _play(self, item: SpeechItem) -> None:
+        result = self._synthesize(item.text)
+        self._played.clear()
+        self._write_audio(result.audio, result.sample_rate)
+        self._write_status("speaking")
+        self.spoken += 1
+
+        duration = len(result.audio) / result.sample_rate
+        if self.acks_seen:
+            if not self._played.wait(duration + ACK_TIMEOUT_S):
+                logger.warning(f"[AUDIO-OUT] No PLAYBACK_DONE after {duration + ACK_TIMEOUT_S:.1f}s")
+        else:
+            self._played.wait(duration + NO_ACK_BUFFER_S)
+
+        with self._cond:
+            if self._responses:
+                return  # The response in progress writes its own DONE
+        self._write_status("DONE")
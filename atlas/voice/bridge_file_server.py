@@ -3,12 +3,14 @@
 ATLAS Audio Bridge Server - WSL2 Side (File-based)
 
 This version uses file-based communication instead of sockets,
-which avoids WSL2 networking issues entirely.
+which avoids WSL2 networking issues entirely. A local socket transport
+(atlas/voice/bridge_transport.py) is available as a push-based alternative;
+the file protocol stays active whenever no socket client is connected.
 
 Usage:
     cd /home/squiz/ATLAS
     source venv/bin/activate
-    python -m atlas.voice.bridge_file_server
+    python -m atlas.voice.bridge_file_server [--transport socket|file]
 """
 
 import asyncio
@@ -19,7 +21,6 @@ import re
 import sys
 import time
 from pathlib import Path
-from threading import Thread, Lock
 
 import numpy as np
 
@@ -35,7 +36,15 @@ from atlas.voice.tts import get_tts, KokoroTTS
 from atlas.voice.tts_qwen import get_qwen_tts, Qwen3TTS
 from atlas.voice.timer_builders import TimerContext, get_timer_status
 from atlas.voice.state_models import WorkoutState, RoutineState, AssessmentState, TimerState
-from atlas.llm.router import get_router, Tier
+from atlas.voice.streaming import SentenceSegmenter, StreamingSpeaker, split_sentences
+from atlas.voice.audio_cache import AudioCache
+from atlas.voice.audio_output import AudioOutput, PROMPT, RESPONSE
+from atlas.voice import announcements
+from atlas.voice.bridge_transport import BridgeTransport, FileTransport, create_transport
+from atlas.voice.session_status import SessionStatusPublisher
+from atlas.llm.router import ATLASRouter, RouterConfig, get_router, Tier
+from atlas.patterns import PatternMatcher
+from atlas.aio import LoopThread, current_trace, span
 from atlas.llm.local import get_client
 
 # Configuration
@@ -57,10 +66,13 @@ SESSION_STATUS_FILE = BRIDGE_DIR / "session_status.json"
 # ============================================
 # Intent patterns can be loaded from external JSON config for easier maintenance.
 # The config file is at: config/voice/intent_patterns.json
-# For now, patterns are defined inline below, but this loader enables gradual migration.
+# The constants below mirror it. get_intent_matcher() compiles the config (falling
+# back to the constants for missing keys) into one PatternMatcher, which the
+# _is_*_intent predicates read their labels from.
 
 INTENT_PATTERNS_PATH = Path(__file__).parent.parent.parent / "config" / "voice" / "intent_patterns.json"
 _intent_patterns_cache: dict | None = None
+_compiled_patterns_cache: dict[tuple[str, str], list] = {}
 
 
 def load_intent_patterns() -> dict:
@@ -105,6 +117,7 @@ def get_compiled_patterns(section: str, key: str) -> list:
     """Get pre-compiled regex patterns from config.
 
     Useful for patterns that need regex matching rather than string containment.
+    Compiled once per (section, key).
 
     Args:
         section: Top-level section
@@ -113,8 +126,11 @@ def get_compiled_patterns(section: str, key: str) -> list:
     Returns:
         List of compiled re.Pattern objects (case-insensitive)
     """
-    patterns = get_patterns(section, key)
-    return [re.compile(p, re.IGNORECASE) for p in patterns]
+    cached = _compiled_patterns_cache.get((section, key))
+    if cached is None:
+        patterns = get_patterns(section, key)
+        cached = _compiled_patterns_cache[(section, key)] = [re.compile(p, re.IGNORECASE) for p in patterns]
+    return cached
 
 
 def _validate_intent_patterns():
@@ -186,6 +202,15 @@ HEALTH_PATTERNS = [
     r"give me.*(rundown|summary|overview)",
 ]
 
+# Skill/XP status query patterns
+SKILL_STATUS_PATTERNS = [
+    r"(what'?s|what is)\s+(my\s+)?(xp|skills?|levels?)",
+    r"skill\s+status",
+    r"(how|where)\s+(am|do)\s+i\s+(at|stand)",
+    r"my\s+(xp|skills?|levels?)",
+    r"check\s+(my\s+)?(xp|skills?|levels?)",
+]
+
 # Workout intent patterns
 WORKOUT_PATTERNS = [
     r"(what'?s|what is|show).*(workout|training|session)",
@@ -375,6 +400,29 @@ WORKOUT_QUERY_EXCLUSIONS = [
     "show workout", "tell me workout", "what's the workout",
 ]
 
+# Completion phrases - handled by workout completion intent, not start
+WORKOUT_START_COMPLETION_EXCLUSIONS = [
+    "finished", "completed", "done with", "wrapped up", "log workout", "track workout",
+]
+
+# Routine/stretch keywords - these go to the routine handler, not workout start
+WORKOUT_START_ROUTINE_EXCLUSIONS = ["stretch", "routine", "morning", "rehab", "protocol"]
+
+# Action verb + optional fillers + workout keyword
+# Action verbs: start, begin, do, run, let's/lets
+# Fillers: a, the, my, next, today's, todays (optional, can appear twice)
+# Workout keywords: workout, strength, cardio, training, zone, mobility, work out
+WORKOUT_START_REGEX = (
+    r"\b(start|begin|do|run|let'?s)\b"  # Action verb
+    r"(\s+(a|the|my|next|today'?s?))?"   # Optional filler words (can chain)
+    r"(\s+(a|the|my|next|today'?s?))?"   # Allow second filler
+    r"\s+"                               # Required space
+    r"(work\s*out|workout|strength|cardio|training|zone|mobility)\b"  # Workout keyword
+)
+
+# Simple start phrases without an action verb
+WORKOUT_START_SIMPLE_PATTERNS = ["daily workout", "daily work out"]
+
 # Traffic light override patterns (for workout intensity)
 TRAFFIC_OVERRIDE_PATTERNS = {
     "GREEN": [
@@ -443,6 +491,11 @@ WORKOUT_STOP_PATTERNS = [
     "stop", "exit", "quit", "cancel",  # Simple exit commands
 ]
 
+# Negations that must NOT stop a workout/routine ("don't stop")
+STOP_NEGATION_PATTERNS = [
+    "don't stop", "dont stop", "can't stop", "cant stop", "won't stop", "wont stop", "do not stop",
+]
+
 # ============================================
 # MORNING ROUTINE PATTERNS
 # ============================================
@@ -585,8 +638,104 @@ ASSESS_INFO_PATTERNS = [
     r"how many.*(sessions?|tests?).*(base\s?line|assessment|faceline)",
 ]
 
-# Pre-compile patterns for efficiency (avoids recompilation on each call)
-ASSESS_INFO_COMPILED = [re.compile(p, re.IGNORECASE) for p in ASSESS_INFO_PATTERNS]
+_intent_matcher: PatternMatcher | None = None
+
+
+def build_intent_matcher() -> PatternMatcher:
+    """Compile the router reflexes and every voice intent pattern into one matcher.
+
+    Patterns come from config/voice/intent_patterns.json, falling back to the
+    constants above for keys the config doesn't have. Labels are what the
+    _is_*_intent predicates test for.
+    """
+    def cfg(section: str, key: str, default):
+        return get_patterns(section, key) or default
+
+    matcher = ATLASRouter.build_matcher()  # "safety", "local", "agent"
+
+    # General
+    matcher.add("meal", cfg("general", "meal_triggers", MEAL_TRIGGERS), kind="prefix")
+    matcher.add("capture", cfg("general", "capture_triggers", CAPTURE_TRIGGERS), kind="prefix")
+    matcher.add("health", cfg("general", "health_patterns", HEALTH_PATTERNS))
+    matcher.add("skill_status", SKILL_STATUS_PATTERNS)
+    matcher.add("workout_query", cfg("general", "workout_patterns", WORKOUT_PATTERNS))
+    matcher.add("weight", cfg("general", "weight_patterns", WEIGHT_PATTERNS))
+    matcher.add("weight_query", cfg("general", "weight_query_patterns", WEIGHT_QUERY_PATTERNS))
+
+    # Health logging
+    matcher.add("exercise", cfg("health", "exercise_patterns", EXERCISE_PATTERNS))
+    matcher.add("pain", cfg("health", "pain_patterns", PAIN_PATTERNS))
+    matcher.add("workout_completion", cfg("health", "workout_completion_patterns", WORKOUT_COMPLETION_PATTERNS))
+    matcher.add("workout_issue", cfg("health", "workout_issue_patterns", WORKOUT_ISSUE_PATTERNS))
+
+    # Interactive workout
+    matcher.add("workout_start", [WORKOUT_START_REGEX])
+    matcher.add("workout_start_simple", WORKOUT_START_SIMPLE_PATTERNS, kind="contains")
+    matcher.add("workout_start_completion", WORKOUT_START_COMPLETION_EXCLUSIONS, kind="contains")
+    matcher.add("workout_start_routine", WORKOUT_START_ROUTINE_EXCLUSIONS, kind="contains")
+    matcher.add("workout_query_exclusion", cfg("workout", "query_exclusions", WORKOUT_QUERY_EXCLUSIONS), kind="contains")
+    for color, patterns in cfg("workout", "traffic_override_patterns", TRAFFIC_OVERRIDE_PATTERNS).items():
+        matcher.add(f"traffic_{color.lower()}", patterns, kind="contains")
+    matcher.add("schedule_status", cfg("workout", "schedule_status_patterns", SCHEDULE_STATUS_PATTERNS), kind="contains")
+    matcher.add("phase_start", cfg("workout", "phase_start_patterns", PHASE_START_PATTERNS), kind="contains")
+    matcher.add("phase_reset", cfg("workout", "phase_reset_patterns", PHASE_RESET_PATTERNS), kind="contains")
+    matcher.add("phase_confirm", cfg("workout", "phase_confirm_patterns", PHASE_CONFIRM_PATTERNS), kind="contains")
+    matcher.add("workout_ready", cfg("workout", "ready_patterns", WORKOUT_READY_PATTERNS), kind="contains")
+    matcher.add("workout_set_done", cfg("workout", "set_done_patterns", WORKOUT_SET_DONE_PATTERNS), kind="contains")
+    matcher.add("workout_skip", cfg("workout", "skip_patterns", WORKOUT_SKIP_PATTERNS), kind="contains")
+    # Bare "stop" only counts as the whole utterance (checked in the predicate)
+    matcher.add(
+        "workout_stop",
+        [p for p in cfg("workout", "stop_patterns", WORKOUT_STOP_PATTERNS) if p != "stop"],
+        kind="contains",
+    )
+    matcher.add("stop_negation", STOP_NEGATION_PATTERNS, kind="contains")
+
+    # Morning routine
+    matcher.add("routine_start", cfg("routine", "start_patterns", ROUTINE_START_PATTERNS), kind="contains")
+    # Bare "wait" only counts at the start (checked in the predicate)
+    matcher.add(
+        "routine_pause",
+        [p for p in cfg("routine", "pause_patterns", ROUTINE_PAUSE_PATTERNS) if p != "wait"],
+        kind="contains",
+    )
+    matcher.add("routine_resume", cfg("routine", "resume_patterns", ROUTINE_RESUME_PATTERNS), kind="contains")
+    matcher.add("routine_skip", cfg("routine", "skip_patterns", ROUTINE_SKIP_PATTERNS), kind="contains")
+    matcher.add(
+        "routine_stop",
+        [p for p in cfg("routine", "stop_patterns", ROUTINE_STOP_PATTERNS) if p != "stop"],
+        kind="contains",
+    )
+    matcher.add("routine_complete", cfg("routine", "complete_patterns", ROUTINE_COMPLETE_PATTERNS), kind="contains")
+    matcher.add("routine_form", cfg("routine", "form_patterns", ROUTINE_FORM_PATTERNS))
+    matcher.add("routine_ready", cfg("routine", "ready_patterns", ROUTINE_READY_PATTERNS), kind="contains")
+
+    # Seneca Trial
+    matcher.add("reflection_start", REFLECTION_TRIGGERS + QUICK_REFLECTION_TRIGGERS, kind="contains")
+    matcher.add("quick_reflection", QUICK_REFLECTION_TRIGGERS, kind="contains")
+
+    # Assessment protocol
+    assess_start = cfg("assessment", "start_patterns", ASSESS_START_PATTERNS)
+    assess_resume = cfg("assessment", "resume_patterns", ASSESS_RESUME_PATTERNS)
+    matcher.add("assess_start", assess_start, kind="contains")
+    matcher.add("assess_start_prefix", assess_start, kind="prefix")
+    matcher.add("assess_resume", assess_resume, kind="contains")
+    matcher.add("assess_resume_prefix", assess_resume, kind="prefix")
+    matcher.add("assess_timer_start", cfg("assessment", "timer_start", ASSESS_TIMER_START), kind="contains")
+    matcher.add("assess_timer_stop", cfg("assessment", "timer_stop", ASSESS_TIMER_STOP), kind="contains")
+    matcher.add("assess_info", cfg("assessment", "info_patterns", ASSESS_INFO_PATTERNS))
+    for cmd, patterns in cfg("assessment", "commands", ASSESS_COMMANDS).items():
+        matcher.add(f"assess_cmd_{cmd}", patterns, kind="contains")
+
+    return matcher
+
+
+def get_intent_matcher() -> PatternMatcher:
+    """Get the shared intent matcher (built on first use)."""
+    global _intent_matcher
+    if _intent_matcher is None:
+        _intent_matcher = build_intent_matcher()
+    return _intent_matcher
 
 # Exercise library - loaded from JSON file
 EXERCISE_LIBRARY_PATH = Path(__file__).parent.parent.parent / "config" / "exercises" / "exercise_library.json"
@@ -708,14 +857,37 @@ Speak like a mentor who has seen much and wastes no words.
 class BridgeFileServer:
     """WSL2 server that processes audio via file-based communication."""
 
-    def __init__(self):
+    def __init__(self, transport: str = "socket", hedge: bool = False):
         print("Loading ATLAS components...", flush=True)
+        # Client I/O (file protocol until setup() binds the configured transport)
+        self.transport_kind = transport
+        self.transport: BridgeTransport = FileTransport(BRIDGE_DIR)
+        # Session status kept in memory; timer ticks publish only changed fields
+        self.status_publisher = SessionStatusPublisher(
+            publish=lambda status, persist: self.transport.publish_session_status(status, persist=persist),
+            publish_delta=lambda delta: self.transport.publish_session_delta(delta),
+        )
         # Use faster-whisper since moonshine API changed
         # base.en is 2-3x faster than small.en, good accuracy for voice
         self.stt = get_stt("faster-whisper", model="base.en")
         self.current_voice = self._read_voice_preference()
         self.tts = self._get_tts_for_voice(self.current_voice)
-        self.router = get_router(system_prompt=SYSTEM_PROMPT)
+        # Synthesized timer prompts and announcements, reused across sessions
+        # (pre-render with scripts/prerender_tts.py)
+        self.audio_cache = AudioCache()
+        # One thread speaks autonomous messages in priority order (replaces a
+        # thread per message and sleep-based playback waits)
+        self.audio_output = AudioOutput(
+            synthesize=lambda text: self.audio_cache.synthesize(self.tts, text),
+            write_audio=lambda audio, rate: self.transport.write_audio(audio, rate),
+            write_status=self.write_status,
+        )
+        # hedge: race local against Haiku for uncertain queries (see atlas/llm/router.py)
+        self.router = get_router(config=RouterConfig(enable_hedging=hedge), system_prompt=SYSTEM_PROMPT)
+        # Router reflexes + intent patterns in one matcher: classify() and the
+        # intent dispatcher share a single pass over each utterance
+        self.router.matcher = get_intent_matcher()
+        self.router.matcher.compile()
         self.llm = get_client()
         self._session_cost = 0.0  # Track session cost for launcher
         self._pending_workout = None  # Track pending workout for confirmation flow
@@ -726,8 +898,18 @@ class BridgeFileServer:
         self.routine = RoutineState()
         self.timer = TimerState()
 
+        # One event loop for the session: intent handlers, LLM streaming and
+        # Garmin sync all run on it (asyncio.run() per call would rebuild the
+        # loop each time and strand async clients bound to the old one)
+        self.event_loop = LoopThread("atlas-bridge")
+
+        # One dispatcher for the session (keeps per-intent match timings)
+        from atlas.voice.intent_dispatcher import IntentDispatcher
+        self.intent_dispatcher = IntentDispatcher(self)
+
         # Progressive overload service
         self._progression_service = None  # Lazy-loaded
+        self._workout_recommendations: dict = {}  # exercise_id -> recommendation (current workout)
 
         # Workout scheduler service
         self._workout_scheduler = None  # Lazy-loaded
@@ -747,66 +929,39 @@ class BridgeFileServer:
         self.stt._ensure_loaded()
         print("  Preloading TTS model...", flush=True)
         self.tts._ensure_loaded()
-        print("  Preloading router embeddings...", flush=True)
+        print("  Preloading shared embeddings (router + memory)...", flush=True)
         self.router._get_embedder()
+        print("  Warming up local LLM...", flush=True)
+        warm_ms = self.router.warm_up_local()
+        if warm_ms is None:
+            print("  [Local LLM not reachable - skipping warm-up]", flush=True)
+        else:
+            print(f"  [Local LLM ready: {warm_ms:.0f}ms]", flush=True)
 
         print("Components loaded and ready.", flush=True)
 
     def setup(self):
-        """Create bridge directory and files."""
-        BRIDGE_DIR.mkdir(exist_ok=True)
-        # Clear old files
-        for f in [AUDIO_IN_FILE, AUDIO_OUT_FILE, COMMAND_FILE, STATUS_FILE]:
-            if f.exists():
-                f.unlink()
+        """Create bridge directory, clear old files and bind the transport."""
+        self.transport = create_transport(self.transport_kind, BRIDGE_DIR)
         print(f"Bridge directory: {BRIDGE_DIR}")
+        if self.transport.name == "socket":
+            host, port = self.transport.address
+            print(f"Bridge socket: {host}:{port} (file protocol as fallback)")
 
     def write_status(self, status: str):
-        """Write status to file."""
-        STATUS_FILE.write_text(status)
+        """Send status to the client (status.txt or a status frame)."""
+        self.transport.write_status(status)
 
-    def read_command(self) -> str:
-        """Read and clear command file."""
-        try:
-            cmd = COMMAND_FILE.read_text().strip()
-            COMMAND_FILE.unlink()
-            return cmd
-        except FileNotFoundError:
-            return ""
-
-    def write_metadata(self, sample_rate: int):
-        """Write audio metadata for Windows client."""
-        METADATA_FILE.write_text(f"sample_rate={sample_rate}")
-
-    def _autonomous_speak(self, text: str):
-        """Speak text autonomously via file bridge (same TTS path as normal responses)."""
-        logger.info(f"[TIMER-AUTO] Autonomous speech: {text}")
-        logger.debug(f"TIMER AUTO-SPEAK: {text}")
+    def _autonomous_speak(self, text: str, priority: int = PROMPT, key: str | None = None):
+        """Queue text for autonomous speech (returns immediately).
 
-        try:
-            # Synthesize with Kokoro TTS (same as normal responses)
-            result = self.tts.synthesize(text)
-
-            # Write to same output file (Windows client will play it)
-            audio_data = result.audio.astype(np.float32)
-            audio_data.tofile(AUDIO_OUT_FILE)
-
-            # Write metadata
-            self.write_metadata(result.sample_rate)
-
-            # Signal Windows to play
-            self.write_status("speaking")
-
-            # Wait for playback to complete (estimate based on audio length)
-            duration_seconds = len(result.audio) / result.sample_rate
-            time.sleep(duration_seconds + 0.5)  # Add buffer for Windows playback
-
-            # Signal done
-            self.write_status("DONE")
-
-        except Exception as e:
-            logger.error(f"[TIMER-AUTO] TTS failed: {e}")
-            logger.error(f"TIMER AUTO-SPEAK ERROR: {e}")
+        Args:
+            text: Message to speak
+            priority: RESPONSE for replies to UI commands, PROMPT for timer prompts
+            key: "workout" or "routine"; supersedes queued prompts of that activity
+        """
+        logger.info(f"[TIMER-AUTO] Autonomous speech: {text}")
+        self.audio_output.speak(text, priority=priority, key=key)
 
     def _check_and_play_timers(self):
         """Check all active timers and trigger autonomous prompts. Called every 100ms."""
@@ -822,13 +977,13 @@ class BridgeFileServer:
                     logger.warning(f"[TIMER-AUTO] Beep failed: {e}")
             # Then speak if there's a message
             if msg:
-                self._autonomous_speak(msg)
+                self._autonomous_speak(msg, key="workout")
 
         # Check if last set of timed exercise completed - advance to next
         if self.workout.last_set_of_timed_exercise:
             self.workout.last_set_of_timed_exercise = False
             try:
-                next_msg = asyncio.run(self._advance_to_next_exercise())
+                next_msg = self.event_loop.run(self._advance_to_next_exercise())
                 if next_msg:
                     self._autonomous_speak(next_msg)
             except Exception as e:
@@ -844,13 +999,13 @@ class BridgeFileServer:
                 except Exception as e:
                     logger.warning(f"[TIMER-AUTO] Beep failed: {e}")
             if msg:
-                self._autonomous_speak(msg)
+                self._autonomous_speak(msg, key="workout")
 
         # Check routine timer (morning routine)
         if self.routine.active and self.routine.timer_active:
             msg, done = self._check_routine_timer()
             if msg:
-                self._autonomous_speak(msg)
+                self._autonomous_speak(msg, key="routine")
             # When exercise completes, start auto-advance
             if done and not self.routine.auto_advance_pending:
                 self._start_routine_auto_advance()
@@ -899,11 +1054,21 @@ class BridgeFileServer:
         else:
             return get_tts(voice)
 
+    def _refresh_voice_preference(self):
+        """Swap TTS engine if the launcher changed the voice preference."""
+        new_voice = self._read_voice_preference()
+        if new_voice != self.current_voice:
+            print(f"  [Voice changed: {self.current_voice} -> {new_voice}]")
+            self.current_voice = new_voice
+            self.tts = self._get_tts_for_voice(new_voice)
+            self.tts._ensure_loaded()
+
     def _write_session_status(
         self, tier: str, confidence: float, cost: float = 0.0,
         user_text: str = "", atlas_response: str = "",
         stt_ms: float = 0, tts_ms: float = 0,
-        action: str = "", saved_to: str = ""
+        action: str = "", saved_to: str = "",
+        first_audio_ms: float = 0, streamed: bool = False
     ):
         """Write session status JSON for Windows launcher."""
         self._session_cost += cost
@@ -918,22 +1083,24 @@ class BridgeFileServer:
             },
             "timing": {
                 "stt_ms": int(stt_ms),
-                "tts_ms": int(tts_ms)
+                "tts_ms": int(tts_ms),
+                "first_audio_ms": int(first_audio_ms),
+                "streamed": streamed
             },
             "gpu": "CUDA" if self.tts.use_gpu else "CPU",
             "action": action,
             "saved_to": saved_to
         }
+        if self.router.response_cache is not None:
+            status["response_cache"] = self.router.response_cache.stats().as_dict()
+        status["tts_cache"] = self.audio_cache.stats().as_dict()
 
         # Add timer block if routine or workout timer is active
         timer_status = self._get_timer_status()
         if timer_status:
             status["timer"] = timer_status
 
-        # Atomic write: write to temp file then rename (prevents race condition with UI polling)
-        temp_file = SESSION_STATUS_FILE.with_suffix('.json.tmp')
-        temp_file.write_text(json.dumps(status, indent=2))
-        temp_file.replace(SESSION_STATUS_FILE)
+        self.status_publisher.publish(status)
 
     def _get_timer_status(self) -> dict | None:
         """Get current timer status for Command Centre UI."""
@@ -997,40 +1164,53 @@ class BridgeFileServer:
 
     def _get_weight_recommendation_for_timer(self, ex_id: str) -> float | None:
         """Get weight recommendation for timer display."""
-        if not self._progression_service:
-            return None
-        try:
-            rec = self._progression_service.get_recommendation(ex_id)
-            return rec.recommended_weight_kg if rec and rec.recommended_weight_kg else None
-        except Exception:
+        if not self._progression_service and ex_id not in self._workout_recommendations:
             return None
+        rec = self._workout_recommendation(ex_id)
+        return rec.recommended_weight_kg if rec and rec.recommended_weight_kg else None
 
-    def _write_timer_status(self):
-        """Write timer status to session_status.json (called frequently during active timers)."""
-        timer_status = self._get_timer_status()
+    def _workout_recommendation(self, exercise_id: str):
+        """Progression recommendation for an exercise, memoized for the workout.
 
-        # Read existing status to preserve other fields
-        if SESSION_STATUS_FILE.exists():
+        Computed once per exercise (prefetched when the workout starts) and
+        invalidated when a set is logged, instead of querying SQLite on
+        every timer tick. None if the lookup failed.
+        """
+        if exercise_id not in self._workout_recommendations:
             try:
-                status = json.loads(SESSION_STATUS_FILE.read_text())
-            except Exception:
-                status = {}
-        else:
-            status = {}
-
-        # Update timer block
-        if timer_status:
-            status["timer"] = timer_status
-        elif "timer" in status:
-            del status["timer"]
+                rec = self.progression_service.get_recommendation(exercise_id)
+            except Exception as e:
+                logger.warning(f"Progression recommendation failed for {exercise_id}: {e}")
+                rec = None
+            self._workout_recommendations[exercise_id] = rec
+        return self._workout_recommendations[exercise_id]
+
+    def _prefetch_workout_recommendations(self):
+        """Compute recommendations for every exercise in the new workout (one batch)."""
+        self._workout_recommendations = {}
+        exercise_ids = [
+            (getattr(ex, 'id', '') or ex.name).lower().replace(' ', '_')
+            for ex in self.workout.exercises
+        ]
+        try:
+            self._workout_recommendations = dict(
+                self.progression_service.get_recommendations_for_session(exercise_ids)
+            )
+        except Exception as e:
+            logger.warning(f"Session recommendations failed, falling back per exercise: {e}")
+        for exercise_id in exercise_ids:
+            self._workout_recommendation(exercise_id)
 
-        # Atomic write: write to temp file then rename (prevents race condition with UI polling)
-        temp_file = SESSION_STATUS_FILE.with_suffix('.json.tmp')
-        temp_file.write_text(json.dumps(status, indent=2))
-        temp_file.replace(SESSION_STATUS_FILE)
+    def _write_timer_status(self):
+        """Publish changed timer fields (called every ~100ms during active timers)."""
+        self.status_publisher.update_timer(self._get_timer_status())
 
     def _clear_timer_from_session_status(self):
         """Clear timer block from session_status.json (called on shutdown)."""
+        if self.status_publisher.document:
+            self.status_publisher.clear_timer()
+            return
+        # Nothing published yet this run: strip a stale timer left by the last one
         if SESSION_STATUS_FILE.exists():
             try:
                 status = json.loads(SESSION_STATUS_FILE.read_text())
@@ -1044,44 +1224,25 @@ class BridgeFileServer:
             except Exception as e:
                 logger.warning(f"Could not clear timer state: {e}")
 
+    def _intent_labels(self, text: str) -> frozenset[str]:
+        """All intent/reflex labels matching text (one pass, cached per utterance)."""
+        return get_intent_matcher().match(text)
+
     def _is_meal_intent(self, text: str) -> bool:
         """Check if text is a meal logging intent."""
-        text_lower = text.lower().strip()
-        for trigger in MEAL_TRIGGERS:
-            if text_lower.startswith(trigger):
-                return True
-        return False
+        return "meal" in self._intent_labels(text)
 
     def _is_capture_intent(self, text: str) -> bool:
         """Check if text is a thought capture intent."""
-        text_lower = text.lower().strip()
-        for trigger in CAPTURE_TRIGGERS:
-            if text_lower.startswith(trigger):
-                return True
-        return False
+        return "capture" in self._intent_labels(text)
 
     def _is_health_intent(self, text: str) -> bool:
         """Check if text is a health/status query."""
-        text_lower = text.lower().strip()
-        for pattern in HEALTH_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return "health" in self._intent_labels(text)
 
     def _is_skill_status_intent(self, text: str) -> bool:
         """Check if text is a skill/XP status query."""
-        text_lower = text.lower().strip()
-        skill_patterns = [
-            r"(what'?s|what is)\s+(my\s+)?(xp|skills?|levels?)",
-            r"skill\s+status",
-            r"(how|where)\s+(am|do)\s+i\s+(at|stand)",
-            r"my\s+(xp|skills?|levels?)",
-            r"check\s+(my\s+)?(xp|skills?|levels?)",
-        ]
-        for pattern in skill_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return "skill_status" in self._intent_labels(text)
 
     async def _handle_skill_status(self) -> str:
         """Handle skill/XP status query."""
@@ -1095,11 +1256,7 @@ class BridgeFileServer:
 
     def _is_workout_intent(self, text: str) -> bool:
         """Check if text is a workout query."""
-        text_lower = text.lower().strip()
-        for pattern in WORKOUT_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return "workout_query" in self._intent_labels(text)
 
     def _is_weight_intent(self, text: str) -> tuple[bool, "BodyComposition | None"]:
         """
@@ -1109,21 +1266,19 @@ class BridgeFileServer:
         """
         from atlas.voice.number_parser import parse_body_composition
 
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
 
         # Skip if it's a query rather than logging
-        for pattern in WEIGHT_QUERY_PATTERNS:
-            if re.search(pattern, text_lower):
-                return False, None
+        if "weight_query" in labels:
+            return False, None
 
         # Check if any weight pattern matches
-        for pattern in WEIGHT_PATTERNS:
-            if re.search(pattern, text_lower):
-                # Use the robust body composition parser
-                body_comp = parse_body_composition(text)
-                if body_comp and body_comp.weight_kg:
-                    return True, body_comp
-                return True, None
+        if "weight" in labels:
+            # Use the robust body composition parser
+            body_comp = parse_body_composition(text)
+            if body_comp and body_comp.weight_kg:
+                return True, body_comp
+            return True, None
 
         return False, None
 
@@ -1132,16 +1287,14 @@ class BridgeFileServer:
         Check if text is a weight/body composition query.
         Returns (is_query, query_type) where query_type is 'status', 'trend', or 'composition'.
         """
-        text_lower = text.lower().strip()
-
-        for pattern in WEIGHT_QUERY_PATTERNS:
-            if re.search(pattern, text_lower):
-                if "trend" in text_lower:
-                    return True, "trend"
-                elif "comp" in text_lower:
-                    return True, "composition"
-                else:
-                    return True, "status"
+        if "weight_query" in self._intent_labels(text):
+            text_lower = text.lower().strip()
+            if "trend" in text_lower:
+                return True, "trend"
+            elif "comp" in text_lower:
+                return True, "composition"
+            else:
+                return True, "status"
 
         return False, ""
 
@@ -1150,20 +1303,18 @@ class BridgeFileServer:
         text_lower = text.lower().strip()
 
         # Check patterns first
-        for pattern in EXERCISE_PATTERNS:
-            match = re.search(pattern, text_lower)
-            if match:
-                # Follow-up pattern ("that exercise") - use last mentioned exercise
-                if "that exercise" in text_lower or "this exercise" in text_lower:
-                    return True, self._last_exercise
-
-                # Try to find the exercise from the library
-                ex_id, _ = _find_exercise(text_lower)
-                if ex_id:
-                    return True, ex_id
+        if "exercise" in self._intent_labels(text):
+            # Follow-up pattern ("that exercise") - use last mentioned exercise
+            if "that exercise" in text_lower or "this exercise" in text_lower:
+                return True, self._last_exercise
 
-                # Pattern matched but couldn't identify - still an exercise question
-                return True, None
+            # Try to find the exercise from the library
+            ex_id, _ = _find_exercise(text_lower)
+            if ex_id:
+                return True, ex_id
+
+            # Pattern matched but couldn't identify - still an exercise question
+            return True, None
 
         # Also check if any exercise alias appears in the text even without pattern
         # This catches "goblet squat" by itself
@@ -1201,29 +1352,28 @@ class BridgeFileServer:
             return True, None, None, True
 
         # Check patterns
-        for pattern in PAIN_PATTERNS:
-            if re.search(pattern, text_lower):
-                # Extract body part
-                body_part = None
-                # Check longer aliases first (e.g., "lower back" before "back")
-                for alias in sorted(BODY_PART_ALIASES.keys(), key=len, reverse=True):
-                    if alias in text_lower:
-                        body_part = BODY_PART_ALIASES[alias]
-                        break
+        if "pain" in self._intent_labels(text):
+            # Extract body part
+            body_part = None
+            # Check longer aliases first (e.g., "lower back" before "back")
+            for alias in sorted(BODY_PART_ALIASES.keys(), key=len, reverse=True):
+                if alias in text_lower:
+                    body_part = BODY_PART_ALIASES[alias]
+                    break
 
-                # Extract pain level (0-10)
-                pain_level = None
-                # Look for patterns like "4 out of 10", "at 4", "is 4", "level 4"
-                level_match = re.search(r'(\d+)\s*(out of|/)?\s*10|(?:is|at|level)\s*(\d+)|(\d+)\s*(?:pain|level)', text_lower)
-                if level_match:
-                    for g in level_match.groups():
-                        if g and g.isdigit():
-                            level = int(g)
-                            if 0 <= level <= 10:
-                                pain_level = level
-                                break
+            # Extract pain level (0-10)
+            pain_level = None
+            # Look for patterns like "4 out of 10", "at 4", "is 4", "level 4"
+            level_match = re.search(r'(\d+)\s*(out of|/)?\s*10|(?:is|at|level)\s*(\d+)|(\d+)\s*(?:pain|level)', text_lower)
+            if level_match:
+                for g in level_match.groups():
+                    if g and g.isdigit():
+                        level = int(g)
+                        if 0 <= level <= 10:
+                            pain_level = level
+                            break
 
-                return True, body_part, pain_level, False
+            return True, body_part, pain_level, False
 
         return False, None, None, False
 
@@ -1440,14 +1590,12 @@ class BridgeFileServer:
 
         has_issues triggers the confirmation flow.
         """
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
 
         # Check for workout completion patterns
-        is_completion = any(re.search(p, text_lower) for p in WORKOUT_COMPLETION_PATTERNS)
-
-        if is_completion:
+        if "workout_completion" in labels:
             # Check for issue patterns that warrant confirmation
-            has_issues = any(re.search(p, text_lower) for p in WORKOUT_ISSUE_PATTERNS)
+            has_issues = "workout_issue" in labels
             return True, has_issues
 
         return False, False
@@ -1492,41 +1640,23 @@ class BridgeFileServer:
         - "begin stretch" (stretch = routine, not workout)
         - "what's my workout" (query, not action)
         """
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
 
         # Exclude completion phrases - these should be handled by completion intent
-        completion_words = ["finished", "completed", "done with", "wrapped up", "log workout", "track workout"]
-        if any(word in text_lower for word in completion_words):
+        if "workout_start_completion" in labels:
             return False
 
         # Exclude query phrases - these should be handled by workout query intent
-        if any(q in text_lower for q in WORKOUT_QUERY_EXCLUSIONS):
+        if "workout_query_exclusion" in labels:
             return False
 
         # Exclude routine/stretch keywords - these go to routine handler
-        routine_keywords = ["stretch", "routine", "morning", "rehab", "protocol"]
-        if any(kw in text_lower for kw in routine_keywords):
+        if "workout_start_routine" in labels:
             return False
 
-        # Regex: action verb + optional fillers + workout keyword
-        # Action verbs: start, begin, do, run, let's/lets
-        # Fillers: a, the, my, next, today's, todays (optional, can appear multiple times)
-        # Workout keywords: workout, strength, cardio, training, zone, mobility, work out
-        workout_pattern = re.compile(
-            r"\b(start|begin|do|run|let'?s)\b"  # Action verb
-            r"(\s+(a|the|my|next|today'?s?))?"   # Optional filler words (can chain)
-            r"(\s+(a|the|my|next|today'?s?))?"   # Allow second filler
-            r"\s+"                               # Required space
-            r"(work\s*out|workout|strength|cardio|training|zone|mobility)\b",  # Workout keyword
-            re.IGNORECASE
-        )
-
-        if workout_pattern.search(text_lower):
-            return True
-
-        # Also check simple patterns like "daily workout"
-        simple_patterns = ["daily workout", "daily work out"]
-        return any(p in text_lower for p in simple_patterns)
+        # Regex: action verb + optional fillers + workout keyword (WORKOUT_START_REGEX),
+        # or simple patterns like "daily workout"
+        return "workout_start" in labels or "workout_start_simple" in labels
 
     def _parse_workout_type(self, text: str) -> str | None:
         """Parse specific workout type from user text.
@@ -1603,21 +1733,19 @@ class BridgeFileServer:
 
     def _detect_traffic_override(self, text: str) -> str | None:
         """Detect if user is requesting a traffic light override."""
-        text_lower = text.lower().strip()
-        for color, patterns in TRAFFIC_OVERRIDE_PATTERNS.items():
-            if any(p in text_lower for p in patterns):
+        labels = self._intent_labels(text)
+        for color in TRAFFIC_OVERRIDE_PATTERNS:
+            if f"traffic_{color.lower()}" in labels:
                 return color
         return None
 
     def _is_schedule_status_intent(self, text: str) -> bool:
         """Check if user wants schedule/program status."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in SCHEDULE_STATUS_PATTERNS)
+        return "schedule_status" in self._intent_labels(text)
 
     def _is_phase_start_intent(self, text: str) -> bool:
         """Check if user wants to start/restart the program phase."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in PHASE_START_PATTERNS)
+        return "phase_start" in self._intent_labels(text)
 
     def _is_workout_ready_command(self, text: str) -> bool:
         """Check if user is ready to start set/exercise."""
@@ -1625,7 +1753,7 @@ class BridgeFileServer:
         # Single word matches for common commands
         if text_lower in ["ready", "start", "begin", "go"]:
             return True
-        return any(p in text_lower for p in WORKOUT_READY_PATTERNS)
+        return "workout_ready" in self._intent_labels(text)
 
     def _is_workout_set_done_command(self, text: str) -> bool:
         """Check if user finished their set."""
@@ -1633,24 +1761,22 @@ class BridgeFileServer:
         # Single word matches
         if text_lower in ["done", "finished", "complete"]:
             return True
-        return any(p in text_lower for p in WORKOUT_SET_DONE_PATTERNS)
+        return "workout_set_done" in self._intent_labels(text)
 
     def _is_workout_skip_command(self, text: str) -> bool:
         """Check if user wants to skip exercise."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in WORKOUT_SKIP_PATTERNS)
+        return "workout_skip" in self._intent_labels(text)
 
     def _is_workout_stop_command(self, text: str) -> bool:
         """Check if user wants to stop workout."""
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
         # Exclude negations: "don't stop", "can't stop", "won't stop"
-        negation_patterns = ["don't stop", "dont stop", "can't stop", "cant stop", "won't stop", "wont stop", "do not stop"]
-        if any(neg in text_lower for neg in negation_patterns):
+        if "stop_negation" in labels:
             return False
         # Exact "stop" by itself
-        if text_lower == "stop":
+        if text.lower().strip() == "stop":
             return True
-        return any(p in text_lower for p in WORKOUT_STOP_PATTERNS if p != "stop")
+        return "workout_stop" in labels
 
     def _is_workout_pause_command(self, text: str) -> bool:
         """Check if user wants to pause workout."""
@@ -1687,7 +1813,7 @@ class BridgeFileServer:
         # Exclude if "workout" is present - that's a workout intent, not routine
         if "workout" in text_lower or "work out" in text_lower:
             return False
-        return any(p in text_lower for p in ROUTINE_START_PATTERNS)
+        return "routine_start" in self._intent_labels(text)
 
     def _is_routine_pause_command(self, text: str) -> bool:
         """Check if user wants to pause routine."""
@@ -1698,37 +1824,30 @@ class BridgeFileServer:
         # "wait" must be exact or at start
         if text_lower == "wait" or text_lower.startswith("wait ") or text_lower.startswith("wait,"):
             return True
-        return any(p in text_lower for p in ROUTINE_PAUSE_PATTERNS if p != "wait")
+        return "routine_pause" in self._intent_labels(text)
 
     def _is_routine_resume_command(self, text: str) -> bool:
         """Check if user wants to resume routine."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in ROUTINE_RESUME_PATTERNS)
+        return "routine_resume" in self._intent_labels(text)
 
     def _is_routine_skip_command(self, text: str) -> bool:
         """Check if user wants to skip exercise."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in ROUTINE_SKIP_PATTERNS)
+        return "routine_skip" in self._intent_labels(text)
 
     def _is_routine_stop_command(self, text: str) -> bool:
         """Check if user wants to stop routine."""
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
         # Exclude negations: "don't stop", "can't stop", "won't stop"
-        negation_patterns = ["don't stop", "dont stop", "can't stop", "cant stop", "won't stop", "wont stop", "do not stop"]
-        if any(neg in text_lower for neg in negation_patterns):
+        if "stop_negation" in labels:
             return False
         # "stop" alone should stop routine when active
-        if text_lower == "stop":
+        if text.lower().strip() == "stop":
             return True
-        return any(p in text_lower for p in ROUTINE_STOP_PATTERNS if p != "stop")
+        return "routine_stop" in labels
 
     def _is_routine_form_request(self, text: str) -> bool:
         """Check if user is asking for form/setup help."""
-        text_lower = text.lower().strip()
-        for pattern in ROUTINE_FORM_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return "routine_form" in self._intent_labels(text)
 
     def _is_routine_ready_command(self, text: str) -> bool:
         """Check if user is ready to start exercise timer."""
@@ -1736,7 +1855,7 @@ class BridgeFileServer:
         # Single word matches
         if text_lower in ["ready", "begin", "go", "start"]:
             return True
-        return any(p in text_lower for p in ROUTINE_READY_PATTERNS)
+        return "routine_ready" in self._intent_labels(text)
 
     def _is_routine_complete_command(self, text: str) -> bool:
         """Check if user is saying routine is complete."""
@@ -1744,7 +1863,7 @@ class BridgeFileServer:
         # Single word matches
         if text_lower in ["finished", "complete", "done"]:
             return True
-        return any(p in text_lower for p in ROUTINE_COMPLETE_PATTERNS)
+        return "routine_complete" in self._intent_labels(text)
 
     def _is_routine_last_exercise(self) -> bool:
         """Check if current exercise is the last one in the routine."""
@@ -1764,15 +1883,12 @@ class BridgeFileServer:
 
     def _is_reflection_start_intent(self, text: str) -> bool:
         """Check if user wants to start a reflection."""
-        text_lower = text.lower().strip()
-        # Check both full and quick triggers
-        all_triggers = REFLECTION_TRIGGERS + QUICK_REFLECTION_TRIGGERS
-        return any(t in text_lower for t in all_triggers)
+        # Matches both full and quick triggers
+        return "reflection_start" in self._intent_labels(text)
 
     def _is_quick_reflection_intent(self, text: str) -> bool:
         """Check if user wants quick reflection mode."""
-        text_lower = text.lower().strip()
-        return any(t in text_lower for t in QUICK_REFLECTION_TRIGGERS)
+        return "quick_reflection" in self._intent_labels(text)
 
     def _is_reflection_active(self) -> bool:
         """Check if a reflection session is currently active."""
@@ -1960,6 +2076,7 @@ class BridgeFileServer:
             self.workout.exercise_sides_done = 0
             self.workout.exercise_beeps_played = set()
             self.workout.last_set_of_timed_exercise = False
+            self._prefetch_workout_recommendations()
 
             # Announce workout with day info, override, and catch-up messages
             response = f"{day_msg}{catch_up_msg}{override_msg}{protocol.name}. {protocol.duration_minutes} minutes. "
@@ -2053,7 +2170,7 @@ class BridgeFileServer:
                     logger.info("[READY-DIAG] First set, getting progression recommendation")
                     exercise_id = ex.get('id', ex.get('name', '')).lower().replace(' ', '_')
                     try:
-                        rec = self.progression_service.get_recommendation(exercise_id)
+                        rec = self._workout_recommendation(exercise_id)
                         voice_prompt = self.progression_service.format_voice_recommendation(rec)
                         if voice_prompt:
                             # Set the recommended weight so next "ready" proceeds
@@ -2222,6 +2339,8 @@ class BridgeFileServer:
                         actual_reps_avg=avg_reps,
                         basis="workout_session",
                     )
+                    # Logged sets change recommendations (and deload checks)
+                    self._workout_recommendations = {}
                 except Exception as e:
                     logger.warning(f"Failed to log progression: {e}")
 
@@ -2257,33 +2376,8 @@ class BridgeFileServer:
             self.workout.active = False
             return "Workout complete! Say finished workout to log it."
 
-        # Handle cardio/continuous sessions differently
-        if ex.get('is_continuous'):
-            duration_mins = ex.get('duration_minutes', 50)
-            response = f"Next: {ex['name']}. {duration_mins} minutes continuous. "
-            if ex.get('notes'):
-                response += f"{ex['notes']} "
-            response += "Say ready to begin, done when finished."
-        else:
-            response = f"Next: {ex['name']}. {ex['sets']} sets"
-            if ex.get('reps'):
-                response += f" of {ex['reps']}"
-                if ex.get('per_side'):
-                    response += " each side"
-            elif ex.get('duration_seconds'):
-                response += f" for {ex['duration_seconds']} seconds"
-                if ex.get('per_side'):
-                    response += " each side"
-                else:
-                    response += " each"
-            if ex.get('per_direction'):
-                response += " each direction"
-            if ex.get('hold_seconds'):
-                response += f". Hold {ex['hold_seconds']} seconds each rep"
-            if ex.get('notes'):
-                # Notes are curated form cues - don't truncate
-                response += f". {ex['notes']}"
-            response += ". Say ready when set up."
+        # Cardio/continuous sessions are announced differently (see announcements.py)
+        response = announcements.workout_exercise_intro(ex)
 
         self.workout.exercise_pending = True
         return response
@@ -2444,8 +2538,7 @@ class BridgeFileServer:
 
     def _is_reset_pattern(self, text: str) -> bool:
         """Check if this is a reset pattern (needs confirmation)."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in PHASE_RESET_PATTERNS)
+        return "phase_reset" in self._intent_labels(text)
 
     async def _handle_phase_start_request(self, original_text: str = "") -> str:
         """Request to start/reset program phase - requires confirmation for resets."""
@@ -2485,8 +2578,7 @@ class BridgeFileServer:
 
     def _is_phase_confirm_command(self, text: str) -> bool:
         """Check if user is confirming phase reset."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in PHASE_CONFIRM_PATTERNS)
+        return "phase_confirm" in self._intent_labels(text)
 
     def _is_cancel_command(self, text: str) -> bool:
         """Check if user is cancelling."""
@@ -2526,7 +2618,7 @@ class BridgeFileServer:
             self.workout.set_active = False
             self.workout.exercise_pending = True  # Wait for ready
             next_set = self.workout.current_set + 1
-            return f"Rest done. Set {next_set}. Say ready when you're set.", []
+            return announcements.rest_done(next_set), []
 
         return None, new_beeps
 
@@ -2569,7 +2661,7 @@ class BridgeFileServer:
                 self.workout.exercise_current_side = 'right'
                 self.workout.exercise_timer_start = time.monotonic()
                 self.workout.exercise_beeps_played = set()
-                return "Switch sides. Right leg. Begin.", []
+                return announcements.SWITCH_TO_RIGHT, []
             else:
                 # Both sides done (or non-per_side exercise) - play SET COMPLETE chime
                 try:
@@ -2606,23 +2698,23 @@ class BridgeFileServer:
                         if ex.get('per_side', False):
                             self.workout.exercise_current_side = 'left'
                             self.workout.exercise_sides_done = 0
-                            return f"Set {self.workout.current_set}. Left side. Begin.", []
+                            return announcements.set_begin(self.workout.current_set, per_side=True), []
                         else:
-                            return f"Set {self.workout.current_set}. Begin.", []
+                            return announcements.set_begin(self.workout.current_set), []
                     else:
                         # Start rest timer
                         self.workout.rest_active = True
                         self.workout.rest_start = time.monotonic()
                         self.workout.rest_duration = rest_seconds
                         self.workout.beeps_played = set()
-                        return f"Set {self.workout.current_set} complete. Rest {rest_seconds} seconds.", []
+                        return announcements.set_complete_rest(self.workout.current_set, rest_seconds), []
                 else:
                     # Last set done - move to next exercise
                     self.workout.exercise_pending = False
                     # Note: We don't call _advance_to_next_exercise() here since it's async
                     # Instead, set a flag for the main loop to handle
                     self.workout.last_set_of_timed_exercise = True
-                    return "Last set complete. Moving to next exercise.", []
+                    return announcements.LAST_SET_COMPLETE, []
 
         return None, []
 
@@ -2868,7 +2960,8 @@ class BridgeFileServer:
                 return None
 
             # Get latest activity (within last 4 hours)
-            hr_data = await garmin.sync_latest_activity()
+            with span("garmin_activity_sync"):
+                hr_data = await garmin.sync_latest_activity()
             if not hr_data:
                 logger.debug("No recent Garmin activity found")
                 return None
@@ -2962,7 +3055,7 @@ class BridgeFileServer:
 
     async def _handle_health_status(self, text: str = "") -> str:
         """Get morning status from cache or sync fresh."""
-        from atlas.health.morning_sync import get_morning_status, format_status_voice, format_briefing_voice
+        from atlas.health.morning_sync import get_morning_status_async, format_status_voice, format_briefing_voice
 
         # Detect if user wants detailed briefing
         text_lower = text.lower()
@@ -2971,7 +3064,8 @@ class BridgeFileServer:
             "how was", "how did", "sleep", "overview"
         ])
 
-        status = get_morning_status()
+        # Awaited on the bridge loop (a stale cache syncs Garmin here)
+        status = await get_morning_status_async()
 
         if wants_briefing:
             return format_briefing_voice(status)
@@ -3635,27 +3729,7 @@ class BridgeFileServer:
 
     def _get_exercise_setup_tip(self, exercise_id: str, exercise_name: str) -> str | None:
         """Get brief setup tip for exercise (for auto-advance announcements)."""
-        form_guides = self._load_routine_form_guides()
-        if not form_guides:
-            return None
-
-        ex_id = exercise_id.lower()
-        ex_name = exercise_name.lower()
-
-        # Try exact ID match first
-        if ex_id in form_guides:
-            return form_guides[ex_id].get('setup', '')
-
-        # Try matching by name or aliases
-        for guide_id, guide in form_guides.items():
-            guide_name = guide.get('name', '').lower()
-            aliases = [a.lower() for a in guide.get('aliases', [])]
-
-            if (ex_name in guide_name or guide_name in ex_name or
-                any(alias in ex_name or ex_name in alias for alias in aliases)):
-                return guide.get('setup', '')
-
-        return None
+        return announcements.setup_tip(self._load_routine_form_guides(), exercise_id, exercise_name)
 
     def _count_routine_exercises(self) -> int:
         """Count total exercises in routine, excluding reminders."""
@@ -4024,7 +4098,7 @@ class BridgeFileServer:
                 chime_side_switch()
             except Exception:
                 pass
-            return "Switch sides.", False  # Not complete yet
+            return announcements.SWITCH_SIDES, False  # Not complete yet
 
         if remaining <= 0 and not self.routine.exercise_complete:
             self.routine.exercise_complete = True
@@ -4034,7 +4108,7 @@ class BridgeFileServer:
                 chime_exercise_complete()
             except ImportError:
                 pass
-            return "Exercise complete.", True
+            return announcements.EXERCISE_COMPLETE, True
 
         return None, False
 
@@ -4079,16 +4153,9 @@ class BridgeFileServer:
             # Store name for UI display during transition
             self.routine.next_exercise_name = ex_name
 
-            # Get setup tip from form guides
-            setup_tip = self._get_exercise_setup_tip(next_ex.id, next_ex.name)
-
             # Build announcement: "Get ready. Next exercise: Cat-Cow. Get on all fours."
-            if setup_tip:
-                return f"Get ready. Next exercise: {ex_name}. {setup_tip}"
-            elif next_ex.cues:
-                return f"Get ready. Next exercise: {ex_name}. {next_ex.cues[0]}"
-            else:
-                return f"Get ready. Next exercise: {ex_name}."
+            setup_tip = self._get_exercise_setup_tip(next_ex.id, next_ex.name)
+            return announcements.next_exercise_announcement(ex_name, setup_tip, next_ex.cues)
 
         # Check next section
         next_section_idx += 1
@@ -4101,17 +4168,11 @@ class BridgeFileServer:
                 # Store name for UI display during transition
                 self.routine.next_exercise_name = ex_name
 
-                # Get setup tip from form guides
-                setup_tip = self._get_exercise_setup_tip(next_ex.id, next_ex.name)
-
                 # Include section transition - announce clearly
-                section_msg = f"Section complete. Next section: {next_section.name}. Get ready. Next exercise: {ex_name}."
-                if setup_tip:
-                    return f"{section_msg} {setup_tip}"
-                elif next_ex.cues:
-                    return f"{section_msg} {next_ex.cues[0]}"
-                else:
-                    return section_msg
+                setup_tip = self._get_exercise_setup_tip(next_ex.id, next_ex.name)
+                return announcements.next_exercise_announcement(
+                    ex_name, setup_tip, next_ex.cues, next_section=next_section.name
+                )
 
         # Routine complete
         self.routine.next_exercise_name = None
@@ -4142,7 +4203,7 @@ class BridgeFileServer:
 
                     # NOW advance to next exercise FIRST (so UI shows READY? screen)
                     try:
-                        asyncio.run(self._advance_routine_exercise_silent())
+                        self.event_loop.run(self._advance_routine_exercise_silent())
                     except Exception as e:
                         logger.error(f"[ROUTINE AUTO-ADVANCE] Advance failed: {e}")
                         self.routine.auto_advance_pending = False
@@ -4158,7 +4219,7 @@ class BridgeFileServer:
                     # No next exercise = routine complete
                     logger.debug("ROUTINE AUTO-ADVANCE Routine complete")
                     try:
-                        msg = asyncio.run(self._handle_routine_complete())
+                        msg = self.event_loop.run(self._handle_routine_complete())
                         self._autonomous_speak(msg)
                     except Exception as e:
                         logger.error(f"[ROUTINE AUTO-ADVANCE] Complete failed: {e}")
@@ -4182,7 +4243,7 @@ class BridgeFileServer:
                         self._auto_start_routine_timer()
                     else:
                         # No timer exercise (like Morning Sunlight) - just announce
-                        self._autonomous_speak(f"{ex.get('name', 'Exercise')}. No timer needed. Say finished or skip.")
+                        self._autonomous_speak(announcements.no_timer_needed(ex.get('name', 'Exercise')))
 
     def _auto_start_routine_timer(self):
         """Auto-start routine timer (Command Centre autonomous flow)."""
@@ -4209,14 +4270,7 @@ class BridgeFileServer:
             pass
 
         # Build and speak the "Go" message
-        duration = self.routine.timer_duration
-        if is_per_side:
-            half_duration = duration // 2
-            msg = f"Go. Left side. {half_duration} seconds."
-        else:
-            msg = f"Go. {duration} seconds."
-
-        self._autonomous_speak(msg)
+        self._autonomous_speak(announcements.routine_go(self.routine.timer_duration, is_per_side), key="routine")
 
     async def _advance_routine_exercise_silent(self):
         """Advance to next exercise without speaking (for auto-advance flow)."""
@@ -4306,13 +4360,11 @@ class BridgeFileServer:
 
     def _is_assessment_start_intent(self, text: str) -> bool:
         """Check if text is starting a new assessment."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in ASSESS_START_PATTERNS)
+        return "assess_start" in self._intent_labels(text)
 
     def _is_assessment_resume_intent(self, text: str) -> bool:
         """Check if text is resuming an assessment."""
-        text_lower = text.lower().strip()
-        return any(p in text_lower for p in ASSESS_RESUME_PATTERNS)
+        return "assess_resume" in self._intent_labels(text)
 
     def _is_assessment_active(self) -> bool:
         """Check if assessment session is active."""
@@ -4327,11 +4379,10 @@ class BridgeFileServer:
 
     def _get_assessment_command(self, text: str) -> str | None:
         """Check if text matches an assessment command."""
-        text_lower = text.lower().strip()
-        for cmd, patterns in ASSESS_COMMANDS.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    return cmd
+        labels = self._intent_labels(text)
+        for cmd in ASSESS_COMMANDS:
+            if f"assess_cmd_{cmd}" in labels:
+                return cmd
         return None
 
     def _is_timer_start(self, text: str) -> bool:
@@ -4341,26 +4392,20 @@ class BridgeFileServer:
         if text_lower in ["go", "start", "ready", "begin"]:
             return True
         # Check for phrase matches
-        return any(phrase in text_lower for phrase in ASSESS_TIMER_START)
+        return "assess_timer_start" in self._intent_labels(text)
 
     def _is_timer_stop(self, text: str) -> bool:
         """Check for timer stop command."""
-        text_lower = text.lower().strip()
-        return any(stop_word in text_lower for stop_word in ASSESS_TIMER_STOP)
+        return "assess_timer_stop" in self._intent_labels(text)
 
     def _is_assessment_info_intent(self, text: str) -> bool:
         """Check if querying assessment info (not starting or resuming)."""
-        text_lower = text.lower().strip()
+        labels = self._intent_labels(text)
         # Exclude if text STARTS with start/resume patterns (those trigger sessions)
         # "start baseline" → action, but "how long is baseline assessment" → info
-        for p in ASSESS_START_PATTERNS:
-            if text_lower.startswith(p):
-                return False
-        for p in ASSESS_RESUME_PATTERNS:
-            if text_lower.startswith(p):
-                return False
-        # Use pre-compiled patterns for efficiency
-        return any(pattern.search(text_lower) for pattern in ASSESS_INFO_COMPILED)
+        if "assess_start_prefix" in labels or "assess_resume_prefix" in labels:
+            return False
+        return "assess_info" in labels
 
     async def _handle_assessment_info(self, text: str) -> str:
         """Provide information about assessment protocol without starting it."""
@@ -4575,19 +4620,38 @@ class BridgeFileServer:
 
         return False, elapsed
 
-    def process_audio(self):
-        """Process audio file through ATLAS pipeline."""
-        from atlas.voice.intent_dispatcher import IntentDispatcher, _make_decision
+    def process_audio(self, audio: np.ndarray, stream: bool = False):
+        """Process recorded audio through ATLAS pipeline.
+
+        The turn runs as a coroutine on the bridge event loop; the awaited
+        steps (STT, dispatch, LLM, TTS) are logged as one trace line.
+
+        Args:
+            audio: Float32 mono audio at SAMPLE_RATE_IN (from the transport)
+            stream: Sentence-level streaming (PROCESS_STREAM). Each sentence is
+                synthesized while the LLM is still generating and delivered as a
+                separate chunk (see atlas/voice/streaming.py). Otherwise the full
+                response is delivered once.
+        """
+        # Queued timer prompts wait until the response is out
+        with self.audio_output.response(), self.event_loop.turn("PROCESS_STREAM" if stream else "PROCESS") as trace:
+            try:
+                self.event_loop.run(self._process_turn(audio, stream))
+            finally:
+                trace.finish()
+                logger.info(f"[Trace] {trace.format()}")
 
-        # Read audio
-        audio = np.fromfile(AUDIO_IN_FILE, dtype=np.float32)
-        AUDIO_IN_FILE.unlink()
+    async def _process_turn(self, audio: np.ndarray, stream: bool):
+        """One voice turn (see process_audio()). Blocking model calls go to the loop's executor."""
+        from atlas.voice.intent_dispatcher import _make_decision
 
         print(f"\nProcessing {len(audio) / SAMPLE_RATE_IN:.1f}s of audio...")
 
         # STT
-        start = time.perf_counter()
-        transcription = self.stt.transcribe(audio, SAMPLE_RATE_IN)
+        turn_start = time.perf_counter()
+        start = turn_start
+        with span("stt"):
+            transcription = await asyncio.to_thread(self.stt.transcribe, audio, SAMPLE_RATE_IN)
         stt_time = (time.perf_counter() - start) * 1000
         print(f"You: {transcription.text}")
         print(f"  [STT: {stt_time:.0f}ms]")
@@ -4598,13 +4662,16 @@ class BridgeFileServer:
             return
 
         # Route
-        decision = self.router.classify(transcription.text)
+        with span("route"):
+            decision = self.router.classify(transcription.text)
         print(f"  [Route: {decision.tier.value}, conf: {decision.confidence:.2f}]")
 
         # Collect all audio to send back
         all_audio = []
         tts_sample_rate = 24000  # Will be updated by actual TTS output
         tts_time = 0  # Track TTS timing for launcher
+        first_audio_ms = 0  # Turn start -> first playable audio
+        synthesized = None  # (audio, sample_rate) of a complete response, for the cache
 
         # Check intents BEFORE LLM routing
         response_text = ""
@@ -4612,8 +4679,35 @@ class BridgeFileServer:
         saved_to = ""  # Where data was saved (if applicable)
 
         # Try intent dispatch first
-        dispatcher = IntentDispatcher(self)
-        intent_result = dispatcher.dispatch(transcription.text)
+        with span("dispatch"):
+            intent_result = await self.intent_dispatcher.dispatch(transcription.text)
+
+        # Then a cached answer to a matching earlier query (skips the LLM,
+        # and TTS too when audio for the current voice was kept)
+        cached = None
+        cached_audio = None
+        if intent_result:
+            self._invalidate_response_cache(intent_result)
+        else:
+            with span("cache_lookup"):
+                cached = self.router.lookup_cached(transcription.text)
+            if cached:
+                self._refresh_voice_preference()
+                cached_audio = cached.audio_for(self.current_voice)
+
+        # Streaming mode: TTS worker consumes sentences as they complete
+        speaker = None
+        segmenter = SentenceSegmenter()
+        if stream and cached_audio is None:
+            self._refresh_voice_preference()
+            speaker = StreamingSpeaker(self.tts, self.transport.audio_writer())
+            speaker.start()
+
+        def speak_completed(text: str):
+            """Hand any sentences completed by text to the streaming TTS worker."""
+            if speaker:
+                for sentence in segmenter.feed(text):
+                    speaker.say(sentence)
 
         if intent_result:
             # Intent was handled - extract results
@@ -4622,6 +4716,12 @@ class BridgeFileServer:
             saved_to = intent_result.saved_to
             if intent_result.tier_override:
                 decision = _make_decision(intent_result.tier_override)
+        elif cached:
+            response_text = cached.response
+            action_type = "cached"
+            decision = _make_decision("CACHE")
+            print(f"ATLAS: {response_text}")
+            print(f"  [Cache hit: {cached.tier} answer, {cached.hits} hits, saved ~{cached.llm_ms:.0f}ms]")
         else:
             # No intent matched - fall through to LLM
             print("ATLAS: ", end="", flush=True)
@@ -4635,22 +4735,33 @@ class BridgeFileServer:
 
             async def get_response():
                 nonlocal response_text
+                trace = current_trace()
+                llm_start = time.perf_counter()
                 try:
                     async for token in self.router.route_and_stream(
                         augmented_query,  # Use augmented query with context
                         temperature=0.7,
                         max_tokens=100,  # Keep responses short for voice
+                        # An answer that leans on the conversation isn't reusable
+                        cache_key=None if session_context else transcription.text,
                     ):
+                        if trace and not response_text:
+                            trace.add("llm_first_token", llm_start, time.perf_counter())
                         response_text += token
                         print(token, end="", flush=True)
+                        speak_completed(token)
                 except Exception as api_error:
                     # API failed - try local LLM
                     logger.warning(f"API error: {api_error}, trying local LLM...")
                     print(f"\n  [API error: {type(api_error).__name__}, trying local...]", flush=True)
                     response_text = ""
+                    segmenter.reset()
+                    if speaker:
+                        # Don't play the start of the cloud answer before the local one
+                        speaker.cancel()
                     try:
-                        # OllamaClient uses generate() not chat()
-                        local_response = self.llm.generate(
+                        local_response = await asyncio.to_thread(
+                            self.llm.generate,
                             prompt=transcription.text,
                             system=SYSTEM_PROMPT,
                             temperature=0.7,
@@ -4658,9 +4769,11 @@ class BridgeFileServer:
                         )
                         response_text = local_response.content
                         print(response_text, flush=True)
+                        speak_completed(response_text)
                     except Exception as local_error:
                         logger.error(f"Local LLM also failed: {local_error}")
                         response_text = f"Both cloud and local LLM failed. Cloud: {type(api_error).__name__}. Local: {type(local_error).__name__}"
+                        speak_completed(response_text)
                         print(response_text)
 
             async def get_response_with_timeout():
@@ -4669,26 +4782,69 @@ class BridgeFileServer:
                 except asyncio.TimeoutError:
                     nonlocal response_text
                     response_text = "Sorry, I took too long. Try again."
+                    segmenter.reset()
+                    if speaker:
+                        speaker.cancel()
+                    speak_completed(response_text)
                     print(response_text)
 
-            asyncio.run(get_response_with_timeout())
+            with span("llm"):
+                await get_response_with_timeout()
             print()
 
+        if speaker:
+            # Speak whatever the token loop has not: the LLM tail, or the whole
+            # response when it came from an intent handler or the cache
+            if intent_result or cached:
+                for sentence in split_sentences(response_text):
+                    speaker.say(sentence)
+            else:
+                speaker.say(segmenter.flush())
+            with span("tts"):
+                stats = await asyncio.to_thread(speaker.finish)
+            tts_time = stats.tts_ms
+            tts_sample_rate = stats.sample_rate
+            if stats.first_audio_at is not None:
+                first_audio_ms = (stats.first_audio_at - turn_start) * 1000
+            print(f"  [TTS (streamed): {stats.sentences} sentences, {tts_time:.0f}ms, "
+                  f"first audio {first_audio_ms:.0f}ms, {stats.audio_seconds:.1f}s audio]")
+            if stats.audio and not stats.failed:
+                synthesized = (np.concatenate(stats.audio), stats.sample_rate)
+
+        elif cached_audio is not None:
+            audio, tts_sample_rate, saved_tts_ms = cached_audio
+            self.router.response_cache.note_saved(saved_tts_ms)
+            print(f"  [TTS: reused cached audio, saved ~{saved_tts_ms:.0f}ms]")
+            if stream:
+                # Streaming clients only poll the numbered chunks: send it as chunk 000
+                writer = self.transport.audio_writer()
+                writer.clear()
+                writer.write(audio, tts_sample_rate)
+                writer.write_silence(0.2)
+                first_audio_ms = (time.perf_counter() - turn_start) * 1000
+            else:
+                all_audio.append(audio)
+
         # TTS for response - check for voice preference change
-        if response_text.strip():
-            new_voice = self._read_voice_preference()
-            if new_voice != self.current_voice:
-                print(f"  [Voice changed: {self.current_voice} -> {new_voice}]")
-                self.current_voice = new_voice
-                self.tts = self._get_tts_for_voice(new_voice)
-                self.tts._ensure_loaded()
+        elif response_text.strip():
+            self._refresh_voice_preference()
 
             start = time.perf_counter()
-            result = self.tts.synthesize(response_text)
+            with span("tts"):
+                result = await asyncio.to_thread(self.tts.synthesize, response_text)
             tts_time = (time.perf_counter() - start) * 1000
             tts_sample_rate = result.sample_rate
             print(f"  [TTS: {tts_time:.0f}ms, {tts_sample_rate}Hz]")
             all_audio.append(result.audio)
+            synthesized = (result.audio, result.sample_rate)
+
+        # Keep the audio with a cached answer so a repeat skips TTS
+        if synthesized is not None:
+            entry = cached or (None if intent_result else self.router.cached_entry(transcription.text))
+            if entry is not None:
+                self.router.response_cache.attach_audio(
+                    entry, self.current_voice, *synthesized, tts_time
+                )
 
         # Add exchange to session buffer for future context
         if response_text.strip():
@@ -4704,8 +4860,8 @@ class BridgeFileServer:
             # Add 200ms silence tail to prevent audio cutoff during playback
             silence_tail = np.zeros(int(0.2 * tts_sample_rate), dtype=np.float32)
             combined = np.concatenate([combined, silence_tail])
-            combined.astype(np.float32).tofile(AUDIO_OUT_FILE)
-            self.write_metadata(tts_sample_rate)  # Tell Windows the correct sample rate
+            self.transport.write_audio(combined, tts_sample_rate)  # Includes sample rate for Windows
+            first_audio_ms = (time.perf_counter() - turn_start) * 1000
             print(f"  [Response: {len(combined) / tts_sample_rate:.1f}s audio @ {tts_sample_rate}Hz]")
 
         # Write session status for Windows launcher
@@ -4718,11 +4874,23 @@ class BridgeFileServer:
             stt_ms=stt_time,
             tts_ms=tts_time,
             action=action_type,
-            saved_to=saved_to
+            saved_to=saved_to,
+            first_audio_ms=first_audio_ms,
+            streamed=stream
         )
 
         self.write_status("DONE")
 
+    def _invalidate_response_cache(self, intent_result) -> None:
+        """Drop cached LLM answers that depend on data an intent just changed."""
+        cache = self.router.response_cache
+        if cache is None:
+            return
+        if intent_result.saved_to:
+            cache.invalidate("health")
+        if intent_result.saved_to == "workouts" or intent_result.action_type in ("phase_confirm", "phase_start"):
+            cache.invalidate("schedule")
+
     async def _sync_garmin_on_startup(self):
         """Sync Garmin data on server startup (replaces cron job)."""
         try:
@@ -4735,7 +4903,10 @@ class BridgeFileServer:
                 return
 
             print("  Syncing Garmin data...", flush=True)
-            await sync_and_cache_morning_status()
+            with span("garmin_sync"):
+                await sync_and_cache_morning_status()
+            if self.router.response_cache is not None:
+                self.router.response_cache.invalidate("health")
 
             # Show current week info
             week = get_current_week()
@@ -4755,34 +4926,29 @@ class BridgeFileServer:
         print("=" * 50)
 
         # Sync Garmin data on startup (replaces 5am cron job)
-        asyncio.run(self._sync_garmin_on_startup())
+        with self.event_loop.turn("STARTUP") as trace:
+            self.event_loop.run(self._sync_garmin_on_startup())
+        logger.info(f"[Trace] {trace.format()}")
 
         print("Waiting for Windows client...")
         print("=" * 50 + "\n")
 
         try:
             while True:
-                cmd = self.read_command()
+                # Returns as soon as a command arrives (socket) or after one poll step (file)
+                cmd = self.transport.wait_command(timeout=0.1)
 
                 if cmd == "PING":
                     print("[PING received]")
                     self.write_status("PONG")
 
-                elif cmd == "PROCESS":
-                    print(f"[PROCESS received]", flush=True)
+                elif cmd in ("PROCESS", "PROCESS_STREAM"):
+                    print(f"[{cmd} received]", flush=True)
 
-                    # Wait for audio file with retry (cross-filesystem sync delay)
-                    retries = 0
-                    max_retries = 30  # 3 seconds max wait
-                    while not AUDIO_IN_FILE.exists() and retries < max_retries:
-                        time.sleep(0.1)
-                        retries += 1
-
-                    if AUDIO_IN_FILE.exists():
-                        if retries > 0:
-                            print(f"  [Audio file appeared after {retries * 100}ms]", flush=True)
+                    audio = self.transport.read_audio()
+                    if audio is not None:
                         try:
-                            self.process_audio()
+                            self.process_audio(audio, stream=(cmd == "PROCESS_STREAM"))
                         except Exception as e:
                             print(f"\n*** PROCESS ERROR: {type(e).__name__}: {e} ***", flush=True)
                             import traceback
@@ -4797,8 +4963,7 @@ class BridgeFileServer:
                             )
                             self.write_status("DONE")  # Tell Windows we're done despite error
                     else:
-                        print(f"[PROCESS but no audio file after {max_retries * 100}ms wait]", flush=True)
-                        print(f"  [Expected at: {AUDIO_IN_FILE}]", flush=True)
+                        print(f"[{cmd} but no audio received]", flush=True)
                         # Show what files DO exist
                         try:
                             existing = list(BRIDGE_DIR.glob("*"))
@@ -4813,41 +4978,43 @@ class BridgeFileServer:
                     self._clear_timer_from_session_status()
                     break
 
+                elif cmd == "PLAYBACK_DONE":
+                    # Client finished playing what it was sent (ends the output wait early)
+                    self.audio_output.playback_done()
+
                 # UI button commands (Command Centre)
-                # NOTE: TTS spawned in background thread to avoid blocking command polling
+                # NOTE: replies are queued on the audio output thread (no blocking here)
                 elif cmd == "PAUSE_ROUTINE":
                     print("[PAUSE_ROUTINE received from UI]")
                     if self.routine.active and not self.routine.paused:
                         try:
-                            msg = asyncio.run(self._handle_routine_pause())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_routine_pause())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                         except Exception as e:
                             print(f"[PAUSE_ROUTINE ERROR: {e}]")
                     elif self.workout.active and not self.workout.paused and not self.routine.active:
                         # Handle workout pause when no routine is active
                         try:
-                            msg = asyncio.run(self._handle_workout_pause())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_pause())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                         except Exception as e:
                             print(f"[PAUSE_WORKOUT ERROR: {e}]")
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "RESUME_ROUTINE":
                     print("[RESUME_ROUTINE received from UI]")
                     if self.routine.active and self.routine.paused:
                         try:
-                            msg = asyncio.run(self._handle_routine_resume())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_routine_resume())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                         except Exception as e:
                             print(f"[RESUME_ROUTINE ERROR: {e}]")
                     elif self.workout.active and self.workout.paused and not self.routine.active:
                         # Handle workout resume when no routine is active
                         try:
-                            msg = asyncio.run(self._handle_workout_resume())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_resume())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                         except Exception as e:
                             print(f"[RESUME_WORKOUT ERROR: {e}]")
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "SKIP_EXERCISE":
                     print(f"[SKIP_EXERCISE received from UI - routine_active={self.routine.active}, "
@@ -4859,8 +5026,8 @@ class BridgeFileServer:
                     # Check WORKOUT first (takes priority over stale routine state)
                     if self.workout.active:
                         try:
-                            msg = asyncio.run(self._handle_workout_skip())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_skip())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                         except Exception as e:
                             print(f"[SKIP_EXERCISE ERROR: {e}]")
                     elif self.routine.active or self.routine.auto_advance_pending or self.routine.timer_active:
@@ -4871,13 +5038,12 @@ class BridgeFileServer:
                         self.routine.paused = False
                         self.routine.active = True
                         try:
-                            msg = asyncio.run(self._handle_routine_skip())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_routine_skip())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                         except Exception as e:
                             print(f"[SKIP_EXERCISE ERROR: {e}]")
                     else:
                         print("[SKIP_EXERCISE: Nothing active to skip]")
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "SET_COMPLETE":
                     print(f"[SET_COMPLETE received from UI - workout_active={self.workout.active}, "
@@ -4885,13 +5051,12 @@ class BridgeFileServer:
 
                     if self.workout.active and self.workout.set_active:
                         try:
-                            msg = asyncio.run(self._handle_workout_set_done())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_set_done())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                         except Exception as e:
                             print(f"[SET_COMPLETE ERROR: {e}]")
                     else:
                         print("[SET_COMPLETE: No active set to complete]")
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "STOP_ROUTINE":
                     print(f"[STOP_ROUTINE received from UI - routine_active={self.routine.active}, "
@@ -4908,8 +5073,8 @@ class BridgeFileServer:
                     if routine_state_active:
                         print("[STOP_ROUTINE: Stopping routine...]")
                         try:
-                            msg = asyncio.run(self._handle_routine_stop())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_routine_stop())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                             print("[STOP_ROUTINE: Routine stopped successfully, server continues running]")
                         except Exception as e:
                             print(f"[STOP_ROUTINE ERROR: {e}]")
@@ -4920,8 +5085,8 @@ class BridgeFileServer:
                     elif self.workout.active:
                         print("[STOP_ROUTINE: Stopping workout...]")
                         try:
-                            msg = asyncio.run(self._handle_workout_stop())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_stop())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                             print("[STOP_ROUTINE: Workout stopped successfully, server continues running]")
                         except Exception as e:
                             print(f"[STOP_ROUTINE ERROR: {e}]")
@@ -4935,7 +5100,6 @@ class BridgeFileServer:
                         self._force_reset_workout_state()
 
                     print("[STOP_ROUTINE: Command processed, continuing main loop]")
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "LOG_ROUTINE":
                     print(f"[LOG_ROUTINE received from UI - routine_finished={self.routine.routine_finished}]")
@@ -4943,7 +5107,7 @@ class BridgeFileServer:
                     if self.routine.routine_finished:
                         try:
                             msg = self._handle_log_routine()
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                             print("[LOG_ROUTINE: Routine logged successfully]")
                         except Exception as e:
                             print(f"[LOG_ROUTINE ERROR: {e}]")
@@ -4955,15 +5119,14 @@ class BridgeFileServer:
                     else:
                         print("[LOG_ROUTINE: No routine awaiting logging]")
 
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "LOG_WORKOUT":
                     print(f"[LOG_WORKOUT received from UI - workout_finished={self.workout.workout_finished}]")
 
                     if self.workout.workout_finished:
                         try:
-                            msg = asyncio.run(self._handle_workout_completion("finished workout", has_issues=False))
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_completion("finished workout", has_issues=False))
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                             print("[LOG_WORKOUT: Workout logged successfully]")
                         except Exception as e:
                             print(f"[LOG_WORKOUT ERROR: {e}]")
@@ -4974,7 +5137,6 @@ class BridgeFileServer:
                     else:
                         print("[LOG_WORKOUT: No workout awaiting logging]")
 
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 elif cmd == "START_TIMER":
                     print(f"[START_TIMER received from UI - routine_active={self.routine.active}, "
@@ -4984,15 +5146,15 @@ class BridgeFileServer:
                     if self.workout.active and self.workout.exercise_pending:
                         # Start workout set (equivalent to saying "ready")
                         try:
-                            msg = asyncio.run(self._handle_workout_ready(""))
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_workout_ready(""))
+                            self._autonomous_speak(msg, priority=RESPONSE, key="workout")
                         except Exception as e:
                             print(f"[START_WORKOUT ERROR: {e}]")
                     elif self.routine.active and self.routine.exercise_pending:
                         # Start the timer for current exercise
                         try:
-                            msg = asyncio.run(self._handle_routine_ready())
-                            Thread(target=self._autonomous_speak, args=(msg,), daemon=True).start()
+                            msg = self.event_loop.run(self._handle_routine_ready())
+                            self._autonomous_speak(msg, priority=RESPONSE, key="routine")
                         except Exception as e:
                             print(f"[START_TIMER ERROR: {e}]")
                     elif self.routine.auto_advance_pending:
@@ -5001,7 +5163,7 @@ class BridgeFileServer:
                         if self.routine.auto_advance_phase == 'completed':
                             # Advance to next exercise first
                             try:
-                                asyncio.run(self._advance_routine_exercise_silent())
+                                self.event_loop.run(self._advance_routine_exercise_silent())
                             except Exception as e:
                                 print(f"[START_TIMER: Advance failed: {e}]")
 
@@ -5011,7 +5173,6 @@ class BridgeFileServer:
 
                         # Start the timer (this speaks "Go. X seconds.")
                         self._auto_start_routine_timer()
-                    COMMAND_FILE.unlink(missing_ok=True)
 
                 # AUTONOMOUS TIMER CHECK - runs every 100ms regardless of user input
                 try:
@@ -5019,20 +5180,43 @@ class BridgeFileServer:
                 except Exception as e:
                     logger.error(f"[TIMER-AUTO] Timer check failed: {e}")
 
-                time.sleep(0.1)  # Poll every 100ms
-
         except KeyboardInterrupt:
             print("\n\nShutting down...")
+        finally:
+            timings = self.intent_dispatcher.format_timings()
+            if timings:
+                logger.info(f"Intent match timings (slowest first):\n{timings}")
+            hedge_stats = self.router.format_hedge_stats()
+            if hedge_stats:
+                logger.info(f"Hedged routing outcomes:\n{hedge_stats}")
+            self.audio_output.close()
+            self.transport.close()
+            self.event_loop.close()
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ATLAS Bridge Server")
+    parser.add_argument(
+        "--transport", choices=["socket", "file"],
+        default=os.environ.get("ATLAS_BRIDGE_TRANSPORT", "socket"),
+        help="socket: push-based local socket with file fallback; file: file polling only",
+    )
+    parser.add_argument(
+        "--hedge", action="store_true",
+        default=os.environ.get("ATLAS_HEDGED_ROUTING", "0") == "1",
+        help="Race the local model against Haiku for uncertain queries (or ATLAS_HEDGED_ROUTING=1)",
+    )
+    args = parser.parse_args()
+
     # Enable INFO logging for diagnostic output
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
         datefmt='%H:%M:%S'
     )
-    server = BridgeFileServer()
+    server = BridgeFileServer(transport=args.transport, hedge=args.hedge)
     server.run()
 
 
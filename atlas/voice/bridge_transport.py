@@ -0,0 +1,525 @@
+"""
+ATLAS Bridge Transports
+
+Two ways for the Windows client to talk to BridgeFileServer:
+
+- FileTransport: the original protocol (command.txt, audio_in.raw,
+  audio_out.raw, status.txt, session_status.json in the bridge directory).
+  Works everywhere, but every step is a 100ms poll and every update is a
+  disk write across the WSL/Windows filesystem boundary.
+- SocketTransport: length-prefixed frames over a local TCP socket (WSL2
+  forwards localhost to Windows). Commands, audio, status and session status
+  are pushed as they happen. While no socket client is connected it delegates
+  to a FileTransport, so file clients keep working.
+
+Frame format (the length-prefix framing from bridge_server.py plus a type byte):
+    [1 byte type][4 bytes big-endian length][payload]
+
+    C  command         utf-8 text ("PING", "PROCESS_STREAM", "SKIP_EXERCISE", ...;
+                       "PLAYBACK_DONE" once the client's audio queue has drained)
+    A  audio           4-byte big-endian sample rate + float32 PCM
+    S  status          utf-8 text ("PONG", "speaking", "DONE")
+    J  session status  utf-8 JSON (same document as session_status.json)
+    D  session delta   utf-8 JSON {"set": {...}, "merge": {...}} applied to the
+                       last J document (apply_session_delta); timer ticks
+    R  audio reset     empty; drop audio frames received but not yet played
+                       (the response was abandoned for an LLM fallback)
+
+Usage:
+    transport = SocketTransport(FileTransport(BRIDGE_DIR))
+    transport.setup()
+    while True:
+        cmd = transport.wait_command(timeout=0.1)
+        if cmd == "PING":
+            transport.write_status("PONG")
+"""
+
+import json
+import logging
+import os
+import queue
+import socket
+import struct
+import time
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Optional
+
+import numpy as np
+
+from atlas.voice.streaming import CHUNK_PREFIX, CHUNK_SUFFIX, ChunkedAudioWriter
+
+logger = logging.getLogger(__name__)
+
+# Socket defaults (override with ATLAS_BRIDGE_HOST / ATLAS_BRIDGE_PORT)
+DEFAULT_HOST = os.environ.get("ATLAS_BRIDGE_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("ATLAS_BRIDGE_PORT", "9998"))
+
+# Frame types
+FRAME_COMMAND = b"C"
+FRAME_AUDIO = b"A"
+FRAME_STATUS = b"S"
+FRAME_SESSION_STATUS = b"J"
+FRAME_SESSION_DELTA = b"D"
+FRAME_AUDIO_RESET = b"R"
+
+_HEADER = struct.Struct(">cI")
+_SAMPLE_RATE = struct.Struct(">I")
+
+
+# =============================================================================
+# Framing
+# =============================================================================
+
+def recv_exact(sock: socket.socket, n: int) -> bytes | None:
+    """Receive exactly n bytes (None if the peer closed the connection)."""
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def send_frame(sock: socket.socket, kind: bytes, payload: bytes) -> None:
+    """Send one typed, length-prefixed frame."""
+    sock.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> tuple[bytes, bytes] | None:
+    """Receive one frame as (type, payload). None if the peer closed."""
+    header = recv_exact(sock, _HEADER.size)
+    if not header:
+        return None
+    kind, length = _HEADER.unpack(header)
+    payload = recv_exact(sock, length) if length else b""
+    if payload is None:
+        return None
+    return kind, payload
+
+
+def encode_audio(audio: np.ndarray, sample_rate: int) -> bytes:
+    """Audio frame payload: sample rate then float32 PCM."""
+    return _SAMPLE_RATE.pack(sample_rate) + audio.astype(np.float32).tobytes()
+
+
+def decode_audio(payload: bytes) -> tuple[np.ndarray, int]:
+    """Inverse of encode_audio."""
+    (sample_rate,) = _SAMPLE_RATE.unpack_from(payload)
+    return np.frombuffer(payload, dtype=np.float32, offset=_SAMPLE_RATE.size).copy(), sample_rate
+
+
+def apply_session_delta(status: dict, delta: dict) -> dict:
+    """Apply a session delta frame to a session status document (in place).
+
+    "set" replaces top-level fields (None removes them); "merge" updates
+    fields of a nested block such as "timer". Blocks are replaced rather
+    than mutated, so earlier snapshots handed to a UI thread stay intact.
+    """
+    for key, value in delta.get("set", {}).items():
+        if value is None:
+            status.pop(key, None)
+        else:
+            status[key] = value
+    for key, fields in delta.get("merge", {}).items():
+        status[key] = {**status.get(key, {}), **fields}
+    return status
+
+
+# =============================================================================
+# Transports
+# =============================================================================
+
+class BridgeTransport:
+    """Interface the bridge server uses for all client I/O."""
+
+    name = "base"
+
+    def setup(self) -> None:
+        """Prepare the transport (create files, bind sockets)."""
+
+    def wait_command(self, timeout: float) -> str:
+        """Return the next command, or "" after at most timeout seconds."""
+        raise NotImplementedError
+
+    def read_audio(self) -> Optional[np.ndarray]:
+        """Return the recorded utterance for a PROCESS command."""
+        raise NotImplementedError
+
+    def write_status(self, status: str) -> None:
+        raise NotImplementedError
+
+    def write_audio(self, audio: np.ndarray, sample_rate: int) -> None:
+        """Deliver a complete response (or autonomous prompt) for playback."""
+        raise NotImplementedError
+
+    def audio_writer(self):
+        """Chunk writer for streamed responses (ChunkedAudioWriter interface)."""
+        raise NotImplementedError
+
+    def publish_session_status(self, status: dict, persist: bool = True) -> None:
+        """Publish the session status document.
+
+        persist=False marks high-frequency updates (timer ticks) that need
+        not hit the disk when a push channel is available.
+        """
+        raise NotImplementedError
+
+    def publish_session_delta(self, delta: dict) -> bool:
+        """Push changed session status fields (apply_session_delta format).
+
+        Returns False when the transport cannot; the caller then publishes
+        the whole document instead.
+        """
+        return False
+
+    def close(self) -> None:
+        """Release resources."""
+
+
+class FileTransport(BridgeTransport):
+    """The original file-polling protocol on the bridge directory."""
+
+    name = "file"
+
+    def __init__(self, bridge_dir: Path, audio_wait_s: float = 3.0):
+        self.bridge_dir = bridge_dir
+        self.audio_in_file = bridge_dir / "audio_in.raw"
+        self.audio_out_file = bridge_dir / "audio_out.raw"
+        self.metadata_file = bridge_dir / "metadata.txt"
+        self.command_file = bridge_dir / "command.txt"
+        self.status_file = bridge_dir / "status.txt"
+        self.session_status_file = bridge_dir / "session_status.json"
+        self.audio_wait_s = audio_wait_s
+
+    def setup(self) -> None:
+        self.bridge_dir.mkdir(exist_ok=True)
+        for f in [self.audio_in_file, self.audio_out_file, self.command_file, self.status_file]:
+            f.unlink(missing_ok=True)
+        for f in self.bridge_dir.glob(f"{CHUNK_PREFIX}*{CHUNK_SUFFIX}"):
+            f.unlink(missing_ok=True)
+
+    def read_command(self) -> str:
+        """Read and clear the command file."""
+        try:
+            cmd = self.command_file.read_text().strip()
+            self.command_file.unlink()
+            return cmd
+        except FileNotFoundError:
+            return ""
+
+    def wait_command(self, timeout: float) -> str:
+        cmd = self.read_command()
+        if not cmd:
+            time.sleep(timeout)
+        return cmd
+
+    def read_audio(self) -> Optional[np.ndarray]:
+        # Wait for audio file with retry (cross-filesystem sync delay)
+        deadline = time.monotonic() + self.audio_wait_s
+        waited = 0
+        while not self.audio_in_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+            waited += 1
+        if not self.audio_in_file.exists():
+            logger.warning(f"PROCESS but no audio file at {self.audio_in_file} "
+                           f"after {self.audio_wait_s:.1f}s")
+            return None
+        if waited:
+            logger.info(f"Audio file appeared after {waited * 100}ms")
+        audio = np.fromfile(self.audio_in_file, dtype=np.float32)
+        self.audio_in_file.unlink()
+        return audio
+
+    def write_status(self, status: str) -> None:
+        self.status_file.write_text(status)
+
+    def write_audio(self, audio: np.ndarray, sample_rate: int) -> None:
+        audio.astype(np.float32).tofile(self.audio_out_file)
+        self.metadata_file.write_text(f"sample_rate={sample_rate}")
+
+    def audio_writer(self) -> ChunkedAudioWriter:
+        return ChunkedAudioWriter(self.bridge_dir, self.metadata_file)
+
+    def publish_session_status(self, status: dict, persist: bool = True) -> None:
+        # Atomic write: write to temp file then rename (prevents race condition with UI polling)
+        temp_file = self.session_status_file.with_suffix('.json.tmp')
+        temp_file.write_text(json.dumps(status, indent=2))
+        temp_file.replace(self.session_status_file)
+
+
+class _SocketChunkWriter:
+    """ChunkedAudioWriter interface over audio frames."""
+
+    def __init__(self, transport: "SocketTransport"):
+        self.transport = transport
+        self.count = 0
+        self.sample_rate: Optional[int] = None
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def discard(self) -> None:
+        self.transport.reset_audio()
+
+    def write(self, audio: np.ndarray, sample_rate: int) -> None:
+        self.transport.write_audio(audio, sample_rate)
+        self.sample_rate = sample_rate
+        self.count += 1
+
+    def write_silence(self, seconds: float) -> None:
+        if self.count == 0 or not self.sample_rate:
+            return None
+        self.write(np.zeros(int(seconds * self.sample_rate), dtype=np.float32), self.sample_rate)
+
+
+class SocketTransport(BridgeTransport):
+    """
+    Push-based transport over a local TCP socket.
+
+    One client at a time. A reader thread turns incoming frames into a
+    command queue, so wait_command returns as soon as a command arrives
+    instead of on the next poll. Without a connected client every call
+    falls through to the file transport.
+    """
+
+    name = "socket"
+
+    def __init__(self, fallback: FileTransport, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.fallback = fallback
+        self.host = host
+        self.port = port
+        self._server: Optional[socket.socket] = None
+        self._client: Optional[socket.socket] = None
+        self._send_lock = Lock()
+        self._commands: queue.Queue = queue.Queue()
+        self._audio_in: Optional[np.ndarray] = None
+        self._synced_client: Optional[socket.socket] = None  # Has a J document to apply deltas to
+        self._closed = False
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Bound (host, port) - useful when constructed with port 0."""
+        return self._server.getsockname() if self._server else (self.host, self.port)
+
+    def setup(self) -> None:
+        self.fallback.setup()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((self.host, self.port))
+        self._server.listen(1)
+        Thread(target=self._accept_loop, daemon=True).start()
+        logger.info(f"Bridge socket listening on {self.address[0]}:{self.address[1]}")
+
+    def _accept_loop(self) -> None:
+        while not self._closed:
+            try:
+                client, addr = self._server.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._client is not None:
+                logger.warning(f"Replacing bridge client with {addr}")
+                self._drop_client()
+            self._client = client
+            logger.info(f"Bridge client connected from {addr}")
+            Thread(target=self._reader_loop, args=(client,), daemon=True).start()
+
+    def _reader_loop(self, client: socket.socket) -> None:
+        try:
+            while True:
+                frame = recv_frame(client)
+                if frame is None:
+                    break
+                kind, payload = frame
+                if kind == FRAME_COMMAND:
+                    self._commands.put(payload.decode("utf-8").strip())
+                elif kind == FRAME_AUDIO:
+                    self._audio_in, _ = decode_audio(payload)
+                else:
+                    logger.warning(f"Ignoring unexpected frame type {kind!r} from client")
+        except OSError as e:
+            logger.info(f"Bridge client read error: {e}")
+        if self._client is client:
+            self._drop_client()
+            logger.info("Bridge client disconnected - file protocol active")
+
+    def _drop_client(self) -> None:
+        client, self._client = self._client, None
+        if client:
+            try:
+                client.close()
+            except OSError:
+                pass
+
+    def _send(self, kind: bytes, payload: bytes) -> bool:
+        """Send a frame to the connected client. False if there is none."""
+        client = self._client
+        if client is None:
+            return False
+        try:
+            with self._send_lock:
+                send_frame(client, kind, payload)
+            return True
+        except OSError as e:
+            logger.warning(f"Bridge socket send failed: {e}")
+            self._drop_client()
+            return False
+
+    def wait_command(self, timeout: float) -> str:
+        try:
+            return self._commands.get_nowait()
+        except queue.Empty:
+            pass
+        if not self.connected:
+            # Socket commands queued meanwhile are picked up on the next call
+            return self.fallback.wait_command(timeout)
+        try:
+            return self._commands.get(timeout=timeout)
+        except queue.Empty:
+            return ""
+
+    def read_audio(self) -> Optional[np.ndarray]:
+        if self._audio_in is not None:
+            audio, self._audio_in = self._audio_in, None
+            return audio
+        return self.fallback.read_audio()
+
+    def write_status(self, status: str) -> None:
+        if not self._send(FRAME_STATUS, status.encode("utf-8")):
+            self.fallback.write_status(status)
+
+    def write_audio(self, audio: np.ndarray, sample_rate: int) -> None:
+        if not self._send(FRAME_AUDIO, encode_audio(audio, sample_rate)):
+            self.fallback.write_audio(audio, sample_rate)
+
+    def audio_writer(self):
+        if self.connected:
+            return _SocketChunkWriter(self)
+        return self.fallback.audio_writer()
+
+    def reset_audio(self) -> None:
+        """Tell the client to drop audio frames it has not played yet."""
+        self._send(FRAME_AUDIO_RESET, b"")
+
+    def publish_session_status(self, status: dict, persist: bool = True) -> None:
+        client = self._client
+        pushed = self._send(FRAME_SESSION_STATUS, json.dumps(status).encode("utf-8"))
+        if pushed:
+            self._synced_client = client
+        # The file copy stays current for other readers (dev tools, restarts),
+        # but high-frequency updates skip the disk while a client is connected
+        if persist or not pushed:
+            self.fallback.publish_session_status(status)
+
+    def publish_session_delta(self, delta: dict) -> bool:
+        # A newly connected client needs a whole document first
+        if self._client is None or self._client is not self._synced_client:
+            return False
+        return self._send(FRAME_SESSION_DELTA, json.dumps(delta).encode("utf-8"))
+
+    def close(self) -> None:
+        self._closed = True
+        self._drop_client()
+        if self._server:
+            self._server.close()
+            self._server = None
+
+
+def create_transport(
+    kind: str,
+    bridge_dir: Path,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> BridgeTransport:
+    """Build and set up a transport. Socket falls back to file if bind fails."""
+    file_transport = FileTransport(bridge_dir)
+    if kind == "file":
+        file_transport.setup()
+        return file_transport
+
+    transport = SocketTransport(file_transport, host=host, port=port)
+    try:
+        transport.setup()
+        return transport
+    except OSError as e:
+        logger.warning(f"Bridge socket unavailable on {host}:{port} ({e}) - using file protocol")
+        transport.close()
+        file_transport.setup()
+        return file_transport
+
+
+# =============================================================================
+# Client (used by the loopback harness; the Windows launcher carries its own copy)
+# =============================================================================
+
+class SocketBridgeClient:
+    """Minimal socket client: send commands/audio, receive pushes."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.sock: Optional[socket.socket] = None
+        self.statuses: queue.Queue = queue.Queue()
+        self.audio: queue.Queue = queue.Queue()
+        self.session_status: Optional[dict] = None
+
+    def connect(self, timeout: float = 2.0) -> bool:
+        try:
+            self.sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        except OSError:
+            self.sock = None
+            return False
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        Thread(target=self._reader_loop, daemon=True).start()
+        return True
+
+    def _reader_loop(self) -> None:
+        try:
+            while True:
+                frame = recv_frame(self.sock)
+                if frame is None:
+                    break
+                kind, payload = frame
+                if kind == FRAME_STATUS:
+                    self.statuses.put(payload.decode("utf-8"))
+                elif kind == FRAME_AUDIO:
+                    self.audio.put(decode_audio(payload))
+                elif kind == FRAME_AUDIO_RESET:
+                    while not self.audio.empty():
+                        self.audio.get_nowait()
+                elif kind == FRAME_SESSION_STATUS:
+                    self.session_status = json.loads(payload)
+                elif kind == FRAME_SESSION_DELTA:
+                    self.session_status = apply_session_delta(dict(self.session_status or {}), json.loads(payload))
+        except OSError:
+            pass
+
+    def send_command(self, cmd: str) -> None:
+        send_frame(self.sock, FRAME_COMMAND, cmd.encode("utf-8"))
+
+    def send_audio(self, audio: np.ndarray, sample_rate: int) -> None:
+        send_frame(self.sock, FRAME_AUDIO, encode_audio(audio, sample_rate))
+
+    def wait_status(self, expected: str, timeout: float = 30.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                if self.statuses.get(timeout=remaining) == expected:
+                    return True
+            except queue.Empty:
+                return False
+
+    def close(self) -> None:
+        if self.sock:
+            self.sock.close()
+            self.sock = None
@@ -10,7 +10,9 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from atlas.aio import span
 
 if TYPE_CHECKING:
     from atlas.voice.bridge_file_server import BridgeFileServer
@@ -29,6 +31,32 @@ class IntentResult:
     handled: bool = True
 
 
+@dataclass
+class IntentTiming:
+    """Accumulated match time for one intent check."""
+
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+# Labels (see bridge_file_server.build_intent_matcher) without which a
+# start handler cannot fire
+START_LABELS = frozenset({
+    "schedule_status", "phase_start", "workout_start", "workout_start_simple",
+    "traffic_green", "traffic_yellow", "traffic_red", "routine_start", "reflection_start",
+})
+
+
 def _make_decision(tier_value: str, confidence: float = 1.0) -> Any:
     """Create a mock decision object matching router.classify() output.
 
@@ -61,8 +89,29 @@ class IntentDispatcher:
     6. Query commands (health status, schedule, exercise info)
     7. Capture intents (remember, note)
     8. Meal logging
+
+    One dispatcher lives for the whole server session. Every predicate
+    call is timed (see match_timings()) so slow checks are easy to find.
+
+    dispatch() and the handlers are coroutines run on the server's
+    long-lived event loop (atlas.aio.LoopThread); each awaited server
+    handler is a span in the turn trace.
     """
 
+    # (group, guard) in priority order. The guard sees the server state and
+    # the utterance's intent labels; a group whose guard is false cannot
+    # match and is skipped. None means always try.
+    PRIORITY: tuple[tuple[str, Callable[[BridgeFileServer, frozenset[str]], bool] | None], ...] = (
+        ("stateful", None),
+        ("active_session", lambda server, labels: server.workout.active or server.routine.active),
+        ("pending_state", lambda server, labels: bool(server._phase_reset_pending)),
+        ("start", lambda server, labels: bool(labels & START_LABELS)),
+        ("logging", None),  # supplement checks are not label-based
+        ("query", None),  # exercise names are looked up without a label
+        ("capture", lambda server, labels: "capture" in labels),
+        ("meal", lambda server, labels: "meal" in labels),
+    )
+
     def __init__(self, server: "BridgeFileServer"):
         """Initialize dispatcher with server reference.
 
@@ -70,8 +119,13 @@ class IntentDispatcher:
             server: Reference to BridgeFileServer for state access and handlers
         """
         self.server = server
+        self._groups = [
+            (name, guard, getattr(self, f"_try_{name}_handlers"))
+            for name, guard in self.PRIORITY
+        ]
+        self._timings: dict[str, IntentTiming] = {}
 
-    def dispatch(self, text: str) -> IntentResult | None:
+    async def dispatch(self, text: str) -> IntentResult | None:
         """Dispatch text to appropriate intent handler.
 
         Returns IntentResult if intent was handled, None if should fall through to LLM.
@@ -82,57 +136,71 @@ class IntentDispatcher:
         Returns:
             IntentResult if an intent was matched and handled, None otherwise
         """
-        # Try handlers in priority order
-        result = self._try_stateful_handlers(text)
-        if result:
-            return result
-
-        result = self._try_active_session_handlers(text)
-        if result:
-            return result
-
-        result = self._try_pending_state_handlers(text)
-        if result:
-            return result
-
-        result = self._try_start_handlers(text)
-        if result:
-            return result
-
-        result = self._try_logging_handlers(text)
-        if result:
-            return result
-
-        result = self._try_query_handlers(text)
-        if result:
-            return result
+        # One pass over the utterance finds every intent label; the server's
+        # _is_* predicates below read from this result instead of re-scanning
+        labels = self._check(self.server._intent_labels, text)
+        logger.debug(f"[Intent labels: {', '.join(sorted(labels)) or 'none'}]")
 
-        result = self._try_capture_handlers(text)
-        if result:
-            return result
-
-        result = self._try_meal_handlers(text)
-        if result:
-            return result
+        # Try handlers in priority order
+        for name, guard, try_group in self._groups:
+            if guard is not None and not guard(self.server, labels):
+                continue
+            result = await try_group(text)
+            if result:
+                return result
 
         # No intent matched - fall through to LLM
         return None
 
+    async def _call(self, handler: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Await a server handler as a span of the current turn."""
+        with span(handler.__name__):
+            return await handler(*args, **kwargs)
+
+    def _check(self, predicate: Callable[..., Any], *args: Any) -> Any:
+        """Call a server intent predicate, recording how long it took."""
+        start = time.perf_counter()
+        try:
+            return predicate(*args)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            name = predicate.__name__
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = IntentTiming()
+            timing.add(elapsed_ms)
+
+    def match_timings(self) -> dict[str, IntentTiming]:
+        """Per-predicate match timing since startup (or reset), slowest total first."""
+        return dict(sorted(self._timings.items(), key=lambda item: item[1].total_ms, reverse=True))
+
+    def format_timings(self, limit: int = 10) -> str:
+        """The slowest predicates by total time, one per line."""
+        lines = [
+            f"{name}: {t.calls} calls, mean {t.mean_ms:.3f}ms, max {t.max_ms:.3f}ms, total {t.total_ms:.1f}ms"
+            for name, t in list(self.match_timings().items())[:limit]
+        ]
+        return "\n".join(lines)
+
+    def reset_timings(self) -> None:
+        """Clear the accumulated match timings."""
+        self._timings.clear()
+
     # =========================================================================
     # Handler Groups
     # =========================================================================
 
-    def _try_stateful_handlers(self, text: str) -> IntentResult | None:
+    async def _try_stateful_handlers(self, text: str) -> IntentResult | None:
         """Handle stateful sessions (highest priority).
 
         These handlers take precedence because they represent ongoing
         conversations that should not be interrupted.
         """
         # Workout confirmation pending
-        if self.server._is_workout_confirmation(text):
+        if self._check(self.server._is_workout_confirmation, text):
             logger.debug("[Intent: WORKOUT_CONFIRM]")
             try:
-                response = asyncio.run(self.server._handle_workout_confirmation(text))
+                response = await self._call(self.server._handle_workout_confirmation, text)
             except Exception as e:
                 logger.debug(f"[WORKOUT_CONFIRM ERROR: {e}]")
                 response = f"Confirmation failed: {e}"
@@ -145,10 +213,10 @@ class IntentDispatcher:
             )
 
         # Assessment active (highest priority when running)
-        if self.server._is_assessment_active():
+        if self._check(self.server._is_assessment_active):
             logger.debug("[Intent: ASSESSMENT_INPUT]")
             try:
-                response = asyncio.run(self.server._handle_assessment_input(text))
+                response = await self._call(self.server._handle_assessment_input, text)
             except Exception as e:
                 logger.debug(f"[ASSESSMENT_INPUT ERROR: {e}]")
                 import traceback
@@ -163,10 +231,10 @@ class IntentDispatcher:
             )
 
         # Assessment session pending (user needs to pick A/B/C)
-        if self.server._is_assessment_session_pending():
+        if self._check(self.server._is_assessment_session_pending):
             logger.debug("[Intent: ASSESSMENT_SESSION_CHOICE]")
             try:
-                response = asyncio.run(self.server._handle_assessment_session_choice(text))
+                response = await self._call(self.server._handle_assessment_session_choice, text)
             except Exception as e:
                 logger.debug(f"[ASSESSMENT_SESSION_CHOICE ERROR: {e}]")
                 response = f"Session selection failed: {e}"
@@ -178,10 +246,10 @@ class IntentDispatcher:
             )
 
         # Assessment resume intent
-        if self.server._is_assessment_resume_intent(text):
+        if self._check(self.server._is_assessment_resume_intent, text):
             logger.debug("[Intent: ASSESSMENT_RESUME]")
             try:
-                response = asyncio.run(self.server._handle_assessment_resume())
+                response = await self._call(self.server._handle_assessment_resume)
             except Exception as e:
                 logger.debug(f"[ASSESSMENT_RESUME ERROR: {e}]")
                 response = f"Resume failed: {e}"
@@ -193,10 +261,10 @@ class IntentDispatcher:
             )
 
         # Assessment info query
-        if self.server._is_assessment_info_intent(text):
+        if self._check(self.server._is_assessment_info_intent, text):
             logger.debug("[Intent: ASSESSMENT_INFO]")
             try:
-                response = asyncio.run(self.server._handle_assessment_info(text))
+                response = await self._call(self.server._handle_assessment_info, text)
             except Exception as e:
                 logger.debug(f"[ASSESSMENT_INFO ERROR: {e}]")
                 response = f"Assessment info failed: {e}"
@@ -208,10 +276,10 @@ class IntentDispatcher:
             )
 
         # Assessment start intent
-        if self.server._is_assessment_start_intent(text):
+        if self._check(self.server._is_assessment_start_intent, text):
             logger.debug("[Intent: ASSESSMENT_START]")
             try:
-                response = asyncio.run(self.server._handle_assessment_start(text))
+                response = await self._call(self.server._handle_assessment_start, text)
             except Exception as e:
                 logger.debug(f"[ASSESSMENT_START ERROR: {e}]")
                 response = f"Assessment start failed: {e}"
@@ -223,10 +291,10 @@ class IntentDispatcher:
             )
 
         # Seneca Trial (reflection) active
-        if self.server._is_reflection_active():
+        if self._check(self.server._is_reflection_active):
             logger.debug("[Intent: REFLECTION_INPUT]")
             try:
-                response = asyncio.run(self.server._handle_reflection_input(text))
+                response = await self._call(self.server._handle_reflection_input, text)
             except Exception as e:
                 logger.debug(f"[REFLECTION_INPUT ERROR: {e}]")
                 response = f"Reflection input failed: {e}"
@@ -240,7 +308,7 @@ class IntentDispatcher:
 
         return None
 
-    def _try_active_session_handlers(self, text: str) -> IntentResult | None:
+    async def _try_active_session_handlers(self, text: str) -> IntentResult | None:
         """Handle active workout/routine sessions.
 
         These have complex sub-state machines for different phases
@@ -248,19 +316,19 @@ class IntentDispatcher:
         """
         # Interactive workout active
         if self.server.workout.active:
-            result = self._handle_active_workout(text)
+            result = await self._handle_active_workout(text)
             if result:
                 return result
 
         # Interactive routine active
         if self.server.routine.active:
-            result = self._handle_active_routine(text)
+            result = await self._handle_active_routine(text)
             if result:
                 return result
 
         return None
 
-    def _try_pending_state_handlers(self, text: str) -> IntentResult | None:
+    async def _try_pending_state_handlers(self, text: str) -> IntentResult | None:
         """Handle pending states that need confirmation or choice."""
         # Phase reset pending (confirmation required)
         if self.server._phase_reset_pending:
@@ -269,16 +337,16 @@ class IntentDispatcher:
                 self.server._phase_reset_pending = False
                 self.server._phase_reset_time = None
                 response = "Reset timed out. No changes made."
-            elif self.server._is_phase_confirm_command(text):
+            elif self._check(self.server._is_phase_confirm_command, text):
                 logger.debug("[Intent: PHASE_CONFIRM]")
                 try:
-                    response = asyncio.run(self.server._handle_phase_confirm())
+                    response = await self._call(self.server._handle_phase_confirm)
                 except Exception as e:
                     response = f"Reset failed: {e}"
-            elif self.server._is_cancel_command(text):
+            elif self._check(self.server._is_cancel_command, text):
                 logger.debug("[Intent: PHASE_CANCEL]")
                 try:
-                    response = asyncio.run(self.server._handle_phase_cancel())
+                    response = await self._call(self.server._handle_phase_cancel)
                 except Exception as e:
                     response = f"Cancel failed: {e}"
             else:
@@ -292,13 +360,13 @@ class IntentDispatcher:
 
         return None
 
-    def _try_start_handlers(self, text: str) -> IntentResult | None:
+    async def _try_start_handlers(self, text: str) -> IntentResult | None:
         """Handle start commands for workouts, routines, assessments, phases."""
         # Schedule status query
-        if self.server._is_schedule_status_intent(text):
+        if self._check(self.server._is_schedule_status_intent, text):
             logger.debug("[Intent: SCHEDULE_STATUS]")
             try:
-                response = asyncio.run(self.server._handle_schedule_status())
+                response = await self._call(self.server._handle_schedule_status)
             except Exception as e:
                 logger.debug(f"[SCHEDULE_STATUS ERROR: {e}]")
                 response = f"Schedule check failed: {e}"
@@ -310,10 +378,10 @@ class IntentDispatcher:
             )
 
         # Phase start request
-        if self.server._is_phase_start_intent(text):
+        if self._check(self.server._is_phase_start_intent, text):
             logger.debug("[Intent: PHASE_START_REQUEST]")
             try:
-                response = asyncio.run(self.server._handle_phase_start_request(text))
+                response = await self._call(self.server._handle_phase_start_request, text)
             except Exception as e:
                 logger.debug(f"[PHASE_START ERROR: {e}]")
                 response = f"Phase start failed: {e}"
@@ -325,16 +393,18 @@ class IntentDispatcher:
             )
 
         # Workout start or traffic override
-        if self.server._is_workout_start_intent(text) or self.server._detect_traffic_override(text):
-            traffic_override = self.server._detect_traffic_override(text)
+        if (
+            self._check(self.server._is_workout_start_intent, text)
+            or self._check(self.server._detect_traffic_override, text)
+        ):
+            traffic_override = self._check(self.server._detect_traffic_override, text)
             protocol_id = self.server._parse_workout_type(text)
             logger.debug(f"[Intent: WORKOUT_START (override={traffic_override}, protocol={protocol_id})]")
             try:
-                response = asyncio.run(
-                    self.server._start_interactive_workout(
-                        traffic_override=traffic_override,
-                        protocol_id=protocol_id,
-                    )
+                response = await self._call(
+                    self.server._start_interactive_workout,
+                    traffic_override=traffic_override,
+                    protocol_id=protocol_id,
                 )
             except Exception as e:
                 logger.debug(f"[WORKOUT_START ERROR: {e}]")
@@ -349,10 +419,10 @@ class IntentDispatcher:
             )
 
         # Routine start
-        if self.server._is_routine_start_intent(text):
+        if self._check(self.server._is_routine_start_intent, text):
             logger.debug("[Intent: ROUTINE_START]")
             try:
-                response = asyncio.run(self.server._start_interactive_routine())
+                response = await self._call(self.server._start_interactive_routine)
             except Exception as e:
                 logger.error(f"[ROUTINE_START ERROR: {e}]")
                 response = f"Routine start failed: {e}"
@@ -364,11 +434,11 @@ class IntentDispatcher:
             )
 
         # Seneca Trial (reflection) start
-        if self.server._is_reflection_start_intent(text):
-            is_quick = self.server._is_quick_reflection_intent(text)
+        if self._check(self.server._is_reflection_start_intent, text):
+            is_quick = self._check(self.server._is_quick_reflection_intent, text)
             logger.debug(f"[Intent: REFLECTION_START (quick={is_quick})]")
             try:
-                response = asyncio.run(self.server._start_reflection(is_quick))
+                response = await self._call(self.server._start_reflection, is_quick)
             except Exception as e:
                 logger.error(f"[REFLECTION_START ERROR: {e}]")
                 response = f"Reflection start failed: {e}"
@@ -381,15 +451,15 @@ class IntentDispatcher:
 
         return None
 
-    def _try_logging_handlers(self, text: str) -> IntentResult | None:
+    async def _try_logging_handlers(self, text: str) -> IntentResult | None:
         """Handle logging commands (weight, pain, supplements, workout completion)."""
         # Weight query (before weight logging)
-        weight_query = self.server._is_weight_query_intent(text)
+        weight_query = self._check(self.server._is_weight_query_intent, text)
         if weight_query[0]:
             _, query_type = weight_query
             logger.debug(f"[Intent: WEIGHT_QUERY - {query_type}]")
             try:
-                response = asyncio.run(self.server._handle_weight_query(query_type))
+                response = await self._call(self.server._handle_weight_query, query_type)
             except Exception as e:
                 logger.debug(f"[WEIGHT_QUERY ERROR: {e}]")
                 response = f"Weight query failed: {e}"
@@ -401,7 +471,7 @@ class IntentDispatcher:
             )
 
         # Weight logging (with body composition)
-        weight_result = self.server._is_weight_intent(text)
+        weight_result = self._check(self.server._is_weight_intent, text)
         if weight_result[0] and weight_result[1]:
             body_comp = weight_result[1]
             extras = []
@@ -412,7 +482,7 @@ class IntentDispatcher:
             extra_str = f" ({', '.join(extras)})" if extras else ""
             logger.debug(f"[Intent: WEIGHT - {body_comp.weight_kg}kg{extra_str}]")
             try:
-                response = asyncio.run(self.server._handle_weight_log(body_comp))
+                response = await self._call(self.server._handle_weight_log, body_comp)
             except Exception as e:
                 logger.debug(f"[WEIGHTHANDLER ERROR: {e}]")
                 response = f"Weight logging failed: {e}"
@@ -425,12 +495,12 @@ class IntentDispatcher:
             )
 
         # Pain logging
-        pain_result = self.server._is_pain_intent(text)
+        pain_result = self._check(self.server._is_pain_intent, text)
         if pain_result[0]:
             _, body_part, pain_level, is_status = pain_result
             logger.debug(f"[Intent: PAIN - {body_part}:{pain_level} status={is_status}]")
             try:
-                response = asyncio.run(self.server._handle_pain(body_part, pain_level, is_status))
+                response = await self._call(self.server._handle_pain, body_part, pain_level, is_status)
             except Exception as e:
                 logger.debug(f"[PAINHANDLER ERROR: {e}]")
                 response = f"Pain logging failed: {e}"
@@ -444,7 +514,7 @@ class IntentDispatcher:
             )
 
         # Supplement logging
-        supp_result = self.server._is_supplement_intent(text)
+        supp_result = self._check(self.server._is_supplement_intent, text)
         if supp_result[0]:
             _, supp_name, timing, is_status, status_type = supp_result
             logger.debug(
@@ -452,8 +522,8 @@ class IntentDispatcher:
                 f"status={is_status} type={status_type}]"
             )
             try:
-                response = asyncio.run(
-                    self.server._handle_supplement(supp_name, timing, is_status, status_type)
+                response = await self._call(
+                    self.server._handle_supplement, supp_name, timing, is_status, status_type
                 )
             except Exception as e:
                 logger.debug(f"[SUPPLEMENTHANDLER ERROR: {e}]")
@@ -468,12 +538,12 @@ class IntentDispatcher:
             )
 
         # Workout completion
-        workout_complete = self.server._is_workout_completion_intent(text)
+        workout_complete = self._check(self.server._is_workout_completion_intent, text)
         if workout_complete[0]:
             _, has_issues = workout_complete
             logger.debug(f"[Intent: WORKOUT_COMPLETE - issues={has_issues}]")
             try:
-                response = asyncio.run(self.server._handle_workout_completion(text, has_issues))
+                response = await self._call(self.server._handle_workout_completion, text, has_issues)
             except Exception as e:
                 logger.debug(f"[WORKOUT_COMPLETE ERROR: {e}]")
                 response = f"Workout logging failed: {e}"
@@ -488,13 +558,13 @@ class IntentDispatcher:
 
         return None
 
-    def _try_query_handlers(self, text: str) -> IntentResult | None:
+    async def _try_query_handlers(self, text: str) -> IntentResult | None:
         """Handle query commands (health status, workout info, exercise info, skill status)."""
         # Skill/XP status query
-        if self.server._is_skill_status_intent(text):
+        if self._check(self.server._is_skill_status_intent, text):
             logger.debug("[Intent: SKILL_STATUS]")
             try:
-                response = asyncio.run(self.server._handle_skill_status())
+                response = await self._call(self.server._handle_skill_status)
             except Exception as e:
                 print(f"[SKILL_STATUS HANDLER ERROR: {e}]")
                 response = "Skill status unavailable."
@@ -506,10 +576,10 @@ class IntentDispatcher:
             )
 
         # Workout query
-        if self.server._is_workout_intent(text):
+        if self._check(self.server._is_workout_intent, text):
             logger.debug("[Intent: WORKOUT]")
             try:
-                response = asyncio.run(self.server._handle_workout_query())
+                response = await self._call(self.server._handle_workout_query)
             except Exception as e:
                 print(f"[WORKOUT HANDLER ERROR: {e}]")
                 response = f"Workout lookup failed: {e}"
@@ -521,12 +591,12 @@ class IntentDispatcher:
             )
 
         # Exercise query
-        exercise_result = self.server._is_exercise_intent(text)
+        exercise_result = self._check(self.server._is_exercise_intent, text)
         if exercise_result[0]:
             _, exercise_name = exercise_result
             logger.debug(f"[Intent: EXERCISE - {exercise_name}]")
             try:
-                response = asyncio.run(self.server._handle_exercise_query(exercise_name))
+                response = await self._call(self.server._handle_exercise_query, exercise_name)
             except Exception as e:
                 print(f"[EXERCISE HANDLER ERROR: {e}]")
                 response = f"Exercise lookup failed: {e}"
@@ -538,10 +608,10 @@ class IntentDispatcher:
             )
 
         # Health status
-        if self.server._is_health_intent(text):
+        if self._check(self.server._is_health_intent, text):
             logger.debug("[Intent: HEALTH]")
             try:
-                response = asyncio.run(self.server._handle_health_status(text))
+                response = await self._call(self.server._handle_health_status, text)
             except Exception as e:
                 print(f"[HEALTH HANDLER ERROR: {e}]")
                 import traceback
@@ -556,11 +626,11 @@ class IntentDispatcher:
 
         return None
 
-    def _try_capture_handlers(self, text: str) -> IntentResult | None:
+    async def _try_capture_handlers(self, text: str) -> IntentResult | None:
         """Handle capture intents (remember, note, save)."""
-        if self.server._is_capture_intent(text):
+        if self._check(self.server._is_capture_intent, text):
             logger.debug("[Intent: CAPTURE]")
-            response = asyncio.run(self.server._handle_capture(text))
+            response = await self._call(self.server._handle_capture, text)
             print(f"ATLAS: {response}")
             # Extract destination from response (format: "Saved to X." or "Saved to X:Y.")
             saved_to = ""
@@ -575,12 +645,12 @@ class IntentDispatcher:
 
         return None
 
-    def _try_meal_handlers(self, text: str) -> IntentResult | None:
+    async def _try_meal_handlers(self, text: str) -> IntentResult | None:
         """Handle meal logging intents."""
-        if self.server._is_meal_intent(text):
+        if self._check(self.server._is_meal_intent, text):
             logger.debug("[Intent: MEAL]")
             try:
-                response = asyncio.run(self.server._handle_meal(text))
+                response = await self._call(self.server._handle_meal, text)
             except Exception as e:
                 print(f"[MEAL HANDLER ERROR: {e}]")
                 import traceback
@@ -600,7 +670,7 @@ class IntentDispatcher:
     # Complex State Machine Handlers
     # =========================================================================
 
-    def _handle_active_workout(self, text: str) -> IntentResult | None:
+    async def _handle_active_workout(self, text: str) -> IntentResult | None:
         """Handle all intents when an interactive workout is active.
 
         The workout state machine has multiple sub-states:
@@ -624,7 +694,7 @@ class IntentDispatcher:
             self.server.workout.last_set_of_timed_exercise = False
             last_set_advanced = True
             try:
-                response_text = asyncio.run(self.server._advance_to_next_exercise())
+                response_text = await self._call(self.server._advance_to_next_exercise)
             except Exception as e:
                 response_text = f"Advance failed: {e}"
 
@@ -649,22 +719,22 @@ class IntentDispatcher:
             pass  # response_text already set
 
         # Global stop check (works in any workout state)
-        elif self.server._is_workout_stop_command(text):
+        elif self._check(self.server._is_workout_stop_command, text):
             logger.debug("[Intent: WORKOUT_STOP]")
             try:
-                response_text = asyncio.run(self.server._handle_workout_stop())
+                response_text = await self._call(self.server._handle_workout_stop)
             except Exception as e:
                 logger.debug(f"[WORKOUT_STOP ERROR: {e}]")
                 response_text = f"Stop failed: {e}"
 
         # Workout completion check (allows "finished workout" during active workout)
-        elif self.server._is_workout_completion_intent(text)[0]:
-            _, has_issues = self.server._is_workout_completion_intent(text)
+        elif self._check(self.server._is_workout_completion_intent, text)[0]:
+            _, has_issues = self._check(self.server._is_workout_completion_intent, text)
             logger.debug(f"[Intent: WORKOUT_COMPLETE (during active) - issues={has_issues}]")
             try:
                 # Stop the workout first, then log it
                 self.server._force_reset_workout_state()
-                response_text = asyncio.run(self.server._handle_workout_completion(text, has_issues))
+                response_text = await self._call(self.server._handle_workout_completion, text, has_issues)
             except Exception as e:
                 logger.debug(f"[WORKOUT_COMPLETE ERROR: {e}]")
                 import traceback
@@ -672,25 +742,25 @@ class IntentDispatcher:
                 response_text = f"Completion failed: {e}"
 
         # Global pause check (works in any workout state when not already paused)
-        elif self.server._is_workout_pause_command(text) and not self.server.workout.paused:
+        elif self._check(self.server._is_workout_pause_command, text) and not self.server.workout.paused:
             logger.debug("[Intent: WORKOUT_PAUSE]")
             try:
-                response_text = asyncio.run(self.server._handle_workout_pause())
+                response_text = await self._call(self.server._handle_workout_pause)
             except Exception as e:
                 logger.debug(f"[WORKOUT_PAUSE ERROR: {e}]")
                 response_text = f"Pause failed: {e}"
 
         # Global resume check (works when paused)
-        elif self.server._is_workout_resume_command(text) and self.server.workout.paused:
+        elif self._check(self.server._is_workout_resume_command, text) and self.server.workout.paused:
             logger.debug("[Intent: WORKOUT_RESUME]")
             try:
-                response_text = asyncio.run(self.server._handle_workout_resume())
+                response_text = await self._call(self.server._handle_workout_resume)
             except Exception as e:
                 logger.debug(f"[WORKOUT_RESUME ERROR: {e}]")
                 response_text = f"Resume failed: {e}"
 
         # Restart workout if user says "start workout" again (handles stuck state)
-        elif self.server._is_workout_start_intent(text):
+        elif self._check(self.server._is_workout_start_intent, text):
             logger.debug("[Intent: WORKOUT_RESTART (was active)]")
             # Reset all workout state before restarting
             self.server.workout.active = False
@@ -701,13 +771,12 @@ class IntentDispatcher:
             self.server.workout.awaiting_reps = False
             self.server.workout.last_set_of_timed_exercise = False
             try:
-                traffic_override = self.server._detect_traffic_override(text)
+                traffic_override = self._check(self.server._detect_traffic_override, text)
                 protocol_id = self.server._parse_workout_type(text)
-                response_text = asyncio.run(
-                    self.server._start_interactive_workout(
-                        traffic_override=traffic_override,
-                        protocol_id=protocol_id,
-                    )
+                response_text = await self._call(
+                    self.server._start_interactive_workout,
+                    traffic_override=traffic_override,
+                    protocol_id=protocol_id,
                 )
             except Exception as e:
                 logger.debug(f"[WORKOUT_RESTART ERROR: {e}]")
@@ -717,19 +786,19 @@ class IntentDispatcher:
 
         # During rest period
         elif self.server.workout.rest_active:
-            response_text = self._handle_workout_rest_state(text, timer_msg)
+            response_text = await self._handle_workout_rest_state(text, timer_msg)
 
         # Waiting for user to be ready for set/exercise
         elif self.server.workout.exercise_pending:
-            response_text = self._handle_workout_pending_state(text)
+            response_text = await self._handle_workout_pending_state(text)
 
         # Waiting for AMRAP rep count after "How many reps?"
         elif self.server.workout.awaiting_reps:
-            response_text = self._handle_workout_awaiting_reps(text)
+            response_text = await self._handle_workout_awaiting_reps(text)
 
         # User doing a set
         elif self.server.workout.set_active:
-            response_text = self._handle_workout_set_active(text, ex_timer_msg)
+            response_text = await self._handle_workout_set_active(text, ex_timer_msg)
 
         else:
             # Fallback - shouldn't reach here normally
@@ -750,12 +819,12 @@ class IntentDispatcher:
             tier_override="WORKOUT_INTERACTIVE",
         )
 
-    def _handle_workout_rest_state(self, text: str, timer_msg: str | None) -> str:
+    async def _handle_workout_rest_state(self, text: str, timer_msg: str | None) -> str:
         """Handle intents during workout rest period."""
-        if self.server._is_workout_skip_command(text):
+        if self._check(self.server._is_workout_skip_command, text):
             logger.debug("[Intent: WORKOUT_SKIP (rest)]")
             try:
-                return asyncio.run(self.server._handle_workout_skip())
+                return await self._call(self.server._handle_workout_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
@@ -763,12 +832,12 @@ class IntentDispatcher:
             remaining = self.server._get_workout_rest_remaining()
             return f"{remaining} seconds left."
 
-        if self.server._is_workout_ready_command(text):
+        if self._check(self.server._is_workout_ready_command, text):
             # User ready early, skip rest
             self.server.workout.rest_active = False
             logger.debug("[Intent: WORKOUT_READY (early)]")
             try:
-                return asyncio.run(self.server._handle_workout_ready(text))
+                return await self._call(self.server._handle_workout_ready, text)
             except Exception as e:
                 return f"Ready failed: {e}"
 
@@ -780,27 +849,27 @@ class IntentDispatcher:
         remaining = self.server._get_workout_rest_remaining()
         return f"Resting. {remaining} seconds. Say ready to skip."
 
-    def _handle_workout_pending_state(self, text: str) -> str:
+    async def _handle_workout_pending_state(self, text: str) -> str:
         """Handle intents while waiting for user to be ready."""
-        if self.server._is_workout_ready_command(text):
+        if self._check(self.server._is_workout_ready_command, text):
             logger.debug("[Intent: WORKOUT_READY]")
             try:
-                return asyncio.run(self.server._handle_workout_ready(text))
+                return await self._call(self.server._handle_workout_ready, text)
             except Exception as e:
                 return f"Ready failed: {e}"
 
-        if self.server._is_workout_skip_command(text):
+        if self._check(self.server._is_workout_skip_command, text):
             logger.debug("[Intent: WORKOUT_SKIP]")
             try:
-                return asyncio.run(self.server._handle_workout_skip())
+                return await self._call(self.server._handle_workout_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
-        if self.server._is_workout_stop_command(text):
+        if self._check(self.server._is_workout_stop_command, text):
             # Allow stopping workout from READY screen
             logger.debug("[Intent: WORKOUT_STOP from READY]")
             try:
-                return asyncio.run(self.server._handle_workout_stop())
+                return await self._call(self.server._handle_workout_stop)
             except Exception as e:
                 return f"Stop failed: {e}"
 
@@ -808,14 +877,14 @@ class IntentDispatcher:
             # Simple "done" or "finished" on READY screen = stop workout
             logger.debug("[Intent: WORKOUT_STOP from READY (done/finished)]")
             try:
-                return asyncio.run(self.server._handle_workout_stop())
+                return await self._call(self.server._handle_workout_stop)
             except Exception as e:
                 return f"Stop failed: {e}"
 
-        if self.server._is_workout_completion_intent(text)[0]:
+        if self._check(self.server._is_workout_completion_intent, text)[0]:
             # Allow completing workout from READY screen
             logger.debug("[Intent: WORKOUT_COMPLETE from READY]")
-            _, has_issues = self.server._is_workout_completion_intent(text)
+            _, has_issues = self._check(self.server._is_workout_completion_intent, text)
             if has_issues:
                 # Store pending completion for confirmation
                 self.server._pending_workout = {
@@ -825,7 +894,7 @@ class IntentDispatcher:
                 return "Got it. What did you skip or modify? Any notes?"
             else:
                 try:
-                    return asyncio.run(self.server._handle_workout_completion(text, False))
+                    return await self._call(self.server._handle_workout_completion, text, False)
                 except Exception as e:
                     return f"Logging failed: {e}"
 
@@ -841,7 +910,7 @@ class IntentDispatcher:
         ex_name = ex["name"] if ex else "exercise"
         return f"Waiting for you. Say ready when set up for {ex_name}."
 
-    def _handle_workout_awaiting_reps(self, text: str) -> str:
+    async def _handle_workout_awaiting_reps(self, text: str) -> str:
         """Handle intents while awaiting AMRAP rep count."""
         from atlas.voice.number_parser import parse_spoken_number
 
@@ -851,18 +920,18 @@ class IntentDispatcher:
             try:
                 self.server.workout.set_reps.append(int(reps))
                 self.server.workout.awaiting_reps = False
-                return asyncio.run(self.server._advance_to_next_exercise())
+                return await self._call(self.server._advance_to_next_exercise)
             except Exception as e:
                 return f"Rep logging failed: {e}"
         return "How many reps did you get?"
 
-    def _handle_workout_set_active(self, text: str, ex_timer_msg: str | None) -> str:
+    async def _handle_workout_set_active(self, text: str, ex_timer_msg: str | None) -> str:
         """Handle intents while user is performing a set."""
         # Check for exercise timer message (switch sides, set complete)
         if ex_timer_msg:
             return ex_timer_msg
 
-        if self.server._is_workout_set_done_command(text):
+        if self._check(self.server._is_workout_set_done_command, text):
             logger.debug("[Intent: WORKOUT_SET_DONE]")
             # For timed exercises, "done" skips remaining time
             if self.server.workout.exercise_timer_active:
@@ -880,26 +949,26 @@ class IntentDispatcher:
                     return "Skipping to right side. Begin."
                 else:
                     # Complete the set entirely
-                    return asyncio.run(self.server._handle_workout_set_done(text))
+                    return await self._call(self.server._handle_workout_set_done, text)
             else:
                 try:
-                    return asyncio.run(self.server._handle_workout_set_done(text))
+                    return await self._call(self.server._handle_workout_set_done, text)
                 except Exception as e:
                     return f"Set done failed: {e}"
 
-        if self.server._is_workout_redo_command(text):
+        if self._check(self.server._is_workout_redo_command, text):
             logger.debug("[Intent: WORKOUT_REDO_SET]")
             try:
-                return asyncio.run(self.server._handle_workout_redo_set(text))
+                return await self._call(self.server._handle_workout_redo_set, text)
             except Exception as e:
                 return f"Redo failed: {e}"
 
-        if self.server._is_workout_skip_command(text):
+        if self._check(self.server._is_workout_skip_command, text):
             logger.debug("[Intent: WORKOUT_SKIP (set)]")
             # Stop any active exercise timer
             self.server.workout.exercise_timer_active = False
             try:
-                return asyncio.run(self.server._handle_workout_skip())
+                return await self._call(self.server._handle_workout_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
@@ -921,7 +990,7 @@ class IntentDispatcher:
             return f"{remaining} seconds remaining."
         return "Set in progress. Say done when finished."
 
-    def _handle_active_routine(self, text: str) -> IntentResult | None:
+    async def _handle_active_routine(self, text: str) -> IntentResult | None:
         """Handle all intents when an interactive routine is active.
 
         The routine state machine has multiple sub-states:
@@ -939,36 +1008,36 @@ class IntentDispatcher:
             timer_msg, exercise_done = self.server._check_routine_timer()
 
         # Global stop check (works in any routine state including auto-advance)
-        if self.server._is_routine_stop_command(text):
+        if self._check(self.server._is_routine_stop_command, text):
             logger.debug("[Intent: ROUTINE_STOP]")
             try:
-                response_text = asyncio.run(self.server._handle_routine_stop())
+                response_text = await self._call(self.server._handle_routine_stop)
             except Exception as e:
                 logger.debug(f"[ROUTINE_STOP ERROR: {e}]")
                 response_text = f"Stop failed: {e}"
 
         # Auto-advance in progress (user can skip or wait)
         elif self.server.routine.auto_advance_pending:
-            response_text = self._handle_routine_auto_advance(text)
+            response_text = await self._handle_routine_auto_advance(text)
 
         # Paused state
         elif self.server.routine.paused:
-            response_text = self._handle_routine_paused(text)
+            response_text = await self._handle_routine_paused(text)
 
         # Pending state - waiting for user to say ready/begin/go
         elif self.server.routine.exercise_pending:
-            response_text = self._handle_routine_pending(text)
+            response_text = await self._handle_routine_pending(text)
 
         # Timer active - exercise in progress
         elif self.server.routine.timer_active and not self.server.routine.exercise_complete:
-            response_text = self._handle_routine_timer_active(text)
+            response_text = await self._handle_routine_timer_active(text)
 
         # Exercise timer complete - auto advance
         elif self.server.routine.exercise_complete:
             # Advance to next exercise automatically
             logger.debug("[Intent: ROUTINE_AUTO_ADVANCE]")
             try:
-                response_text = asyncio.run(self.server._advance_routine_exercise())
+                response_text = await self._call(self.server._advance_routine_exercise)
             except Exception as e:
                 response_text = f"Advance failed: {e}"
 
@@ -985,25 +1054,26 @@ class IntentDispatcher:
             tier_override="ROUTINE_INTERACTIVE",
         )
 
-    def _handle_routine_auto_advance(self, text: str) -> str:
+    async def _handle_routine_auto_advance(self, text: str) -> str:
         """Handle intents during routine auto-advance transition."""
-        if self.server._is_routine_skip_command(text):
+        if self._check(self.server._is_routine_skip_command, text):
             logger.debug("[Intent: ROUTINE_SKIP (during auto-advance)]")
             # Cancel current auto-advance and skip to next exercise
             self.server.routine.auto_advance_pending = False
             self.server.routine.auto_advance_start = None
             self.server.routine.auto_advance_phase = None
             try:
-                return asyncio.run(self.server._handle_routine_skip())
+                return await self._call(self.server._handle_routine_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
-        if self.server._is_routine_ready_command(text):
+        if self._check(self.server._is_routine_ready_command, text):
             logger.debug("[Intent: ROUTINE_READY (during auto-advance) - start now]")
             # Skip remaining transition time and start immediately
             self.server.routine.auto_advance_pending = False
             self.server.routine.auto_advance_phase = None
-            self.server._auto_start_routine_timer()
+            # Speaks the "Go" prompt (blocking TTS), so off the loop
+            await asyncio.to_thread(self.server._auto_start_routine_timer)
             ex = self.server.routine.current_exercise
             if ex:
                 return f"Timer started. {ex.get('name', 'Exercise')}. Go."
@@ -1017,38 +1087,41 @@ class IntentDispatcher:
             return "Positioning. Say ready to start now, or wait."
         return "Transitioning. Please wait or say skip."
 
-    def _handle_routine_paused(self, text: str) -> str:
+    async def _handle_routine_paused(self, text: str) -> str:
         """Handle intents while routine is paused."""
-        if self.server._is_routine_resume_command(text) or self.server._is_routine_ready_command(text):
+        if (
+            self._check(self.server._is_routine_resume_command, text)
+            or self._check(self.server._is_routine_ready_command, text)
+        ):
             # Both "resume" and "ready" unpause and restart the timer
             logger.debug("[Intent: ROUTINE_RESUME (via ready/resume)]")
             try:
-                return asyncio.run(self.server._handle_routine_resume())
+                return await self._call(self.server._handle_routine_resume)
             except Exception as e:
                 return f"Resume failed: {e}"
 
-        if self.server._is_routine_skip_command(text):
+        if self._check(self.server._is_routine_skip_command, text):
             # Skip works during pause too
             logger.debug("[Intent: ROUTINE_SKIP (during pause)]")
             self.server.routine.paused = False
             try:
-                return asyncio.run(self.server._handle_routine_skip())
+                return await self._call(self.server._handle_routine_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
-        if self.server._is_routine_stop_command(text):
+        if self._check(self.server._is_routine_stop_command, text):
             # Stop works during pause too
             logger.debug("[Intent: ROUTINE_STOP (during pause)]")
             self.server.routine.paused = False
             try:
-                return asyncio.run(self.server._handle_routine_stop())
+                return await self._call(self.server._handle_routine_stop)
             except Exception as e:
                 return f"Stop failed: {e}"
 
-        if self.server._is_routine_form_request(text):
+        if self._check(self.server._is_routine_form_request, text):
             logger.debug("[Intent: ROUTINE_FORM]")
             try:
-                return asyncio.run(self.server._handle_routine_form_request(text))
+                return await self._call(self.server._handle_routine_form_request, text)
             except Exception as e:
                 return f"Form help failed: {e}"
 
@@ -1056,7 +1129,7 @@ class IntentDispatcher:
         ex_name = ex["name"] if ex else "exercise"
         return f"Paused on {ex_name}. Say resume, or ask about form."
 
-    def _handle_routine_pending(self, text: str) -> str:
+    async def _handle_routine_pending(self, text: str) -> str:
         """Handle intents while waiting for user to be ready."""
         ex = self.server.routine.current_exercise
         ex_name = ex["name"] if ex else "exercise"
@@ -1065,55 +1138,55 @@ class IntentDispatcher:
         has_timer = ex and (ex.get("duration_seconds") or ex.get("reps"))
 
         # Complete command - finish routine gracefully
-        if self.server._is_routine_complete_command(text):
+        if self._check(self.server._is_routine_complete_command, text):
             logger.debug("[Intent: ROUTINE_COMPLETE]")
             try:
-                return asyncio.run(self.server._handle_routine_complete())
+                return await self._call(self.server._handle_routine_complete)
             except Exception as e:
                 return f"Complete failed: {e}"
 
-        if self.server._is_routine_ready_command(text):
+        if self._check(self.server._is_routine_ready_command, text):
             if has_timer:
                 logger.debug("[Intent: ROUTINE_READY]")
                 try:
-                    return asyncio.run(self.server._handle_routine_ready())
+                    return await self._call(self.server._handle_routine_ready)
                 except Exception as e:
                     return f"Ready failed: {e}"
             else:
                 # No timer exercise - check if last exercise
-                is_last = self.server._is_routine_last_exercise()
+                is_last = self._check(self.server._is_routine_last_exercise)
                 if is_last:
                     logger.debug("[Intent: ROUTINE_READY (last, no timer) -> COMPLETE]")
                     try:
-                        return asyncio.run(self.server._handle_routine_complete())
+                        return await self._call(self.server._handle_routine_complete)
                     except Exception as e:
                         return f"Complete failed: {e}"
                 else:
                     logger.debug("[Intent: ROUTINE_READY (no timer) -> SKIP]")
                     try:
-                        return asyncio.run(self.server._handle_routine_skip())
+                        return await self._call(self.server._handle_routine_skip)
                     except Exception as e:
                         return f"Skip failed: {e}"
 
-        if self.server._is_routine_stop_command(text):
+        if self._check(self.server._is_routine_stop_command, text):
             # Redundant stop check for pending state (safety net)
             logger.debug("[Intent: ROUTINE_STOP (pending - safety net)]")
             try:
-                return asyncio.run(self.server._handle_routine_stop())
+                return await self._call(self.server._handle_routine_stop)
             except Exception as e:
                 return f"Stop failed: {e}"
 
-        if self.server._is_routine_skip_command(text):
+        if self._check(self.server._is_routine_skip_command, text):
             logger.debug("[Intent: ROUTINE_SKIP (pending)]")
             try:
-                return asyncio.run(self.server._handle_routine_skip())
+                return await self._call(self.server._handle_routine_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
-        if self.server._is_routine_form_request(text):
+        if self._check(self.server._is_routine_form_request, text):
             logger.debug("[Intent: ROUTINE_FORM (pending)]")
             try:
-                response = asyncio.run(self.server._handle_routine_form_request(text))
+                response = await self._call(self.server._handle_routine_form_request, text)
                 if has_timer:
                     response += " Say ready to start timer."
                 else:
@@ -1126,36 +1199,36 @@ class IntentDispatcher:
             return f"Waiting. {ex_name}. Say ready, begin, or go to start timer."
         return f"{ex_name}. No timer needed. Say finished when done, or skip."
 
-    def _handle_routine_timer_active(self, text: str) -> str:
+    async def _handle_routine_timer_active(self, text: str) -> str:
         """Handle intents while exercise timer is running."""
-        if self.server._is_routine_pause_command(text):
+        if self._check(self.server._is_routine_pause_command, text):
             logger.debug("[Intent: ROUTINE_PAUSE]")
             try:
-                return asyncio.run(self.server._handle_routine_pause())
+                return await self._call(self.server._handle_routine_pause)
             except Exception as e:
                 return f"Pause failed: {e}"
 
-        if self.server._is_routine_stop_command(text):
+        if self._check(self.server._is_routine_stop_command, text):
             # Redundant stop check for timer active state (safety net)
             logger.debug("[Intent: ROUTINE_STOP (timer active - safety net)]")
             try:
-                return asyncio.run(self.server._handle_routine_stop())
+                return await self._call(self.server._handle_routine_stop)
             except Exception as e:
                 return f"Stop failed: {e}"
 
-        if self.server._is_routine_skip_command(text):
+        if self._check(self.server._is_routine_skip_command, text):
             logger.debug("[Intent: ROUTINE_SKIP]")
             try:
-                return asyncio.run(self.server._handle_routine_skip())
+                return await self._call(self.server._handle_routine_skip)
             except Exception as e:
                 return f"Skip failed: {e}"
 
-        if self.server._is_routine_form_request(text):
+        if self._check(self.server._is_routine_form_request, text):
             # Pause and provide form help
             logger.debug("[Intent: ROUTINE_FORM (auto-pause)]")
             try:
-                asyncio.run(self.server._handle_routine_pause())
-                return asyncio.run(self.server._handle_routine_form_request(text))
+                await self._call(self.server._handle_routine_pause)
+                return await self._call(self.server._handle_routine_form_request, text)
             except Exception as e:
                 return f"Form help failed: {e}"
 
@@ -22,11 +22,11 @@ logger = logging.getLogger(__name__)
 import numpy as np
 import sounddevice as sd
 
-from atlas.voice.stt import MoonshineSTT, FasterWhisperSTT, get_stt
+from atlas.voice.stt import MoonshineSTT, FasterWhisperSTT, StreamingTranscriber, TranscriptionResult, get_stt
 from atlas.voice.tts import KokoroTTS, get_tts
 from atlas.voice.vad import StreamingVAD, VADConfig, get_streaming_vad
 from atlas.llm.local import OllamaClient, get_client
-from atlas.llm.router import ATLASRouter, get_router, Tier
+from atlas.llm.router import ATLASRouter, RoutingDecision, get_router, Tier
 from atlas.orchestrator.classifier import ThoughtClassifier, Category, ProjectRecord, RecipeRecord
 
 # Filler phrases for cloud latency masking (Lethal Gentleman persona)
@@ -138,6 +138,10 @@ class VoicePipelineConfig:
 
     # STT backend
     stt_backend: str = "moonshine"  # or "faster-whisper"
+    # Transcribe overlapping windows while the user speaks (faster-whisper only);
+    # partials are routed early and end-of-speech leaves about one window to transcribe
+    streaming_stt: bool = False
+    stt_window_s: float = 3.0
 
     # TTS settings
     tts_voice: str = "bm_lewis"  # British male per persona
@@ -197,6 +201,8 @@ class VoicePipeline:
         self._audio_buffer: list[np.ndarray] = []
         self._is_recording = False
         self._stream = None
+        self._transcriber: Optional[StreamingTranscriber] = None
+        self._partial_route: Optional[tuple[str, RoutingDecision]] = None
 
         # Metrics
         self._last_metrics: Optional[PipelineMetrics] = None
@@ -737,6 +743,10 @@ Return only valid JSON, no explanation."""
         self._audio_buffer = []
         self._is_recording = True
         self.vad.reset()
+        if self._transcriber is not None:
+            self._transcriber.cancel()
+        self._transcriber = None
+        self._partial_route = None
 
         chunk_samples = int(
             self.config.sample_rate * self.config.chunk_duration_ms / 1000
@@ -757,6 +767,13 @@ Return only valid JSON, no explanation."""
 
             if result.speech_started:
                 print("Speech detected...", file=sys.stderr)
+                if self._streaming_stt_enabled():
+                    self._transcriber = self.stt.stream(
+                        on_partial=self._on_partial_transcript, window_s=self.config.stt_window_s
+                    )
+                    self._transcriber.feed(self.vad.buffered_audio())
+            elif self._transcriber is not None and self.vad.is_speaking():
+                self._transcriber.feed(audio_chunk)
 
             if result.speech_ended:
                 nonlocal speech_audio
@@ -781,6 +798,30 @@ Return only valid JSON, no explanation."""
 
         return speech_audio
 
+    def _streaming_stt_enabled(self) -> bool:
+        return self.config.streaming_stt and isinstance(self.stt, FasterWhisperSTT)
+
+    def _on_partial_transcript(self, text: str) -> None:
+        """Route a partial transcript early (runs on the transcriber's thread)."""
+        logger.debug(f"Partial transcript: {text}")
+        if self.config.use_router and text:
+            self._partial_route = (text, self.router.classify(text))
+
+    def _classify(self, user_text: str) -> RoutingDecision:
+        """Routing decision, reused from the last partial when the final text matches it."""
+        partial = self._partial_route
+        self._partial_route = None
+        if partial and partial[0].strip().lower() == user_text.strip().lower():
+            return partial[1]
+        return self.router.classify(user_text)
+
+    async def _transcribe_recorded(self, audio: np.ndarray) -> TranscriptionResult:
+        """Final transcript: the streaming transcriber's tail if one ran, else the full audio."""
+        transcriber, self._transcriber = self._transcriber, None
+        if transcriber is not None:
+            return await asyncio.to_thread(transcriber.finish)
+        return self.stt.transcribe(audio, self.config.sample_rate)
+
     async def process_turn(self) -> str:
         """
         Process a single conversation turn.
@@ -802,9 +843,9 @@ Return only valid JSON, no explanation."""
         metrics.vad_end_time = time.perf_counter()
         print(f"Captured {len(audio) / self.config.sample_rate:.1f}s of audio")
 
-        # 2. Transcribe (STT on CPU)
+        # 2. Transcribe (STT on CPU; with streaming_stt only the last window is left)
         metrics.stt_start_time = time.perf_counter()
-        transcription = self.stt.transcribe(audio, self.config.sample_rate)
+        transcription = await self._transcribe_recorded(audio)
         metrics.stt_end_time = time.perf_counter()
 
         user_text = transcription.text
@@ -868,7 +909,7 @@ Return only valid JSON, no explanation."""
 
         # Classify the query to decide routing
         if self.config.use_router:
-            decision = self.router.classify(user_text)
+            decision = self._classify(user_text)
             tier = decision.tier
             print(f"  [Route: {tier.value}, conf: {decision.confidence:.2f}]")
 
@@ -1412,12 +1453,18 @@ async def _async_main():
         default="bm_lewis",
         help="TTS voice (default: bm_lewis)",
     )
+    parser.add_argument(
+        "--stream-stt",
+        action="store_true",
+        help="Transcribe while speaking (faster-whisper only)",
+    )
 
     args = parser.parse_args()
 
     config = VoicePipelineConfig(
         stt_backend=args.stt,
         tts_voice=args.voice,
+        streaming_stt=args.stream_stt,
     )
 
     if args.text_mode:
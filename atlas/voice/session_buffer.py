@@ -2,7 +2,8 @@
 Session Buffer for Voice Pipeline
 
 Maintains a rolling buffer of recent voice exchanges for LLM context injection.
-SQLite-backed for persistence across restarts.
+The in-memory deque is the source of truth; SQLite is written in the
+background for crash recovery and read once on startup.
 
 Usage:
     from atlas.voice.session_buffer import SessionBuffer
@@ -16,13 +17,17 @@ Usage:
 
 import logging
 import os
-import sqlite3
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from atlas.db import get_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,9 +54,10 @@ class SessionBuffer:
     """
     Rolling buffer of recent voice exchanges.
 
-    - Stores last 5 exchanges
+    - Stores last 5 exchanges in a bounded deque (no disk I/O per turn)
     - 10-minute TTL per exchange
-    - Persisted to SQLite for crash recovery
+    - Persisted to SQLite on a background thread for crash recovery
+    - Rehydrated from SQLite on startup
     - Uses main atlas.db (not separate file)
     """
 
@@ -68,11 +74,15 @@ class SessionBuffer:
         if db_path is None:
             db_path = os.path.expanduser("~/.atlas/atlas.db")
         self.db_path = db_path
+        self._exchanges: deque[Exchange] = deque(maxlen=self.MAX_EXCHANGES)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session_buffer_")
         self._ensure_table()
+        self._rehydrate()
 
     def _ensure_table(self):
         """Create session_buffer table if not exists."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS session_buffer (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -105,13 +115,26 @@ class SessionBuffer:
             atlas_response: ATLAS's response
             intent_type: Type of intent (e.g., "health", "pain", "workout")
         """
-        conn = sqlite3.connect(self.db_path)
+        exchange = Exchange(
+            timestamp=time.time(),
+            user_text=user_text,
+            atlas_response=atlas_response,
+            intent_type=intent_type,
+        )
+        with self._lock:
+            self._exchanges.append(exchange)
+        self._executor.submit(self._persist, exchange)
+        logger.debug(f"Added exchange: {intent_type} - {user_text[:50]}...")
+
+    def _persist(self, exchange: Exchange) -> None:
+        """Write an exchange and prune old rows (runs on the background thread)."""
+        conn = get_connection(self.db_path)
         try:
             # Insert new exchange
             conn.execute("""
                 INSERT INTO session_buffer (timestamp, user_text, atlas_response, intent_type)
                 VALUES (?, ?, ?, ?)
-            """, (time.time(), user_text, atlas_response, intent_type))
+            """, (exchange.timestamp, exchange.user_text, exchange.atlas_response, exchange.intent_type))
 
             # Prune old exchanges (keep only MAX_EXCHANGES)
             conn.execute("""
@@ -125,24 +148,14 @@ class SessionBuffer:
             conn.execute("DELETE FROM session_buffer WHERE timestamp < ?", (cutoff,))
 
             conn.commit()
-            logger.debug(f"Added exchange: {intent_type} - {user_text[:50]}...")
         except Exception as e:
-            logger.error(f"Failed to add exchange: {e}")
+            logger.error(f"Failed to persist exchange: {e}")
         finally:
             conn.close()
 
-    def get_context(self, max_exchanges: int = 5) -> list[Exchange]:
-        """
-        Get recent non-stale exchanges for LLM context.
-
-        Args:
-            max_exchanges: Maximum exchanges to return
-
-        Returns:
-            List of Exchange in chronological order (oldest first)
-        """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _rehydrate(self) -> None:
+        """Load non-stale exchanges persisted by a previous run."""
+        conn = get_connection(self.db_path, readonly=True)
 
         cutoff = time.time() - (self.TTL_MINUTES * 60)
 
@@ -153,7 +166,7 @@ class SessionBuffer:
                 WHERE timestamp >= ?
                 ORDER BY timestamp DESC
                 LIMIT ?
-            """, (cutoff, max_exchanges))
+            """, (cutoff, self.MAX_EXCHANGES))
 
             exchanges = [
                 Exchange(
@@ -164,12 +177,32 @@ class SessionBuffer:
                 )
                 for row in cursor.fetchall()
             ]
-
-            # Return in chronological order (oldest first)
-            return list(reversed(exchanges))
+        except Exception as e:
+            logger.error(f"Failed to load session buffer: {e}")
+            return
         finally:
             conn.close()
 
+        with self._lock:
+            # Chronological order (oldest first)
+            self._exchanges.extend(reversed(exchanges))
+
+    def get_context(self, max_exchanges: int = 5) -> list[Exchange]:
+        """
+        Get recent non-stale exchanges for LLM context.
+
+        Args:
+            max_exchanges: Maximum exchanges to return
+
+        Returns:
+            List of Exchange in chronological order (oldest first)
+        """
+        with self._lock:
+            exchanges = [ex for ex in self._exchanges if not ex.is_stale(self.TTL_MINUTES)]
+        if max_exchanges <= 0:
+            return []
+        return exchanges[-max_exchanges:]
+
     def format_for_llm(self) -> str:
         """
         Format buffer as context for LLM injection.
@@ -205,12 +238,29 @@ class SessionBuffer:
 
     def clear(self) -> None:
         """Clear all exchanges (for testing or reset)."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("DELETE FROM session_buffer")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._exchanges.clear()
+        self._executor.submit(self._delete_all)
         logger.info("Session buffer cleared")
 
+    def _delete_all(self) -> None:
+        conn = get_connection(self.db_path)
+        try:
+            conn.execute("DELETE FROM session_buffer")
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to clear persisted session buffer: {e}")
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        """Wait until queued writes have reached SQLite."""
+        self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Finish queued writes and stop the background writer."""
+        self._executor.shutdown(wait=True)
+
 
 # Convenience function
 def get_session_buffer() -> SessionBuffer:
@@ -0,0 +1,124 @@
+"""
+ATLAS Session Status Publisher
+
+Keeps the Command Centre session status document in memory. Full
+documents are published after each exchange; timer ticks (every 100ms
+while a routine or workout is active) only publish when the timer block
+changed, and then only the changed fields:
+
+- Socket clients get a session delta frame (apply_session_delta format).
+- File clients get the whole document, written from memory (the file is
+  never read back).
+- Changes to THROTTLED_FIELDS alone (progress_pct moves every tick) are
+  published at most every MIN_INTERVAL_S. Countdown seconds and every
+  other field are published as soon as they change, so the UI stays at
+  one-second resolution with ~60 writes a minute instead of ~600.
+
+Usage:
+    publisher = SessionStatusPublisher(transport.publish_session_status,
+                                       transport.publish_session_delta)
+    publisher.publish(status)                  # After an exchange
+    publisher.update_timer(get_timer_status())  # Every timer tick
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+MIN_INTERVAL_S = 1.0  # Minimum spacing of throttled-only updates
+THROTTLED_FIELDS = frozenset({"progress_pct"})
+
+
+def timer_delta(previous: Optional[dict], timer: Optional[dict]) -> Optional[dict]:
+    """Session delta turning previous into timer (None if they are equal)."""
+    if timer == previous:
+        return None
+    if timer is None or previous is None or timer.keys() != previous.keys():
+        # Started, stopped or changed mode: the block's fields differ
+        return {"set": {"timer": timer}}
+    return {"merge": {"timer": {k: v for k, v in timer.items() if previous[k] != v}}}
+
+
+class SessionStatusPublisher:
+    """In-memory session status with delta, rate-bounded timer updates."""
+
+    def __init__(
+        self,
+        publish: Callable[[dict, bool], None],
+        publish_delta: Callable[[dict], bool],
+        min_interval_s: float = MIN_INTERVAL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            publish: (document, persist) -> None; publishes the whole document
+            publish_delta: delta -> True if pushed (False: publish the document)
+            min_interval_s: Minimum spacing of updates that only move
+                THROTTLED_FIELDS
+            clock: Monotonic time source
+        """
+        self._publish = publish
+        self._publish_delta = publish_delta
+        self.min_interval_s = min_interval_s
+        self._clock = clock
+        self._last_timer_at = float("-inf")
+        self.document: dict = {}
+        self.documents = 0  # Whole documents published
+        self.deltas = 0  # Delta frames pushed
+        self.skipped = 0  # Timer ticks that published nothing
+
+    def publish(self, status: dict) -> None:
+        """Publish a complete document (persisted for file readers)."""
+        self.document = status
+        self._last_timer_at = self._clock()
+        self._publish(status, True)
+        self.documents += 1
+
+    def update_timer(self, timer: Optional[dict], force: bool = False) -> bool:
+        """
+        Publish a timer block if it changed.
+
+        Args:
+            timer: Current timer block (None when no timer is active)
+            force: Publish throttled-only changes immediately
+
+        Returns:
+            True if anything was published
+        """
+        previous = self.document.get("timer")
+        delta = timer_delta(previous, timer)
+        now = self._clock()
+        if delta is None or (
+            not force
+            and "merge" in delta
+            and delta["merge"]["timer"].keys() <= THROTTLED_FIELDS
+            and now - self._last_timer_at < self.min_interval_s
+        ):
+            self.skipped += 1
+            return False
+
+        document = dict(self.document)
+        if timer is None:
+            document.pop("timer", None)
+        else:
+            document["timer"] = timer
+        self.document = document
+        self._last_timer_at = now
+
+        if self._publish_delta(delta):
+            self.deltas += 1
+        else:
+            self._publish(document, False)
+            self.documents += 1
+        return True
+
+    def clear_timer(self) -> None:
+        """Remove the timer block and persist the document."""
+        if "timer" in self.document:
+            self.document = {k: v for k, v in self.document.items() if k != "timer"}
+        self.publish(self.document)
+
+    def stats(self) -> dict:
+        return {"documents": self.documents, "deltas": self.deltas, "skipped": self.skipped}
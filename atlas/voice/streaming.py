@@ -0,0 +1,261 @@
+"""
+Sentence-Level Streaming for the File Bridge
+
+Cuts the LLM token stream at sentence boundaries, synthesizes each sentence
+while the LLM is still generating, and hands finished audio to the Windows
+client as numbered chunk files so playback starts after the first sentence.
+
+Chunk protocol (bridge directory):
+    1. Client writes audio_in.raw and sends PROCESS_STREAM (PROCESS keeps the
+       single-file audio_out.raw behaviour for older clients).
+    2. Server writes metadata.txt, then audio_out_000.raw, audio_out_001.raw, ...
+       Each chunk is written to a temp file and renamed, so a visible chunk is
+       always complete.
+    3. Server writes status DONE after the last chunk.
+    4. Client plays chunks in order, deleting each after playback, until status
+       is DONE and the next chunk does not exist. Empty chunks are skipped.
+    5. If the response is abandoned mid-stream (LLM fallback), the server
+       empties the chunks still on disk and numbering continues, so the
+       client moves straight on to the replacement.
+
+Usage:
+    from atlas.voice.streaming import SentenceSegmenter, ChunkedAudioWriter, StreamingSpeaker
+
+    speaker = StreamingSpeaker(tts, ChunkedAudioWriter(BRIDGE_DIR, METADATA_FILE))
+    speaker.start()
+    segmenter = SentenceSegmenter()
+    async for token in router.route_and_stream(query):
+        for sentence in segmenter.feed(token):
+            speaker.say(sentence)
+    speaker.say(segmenter.flush())
+    stats = speaker.finish()
+"""
+
+import logging
+import queue
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Thread
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Chunk file naming (audio_out_000.raw, audio_out_001.raw, ...)
+CHUNK_PREFIX = "audio_out_"
+CHUNK_SUFFIX = ".raw"
+
+# Sentence boundary: terminator (optionally followed by closing quote/bracket)
+# then whitespace. Requiring the whitespace keeps "3.5kg" and "e.g" intact
+# until the next token arrives.
+_SENTENCE_BOUNDARY = re.compile(r'[.!?:]["\')\]]*\s+')
+
+
+def chunk_path(bridge_dir: Path, index: int) -> Path:
+    """Path of the index-th streamed audio chunk."""
+    return bridge_dir / f"{CHUNK_PREFIX}{index:03d}{CHUNK_SUFFIX}"
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split complete text into sentences (used for non-LLM responses)."""
+    segmenter = SentenceSegmenter(min_chars=0)
+    sentences = segmenter.feed(text)
+    tail = segmenter.flush()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+class SentenceSegmenter:
+    """
+    Incremental sentence splitter for a token stream.
+
+    Tokens are appended to an internal buffer; every complete sentence is
+    returned as soon as its boundary is seen. Sentences shorter than
+    min_chars are merged into the next one so "Yes." does not become its
+    own TTS call.
+    """
+
+    def __init__(self, min_chars: int = 8):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, token: str) -> list[str]:
+        """Add a token and return any sentences it completed."""
+        self._buffer += token
+        sentences = []
+        start = 0
+        for match in _SENTENCE_BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            if len(candidate) < self.min_chars:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> str:
+        """Return whatever is left in the buffer (end of stream)."""
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder
+
+    def reset(self) -> None:
+        """Drop buffered text (e.g. when falling back to another LLM)."""
+        self._buffer = ""
+
+
+class ChunkedAudioWriter:
+    """Writes numbered float32 audio chunks to the bridge directory."""
+
+    def __init__(self, bridge_dir: Path, metadata_file: Path):
+        self.bridge_dir = bridge_dir
+        self.metadata_file = metadata_file
+        self.count = 0
+        self.sample_rate: Optional[int] = None
+
+    def clear(self) -> None:
+        """Remove stale chunks left over from an interrupted turn."""
+        for stale in self.bridge_dir.glob(f"{CHUNK_PREFIX}*{CHUNK_SUFFIX}"):
+            stale.unlink(missing_ok=True)
+        self.count = 0
+
+    def write(self, audio, sample_rate: int) -> Path:
+        """Atomically write one chunk. Metadata is written before the first chunk."""
+        if self.sample_rate != sample_rate:
+            self.metadata_file.write_text(f"sample_rate={sample_rate}")
+            self.sample_rate = sample_rate
+
+        path = chunk_path(self.bridge_dir, self.count)
+        temp_file = path.with_suffix(".tmp")
+        audio.astype("float32").tofile(temp_file)
+        temp_file.replace(path)
+        self.count += 1
+        return path
+
+    def discard(self) -> None:
+        """Empty the chunks the client has not played yet, keeping the numbering.
+
+        The client deletes each chunk once played, so the chunks still on
+        disk are unplayed. Empty chunks are skipped, and the next write()
+        continues from count, which is where the client will look next.
+        """
+        for index in range(self.count):
+            path = chunk_path(self.bridge_dir, index)
+            if path.exists():
+                # If the client takes it meanwhile, the empty file left behind
+                # is removed by the next turn's clear()
+                temp_file = path.with_suffix(".tmp")
+                temp_file.write_bytes(b"")
+                temp_file.replace(path)
+
+    def write_silence(self, seconds: float) -> Optional[Path]:
+        """Append a silence chunk (prevents cutoff at the end of playback)."""
+        if self.count == 0 or not self.sample_rate:
+            return None
+        path = chunk_path(self.bridge_dir, self.count)
+        temp_file = path.with_suffix(".tmp")
+        # float32 zero is four zero bytes
+        temp_file.write_bytes(b"\x00" * (4 * int(seconds * self.sample_rate)))
+        temp_file.replace(path)
+        self.count += 1
+        return path
+
+
+@dataclass
+class SpeakerStats:
+    """Timing for one streamed response."""
+    sentences: int = 0
+    failed: int = 0  # Sentences whose TTS raised (their audio is missing)
+    chunks: int = 0
+    tts_ms: float = 0.0
+    first_audio_at: Optional[float] = None  # perf_counter() when chunk 0 landed
+    sample_rate: int = 24000
+    audio: list = field(default_factory=list)  # PCM of each sentence chunk, in order
+
+    @property
+    def audio_seconds(self) -> float:
+        """Total audio duration across all chunks."""
+        return sum(len(a) for a in self.audio) / self.sample_rate if self.audio else 0.0
+
+
+class StreamingSpeaker:
+    """
+    Background TTS worker for sentence-level streaming.
+
+    Sentences are synthesized in order on a single worker thread so the LLM
+    stream is never blocked by TTS, and chunk numbering matches speech order.
+    """
+
+    _STOP = object()
+    _CANCEL = object()
+
+    def __init__(self, tts, writer: ChunkedAudioWriter):
+        self.tts = tts
+        self.writer = writer
+        self.stats = SpeakerStats()
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        """Clear stale chunks and start the worker thread."""
+        self.writer.clear()
+        self._thread = Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def say(self, sentence: str) -> None:
+        """Queue a sentence for synthesis (empty strings are ignored)."""
+        if sentence and sentence.strip():
+            self._queue.put(sentence.strip())
+
+    def cancel(self) -> None:
+        """Drop unspoken sentences and the chunks not yet played (LLM fallback).
+
+        Returns immediately. A sentence already being synthesized finishes
+        first, then the worker discards the writer's unplayed chunks, so
+        the client plays sentences queued after cancel() next.
+        """
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(self._CANCEL)
+
+    def finish(self, tail_seconds: float = 0.2, timeout: Optional[float] = None) -> SpeakerStats:
+        """Wait for queued sentences to be written, then append the silence tail."""
+        self._queue.put(self._STOP)
+        if self._thread:
+            self._thread.join(timeout)
+        self.writer.write_silence(tail_seconds)
+        self.stats.chunks = self.writer.count
+        return self.stats
+
+    def _worker(self) -> None:
+        while True:
+            sentence = self._queue.get()
+            if sentence is self._STOP:
+                return
+            if sentence is self._CANCEL:
+                self.writer.discard()
+                self.stats.sentences = 0
+                self.stats.failed = 0
+                self.stats.first_audio_at = None
+                self.stats.audio = []
+                continue
+            try:
+                start = time.perf_counter()
+                result = self.tts.synthesize(sentence)
+                self.stats.tts_ms += (time.perf_counter() - start) * 1000
+                if len(result.audio) == 0:
+                    continue
+                self.writer.write(result.audio, result.sample_rate)
+                if self.stats.first_audio_at is None:
+                    self.stats.first_audio_at = time.perf_counter()
+                self.stats.sample_rate = result.sample_rate
+                self.stats.sentences += 1
+                self.stats.audio.append(result.audio)
+            except Exception as e:
+                self.stats.failed += 1
+                logger.error(f"[STREAM] TTS failed for sentence: {e}")
@@ -5,15 +5,40 @@ Moonshine STT wrapper for CPU-based transcription.
 Per R25: STT runs on CPU to reserve GPU for LLM.
 
 Target latency: < 700ms for typical utterance
+
+Streaming mode (faster-whisper): StreamingTranscriber transcribes
+overlapping windows while the user is still speaking. Words that end
+before the overlap are committed; the rest are re-transcribed with the
+next window. On end-of-speech only the uncommitted tail (at most about
+one window) is left to transcribe.
 """
 
+import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+# Streaming defaults
+STREAM_WINDOW_S = 3.0  # Audio per partial transcription
+STREAM_OVERLAP_S = 1.0  # Tail of each window re-transcribed with the next
+STREAM_PAD_S = 0.1  # Leading silence (prevents first-word cutoff)
+MIN_STREAM_HOP_S = 0.5  # New audio needed before another window
+
+
+@dataclass(frozen=True)
+class Word:
+    """A transcribed word with times in seconds from the start of the audio."""
+    start: float
+    end: float
+    text: str
+
 
 @dataclass
 class TranscriptionResult:
@@ -258,6 +283,40 @@ class FasterWhisperSTT:
             audio_duration_s=audio_duration,
         )
 
+    def transcribe_words(self, audio: np.ndarray) -> list[Word]:
+        """
+        Transcribe audio with word timestamps (no padding added).
+
+        Args:
+            audio: 16kHz mono float32
+
+        Returns:
+            Words with start/end relative to the start of audio
+        """
+        self._ensure_loaded()
+        segments, _ = self._model.transcribe(
+            audio,
+            beam_size=1,
+            language="en",
+            vad_filter=False,
+            condition_on_previous_text=False,
+            word_timestamps=True,
+        )
+        return [
+            Word(word.start, word.end, word.word.strip())
+            for segment in segments
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+
+    def stream(
+        self,
+        on_partial: Optional[Callable[[str], None]] = None,
+        window_s: float = STREAM_WINDOW_S,
+    ) -> "StreamingTranscriber":
+        """Start a streaming transcription of one utterance (see StreamingTranscriber)."""
+        return StreamingTranscriber(self, on_partial=on_partial, window_s=window_s)
+
     def is_available(self) -> bool:
         """Check if faster-whisper is available."""
         try:
@@ -267,6 +326,134 @@ class FasterWhisperSTT:
             return False
 
 
+class StreamingTranscriber:
+    """
+    Transcribes one utterance while it is being spoken.
+
+    feed() audio as it is recorded (e.g. every VAD chunk after speech
+    starts). Whenever a window of uncommitted audio is buffered, it is
+    transcribed on a background thread: words ending before the window's
+    overlap are committed and the window start moves to the last committed
+    word (with none, to the first word or past the stable part, so every
+    window makes progress); the remaining words are a tentative tail.
+    on_partial receives committed + tentative text after each window.
+    finish() (on VAD end-of-speech) transcribes only the uncommitted tail.
+
+    Usage:
+        transcriber = stt.stream(on_partial=lambda text: print(text))
+        for chunk in chunks:
+            transcriber.feed(chunk)
+        result = transcriber.finish()   # result.duration_ms = end-of-speech to text
+    """
+
+    SAMPLE_RATE = 16000
+
+    def __init__(
+        self,
+        stt: FasterWhisperSTT,
+        on_partial: Optional[Callable[[str], None]] = None,
+        window_s: float = STREAM_WINDOW_S,
+        overlap_s: float = STREAM_OVERLAP_S,
+    ):
+        if overlap_s >= window_s:
+            raise ValueError("overlap_s must be shorter than window_s")
+        self.stt = stt
+        self.on_partial = on_partial
+        self.window = int(window_s * self.SAMPLE_RATE)
+        self.overlap = int(overlap_s * self.SAMPLE_RATE)
+        pad = int(STREAM_PAD_S * self.SAMPLE_RATE)
+        # Growable buffer with the silence pad already in place (no per-window concatenation)
+        self._buffer = np.zeros(pad + 30 * self.SAMPLE_RATE, dtype=np.float32)
+        self._length = pad
+        self._pad = pad
+        self._committed: list[str] = []
+        self._commit_pos = 0  # Buffer index where uncommitted audio starts
+        self._next_window_at = 0  # Buffer length that allows the next window
+        self._tentative = ""
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="atlas-stt-stream")
+        self._pending: Optional[Future] = None
+        self.windows = 0
+
+    @property
+    def partial(self) -> str:
+        """Committed text plus the latest tentative tail."""
+        with self._lock:
+            return " ".join(self._committed + ([self._tentative] if self._tentative else []))
+
+    def feed(self, audio: np.ndarray) -> None:
+        """Append recorded audio; starts a window transcription when one is buffered."""
+        with self._lock:
+            end = self._length + len(audio)
+            if end > len(self._buffer):
+                grown = np.zeros(max(end, 2 * len(self._buffer)), dtype=np.float32)
+                grown[:self._length] = self._buffer[:self._length]
+                self._buffer = grown
+            self._buffer[self._length:end] = audio
+            self._length = end
+            ready = self._length - self._commit_pos >= self.window and self._length >= self._next_window_at
+            busy = self._pending is not None and not self._pending.done()
+            if ready and not busy:
+                self._pending = self._executor.submit(self._transcribe_window)
+
+    def _transcribe_window(self) -> None:
+        with self._lock:
+            start = self._commit_pos
+            window = self._buffer[start:start + self.window]  # A view; the buffer only grows past it
+            self._next_window_at = self._length + int(MIN_STREAM_HOP_S * self.SAMPLE_RATE)
+        words = self.stt.transcribe_words(window)
+        self.windows += 1
+
+        stable_end = (self.window - self.overlap) / self.SAMPLE_RATE
+        committed = [w for w in words if w.end <= stable_end]
+        with self._lock:
+            if committed:
+                self._committed.extend(w.text for w in committed)
+                # Cut between the last committed word and the next one (word times are approximate)
+                boundary = committed[-1].end
+                if len(words) > len(committed):
+                    boundary = (boundary + max(boundary, words[len(committed)].start)) / 2
+                self._commit_pos = start + int(boundary * self.SAMPLE_RATE)
+            elif words and int(words[0].start * self.SAMPLE_RATE) > 0:
+                # No word ended in time: keep the next window from re-reading the lead-in
+                self._commit_pos = start + int(min(words[0].start, stable_end) * self.SAMPLE_RATE)
+            else:
+                # Silence, or one word spanning the stable part: move on regardless
+                self._commit_pos = start + self.window - self.overlap
+            self._tentative = " ".join(w.text for w in words[len(committed):])
+        if self.on_partial:
+            try:
+                self.on_partial(self.partial)
+            except Exception as e:
+                logger.warning(f"Partial transcript callback failed: {e}")
+
+    def finish(self, timeout: Optional[float] = None) -> TranscriptionResult:
+        """
+        Transcribe the uncommitted tail and return the full utterance.
+
+        duration_ms measures from this call (end-of-speech) to the text.
+        """
+        start = time.perf_counter()
+        if self._pending is not None:
+            self._pending.result(timeout)
+        with self._lock:
+            tail = self._buffer[self._commit_pos:self._length]
+            total = self._length - self._pad
+        tail_words = [w.text for w in self.stt.transcribe_words(tail)] if len(tail) else []
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            text = " ".join(self._committed + tail_words)
+        return TranscriptionResult(
+            text=text.strip(),
+            duration_ms=(time.perf_counter() - start) * 1000,
+            audio_duration_s=total / self.SAMPLE_RATE,
+        )
+
+    def cancel(self) -> None:
+        """Abandon the utterance."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 def get_stt(
     backend: str = "moonshine",
     model: str = "base.en",
@@ -343,6 +343,12 @@ class StreamingVAD:
         """Check if currently detecting speech."""
         return self._is_speaking
 
+    def buffered_audio(self) -> Optional[np.ndarray]:
+        """Audio of the utterance so far (pre-speech padding included), or None."""
+        if not self._audio_buffer:
+            return None
+        return np.concatenate(self._audio_buffer)
+
 
 def get_vad(config: Optional[VADConfig] = None) -> SileroVAD:
     """
@@ -18,11 +18,14 @@ Dependencies:
 import sys
 import os
 import json
+import queue
+import socket
+import struct
 import time
 import subprocess
 import tkinter as tk
 from pathlib import Path
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 from typing import Optional
 
 # Check dependencies
@@ -48,6 +51,10 @@ WSL_PATH = Path(r"\\wsl$\Ubuntu\home\squiz\ATLAS")
 BRIDGE_DIR = WSL_PATH / ".bridge"
 SAMPLE_RATE = 16000
 
+# Bridge socket (WSL2 forwards localhost). Falls back to files if unavailable.
+BRIDGE_HOST = os.environ.get("ATLAS_BRIDGE_HOST", "127.0.0.1")
+BRIDGE_PORT = int(os.environ.get("ATLAS_BRIDGE_PORT", "9998"))
+
 # OSRS-style colors (matched to reference)
 OSRS = {
     "bg_dark": "#0e0c0a",        # Darkest background (near black)
@@ -82,6 +89,144 @@ STATE_COLORS = {
 }
 
 
+class BridgeSocket:
+    """Socket client for the bridge server (frame format: atlas/voice/bridge_transport.py).
+
+    Frames are [1 byte type][4 byte big-endian length][payload]:
+    C command, A audio (sample rate + float32), S status, J session status JSON,
+    D session delta JSON (changed fields, applied to the last J document),
+    R audio reset (drop queued audio: the response was abandoned mid-stream).
+    """
+
+    def __init__(self, on_session_status, on_disconnect):
+        self.sock: Optional[socket.socket] = None
+        self.on_session_status = on_session_status
+        self.on_disconnect = on_disconnect
+        self.statuses: queue.Queue = queue.Queue()
+        self.audio: queue.Queue = queue.Queue()
+        self.session_status: dict = {}
+        self._send_lock = Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self.sock is not None
+
+    def connect(self, timeout: float = 2.0) -> bool:
+        try:
+            sock = socket.create_connection((BRIDGE_HOST, BRIDGE_PORT), timeout=timeout)
+        except OSError:
+            return False
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = sock
+        Thread(target=self._reader, daemon=True).start()
+        Thread(target=self._player, daemon=True).start()
+        return True
+
+    def _recv_exact(self, n: int) -> Optional[bytes]:
+        data = b""
+        while len(data) < n:
+            chunk = self.sock.recv(n - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _reader(self):
+        try:
+            while True:
+                header = self._recv_exact(5)
+                if not header:
+                    break
+                kind, length = struct.unpack(">cI", header)
+                payload = self._recv_exact(length) if length else b""
+                if payload is None:
+                    break
+                if kind == b"S":
+                    self.statuses.put(payload.decode("utf-8"))
+                elif kind == b"A":
+                    rate = struct.unpack_from(">I", payload)[0]
+                    self.audio.put((np.frombuffer(payload, dtype=np.float32, offset=4), rate))
+                elif kind == b"R":
+                    self._drop_queued_audio()
+                elif kind == b"J":
+                    self.session_status = json.loads(payload)
+                    self.on_session_status(self.session_status)
+                elif kind == b"D":
+                    # New dict per delta: the UI thread may still hold the last one
+                    status = dict(self.session_status)
+                    delta = json.loads(payload)
+                    for key, value in delta.get("set", {}).items():
+                        if value is None:
+                            status.pop(key, None)
+                        else:
+                            status[key] = value
+                    for key, fields in delta.get("merge", {}).items():
+                        status[key] = {**status.get(key, {}), **fields}
+                    self.session_status = status
+                    self.on_session_status(status)
+        except (OSError, ValueError) as e:
+            print(f"[Bridge] Socket read error: {e}")
+        self.sock = None
+        self.on_disconnect()
+
+    def _drop_queued_audio(self):
+        """Discard audio frames not yet played (the chunk playing finishes)."""
+        while True:
+            try:
+                self.audio.get_nowait()
+            except queue.Empty:
+                return
+            self.audio.task_done()
+
+    def _player(self):
+        """Play audio frames in arrival order (responses and timer prompts)."""
+        while True:
+            audio, rate = self.audio.get()
+            try:
+                if len(audio) > 0:
+                    sd.play(audio, rate)
+                    sd.wait()
+            except Exception as e:
+                print(f"[Bridge] Playback error: {e}")
+            finally:
+                self.audio.task_done()
+            if self.audio.unfinished_tasks == 0 and self.connected:
+                # Everything sent so far has played: lets the server's audio
+                # output move on without guessing from the audio length
+                try:
+                    self.send_command("PLAYBACK_DONE")
+                except OSError:
+                    pass
+
+    def _send(self, kind: bytes, payload: bytes):
+        with self._send_lock:
+            self.sock.sendall(struct.pack(">cI", kind, len(payload)) + payload)
+
+    def send_command(self, cmd: str):
+        self._send(b"C", cmd.encode("utf-8"))
+
+    def send_audio(self, audio, rate: int):
+        self._send(b"A", struct.pack(">I", rate) + audio.astype(np.float32).tobytes())
+
+    def wait_status(self, expected: str, timeout: float) -> bool:
+        deadline = time.time() + timeout
+        while self.connected:
+            try:
+                if self.statuses.get(timeout=max(0.0, deadline - time.time())) == expected:
+                    return True
+            except queue.Empty:
+                return False
+        return False
+
+    def close(self):
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+
+
 class ATLASLauncher(ctk.CTk):
     """OSRS-style Command Centre."""
 
@@ -105,6 +250,10 @@ class ATLASLauncher(ctk.CTk):
         self.transcript_history = []
         self.last_exchange_hash = ""
         self.current_state = "idle"
+        self.bridge = BridgeSocket(
+            on_session_status=lambda data: self.after(0, lambda: self._apply_session_status(data)),
+            on_disconnect=lambda: print("[Bridge] Socket closed - using file protocol"),
+        )
 
         # Undo history (last 10 actions)
         self._action_history = []
@@ -1650,11 +1799,21 @@ class ATLASLauncher(ctk.CTk):
         except Exception as e:
             print(f"[UI] Error saving voice: {e}")
 
+    def _send_command(self, cmd):
+        """Send a command over the socket if connected, else via command.txt."""
+        if self.bridge.connected:
+            try:
+                self.bridge.send_command(cmd)
+                return
+            except OSError as e:
+                print(f"[Bridge] Send failed ({e}) - using file protocol")
+        BRIDGE_DIR.mkdir(exist_ok=True)
+        (BRIDGE_DIR / "command.txt").write_text(cmd)
+
     def _send_workout_command(self, cmd):
         """Send workout control command (PAUSE/SKIP/STOP) to bridge."""
         try:
-            BRIDGE_DIR.mkdir(exist_ok=True)
-            (BRIDGE_DIR / "command.txt").write_text(cmd)
+            self._send_command(cmd)
             print(f"[UI] Workout command: {cmd}")
         except Exception as e:
             print(f"[UI] Error: {e}")
@@ -1753,11 +1912,24 @@ class ATLASLauncher(ctk.CTk):
         self._poll_status()
 
     def _poll_status(self):
-        """Poll status files and update UI."""
+        """Poll status files and update UI (socket clients get pushes instead)."""
+        if self.bridge.connected:
+            self.after(500, self._poll_status)
+            return
+
         status_file = BRIDGE_DIR / "session_status.json"
         try:
             if status_file.exists():
-                data = json.loads(status_file.read_text())
+                self._apply_session_status(json.loads(status_file.read_text()))
+        except Exception:
+            pass  # Silent fail on poll errors
+
+        self.after(100, self._poll_status)  # Poll faster for smooth timer updates
+
+    def _apply_session_status(self, data):
+        """Update UI from a session status document (file poll or socket push)."""
+        try:
+            if data:
                 cost = data.get('session_cost', 0)
                 self.cost_label.configure(text=f"${cost:.2f}")
 
@@ -1787,9 +1959,7 @@ class ATLASLauncher(ctk.CTk):
                     self._update_transcript()
 
         except Exception as e:
-            pass  # Silent fail on poll errors
-
-        self.after(100, self._poll_status)  # Poll faster for smooth timer updates
+            pass  # Silent fail on bad status documents
 
     def _update_workout_display(self, timer):
         """Update the workout visual display with timer data."""
@@ -1973,6 +2143,18 @@ class ATLASLauncher(ctk.CTk):
         self.server_status.configure(text="● Online", text_color=OSRS["orb_green"])
         self.status_bar.configure(text="Hold SPACE to speak", text_color=OSRS["text"])
         self.stop_btn.configure(state="normal")
+        Thread(target=self._connect_bridge_socket, daemon=True).start()
+
+    def _connect_bridge_socket(self, attempts: int = 30):
+        """Connect to the bridge socket (bound after startup sync); files otherwise."""
+        for _ in range(attempts):
+            if not self.server_ready.is_set():
+                return
+            if self.bridge.connect():
+                print(f"[Bridge] Socket connected on {BRIDGE_HOST}:{BRIDGE_PORT}")
+                return
+            time.sleep(1.0)
+        print("[Bridge] Socket unavailable - using file protocol")
 
     def _on_server_stopped(self):
         """Server stopped callback."""
@@ -1990,10 +2172,10 @@ class ATLASLauncher(ctk.CTk):
 
         self.status_bar.configure(text="Stopping...")
         try:
-            BRIDGE_DIR.mkdir(exist_ok=True)
-            (BRIDGE_DIR / "command.txt").write_text("QUIT")
+            self._send_command("QUIT")
         except:
             pass
+        self.bridge.close()
 
         try:
             self.server_process.wait(timeout=5)
@@ -2057,46 +2239,48 @@ class ATLASLauncher(ctk.CTk):
 
         try:
             self.after(0, lambda: self._set_state("processing"))
+            if self.bridge.connected:
+                self._send_audio_socket(audio)
+                return
             BRIDGE_DIR.mkdir(exist_ok=True)
 
             # Save audio
             audio.astype(np.float32).tofile(BRIDGE_DIR / "audio_in.raw")
             time.sleep(0.1)
 
-            # Send command
+            # Send command (PROCESS_STREAM: server writes one chunk per sentence)
             status_file = BRIDGE_DIR / "status.txt"
             if status_file.exists():
                 status_file.unlink()
-            (BRIDGE_DIR / "command.txt").write_text("PROCESS")
+            (BRIDGE_DIR / "command.txt").write_text("PROCESS_STREAM")
 
-            # Wait for response
+            # Play chunks as they land; DONE is written after the last chunk
             start = time.time()
+            chunk_idx = 0
             while time.time() - start < 60:
+                chunk = BRIDGE_DIR / f"audio_out_{chunk_idx:03d}.raw"
+                if chunk.exists():
+                    response = np.fromfile(chunk, dtype=np.float32)
+                    chunk.unlink()
+                    chunk_idx += 1
+                    if len(response) > 0:
+                        if self.current_state != "speaking":
+                            self.after(0, lambda: self._set_state("speaking"))
+                        sd.play(response, self._read_playback_rate())
+                        sd.wait()
+                    start = time.time()  # Timeout measures server silence, not playback
+                    continue
                 if status_file.exists() and status_file.read_text().strip() == "DONE":
-                    break
-                time.sleep(0.1)
+                    # Re-check: the final chunk may have landed just before DONE
+                    if not (BRIDGE_DIR / f"audio_out_{chunk_idx:03d}.raw").exists():
+                        break
+                    continue
+                time.sleep(0.02)
             else:
                 self.after(0, lambda: self.status_bar.configure(
                     text="Timeout", text_color=OSRS["error"]))
                 return
 
-            # Play response
-            audio_out = BRIDGE_DIR / "audio_out.raw"
-            if audio_out.exists():
-                metadata = BRIDGE_DIR / "metadata.txt"
-                rate = 24000
-                if metadata.exists():
-                    for line in metadata.read_text().splitlines():
-                        if "sample_rate=" in line:
-                            rate = int(line.split("=")[1])
-
-                response = np.fromfile(audio_out, dtype=np.float32)
-                if len(response) > 0:
-                    self.after(0, lambda: self._set_state("speaking"))
-                    sd.play(response, rate)
-                    sd.wait()
-                audio_out.unlink()
-
             self.after(0, lambda: [
                 self.voice_instruction.configure(text="Hold SPACE to speak"),
                 self._set_state("idle")
@@ -2110,6 +2294,35 @@ class ATLASLauncher(ctk.CTk):
             self.after(0, lambda: self.voice_instruction.configure(
                 text="Hold SPACE to speak"))
 
+    def _send_audio_socket(self, audio):
+        """Socket path for _send_audio: push audio, play frames as they arrive."""
+        while not self.bridge.statuses.empty():
+            self.bridge.statuses.get_nowait()  # Drop stale statuses
+        self.bridge.send_audio(audio, SAMPLE_RATE)
+        self.bridge.send_command("PROCESS_STREAM")
+        self.after(0, lambda: self._set_state("speaking"))
+
+        if not self.bridge.wait_status("DONE", timeout=60):
+            self.after(0, lambda: self.status_bar.configure(
+                text="Timeout", text_color=OSRS["error"]))
+            return
+        self.bridge.audio.join()  # Wait for streamed chunks to finish playing
+
+        self.after(0, lambda: [
+            self.voice_instruction.configure(text="Hold SPACE to speak"),
+            self._set_state("idle")
+        ])
+
+    def _read_playback_rate(self) -> int:
+        """Read TTS sample rate from bridge metadata (default Kokoro 24kHz)."""
+        metadata = BRIDGE_DIR / "metadata.txt"
+        rate = 24000
+        if metadata.exists():
+            for line in metadata.read_text().splitlines():
+                if "sample_rate=" in line:
+                    rate = int(line.split("=")[1])
+        return rate
+
     def _on_close(self):
         """Handle close."""
         if self.server_process:
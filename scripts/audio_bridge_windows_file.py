@@ -35,6 +35,11 @@ COMMAND_FILE = os.path.join(WSL_PATH, ".bridge", "command.txt")
 STATUS_FILE = os.path.join(WSL_PATH, ".bridge", "status.txt")
 
 
+def chunk_file(index: int) -> str:
+    """Path of the index-th streamed response chunk (see atlas/voice/streaming.py)."""
+    return os.path.join(WSL_PATH, ".bridge", f"audio_out_{index:03d}.raw")
+
+
 def ensure_bridge_dir():
     """Create bridge directory if needed."""
     bridge_dir = os.path.join(WSL_PATH, ".bridge")
@@ -90,6 +95,37 @@ def wait_for_status(expected: str, timeout: float = 30.0) -> bool:
     return False
 
 
+def play_streamed_response(timeout: float = 60.0) -> bool:
+    """Play response chunks as the server writes them.
+
+    The server writes audio_out_000.raw, audio_out_001.raw, ... (one per
+    sentence) and sets status DONE after the last one. Returns False on timeout.
+    """
+    index = 0
+    last_activity = time.time()
+    while time.time() - last_activity < timeout:
+        path = chunk_file(index)
+        if os.path.exists(path):
+            chunk = np.fromfile(path, dtype=np.float32)
+            os.remove(path)
+            index += 1
+            if len(chunk) > 0:
+                playback_rate = read_metadata()["sample_rate"]
+                if index == 1:
+                    print(f"Playing response @ {playback_rate}Hz...")
+                sd.play(chunk, playback_rate)
+                sd.wait()
+            last_activity = time.time()
+            continue
+        if read_status() == "DONE":
+            # The final chunk may have landed just before DONE
+            if not os.path.exists(chunk_file(index)):
+                return True
+            continue
+        time.sleep(0.02)
+    return False
+
+
 def record_audio() -> np.ndarray:
     """Record audio until Enter is pressed."""
     print("Recording... (press ENTER to stop)")
@@ -160,30 +196,17 @@ def main():
             # Save audio to file
             audio.astype(np.float32).tofile(AUDIO_IN_FILE)
 
-            # Signal server to process
+            # Signal server to process (streamed: one chunk per sentence)
             clear_status()
-            write_command("PROCESS")
+            write_command("PROCESS_STREAM")
 
             print("Processing...")
 
-            # Wait for response
-            if not wait_for_status("DONE", timeout=60):
+            # Play chunks as they arrive
+            if not play_streamed_response(timeout=60):
                 print("Timeout waiting for response.")
                 continue
 
-            # Read metadata for correct sample rate
-            metadata = read_metadata()
-            playback_rate = metadata["sample_rate"]
-
-            # Read and play response audio
-            if os.path.exists(AUDIO_OUT_FILE):
-                response_audio = np.fromfile(AUDIO_OUT_FILE, dtype=np.float32)
-                if len(response_audio) > 0:
-                    print(f"Playing response ({len(response_audio) / playback_rate:.1f}s @ {playback_rate}Hz)...")
-                    sd.play(response_audio, playback_rate)
-                    sd.wait()
-                os.remove(AUDIO_OUT_FILE)
-
             clear_status()
 
     except KeyboardInterrupt:
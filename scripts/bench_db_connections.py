@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark the DB round-trips of a typical voice turn.
+
+One simulated turn does what the bridge does around an LLM call:
+- SessionBuffer.format_for_llm() for conversation context
+- CostTracker.get_budget_status() for routing
+- WorkoutScheduler.get_last_workout() for health context
+- XPService.get_all_skills() and award_xp() for a logged activity
+- CostTracker.log_usage() and SessionBuffer.add_exchange() afterwards
+
+"before" runs with ATLAS_DB_POOL=0 (a new connection with its own pragma
+setup per call, as the services used to do); "after" uses the pooled
+per-thread connections from atlas.db.
+
+Usage:
+    python scripts/bench_db_connections.py
+    python scripts/bench_db_connections.py --turns 500
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlas import db  # noqa: E402
+from atlas.gamification.xp_service import XPService  # noqa: E402
+from atlas.health.scheduler import WorkoutScheduler  # noqa: E402
+from atlas.llm.cost_tracker import CostTracker, UsageRecord  # noqa: E402
+from atlas.voice.session_buffer import SessionBuffer  # noqa: E402
+
+
+def run(label: str, pooled: bool, turns: int) -> list[float]:
+    os.environ["ATLAS_DB_POOL"] = "1" if pooled else "0"
+    db.close_all()
+    with tempfile.TemporaryDirectory() as tmp:
+        atlas_db = Path(tmp) / "atlas.db"
+        buffer = SessionBuffer(str(atlas_db))
+        tracker = CostTracker(Path(tmp) / "cost_tracker.db")
+        scheduler = WorkoutScheduler(atlas_db)
+        xp = XPService(atlas_db)
+        record = UsageRecord("haiku", "claude-haiku", 120, 40, 0.0002, 350.0, "query", 0.8)
+
+        timings = []
+        for i in range(turns):
+            start = time.perf_counter()
+            buffer.format_for_llm()
+            tracker.get_budget_status()
+            scheduler.get_last_workout()
+            xp.get_all_skills()
+            xp.award_xp("strength", 5, "bench")
+            tracker.log_usage(record, f"turn {i}")
+            buffer.add_exchange(f"turn {i}", "ok", "health")
+            timings.append((time.perf_counter() - start) * 1000)
+
+        xp.close()
+        db.close_all()
+
+    timings.sort()
+    print(
+        f"{label:>7}: p50 {statistics.median(timings):6.2f}ms  "
+        f"p99 {timings[int(len(timings) * 0.99) - 1]:6.2f}ms  "
+        f"mean {statistics.fmean(timings):6.2f}ms"
+    )
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"Voice turn DB round-trips ({args.turns} turns)")
+    before = run("before", pooled=False, turns=args.turns)
+    after = run("after", pooled=True, turns=args.turns)
+    print(f"speedup: {statistics.median(before) / statistics.median(after):.1f}x (p50)")
+
+
+if __name__ == "__main__":
+    main()
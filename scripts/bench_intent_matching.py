@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark intent/routing pattern matching over recorded utterances.
+
+For each utterance in tests/fixtures/voice_utterances.txt:
+- "before": every label checked pattern by pattern, the way the router's
+  reflex lists and the bridge's _is_* predicates used to (re.search per
+  regex, `p in text` per phrase). This is what an utterance that falls
+  through to the LLM paid: the dispatcher tries every predicate, then
+  classify() walks the router lists.
+- "after": one PatternMatcher.match() (a single trie scan for all phrases
+  plus one precompiled alternation per regex label), which the router and
+  the dispatcher then share.
+
+Usage:
+    python scripts/bench_intent_matching.py
+    python scripts/bench_intent_matching.py --rounds 50
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlas.voice.bridge_file_server import build_intent_matcher  # noqa: E402
+
+UTTERANCES_PATH = Path(__file__).parent.parent / "tests" / "fixtures" / "voice_utterances.txt"
+
+
+def load_utterances() -> list[str]:
+    lines = UTTERANCES_PATH.read_text().splitlines()
+    return [line for line in lines if line.strip() and not line.startswith("#")]
+
+
+def match_each(rules: list[tuple[str, str, tuple[str, ...]]], text: str) -> set[str]:
+    """Per-pattern matching (the old predicate loops)."""
+    labels = set()
+    for label, kind, patterns in rules:
+        text_lower = text.lower().strip()
+        if kind == "search":
+            hit = any(re.search(p, text_lower) for p in patterns)
+        elif kind == "contains":
+            hit = any(p in text_lower for p in patterns)
+        elif kind == "prefix":
+            hit = any(text_lower.startswith(p) for p in patterns)
+        else:
+            hit = text_lower in patterns
+        if hit:
+            labels.add(label)
+    return labels
+
+
+def time_per_utterance(fn, utterances: list[str], rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        for text in utterances:
+            start = time.perf_counter()
+            fn(text)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+    timings.sort()
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(
+        f"{label:>7}: p50 {statistics.median(timings):7.1f}us  "
+        f"p99 {timings[int(len(timings) * 0.99) - 1]:7.1f}us  "
+        f"mean {statistics.fmean(timings):7.1f}us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    utterances = load_utterances()
+    matcher = build_intent_matcher()
+    rules = [(label, *matcher.rule(label)) for label in matcher.labels]
+    pattern_count = sum(len(patterns) for _, _, patterns in rules)
+
+    # Same answers either way
+    for text in utterances:
+        assert matcher.match(text) == match_each(rules, text), text
+
+    start = time.perf_counter()
+    build_intent_matcher().compile()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"{len(utterances)} utterances x {args.rounds} rounds, "
+        f"{len(rules)} labels / {pattern_count} patterns (matcher compiles in {compile_ms:.1f}ms)"
+    )
+    before = time_per_utterance(lambda text: match_each(rules, text), utterances, args.rounds)
+    # A fresh matcher per run so the last-utterance cache never hits
+    fresh = build_intent_matcher()
+    fresh.compile()
+    after = time_per_utterance(fresh.match, utterances, args.rounds)
+    report("before", before)
+    report("after", after)
+    print(f"speedup: {statistics.median(before) / statistics.median(after):.1f}x (p50)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Check the router's embedding-stage thresholds against recorded utterances.
+
+For each utterance in tests/fixtures/voice_utterances.txt that reaches
+stage 2 of ATLASRouter.classify() (no reflex pattern, 4-25 words), prints
+the tier with the nearest prototype, its cosine similarity and the tier
+classify() picks with the current RouterConfig thresholds. Utterances
+labelled in ROUTING_TIERS are marked when routed to another tier, and per
+tier the script reports the score range a threshold has to separate:
+
+- lowest score of a labelled utterance that belongs to the tier
+- highest score of a labelled utterance nearest to it that doesn't
+
+Re-run after changing the embedding model (ATLAS_EMBEDDING_MODEL) or the
+prototypes, and update RouterConfig and config/routing.yaml to match.
+
+Usage:
+    python scripts/calibrate_router.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlas.llm.router import ATLASRouter, RouterConfig, Tier  # noqa: E402
+from tests.fixtures.utterances import ROUTING_TIERS, load_utterances  # noqa: E402
+
+
+def main():
+    config = RouterConfig(enable_response_cache=False)
+    router = ATLASRouter(config=config)
+    if router.nearest_tier("warm up") is None:
+        sys.exit("Embedding model not available (needs sentence-transformers)")
+
+    belongs: dict[Tier, list[float]] = {tier: [] for tier in Tier}
+    intrudes: dict[Tier, list[float]] = {tier: [] for tier in Tier}
+    wrong = 0
+    for text in load_utterances():
+        decision = router.classify(text)
+        if decision.bypass_reason is not None:
+            continue  # Routed by stage 1
+        nearest, score = router.nearest_tier(text)
+        label = ROUTING_TIERS.get(text)
+        mark = ""
+        if label is not None:
+            expected = Tier(label)
+            (belongs if nearest == expected else intrudes)[nearest].append(score)
+            if decision.tier != expected:
+                mark = f"  <- expected {label}"
+                wrong += 1
+        print(f"{score:.3f} {nearest.value:>9} -> {decision.tier.value:<9} {text}{mark}")
+
+    thresholds = {
+        Tier.LOCAL: config.local_confidence,
+        Tier.HAIKU: config.haiku_confidence,
+        Tier.AGENT_SDK: config.agent_confidence,
+    }
+    print()
+    for tier in Tier:
+        low = f"{min(belongs[tier]):.3f}" if belongs[tier] else "  -  "
+        high = f"{max(intrudes[tier]):.3f}" if intrudes[tier] else "  -  "
+        print(f"{tier.value:>9}: threshold {thresholds[tier]:.2f}  "
+              f"lowest own {low}  highest other {high}")
+    labelled = len(ROUTING_TIERS)
+    print(f"\n{labelled - wrong}/{labelled} labelled utterances routed as expected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+TTS Audio Cache Pre-Render
+
+Synthesizes every timer prompt, routine/workout announcement and form cue
+the bridge can speak on its own (atlas.voice.announcements) into the TTS
+audio cache, so those prompts play without synthesis during a session.
+Run after editing the routine, workout protocols or form guides, or after
+changing voice.
+
+Usage:
+    python scripts/prerender_tts.py                      # Launcher's current voice
+    python scripts/prerender_tts.py --voice bm_lewis --voice jeremy_irons
+    python scripts/prerender_tts.py --list               # Print phrases only
+    python scripts/prerender_tts.py --stats              # Show cache stats only
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlas.voice.announcements import prerender_phrases
+from atlas.voice.audio_cache import AudioCache
+from atlas.voice.bridge_file_server import VOICE_FILE, BridgeFileServer
+from atlas.voice.tts import get_tts
+from atlas.voice.tts_qwen import get_qwen_tts
+
+VOICES = BridgeFileServer.KOKORO_VOICES + BridgeFileServer.QWEN_VOICES
+
+
+def current_voice() -> str:
+    """The launcher's voice preference (same default as the bridge)."""
+    if VOICE_FILE.exists():
+        voice = VOICE_FILE.read_text().strip()
+        if voice in VOICES:
+            return voice
+    return "jeremy_irons"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-render ATLAS timer prompts into the TTS audio cache")
+    parser.add_argument("--voice", action="append", choices=VOICES,
+                        help="Voice to render (repeatable; default: launcher's current voice)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Speech speed multiplier")
+    parser.add_argument("--cache-dir", type=Path, help="Cache directory (default ~/.atlas/tts_cache)")
+    parser.add_argument("--list", action="store_true", help="Print the phrases without rendering")
+    parser.add_argument("--stats", action="store_true", help="Show cache stats without rendering")
+    args = parser.parse_args()
+
+    phrases = prerender_phrases()
+    if args.list:
+        for phrase in phrases:
+            print(phrase)
+        print(f"\n{len(phrases)} phrases")
+        return
+
+    cache = AudioCache(args.cache_dir)
+    if not args.stats:
+        for voice in args.voice or [current_voice()]:
+            tts = get_qwen_tts(voice) if voice in BridgeFileServer.QWEN_VOICES else get_tts(voice)
+            print(f"Rendering {len(phrases)} phrases with {voice}...")
+            report = cache.prerender(
+                tts, phrases, speed=args.speed,
+                progress=lambda done, total: print(f"  {done:,}/{total:,} phrases", end="\r"),
+            )
+            print()
+            print(f"  {report['rendered']:,} rendered, {report['cached']:,} already cached "
+                  f"in {report['duration_ms'] / 1000:.1f}s")
+    print(f"Cache: {cache.stats().as_dict()}")
+
+
+if __name__ == "__main__":
+    main()
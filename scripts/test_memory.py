@@ -8,10 +8,14 @@ Tests:
 3. Hybrid search with embeddings
 4. Scale testing: Generate 100K dummy records, verify <75ms hybrid search
 5. Blueprint API operations
+6. Bulk ingestion: add_memories_bulk vs per-row add_memory throughput
+7. Hybrid search latency: single-statement RRF vs Python fusion (p50/p99)
 
 Usage:
     python scripts/test_memory.py
     python scripts/test_memory.py --scale  # Run 100K scale test (slow)
+    python scripts/test_memory.py --bulk   # Run 100K bulk ingestion benchmark
+    python scripts/test_memory.py --hybrid-bench --hybrid-sizes 10000,100000,1000000
 """
 
 import argparse
@@ -75,6 +79,9 @@ def test_embeddings():
         query_time = (time.perf_counter() - start) * 1000
         print(f"  Latency: {query_time:.1f}ms")
 
+        # Shared service counters (cache hits, batch sizes)
+        print(f"\nEmbedding service: {embedder.service.stats.as_dict()}")
+
         return True
 
     except ImportError as e:
@@ -191,8 +198,7 @@ def test_hybrid_search():
 
         # Test hybrid search
         try:
-            from atlas.memory.embeddings import get_embedder
-            embedder = get_embedder()
+            from atlas.memory.embeddings import get_embedder  # noqa: F401 - availability probe
             has_embeddings = True
         except ImportError:
             has_embeddings = False
@@ -200,7 +206,7 @@ def test_hybrid_search():
         if has_embeddings:
             print("\nHybrid search for 'best workout routine':")
             query = "best workout routine"
-            embedding = embedder.embed_query(query)
+            embedding = store.embed_query(query)
 
             start = time.perf_counter()
             results = store.search_hybrid(query, embedding, limit=5)
@@ -427,8 +433,7 @@ def test_scale(record_count: int = 100000):
 
         # Test search latency with real embedding
         try:
-            from atlas.memory.embeddings import get_embedder
-            embedder = get_embedder()
+            from atlas.memory.embeddings import get_embedder  # noqa: F401 - availability probe
 
             print("\nHybrid search latency at scale:")
             test_queries = [
@@ -443,7 +448,7 @@ def test_scale(record_count: int = 100000):
             for query in test_queries:
                 # Generate real embedding
                 emb_start = time.perf_counter()
-                embedding = embedder.embed_query(query)
+                embedding = store.embed_query(query)
                 emb_time = (time.perf_counter() - emb_start) * 1000
 
                 # Run hybrid search
@@ -482,10 +487,167 @@ def test_scale(record_count: int = 100000):
         Path(db_path).unlink(missing_ok=True)
 
 
+def test_bulk_ingest(record_count: int = 100000, baseline_count: int = 10000, batch_size: int = 1000):
+    """Benchmark add_memories_bulk against the per-row add_memory path."""
+    print("\n" + "=" * 60)
+    print(f"TEST: Bulk ingestion ({record_count:,} records)")
+    print("=" * 60)
+
+    from atlas.memory.store import MemoryStore, SQLITE_VEC_AVAILABLE
+
+    if not SQLITE_VEC_AVAILABLE:
+        print("[SKIP] sqlite-vec not available for bulk ingestion test")
+        return True
+
+    topics = ["workout", "sleep", "nutrition", "supplements", "recovery", "strength", "cardio", "stretching"]
+
+    def synthetic(count: int):
+        # Fake embeddings isolate the write path (embedding cost is the same per text either way)
+        for i in range(count):
+            yield {
+                "content": f"memory {i} about {random.choice(topics)} and {random.choice(topics)}",
+                "importance": round(random.random(), 2),
+                "embedding": [random.random() for _ in range(384)],
+            }
+
+    paths = []
+    try:
+        # Current path: one INSERT pair + commit per memory
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            paths.append(Path(f.name))
+        store = MemoryStore(paths[-1])
+        store.init_db()
+        start = time.perf_counter()
+        for item in synthetic(baseline_count):
+            store.add_memory(item["content"], importance=item["importance"], embedding=item["embedding"])
+        per_row_rate = baseline_count / (time.perf_counter() - start)
+        store.close()
+        print(f"\n  add_memory:        {baseline_count:>9,} rows  {per_row_rate:>10,.0f} rows/sec")
+
+        # Bulk path
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            paths.append(Path(f.name))
+        store = MemoryStore(paths[-1])
+        store.init_db()
+        report = store.add_memories_bulk(synthetic(record_count), batch_size=batch_size)
+        count = store.conn.execute("SELECT COUNT(*) FROM semantic_memory").fetchone()[0]
+        fts_count = store.conn.execute(
+            "SELECT COUNT(*) FROM fts_memory WHERE fts_memory MATCH 'memory'"
+        ).fetchone()[0]
+        store.close()
+        print(f"  add_memories_bulk: {report.rows:>9,} rows  {report.rows_per_sec:>10,.0f} rows/sec "
+              f"(batch_size={batch_size}, write {report.write_ms / 1000:.1f}s)")
+        print(f"\n  Speedup: {report.rows_per_sec / per_row_rate:.1f}x")
+
+        if count != record_count or fts_count != record_count:
+            print(f"[FAIL] Expected {record_count:,} rows, got {count:,} ({fts_count:,} in FTS)")
+            return False
+        print(f"  Verified {count:,} rows in semantic_memory and fts_memory")
+        return True
+
+    except Exception as e:
+        print(f"[FAIL] {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def test_hybrid_latency(sizes: list[int], queries: int = 200, limit: int = 10):
+    """Benchmark search_hybrid (one SQL statement) against the Python fusion path."""
+    print("\n" + "=" * 60)
+    print(f"TEST: Hybrid search latency ({', '.join(f'{n:,}' for n in sizes)} memories)")
+    print("=" * 60)
+
+    import numpy as np
+
+    from atlas.memory.store import MemoryStore, SQLITE_VEC_AVAILABLE
+
+    if not SQLITE_VEC_AVAILABLE:
+        print("[SKIP] sqlite-vec not available for hybrid latency test")
+        return True
+
+    topics = ["workout", "sleep", "nutrition", "supplements", "recovery", "strength", "cardio", "stretching"]
+    rng = np.random.default_rng(42)
+
+    def random_unit_vectors(n: int) -> np.ndarray:
+        vectors = rng.standard_normal((n, 384), dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def synthetic(count: int):
+        for start in range(0, count, 10000):
+            vectors = random_unit_vectors(min(10000, count - start))
+            for vector in vectors:
+                yield {
+                    "content": f"{random.choice(topics)} {random.choice(topics)} note {random.randint(0, 999)}",
+                    "importance": round(random.random(), 2),
+                    "memory_type": random.choice(["fact", "preference", "event"]),
+                    "embedding": vector.tolist(),
+                }
+
+    def percentiles(samples: list[float]) -> tuple[float, float]:
+        return float(np.percentile(samples, 50)), float(np.percentile(samples, 99))
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+
+    try:
+        store = MemoryStore(db_path)
+        store.init_db()
+        loaded = 0
+        query_vectors = [v.tolist() for v in random_unit_vectors(queries)]
+        query_texts = [random.choice(topics) for _ in range(queries)]
+
+        print(f"\n  {'memories':>10}  {'path':<12} {'p50 ms':>8} {'p99 ms':>8}")
+        for size in sorted(sizes):
+            store.add_memories_bulk(synthetic(size - loaded), batch_size=5000)
+            loaded = size
+
+            for name, search in [
+                ("python", store._search_hybrid_python),
+                ("sql", store.search_hybrid),
+            ]:
+                search(query_texts[0], query_vectors[0], limit=limit)  # warm page cache
+                latencies = []
+                for text, vector in zip(query_texts, query_vectors):
+                    start = time.perf_counter()
+                    search(text, vector, limit=limit)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                p50, p99 = percentiles(latencies)
+                print(f"  {size:>10,}  {name:<12} {p50:>8.2f} {p99:>8.2f}")
+
+            # Spot-check equivalence at this size
+            for text, vector in list(zip(query_texts, query_vectors))[:20]:
+                expected = [r.memory.id for r in store._search_hybrid_python(text, vector, limit=limit)]
+                actual = [r.memory.id for r in store.search_hybrid(text, vector, limit=limit)]
+                if expected != actual:
+                    print(f"[FAIL] Result mismatch for '{text}' at {size:,} memories")
+                    return False
+
+        store.close()
+        return True
+
+    except Exception as e:
+        print(f"[FAIL] {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="ATLAS Memory System Tests")
     parser.add_argument("--scale", action="store_true", help="Run 100K scale test (slow)")
     parser.add_argument("--scale-count", type=int, default=100000, help="Number of records for scale test")
+    parser.add_argument("--bulk", action="store_true", help="Run bulk ingestion benchmark")
+    parser.add_argument("--bulk-count", type=int, default=100000, help="Number of records for bulk benchmark")
+    parser.add_argument("--hybrid-bench", action="store_true", help="Run hybrid search latency benchmark")
+    parser.add_argument("--hybrid-sizes", default="10000,100000,1000000",
+                        help="Comma-separated memory counts for the hybrid benchmark")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -503,6 +665,11 @@ def main():
     # Scale test (optional)
     if args.scale:
         results["scale"] = test_scale(args.scale_count)
+    if args.bulk:
+        results["bulk_ingest"] = test_bulk_ingest(args.bulk_count)
+    if args.hybrid_bench:
+        sizes = [int(n) for n in args.hybrid_sizes.split(",")]
+        results["hybrid_latency"] = test_hybrid_latency(sizes)
 
     # Summary
     print("\n" + "=" * 60)
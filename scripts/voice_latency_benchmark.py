@@ -9,8 +9,17 @@ Compares LLM latency for voice interactions:
 
 Measures time-to-first-token and total generation time,
 then calculates simulated end-to-end voice latency.
+
+The local model is measured twice: with a new client (and connection)
+per query, and with one pooled client warmed up first, as the voice
+bridge now runs it.
+
+Usage:
+    python scripts/voice_latency_benchmark.py
+    python scripts/voice_latency_benchmark.py --local-only
 """
 
+import argparse
 import asyncio
 import sys
 import time
@@ -60,9 +69,13 @@ class BenchmarkResult:
         return 0.0
 
 
-async def benchmark_ollama() -> Optional[BenchmarkResult]:
-    """Benchmark local Qwen2.5-3B via Ollama."""
-    client = OllamaClient(model="qwen2.5:3b-instruct")
+async def benchmark_ollama(
+    client: Optional[OllamaClient] = None,
+    label: str = "Qwen2.5-3B (local)",
+) -> Optional[BenchmarkResult]:
+    """Benchmark local Qwen2.5-3B via Ollama (a new client unless one is given)."""
+    if client is None:
+        client = OllamaClient(model="qwen2.5:3b-instruct")
 
     if not client.is_available():
         print("  [SKIP] Ollama not available")
@@ -92,7 +105,7 @@ async def benchmark_ollama() -> Optional[BenchmarkResult]:
         return None
 
     return BenchmarkResult(
-        model="Qwen2.5-3B (local)",
+        model=label,
         ttft_ms=(first_token_time - start) * 1000,
         total_gen_ms=(end - start) * 1000,
         token_count=len(tokens),
@@ -229,7 +242,7 @@ def print_results(results: list[BenchmarkResult]) -> None:
     print("=" * 70)
 
 
-async def run_benchmark() -> None:
+async def run_benchmark(local_only: bool = False) -> None:
     """Run the full benchmark suite."""
     print("=" * 70)
     print("ATLAS Voice Latency Benchmark")
@@ -239,22 +252,38 @@ async def run_benchmark() -> None:
 
     all_results: dict[str, list[BenchmarkResult]] = {}
 
-    # Test local Qwen2.5-3B
+    # Test local Qwen2.5-3B: new client per query, then one warmed pooled client
     print("[1/4] Testing Qwen2.5-3B (local via Ollama)...")
-    ollama_results = []
-    for i in range(NUM_RUNS):
-        print(f"  Run {i+1}/{NUM_RUNS}...", end=" ", flush=True)
-        result = await benchmark_ollama()
-        if result:
-            ollama_results.append(result)
-            print(f"TTFT: {result.ttft_ms:.0f}ms, Total: {result.total_gen_ms:.0f}ms")
-        else:
-            print("FAILED")
-    if ollama_results:
-        all_results["local"] = ollama_results
+    pooled = OllamaClient(model="qwen2.5:3b-instruct")
+    runs = [
+        ("local_new_client", "Qwen2.5-3B (local, new)", lambda: None),
+        ("local_pooled", "Qwen2.5-3B (local, pooled)", lambda: pooled),
+    ]
+    for key, label, client_for_run in runs:
+        if key == "local_pooled":
+            warm_ms = pooled.warm_up(system=SYSTEM_PROMPT)
+            if warm_ms is not None:
+                print(f"  Warm-up: {warm_ms:.0f}ms")
+        print(f"  {label}")
+        ollama_results = []
+        for i in range(NUM_RUNS):
+            print(f"  Run {i+1}/{NUM_RUNS}...", end=" ", flush=True)
+            result = await benchmark_ollama(client_for_run(), label)
+            if result:
+                ollama_results.append(result)
+                print(f"TTFT: {result.ttft_ms:.0f}ms, Total: {result.total_gen_ms:.0f}ms")
+            else:
+                print("FAILED")
+        if ollama_results:
+            all_results[key] = ollama_results
+    await pooled.aclose()
 
     print()
 
+    if local_only:
+        report(all_results)
+        return
+
     # Test Direct Haiku API
     print("[2/4] Testing Haiku (Direct API)...")
     direct_haiku_results = []
@@ -305,6 +334,11 @@ async def run_benchmark() -> None:
     if sonnet_results:
         all_results["sonnet"] = sonnet_results
 
+    report(all_results)
+
+
+def report(all_results: dict[str, list[BenchmarkResult]]) -> None:
+    """Average each model's runs, print the table and sample responses."""
     # Calculate averages and display results
     avg_results = []
     for key, results in all_results.items():
@@ -335,7 +369,10 @@ async def run_benchmark() -> None:
 
 def main():
     """Entry point."""
-    asyncio.run(run_benchmark())
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--local-only", action="store_true", help="Only benchmark the local model")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(local_only=args.local_only))
 
 
 if __name__ == "__main__":
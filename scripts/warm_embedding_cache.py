@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache Warm-Up
+
+Embeds every memory whose content is missing from the persistent
+embedding cache (embedding_cache table in atlas.db), in batches, and
+indexes memories that never got a vec_semantic row. Run after switching
+ATLAS_EMBEDDING_MODEL or restoring a database.
+
+Usage:
+    python scripts/warm_embedding_cache.py
+    python scripts/warm_embedding_cache.py --db data/atlas.db --batch-size 512
+    python scripts/warm_embedding_cache.py --stats    # Show cache stats only
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlas.memory.embeddings import get_embedding_service
+from atlas.memory.store import MemoryStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm the ATLAS embedding cache")
+    parser.add_argument("--db", help="Database path (default ~/.atlas/atlas.db)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Texts per encode() call")
+    parser.add_argument("--stats", action="store_true", help="Show cache stats without embedding")
+    args = parser.parse_args()
+
+    with MemoryStore(args.db) as store:
+        store.init_db()
+        if not args.stats:
+            report = store.warm_embeddings(
+                batch_size=args.batch_size,
+                progress=lambda done, total: print(f"  {done:,}/{total:,} memories", end="\r"),
+            )
+            print()
+            print(f"Scanned {report['scanned']:,} memories in {report['duration_ms'] / 1000:.1f}s: "
+                  f"{report['embedded']:,} embedded, {report['cached']:,} already cached, "
+                  f"{report['indexed']:,} added to vec_semantic")
+            print(f"Encoder: {get_embedding_service().stats.as_dict()}")
+        print(f"Cache: {store.embedding_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
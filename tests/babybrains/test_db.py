@@ -362,6 +362,15 @@ class TestWALMode:
         assert mode == "wal"
         conn.close()
 
+    def test_dedicated_connection_not_shared(self, tmp_path):
+        """dedicated=True should give a private connection with WAL mode."""
+        db_path = tmp_path / "test_dedicated.db"
+        conn = db.get_bb_connection(db_path, dedicated=True)
+        assert conn is not db.get_bb_connection(db_path)
+        assert conn is not db.get_bb_connection(db_path, dedicated=True)
+        assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        conn.close()
+
 
 class TestContentBriefNullHandling:
     """Test that None values produce [] not null in JSON columns."""
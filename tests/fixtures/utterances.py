@@ -0,0 +1,62 @@
+"""
+Recorded voice utterances for intent/routing tests.
+
+Usage:
+    from tests.fixtures.utterances import load_utterances, reference_match
+
+    for text in load_utterances():
+        ...
+
+ROUTING_TIERS labels utterances that reach the router's embedding stage
+(no reflex pattern, 4-25 words) with the tier they should be routed to.
+"""
+
+import re
+from pathlib import Path
+
+UTTERANCES_PATH = Path(__file__).parent / "voice_utterances.txt"
+
+# Haiku prototypes and paraphrases, then personal and open questions no
+# prototype is close to (Haiku by default)
+ROUTING_TIERS = {
+    "explain how compound interest works": "haiku",
+    "draft a polite email declining the invitation": "haiku",
+    "what's a good warm up before bench press": "haiku",
+    "tell me something interesting about the roman empire": "haiku",
+    (
+        "how should i structure my day to get more deep work done "
+        "without burning out by the afternoon"
+    ): "haiku",
+    "how did i sleep last night": "haiku",
+    "what's my body battery": "haiku",
+    "what is on the schedule": "haiku",
+    "what's my workout today": "haiku",
+    "do my daily workout": "haiku",
+    "which supplements do i still need": "haiku",
+    "what equipment do i need": "haiku",
+    "how long does the baseline assessment take": "haiku",
+    "note the car needs a service": "haiku",
+}
+
+
+def load_utterances() -> list[str]:
+    """Utterances from voice_utterances.txt (blank lines and # comments skipped)."""
+    lines = UTTERANCES_PATH.read_text().splitlines()
+    return [line for line in lines if line.strip() and not line.startswith("#")]
+
+
+def reference_match(kind: str, patterns, text: str) -> bool:
+    """The per-pattern check a PatternMatcher kind stands in for."""
+    text_lower = text.lower().strip()
+    if kind == "search":
+        return any(re.search(p, text_lower) for p in patterns)
+    if kind == "contains":
+        return any(p in text_lower for p in patterns)
+    if kind == "prefix":
+        return any(text_lower.startswith(p) for p in patterns)
+    return text_lower in patterns
+
+
+def expected_labels(matcher, text: str) -> set[str]:
+    """Labels a matcher should report for text, checked pattern by pattern."""
+    return {label for label in matcher.labels if reference_match(*matcher.rule(label), text)}
@@ -0,0 +1,162 @@
+"""Shared fixtures for health tests: a local fake Garmin Connect server."""
+
+import json
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+FAKE_TOKEN = "fake-garmin-token"
+DISPLAY_NAME = "atlas-fake"
+
+SCHEMA = Path(__file__).parents[2] / "atlas" / "memory" / "schema.sql"
+
+
+class FakeGarmin:
+    """
+    Garmin Connect stand-in serving the endpoints GarminService syncs.
+
+    Values are derived from the date, so results are checkable. Set
+    latency_s to model the real API's round trip, missing_days for days
+    the watch never synced (404), and rate_limit_paths for paths that
+    answer 429 once before succeeding.
+    """
+
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.missing_days: set[date] = set()
+        self.rate_limit_paths: set[str] = set()
+        self.requests = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def expected(day: date) -> dict:
+        """Values the fake serves for a day."""
+        n = day.toordinal()
+        return {
+            "sleep_hours": round((25200 + (n % 7) * 900) / 3600, 2),
+            "sleep_score": 60 + n % 30,
+            "resting_hr": 48 + n % 6,
+            "hrv_avg": 40 + n % 15,
+            "hrv_status": ["BALANCED", "UNBALANCED", "LOW"][n % 3],
+            "body_battery": 50 + n % 40,
+        }
+
+    def respond(self, path: str, query: dict) -> tuple[int, object]:
+        if path == "/userprofile-service/socialProfile":
+            return 200, {"displayName": DISPLAY_NAME}
+
+        match = re.fullmatch(r"/wellness-service/wellness/dailySleepData/[^/]+", path)
+        if match:
+            day = date.fromisoformat(query["date"][0])
+        else:
+            match = re.fullmatch(r"/(?:hrv-service/hrv|wellness-service/wellness/dailyStress)/([\d-]+)", path)
+            if not match:
+                return 404, None
+            day = date.fromisoformat(match.group(1))
+        if day in self.missing_days:
+            return 404, None
+
+        v = self.expected(day)
+        if "dailySleepData" in path:
+            return 200, {
+                "dailySleepDTO": {
+                    "sleepTimeSeconds": round(v["sleep_hours"] * 3600),
+                    "deepSleepSeconds": 5400,
+                    "remSleepSeconds": 5100,
+                    "lightSleepSeconds": 14400,
+                    "awakeSleepSeconds": 1200,
+                    "sleepScores": {"overall": {"value": v["sleep_score"]}},
+                },
+                "restingHeartRate": v["resting_hr"],
+                "avgOvernightHrv": v["hrv_avg"],
+                "hrvStatus": v["hrv_status"],
+            }
+        if path.startswith("/hrv-service"):
+            return 200, {"hrvSummary": {
+                "status": v["hrv_status"], "lastNightAvg": v["hrv_avg"], "lastNight5MinHigh": v["hrv_avg"] + 8,
+            }}
+        return 200, {
+            "avgStressLevel": 30,
+            "bodyBatteryValuesArray": [[0, "ACTIVE", 20, 1.0], [1, "ACTIVE", v["body_battery"], 1.0]],
+        }
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    if fake.latency_s:
+                        time.sleep(fake.latency_s)
+                    url = urlparse(self.path)
+                    if self.headers.get("Authorization") != f"Bearer {FAKE_TOKEN}":
+                        return self._send(401, {"message": "unauthorized"})
+                    with fake._lock:
+                        limited = url.path in fake.rate_limit_paths
+                        fake.rate_limit_paths.discard(url.path)
+                        fake.rate_limited += limited
+                    if limited:
+                        return self._send(429, None, {"Retry-After": "0"})
+                    status, body = fake.respond(url.path, parse_qs(url.query))
+                    self._send(status, body)
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def fake_garmin():
+    """Local fake Garmin Connect API (see FakeGarmin)."""
+    server = FakeGarmin()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def daily_metrics_api(tmp_path):
+    """BlueprintAPI on a temp database holding only the daily_metrics table."""
+    from atlas.memory.blueprint import BlueprintAPI
+    from atlas.memory.store import MemoryStore
+
+    store = MemoryStore(tmp_path / "atlas.db")
+    table = re.search(r"CREATE TABLE IF NOT EXISTS daily_metrics \(.*?\n\);", SCHEMA.read_text(), re.S)
+    store.conn.execute(table.group(0))
+    yield BlueprintAPI(store)
+    store.close()
@@ -0,0 +1,139 @@
+"""
+Tests for concurrent Garmin fetching and range sync (backfill).
+
+Runs against the local fake Garmin server (tests/health/conftest.py).
+
+Tests cover:
+- sync_range writes daily_metrics rows with the served values
+- Complete days are skipped on the next run
+- Days without data are returned but not written
+- Rate limits are retried; concurrency stays bounded
+- Auth failures stop the sync
+- Backfill throughput benchmark (days/sec)
+
+The benchmark is opt-in; run it with output to see throughput:
+    pytest tests/health/test_garmin_sync.py -m benchmark -s
+"""
+
+import time
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from atlas.health.garmin import GarminAuthError, GarminService  # noqa: E402
+from tests.health.conftest import FAKE_TOKEN, FakeGarmin  # noqa: E402
+
+START = date(2025, 3, 1)
+
+
+def make_service(fake, token=FAKE_TOKEN, **kwargs) -> GarminService:
+    kwargs.setdefault("requests_per_second", 1000)
+    return GarminService(api_base=fake.url, token=lambda: token, **kwargs)
+
+
+@pytest.mark.asyncio
+class TestSyncRange:
+    """Tests for the range backfill."""
+
+    async def test_writes_rows(self, fake_garmin, daily_metrics_api):
+        service = make_service(fake_garmin)
+        end = START + timedelta(days=20)
+
+        results = await service.sync_range(START, end, blueprint=daily_metrics_api, batch_days=7)
+
+        assert [m.date for m in results] == [START + timedelta(days=n) for n in range(21)]
+        rows = daily_metrics_api.get_daily_metrics_range(START, end)
+        assert len(rows) == 21
+        for row in rows:
+            expected = FakeGarmin.expected(row.date)
+            assert (row.sleep_hours, row.sleep_score, row.resting_hr) == (
+                expected["sleep_hours"], expected["sleep_score"], expected["resting_hr"])
+            assert (row.hrv_status, row.hrv_avg, row.body_battery) == (
+                expected["hrv_status"], expected["hrv_avg"], expected["body_battery"])
+
+    async def test_skips_complete_days(self, fake_garmin, daily_metrics_api):
+        service = make_service(fake_garmin)
+        end = START + timedelta(days=9)
+        await service.sync_range(START, end, blueprint=daily_metrics_api)
+        requests = fake_garmin.requests
+
+        assert await service.sync_range(START, end, blueprint=daily_metrics_api) == []
+        assert fake_garmin.requests == requests
+
+        # Extending the range only fetches the new days (plus the profile)
+        results = await service.sync_range(START, end + timedelta(days=2), blueprint=daily_metrics_api)
+        assert [m.date for m in results] == [end + timedelta(days=1), end + timedelta(days=2)]
+        assert fake_garmin.requests == requests + 1 + 2 * 3
+
+    async def test_day_without_data_not_written(self, fake_garmin, daily_metrics_api):
+        fake_garmin.missing_days = {START + timedelta(days=1)}
+        service = make_service(fake_garmin)
+
+        results = await service.sync_range(START, START + timedelta(days=2), blueprint=daily_metrics_api)
+
+        assert [m.sync_status for m in results] == ["success", "no_data", "success"]
+        rows = daily_metrics_api.get_daily_metrics_range(START, START + timedelta(days=2))
+        assert [r.date for r in rows] == [START, START + timedelta(days=2)]
+
+    async def test_rate_limit_retried_and_concurrency_bounded(self, daily_metrics_api):
+        fake = FakeGarmin(latency_s=0.01)
+        try:
+            fake.rate_limit_paths = {f"/hrv-service/hrv/{START + timedelta(days=2)}"}
+            service = make_service(fake, max_concurrency=3)
+
+            results = await service.sync_range(START, START + timedelta(days=5), blueprint=daily_metrics_api)
+
+            assert fake.rate_limited == 1
+            assert len(results) == 6 and all(m.sync_status == "success" for m in results)
+            assert fake.max_in_flight <= 3
+        finally:
+            fake.close()
+
+    async def test_auth_failure_stops(self, fake_garmin, daily_metrics_api):
+        service = make_service(fake_garmin, token="expired")
+        with pytest.raises(GarminAuthError):
+            # Profile lookup tolerates errors; the day fetches raise
+            await service.sync_range(START, START + timedelta(days=3), blueprint=daily_metrics_api)
+        assert daily_metrics_api.get_daily_metrics_range(START, START + timedelta(days=3)) == []
+
+
+@pytest.mark.asyncio
+class TestSyncTodayFetcher:
+    """sync_today against the fake server."""
+
+    async def test_sync_today(self, fake_garmin):
+        service = make_service(fake_garmin)
+        metrics = await service.sync_today()
+
+        assert metrics.sync_status == "success"
+        assert metrics.date == date.today()
+        assert metrics.hrv_morning == FakeGarmin.expected(date.today())["hrv_avg"] + 8
+        assert fake_garmin.requests == 4  # Profile + three day endpoints
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestBackfillThroughput:
+    """Backfill throughput against the fake server with API-like latency."""
+
+    async def test_backfill_throughput(self, daily_metrics_api):
+        days = 30
+        fake = FakeGarmin(latency_s=0.02)
+        try:
+            rates = {}
+            for concurrency in (1, 4):
+                service = make_service(fake, max_concurrency=concurrency)
+                start = START + timedelta(days=days * concurrency)  # Fresh days each run
+                started = time.perf_counter()
+                results = await service.sync_range(
+                    start, start + timedelta(days=days - 1), blueprint=daily_metrics_api)
+                rates[concurrency] = len(results) / (time.perf_counter() - started)
+                assert len(results) == days
+
+            print(f"\nBackfill throughput: sequential {rates[1]:.1f} days/s, "
+                  f"4 concurrent {rates[4]:.1f} days/s")
+            assert rates[4] > rates[1] * 2
+        finally:
+            fake.close()
@@ -8,6 +8,10 @@ Tests:
 - Deload detection
 - Pain trend calculation
 - Voice recommendation formatting
+- Session recommendations: same results, constant query count, 12-exercise benchmark
+
+Run the benchmark with output to see timings:
+    pytest tests/health/test_progression.py -k benchmark -s
 """
 
 import sqlite3
@@ -370,3 +374,135 @@ class TestWorkoutSummary:
         service = ProgressionService()
         summary = service.get_workout_summary([])
         assert "good" in summary.lower() or len(summary) < 20
+
+
+SESSION_EXERCISES = [
+    "goblet_squat", "floor_press", "split_squat", "chest_supported_row",
+    "landmine_press", "rdl", "sumo_deadlift", "suitcase_carry",
+    "single_leg_rdl", "kb_swings", "side_lying_wiper", "bird_dog",
+]
+
+
+class TestSessionRecommendations:
+    """Test batched recommendations for a whole session."""
+
+    @pytest.fixture
+    def session_db(self, tmp_path):
+        """Database with history, pain, baselines and an active phase."""
+        import re
+
+        from atlas.db import get_connection
+        from atlas.health.progression import ProgressionService
+        from atlas.memory.blueprint import BlueprintAPI
+        from atlas.memory.store import MemoryStore
+
+        schema_dir = Path(__file__).parents[2] / "atlas" / "memory"
+        db_path = tmp_path / "atlas.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript((schema_dir / "schema_fitness.sql").read_text())
+        schema = (schema_dir / "schema.sql").read_text()
+        for table in ("daily_metrics", "workouts", "workout_exercises"):
+            conn.execute(re.search(rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\n\);", schema, re.S).group(0))
+
+        today = date.today()
+        conn.execute("INSERT INTO phase_history (phase_id, start_date) VALUES (1, ?)", (today.isoformat(),))
+        for name, value, days_ago in [("goblet_squat_5rm", 32.0, 3), ("floor_press_8rm", 24.0, 40),
+                                      ("rdl_5rm", 50.0, 3), ("landmine_press_8rm", 20.0, 3)]:
+            type_id = conn.execute("INSERT INTO assessment_types (name, category) VALUES (?, 'strength')",
+                                   (name,)).lastrowid
+            conn.execute("INSERT INTO assessments (assessment_type_id, date, value) VALUES (?, ?, ?)",
+                         (type_id, (today - timedelta(days=days_ago)).isoformat(), value))
+        for i, pain in enumerate([2, 3, 4, 5]):  # Shoulder trending up
+            conn.execute("INSERT INTO pain_log (date, body_part, pain_level) VALUES (?, 'shoulder_right', ?)",
+                         ((today - timedelta(days=4 - i)).isoformat(), pain))
+        # Two workouts; the most recent one decides
+        for days_ago, reps in [(10, 8), (3, 12)]:
+            workout_id = conn.execute("INSERT INTO workouts (date, type) VALUES (?, 'strength')",
+                                      ((today - timedelta(days=days_ago)).isoformat(),)).lastrowid
+            for exercise_id in ["goblet_squat", "floor_press", "rdl", "kb_swings"]:
+                we_id = conn.execute(
+                    "INSERT INTO workout_exercises (workout_id, exercise_id, exercise_name, weight_kg) "
+                    "VALUES (?, ?, ?, 20.0)", (workout_id, exercise_id, exercise_id)).lastrowid
+                for set_number in (1, 2, 3):
+                    conn.execute(
+                        "INSERT INTO workout_exercise_sets "
+                        "(workout_exercise_id, set_number, reps_target, reps_actual, weight_kg) "
+                        "VALUES (?, ?, ?, ?, 22.5)", (we_id, set_number, reps, reps))
+        conn.commit()
+        conn.close()
+
+        store = MemoryStore(db_path)
+        service = ProgressionService(db_path=db_path)
+        service._blueprint = BlueprintAPI(store)
+
+        # Count SELECTs on both connections the service uses
+        statements = []
+
+        def trace(sql):
+            if sql.lstrip().upper().startswith("SELECT"):
+                statements.append(sql)
+
+        pooled = get_connection(db_path)
+        pooled.set_trace_callback(trace)
+        store.conn.set_trace_callback(trace)
+        yield service, statements
+
+        pooled.set_trace_callback(None)
+        pooled.close()
+        store.close()
+
+    def test_matches_single_recommendations(self, session_db):
+        """Batch results equal get_recommendation for each exercise."""
+        service, _ = session_db
+        batch = service.get_recommendations_for_session(SESSION_EXERCISES)
+
+        assert list(batch) == SESSION_EXERCISES
+        assert batch == {ex: service.get_recommendation(ex) for ex in SESSION_EXERCISES}
+        assert batch["goblet_squat"].ready_to_progress is True
+        assert batch["goblet_squat"].recommended_weight_kg == 25.0
+        assert batch["floor_press"].pain_warning == "shoulder right pain trending up"
+        assert batch["rdl"].basis == "progression"
+        assert batch["sumo_deadlift"].basis == "derived:rdl"
+        assert batch["suitcase_carry"].basis == "derived:sumo_deadlift"
+        assert batch["bird_dog"].basis == "no_weight_tracking"
+
+    def test_query_count_constant(self, session_db):
+        """Query count does not grow with the number of exercises."""
+        service, statements = session_db
+        counts = {}
+        for n in (1, 4, 12):
+            statements.clear()
+            service.get_recommendations_for_session(SESSION_EXERCISES[:n])
+            counts[n] = len(statements)
+
+        assert counts[1] == counts[4] == counts[12]
+        statements.clear()
+        for exercise_id in SESSION_EXERCISES:
+            service.get_recommendation(exercise_id)
+        assert len(statements) > 3 * counts[12]
+
+    def test_benchmark_12_exercise_day(self, session_db):
+        """Batch vs per-exercise lookups for a 12-exercise day."""
+        import time
+
+        service, statements = session_db
+        rounds = 20
+
+        statements.clear()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for exercise_id in SESSION_EXERCISES:
+                service.get_recommendation(exercise_id)
+        per_exercise_ms = (time.perf_counter() - start) * 1000 / rounds
+        per_exercise_queries = len(statements) // rounds
+
+        statements.clear()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            service.get_recommendations_for_session(SESSION_EXERCISES)
+        batch_ms = (time.perf_counter() - start) * 1000 / rounds
+        batch_queries = len(statements) // rounds
+
+        print(f"\n12-exercise day: per exercise {per_exercise_ms:.2f}ms ({per_exercise_queries} queries), "
+              f"session batch {batch_ms:.2f}ms ({batch_queries} queries)")
+        assert batch_queries < per_exercise_queries
@@ -0,0 +1,107 @@
+"""
+Tests for CostTracker.
+
+Tests:
+- Budget status served from running counters (no database access)
+- Background usage writes and the llm_usage_daily rollup
+- Counters reload from the rollup, including pre-rollup databases
+- UTC day and month rollover
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+# atlas.llm imports the API clients
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk", "numpy"):
+    pytest.importorskip(_module)
+
+from atlas import db  # noqa: E402
+from atlas.llm.cost_tracker import CostTracker, UsageRecord  # noqa: E402
+
+
+def _record(cost: float) -> UsageRecord:
+    return UsageRecord("haiku", "haiku", 100, 50, cost, 300.0, "query", 0.8)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    t = CostTracker(tmp_path / "cost_tracker.db")
+    yield t
+    t.close()
+    db.close_all()
+
+
+class TestCostTracker:
+    """Test in-memory budget counters with background logging."""
+
+    def test_status_reads_counters_only(self, tracker, monkeypatch):
+        tracker.log_usage(_record(0.10), "q1")
+        tracker.log_usage(_record(0.05), "q2")
+        tracker.flush()
+        monkeypatch.setattr("atlas.llm.cost_tracker.get_connection", None)
+        status = tracker.get_budget_status()
+        assert status.daily_spend == pytest.approx(0.15)
+        assert status.monthly_spend == pytest.approx(0.15)
+        assert status.daily_limit == 0.33
+
+    def test_rows_and_rollup_written(self, tracker):
+        tracker.log_usage(_record(0.10), "q1")
+        tracker.log_usage(_record(0.20), "q2")
+        tracker.flush()
+        conn = sqlite3.connect(tracker.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM llm_usage").fetchone()[0] == 2
+        requests, cost = conn.execute("SELECT requests, cost_usd FROM llm_usage_daily").fetchone()
+        assert requests == 2
+        assert cost == pytest.approx(0.30)
+        conn.close()
+        assert sum(row["requests"] for row in tracker.get_daily_summary()) == 2
+
+    def test_restart_reloads_counters(self, tracker):
+        tracker.log_usage(_record(0.25))
+        tracker.set_budget(daily=1.0, monthly=20.0)
+        tracker.close()
+
+        reopened = CostTracker(tracker.db_path)
+        status = reopened.get_budget_status()
+        assert status.daily_spend == pytest.approx(0.25)
+        assert (status.daily_limit, status.monthly_limit) == (1.0, 20.0)
+        reopened.close()
+
+    def test_rollup_backfilled_for_existing_database(self, tmp_path):
+        path = tmp_path / "cost_tracker.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE llm_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                query_hash TEXT NOT NULL, tier TEXT NOT NULL, model TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL, output_tokens INTEGER NOT NULL,
+                cost_usd REAL NOT NULL, latency_ms REAL NOT NULL,
+                routing_confidence REAL, category TEXT,
+                escalated BOOLEAN DEFAULT FALSE, escalation_reason TEXT
+            );
+            INSERT INTO llm_usage (query_hash, tier, model, input_tokens, output_tokens, cost_usd, latency_ms)
+            VALUES ('', 'haiku', 'haiku', 1, 1, 0.4, 1.0), ('', 'haiku', 'haiku', 1, 1, 0.1, 1.0);
+            """
+        )
+        conn.close()
+
+        tracker = CostTracker(path)
+        assert tracker.get_budget_status().daily_spend == pytest.approx(0.5)
+        tracker.close()
+        db.close_all()
+
+    def test_day_and_month_rollover(self, tracker, monkeypatch):
+        today = [date(2026, 3, 31)]
+        monkeypatch.setattr(CostTracker, "_today", staticmethod(lambda: today[0]))
+        tracker.refresh()
+        tracker.log_usage(_record(0.30))
+
+        assert tracker.get_budget_status().daily_spend == pytest.approx(0.30)
+
+        today[0] = date(2026, 4, 1)
+        status = tracker.get_budget_status()
+        assert (status.daily_spend, status.monthly_spend) == (0.0, 0.0)
@@ -0,0 +1,143 @@
+"""
+Tests for OllamaClient.
+
+Tests:
+- Every call uses /api/chat with the same message layout and keep_alive
+- Streaming reuses one pooled async client per event loop
+- Warm-up request and unreachable server handling
+"""
+
+import asyncio
+import json
+
+import pytest
+
+# atlas.llm imports the API clients
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk", "numpy"):
+    pytest.importorskip(_module)
+
+import httpx  # noqa: E402
+
+from atlas.llm.local import OllamaClient  # noqa: E402
+
+SYSTEM = "You are ATLAS."
+
+
+class FakeOllama:
+    """Records requests and answers like Ollama's chat endpoint."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else {}
+        self.requests.append((request.url.path, body))
+        if body.get("stream"):
+            lines = [{"message": {"content": t}} for t in ("Hello", " there")] + [{"done": True}]
+            return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+        return httpx.Response(200, json={
+            "model": body.get("model"),
+            "message": {"role": "assistant", "content": " Four. "},
+            "total_duration": 5_000_000,
+            "eval_count": 3,
+            "eval_duration": 2_000_000,
+        })
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    fake = FakeOllama()
+    transport = httpx.MockTransport(fake)
+    async_transport = httpx.MockTransport(fake)
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+    monkeypatch.setattr(httpx, "Client", lambda **kw: real_client(transport=transport, **kw))
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_async_client(transport=async_transport, **kw))
+    return fake
+
+
+class TestChatEndpoint:
+    """Test request layout."""
+
+    def test_generate_uses_chat(self, ollama):
+        client = OllamaClient(model="qwen2.5:3b-instruct")
+        response = client.generate("What is 2+2?", system=SYSTEM, max_tokens=10)
+
+        assert response.content == "Four."
+        assert response.first_token_ms == 3.0
+        path, body = ollama.requests[0]
+        assert path == "/api/chat"
+        assert body["messages"] == [
+            {"role": "system", "content": SYSTEM},
+            {"role": "user", "content": "What is 2+2?"},
+        ]
+        assert body["keep_alive"] == "30m"
+        assert body["options"]["num_predict"] == 10
+
+    def test_stream_and_agenerate_match_generate(self, ollama):
+        client = OllamaClient(keep_alive=None)
+
+        async def run():
+            tokens = [t async for t in client.stream("hi", system=SYSTEM)]
+            await client.agenerate("hi", system=SYSTEM)
+            return tokens
+
+        assert asyncio.run(run()) == ["Hello", " there"]
+        (stream_path, stream_body), (path, body) = ollama.requests
+        assert stream_path == path == "/api/chat"
+        assert stream_body["messages"] == body["messages"]
+        assert "keep_alive" not in body
+
+
+class TestPooledClient:
+    """Test async client reuse."""
+
+    def test_one_client_per_loop(self, ollama):
+        client = OllamaClient()
+
+        async def two_streams():
+            clients = []
+            for _ in range(2):
+                async for _token in client.stream("hi"):
+                    pass
+                clients.append(client.async_client)
+            return clients
+
+        first, second = asyncio.run(two_streams())
+        assert first is second
+        assert not first.is_closed
+
+        # A new loop gets its own client rather than one bound to a closed loop
+        other, _ = asyncio.run(two_streams())
+        assert other is not first
+
+    def test_aclose(self, ollama):
+        client = OllamaClient()
+
+        async def run():
+            pooled = client.async_client
+            await client.aclose()
+            return pooled, client.async_client
+
+        closed, fresh = asyncio.run(run())
+        assert closed.is_closed
+        assert fresh is not closed
+
+
+class TestWarmUp:
+    """Test model warm-up."""
+
+    def test_warm_up_prefills_system_prompt(self, ollama):
+        assert OllamaClient().warm_up(system=SYSTEM) is not None
+        path, body = ollama.requests[0]
+        assert path == "/api/chat"
+        assert body["messages"][0] == {"role": "system", "content": SYSTEM}
+        assert body["options"]["num_predict"] == 1
+        assert body["keep_alive"] == "30m"
+
+    def test_warm_up_without_system_just_loads(self, ollama):
+        OllamaClient().warm_up()
+        assert ollama.requests[0][1]["messages"] == []
+
+    def test_unreachable_server(self):
+        # Nothing listens on port 9
+        assert OllamaClient(host="http://127.0.0.1:9", timeout=1.0).warm_up() is None
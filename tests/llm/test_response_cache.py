@@ -0,0 +1,144 @@
+"""
+Tests for the semantic response cache.
+
+Tests:
+- Similarity threshold, system-prompt context and per-tier TTL
+- Tag invalidation and never-cached queries
+- Hit-rate and saved-latency stats
+- route_and_stream stores answers that lookup_cached serves
+"""
+
+import asyncio
+
+import pytest
+
+# atlas.llm imports the API clients
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk", "numpy"):
+    pytest.importorskip(_module)
+
+import numpy as np  # noqa: E402
+
+from atlas import db  # noqa: E402
+from atlas.llm.cost_tracker import CostTracker  # noqa: E402
+from atlas.llm.response_cache import ResponseCache  # noqa: E402
+from atlas.llm.router import ATLASRouter, RouterConfig, RoutingDecision, Tier  # noqa: E402
+
+SLEEP = [1.0, 0.0, 0.0]
+SLEEP_REPHRASED = [0.98, 0.2, 0.0]  # cosine ~0.98
+BENCH = [0.0, 1.0, 0.0]
+
+
+class TestResponseCache:
+    """Test lookups, expiry and invalidation."""
+
+    def test_similar_query_hits(self):
+        cache = ResponseCache(threshold=0.9)
+        cache.store("how did i sleep", SLEEP, "Seven hours, good.", tier="haiku", llm_ms=800)
+
+        entry = cache.lookup("how well did i sleep", SLEEP_REPHRASED)
+        assert entry.response == "Seven hours, good."
+        assert cache.lookup("what is a good bench warm-up", BENCH) is None
+
+        stats = cache.stats()
+        assert (stats.lookups, stats.hits, stats.hit_rate) == (2, 1, 0.5)
+        assert stats.saved_ms == 800
+        assert stats.as_dict()["saved_ms"] == 800
+
+    def test_context_must_match(self):
+        cache = ResponseCache()
+        cache.store("define hypertrophy", BENCH, "Muscle growth.", tier="haiku", context="prompt A")
+        assert cache.lookup("define hypertrophy", BENCH, context="prompt B") is None
+        assert cache.lookup("define hypertrophy", BENCH, context="prompt A") is not None
+
+    def test_tier_ttl(self, monkeypatch):
+        cache = ResponseCache(ttls={"local": 10})
+        assert cache.store("define tempo", BENCH, "Lifting speed.", tier="agent_sdk") is None
+        cache.store("define tempo", BENCH, "Lifting speed.", tier="local")
+
+        now = __import__("time").time()
+        monkeypatch.setattr("atlas.llm.response_cache.time.time", lambda: now + 11)
+        assert cache.lookup("define tempo", BENCH) is None
+        assert len(cache) == 0
+
+    def test_tags_and_invalidation(self):
+        cache = ResponseCache()
+        health = cache.store("how did i sleep", SLEEP, "Seven hours.", tier="haiku")
+        cache.store("define hypertrophy", BENCH, "Muscle growth.", tier="haiku")
+        assert health.tags == {"health"}
+
+        assert cache.invalidate("health") == 1
+        assert cache.lookup("how did i sleep", SLEEP) is None
+        assert cache.lookup("define hypertrophy", BENCH) is not None
+        assert cache.invalidate() == 1
+
+    def test_never_cached(self):
+        cache = ResponseCache()
+        for query in ("what time is it", "what about tomorrow", "why is that", "remember to buy milk"):
+            assert not cache.cacheable(query)
+            assert cache.store(query, SLEEP, "Answer.", tier="haiku") is None
+
+    def test_audio_and_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        first = cache.store("define tempo", SLEEP, "Lifting speed.", tier="haiku")
+        cache.attach_audio(first, "af_heart", np.zeros(10, dtype=np.float32), 24000, 120.0)
+        assert cache.entry_for("define tempo").audio_for("af_heart")[1] == 24000
+        assert cache.entry_for("define tempo").audio_for("bm_george") is None
+
+        cache.store("define rpe", BENCH, "Effort scale.", tier="haiku")
+        cache.store("define amrap", [0.0, 0.0, 1.0], "As many reps as possible.", tier="haiku")
+        assert len(cache) == 2
+        assert cache.entry_for("define tempo") is None
+
+
+class FakeEmbedder:
+    VECTORS = {"how did i sleep": SLEEP, "how well did i sleep": SLEEP_REPHRASED}
+
+    def embed(self, text):
+        return self.VECTORS.get(text, BENCH)
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def stream(self, prompt, system=None, temperature=0.7, max_tokens=256):
+        self.calls += 1
+        for token in ("Seven ", "hours."):
+            yield token
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    tracker = CostTracker(tmp_path / "cost_tracker.db")
+    monkeypatch.setattr("atlas.llm.router.get_cost_tracker", lambda: tracker)
+    router = ATLASRouter(config=RouterConfig(), system_prompt="You are ATLAS.")
+    router._embedder = FakeEmbedder()
+    router.classify = lambda query: RoutingDecision(Tier.HAIKU, 0.9, "embedding")
+    router._haiku_client = FakeClient()
+    yield router
+    tracker.close()
+    db.close_all()
+
+
+class TestRouterCache:
+    """Test caching through route_and_stream."""
+
+    def _stream(self, router, query, cache_key):
+        async def collect():
+            return "".join([t async for t in router.route_and_stream(query, cache_key=cache_key)])
+        return asyncio.run(collect())
+
+    def test_store_then_hit(self, router):
+        assert router.lookup_cached("how did i sleep") is None
+        answer = self._stream(router, "Context: ...\n\nCurrent query: how did i sleep", "how did i sleep")
+        assert answer == "Seven hours."
+
+        entry = router.lookup_cached("how well did i sleep")
+        assert entry.response == "Seven hours."
+        assert entry.tier == "haiku"
+        assert router.cached_entry("how did i sleep") is entry
+        assert router._haiku_client.calls == 1
+
+    def test_no_cache_key_no_store(self, router):
+        self._stream(router, "how did i sleep", None)
+        assert len(router.response_cache) == 0
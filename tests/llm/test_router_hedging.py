@@ -0,0 +1,140 @@
+"""
+Tests for hedged local-vs-Haiku routing in ATLASRouter.
+
+Tests:
+- Local wins with a fast acceptable first sentence; Haiku is cancelled
+- Unacceptable local sentences, an expired budget or a failed leg
+- Only the committed stream is logged to the CostTracker
+- Per-category win rates
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+# atlas.llm imports the API clients
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk", "numpy"):
+    pytest.importorskip(_module)
+
+from atlas import db  # noqa: E402
+from atlas.llm.cost_tracker import CostTracker  # noqa: E402
+from atlas.llm.router import ATLASRouter, RouterConfig, RoutingDecision, Tier  # noqa: E402
+
+
+class FakeClient:
+    """Streams tokens after a delay; records whether the stream was cut off."""
+
+    def __init__(self, tokens, delay=0.0, error=None):
+        self.tokens = tokens
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    async def stream(self, prompt, system=None, temperature=0.7, max_tokens=256):
+        try:
+            await asyncio.sleep(self.delay)
+            for token in self.tokens:
+                yield token
+                await asyncio.sleep(0)
+            if self.error:
+                raise self.error
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    t = CostTracker(tmp_path / "cost_tracker.db")
+    monkeypatch.setattr("atlas.llm.router.get_cost_tracker", lambda: t)
+    yield t
+    t.close()
+    db.close_all()
+
+
+def _router(local, haiku, confidence=0.5, **config):
+    config = {"enable_hedging": True, "enable_embeddings": False,
+              "local_latency_max": 20, "haiku_latency_max": 60, **config}
+    router = ATLASRouter(config=RouterConfig(**config))
+    router.classify = lambda query: RoutingDecision(Tier.HAIKU, confidence, "default")
+    router._local_client = local
+    router._haiku_client = haiku
+    return router
+
+
+def _answer(router, query="how do I sleep better"):
+    async def collect():
+        return "".join([t async for t in router.route_and_stream(query)])
+    return asyncio.run(collect())
+
+
+def _logged_tiers(tracker):
+    tracker.flush()
+    conn = sqlite3.connect(tracker.db_path)
+    rows = [row[0] for row in conn.execute("SELECT tier FROM llm_usage")]
+    conn.close()
+    return rows
+
+
+class TestHedgedRace:
+    """Test which stream is committed."""
+
+    def test_local_wins(self, tracker):
+        local = FakeClient(["Keep a fixed ", "wake time. ", "Cut caffeine."])
+        haiku = FakeClient(["Haiku answer. "], delay=0.5)
+        router = _router(local, haiku)
+
+        assert _answer(router) == "Keep a fixed wake time. Cut caffeine."
+        assert haiku.cancelled
+        assert _logged_tiers(tracker) == []  # cancelled Haiku stream is not billed
+        stats = router.hedge_stats()["default"]
+        assert (stats.races, stats.local_wins, stats.local_win_rate) == (1, 1, 1.0)
+
+    def test_unacceptable_local_sentence(self, tracker):
+        local = FakeClient(["I'm not sure about that. ", "Maybe rest."])
+        haiku = FakeClient(["Aim for ", "eight hours. "], delay=0.01)
+        router = _router(local, haiku)
+
+        assert _answer(router) == "Aim for eight hours. "
+        assert _logged_tiers(tracker) == ["haiku"]
+        stats = router.hedge_stats()["default"]
+        assert (stats.haiku_wins, stats.local_rejected) == (1, 1)
+
+    def test_budget_expires_to_haiku(self, tracker):
+        local = FakeClient(["Too slow. "], delay=0.5)
+        haiku = FakeClient(["Slow ", "but ", "sure. "], delay=0.2)
+        router = _router(local, haiku)
+
+        assert _answer(router) == "Slow but sure. "
+        assert local.cancelled
+        assert router.hedge_stats()["default"].budget_expired == 1
+
+    def test_haiku_failure_falls_back_to_local(self, tracker):
+        local = FakeClient(["Short naps ", "help too. "], delay=0.03)
+        haiku = FakeClient([], error=RuntimeError("overloaded"))
+        router = _router(local, haiku)
+
+        assert _answer(router) == "Short naps help too. "
+        assert _logged_tiers(tracker) == []
+
+    def test_both_fail(self, tracker):
+        router = _router(FakeClient([], error=ValueError("down")), FakeClient([], error=RuntimeError("overloaded")))
+        with pytest.raises(RuntimeError):
+            _answer(router)
+
+
+class TestHedgeSelection:
+    """Test when hedging applies."""
+
+    def test_confident_haiku_not_hedged(self, tracker):
+        local = FakeClient(["Local answer here. "])
+        haiku = FakeClient(["Haiku answer. "])
+        router = _router(local, haiku, confidence=0.9)
+        assert _answer(router) == "Haiku answer. "
+        assert router.hedge_stats() == {}
+
+    def test_disabled_by_default(self, tracker):
+        router = _router(FakeClient(["Local answer here. "]), FakeClient(["Haiku answer. "]), enable_hedging=False)
+        assert _answer(router) == "Haiku answer. "
+        assert router.format_hedge_stats() == ""
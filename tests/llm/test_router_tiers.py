@@ -0,0 +1,38 @@
+"""
+Tests for ATLASRouter tiers on recorded utterances.
+
+Tests:
+- Labelled utterances reaching the embedding stage get their tier
+  (needs the embedding model; see scripts/calibrate_router.py)
+"""
+
+import pytest
+
+# atlas.llm imports the API clients
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk", "numpy"):
+    pytest.importorskip(_module)
+pytest.importorskip("sentence_transformers")
+
+from atlas.llm.router import ATLASRouter, RouterConfig, Tier  # noqa: E402
+from tests.fixtures.utterances import ROUTING_TIERS, load_utterances  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def router():
+    router = ATLASRouter(config=RouterConfig(enable_response_cache=False))
+    try:
+        router.nearest_tier("warm up")
+    except Exception as e:  # Model not downloaded and no network
+        pytest.skip(f"Embedding model unavailable: {e}")
+    return router
+
+
+def test_labels_are_recorded_utterances():
+    assert set(ROUTING_TIERS) <= set(load_utterances())
+
+
+@pytest.mark.parametrize("text, tier", sorted(ROUTING_TIERS.items()))
+def test_labelled_tier(router, text, tier):
+    decision = router.classify(text)
+    assert decision.bypass_reason is None  # Decided by the embedding stage
+    assert decision.tier == Tier(tier)
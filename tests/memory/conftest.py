@@ -0,0 +1,53 @@
+"""Shared fixtures for memory store tests."""
+
+import sqlite3
+
+import pytest
+
+from atlas.memory import embeddings
+from atlas.memory.embeddings import EmbeddingService
+from atlas.memory.store import MemoryStore
+from tests.memory.test_embeddings import FakeModel
+
+
+def _sqlite_vec_loadable() -> bool:
+    try:
+        import sqlite_vec
+        probe = sqlite3.connect(":memory:")
+        probe.enable_load_extension(True)
+        sqlite_vec.load(probe)
+        probe.close()
+        return True
+    except (ImportError, AttributeError, sqlite3.Error):
+        return False
+
+
+SQLITE_VEC_LOADABLE = _sqlite_vec_loadable()
+
+
+class FakeModel384(FakeModel):
+    """FakeModel padded to the vec_semantic dimension."""
+
+    def encode(self, texts, normalize_embeddings=True):
+        vectors = super().encode(texts, normalize_embeddings)
+        return type(vectors)(v + [0.0] * 381 for v in vectors)
+
+
+@pytest.fixture
+def memory_service(monkeypatch):
+    """Install a fake-model service as the process-wide embedding service."""
+    svc = EmbeddingService(model_name="test-model")
+    svc._model = FakeModel384()
+    monkeypatch.setattr(embeddings, "_service", svc)
+    return svc
+
+
+@pytest.fixture
+def store(tmp_path, memory_service):
+    """Initialized MemoryStore on a temp database (needs loadable sqlite-vec)."""
+    if not SQLITE_VEC_LOADABLE:
+        pytest.skip("sqlite-vec extension cannot be loaded")
+    s = MemoryStore(tmp_path / "atlas.db")
+    s.init_db()
+    yield s
+    s.close()
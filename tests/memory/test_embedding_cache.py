@@ -0,0 +1,113 @@
+"""
+Tests for the persistent embedding cache.
+
+Tests:
+- Round trip of float32 vectors keyed by content hash
+- Model-version invalidation on init
+- LRU eviction past max_entries
+- MemoryStore checks the cache before the model
+- Bulk warm-up embeds only what is missing
+"""
+
+import sqlite3
+
+import pytest
+
+from atlas.memory.embeddings import EmbeddingCache, content_hash
+from atlas.memory.store import MemoryStore
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def cache(conn):
+    c = EmbeddingCache(conn, model_name="test-model", max_entries=10)
+    c.init()
+    return c
+
+
+class TestEmbeddingCache:
+    """Test the embedding_cache table."""
+
+    def test_round_trip(self, cache):
+        assert cache.get("morning workouts") is None
+        cache.put("morning workouts", [0.5, -1.25, 3.0])
+        assert cache.get("  morning   workouts ") == [0.5, -1.25, 3.0]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_get_many_preserves_order(self, cache):
+        cache.put_many([("a", [1.0]), ("b", [2.0])])
+        assert cache.get_many(["b", "x", "a", "b"]) == [[2.0], None, [1.0], [2.0]]
+
+    def test_model_change_invalidates(self, conn, cache):
+        cache.put("sleep", [1.0, 2.0])
+        other = EmbeddingCache(conn, model_name="other-model")
+        assert other.init() == 1
+        assert other.get("sleep") is None
+        assert len(other) == 0
+
+    def test_eviction_keeps_recently_used(self, conn, cache):
+        for i in range(10):
+            cache.put(f"text {i}", [float(i)])
+        conn.execute("UPDATE embedding_cache SET last_used = 0")  # all equally old
+        assert cache.get("text 0") == [0.0]  # touched on the next put
+        cache.put("text 10", [10.0])
+        assert len(cache) == 9
+        assert cache.get("text 0") == [0.0]
+        assert cache.evicted == 2
+
+    def test_key_is_normalized_sha256(self):
+        assert content_hash("a  b") == content_hash(" a b ")
+        assert len(content_hash("a")) == 64
+
+
+class TestStoreIntegration:
+    """Test MemoryStore use of the cache."""
+
+    def test_add_memory_reuses_cached_vector(self, store, memory_service):
+        store.embed_content("User prefers morning workouts")
+        memory_service.clear_cache()
+        memory_service._model.calls.clear()
+        store.add_memory("User prefers morning workouts")
+        assert memory_service._model.calls == []
+
+    def test_query_embeddings_are_cached(self, store, memory_service):
+        first = store.embed_query("best workout")
+        memory_service.clear_cache()
+        assert store.embed_query("best workout") == first
+        assert len(memory_service._model.calls) == 1
+
+    def test_cache_survives_reopen(self, tmp_path, store, memory_service):
+        store.embed_content("persisted text")
+        store.close()
+        memory_service.clear_cache()
+        memory_service._model.calls.clear()
+        reopened = MemoryStore(tmp_path / "atlas.db")
+        reopened.embed_content("persisted text")
+        reopened.close()
+        assert memory_service._model.calls == []
+
+    def test_warm_embeds_only_missing(self, store, memory_service):
+        ids = [
+            store.add_memory(f"memory {i}", embedding=[0.0] * 384)
+            for i in range(5)
+        ]
+        store.embed_content("memory 0")
+        memory_service._model.calls.clear()
+        memory_service.clear_cache()
+
+        store.conn.execute("DELETE FROM vec_semantic WHERE memory_id = ?", (ids[-1],))
+        report = store.warm_embeddings(batch_size=2)
+
+        assert report["scanned"] == len(ids)
+        assert report["cached"] == 1
+        assert report["embedded"] == 4
+        assert report["indexed"] == 1
+        assert all(len(batch) <= 2 for batch in memory_service._model.calls)
+        assert store.warm_embeddings()["embedded"] == 0
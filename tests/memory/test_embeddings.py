@@ -0,0 +1,129 @@
+"""
+Tests for the shared embedding service.
+
+Tests:
+- LRU cache keyed by normalized text
+- Concurrent embed() calls coalesced into one encode()
+- embed_many batches only cache misses
+- Encode errors reach every waiting caller
+- BGEEmbedder facade shares the service
+"""
+
+import threading
+
+import pytest
+
+from atlas.memory.embeddings import BGEEmbedder, EmbeddingService, normalize_text
+
+
+class _Vectors(list):
+    """Stand-in for the ndarray returned by SentenceTransformer.encode."""
+
+    def tolist(self):
+        return [list(v) for v in self]
+
+
+class FakeModel:
+    """Deterministic 3-dim 'model' that records encode() calls."""
+
+    def __init__(self, delay: threading.Event | None = None):
+        self.calls: list[list[str]] = []
+        self.delay = delay
+
+    def encode(self, texts, normalize_embeddings=True):
+        if self.delay is not None:
+            self.delay.wait(timeout=2)
+        self.calls.append(list(texts))
+        return _Vectors([float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts)
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+
+@pytest.fixture
+def service():
+    svc = EmbeddingService(model_name="test-model", cache_size=3, batch_window_ms=20)
+    svc._model = FakeModel()
+    return svc
+
+
+class TestCache:
+    """Test LRU cache behaviour."""
+
+    def test_normalize_text(self):
+        assert normalize_text("  what's   my\tworkout \n") == "what's my workout"
+
+    def test_repeat_is_cache_hit(self, service):
+        first = service.embed("how did I sleep")
+        second = service.embed("  how did  I sleep ")
+        assert first == second
+        assert len(service._model.calls) == 1
+        assert service.stats.cache_hits == 1
+        assert service.stats.cache_misses == 1
+
+    def test_lru_eviction(self, service):
+        for text in ["a", "b", "c"]:
+            service.embed(text)
+        service.embed("a")  # refresh 'a'
+        service.embed("d")  # evicts 'b'
+        service.embed("a")
+        service.embed("b")
+        assert [c for c in service._model.calls] == [["a"], ["b"], ["c"], ["d"], ["b"]]
+
+
+class TestBatching:
+    """Test request coalescing."""
+
+    def test_concurrent_calls_share_one_encode(self):
+        gate = threading.Event()
+        svc = EmbeddingService(model_name="test-model", batch_window_ms=200)
+        svc._model = FakeModel(delay=gate)
+        results = {}
+
+        def worker(text):
+            results[text] = svc.embed(text)
+
+        threads = [threading.Thread(target=worker, args=(f"query {i}",)) for i in range(8)]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(results) == 8
+        assert sum(len(c) for c in svc._model.calls) == 8
+        assert len(svc._model.calls) < 8
+        assert svc.stats.max_batch_size > 1
+
+    def test_embed_many_encodes_only_misses(self, service):
+        service.embed("warm")
+        vectors = service.embed_many(["warm", "cold", "cold", "hot"])
+        assert len(vectors) == 4
+        assert vectors[1] == vectors[2]
+        assert service._model.calls[-1] == ["cold", "hot"]
+
+    def test_encode_error_reaches_caller(self):
+        class Broken:
+            def encode(self, texts, normalize_embeddings=True):
+                raise RuntimeError("model offline")
+
+        svc = EmbeddingService(model_name="test-model")
+        svc._model = Broken()
+        with pytest.raises(RuntimeError, match="model offline"):
+            svc.embed("anything")
+
+
+class TestFacade:
+    """Test BGEEmbedder routes through the service."""
+
+    def test_query_prefix_only_for_bge(self, service):
+        assert service.query_instruction == ""
+        bge = EmbeddingService(model_name="BAAI/bge-small-en-v1.5")
+        assert bge.query_instruction == BGEEmbedder.QUERY_INSTRUCTION
+
+    def test_embedder_uses_service(self, service):
+        embedder = BGEEmbedder(service=service)
+        result = embedder.embed("note")
+        assert result.embedding == service.embed("note")
+        assert embedder.embed_batch(["note"]) == [result.embedding]
+        assert len(service._model.calls) == 1
@@ -0,0 +1,269 @@
+"""
+Tests for MemoryStore.
+
+Tests:
+- Bulk ingestion: IDs, FTS/vector indexing, batching, trigger restored
+- Single-statement hybrid search: identical to the Python fusion, filters
+- Salience ranking: memory_decay maintenance, importance/recency blend
+- Write-behind access counts: deferred, batched, flushed on threshold/interval/close
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from atlas.memory.store import AccessTracker, MemoryStore, SalienceWeights
+
+
+class TestBulkIngest:
+    """Test add_memories_bulk."""
+
+    def test_ids_match_rows_in_input_order(self, store):
+        store.add_memory("existing memory", embedding=[0.0] * 384)
+        report = store.add_memories_bulk(
+            (f"bulk memory {i}" for i in range(7)), batch_size=3
+        )
+        assert report.rows == 7
+        assert report.batches == 3
+        for i, memory_id in enumerate(report.ids):
+            assert store.get_memory(memory_id).content == f"bulk memory {i}"
+
+    def test_dict_items_keep_metadata(self, store):
+        report = store.add_memories_bulk([
+            {"content": "likes oats", "importance": 0.9, "memory_type": "preference", "source": "import"},
+        ])
+        memory = store.get_memory(report.ids[0])
+        assert (memory.importance, memory.memory_type, memory.source) == (0.9, "preference", "import")
+
+    def test_rows_are_searchable(self, store):
+        report = store.add_memories_bulk(["deadlift form cues", "sleep hygiene notes"])
+        fts = store.search_fts("deadlift")
+        assert [r.memory.id for r in fts] == [report.ids[0]]
+        vec = store.search_vector(store.embed_content("sleep hygiene notes"), limit=1)
+        assert vec[0].memory.id == report.ids[1]
+
+    def test_batches_embed_in_one_call(self, store, memory_service):
+        memory_service._model.calls.clear()
+        report = store.add_memories_bulk([f"text {i}" for i in range(10)], batch_size=5)
+        assert [len(c) for c in memory_service._model.calls] == [5, 5]
+        assert report.embedded == 10
+
+    def test_trigger_restored_and_ids_continue(self, store):
+        store.add_memories_bulk(["first"])
+        memory_id = store.add_memory("after bulk", embedding=[0.0] * 384)
+        assert [r.memory.id for r in store.search_fts("after")] == [memory_id]
+
+    def test_ids_skip_deleted_autoincrement_values(self, store):
+        last = store.add_memory("to delete", embedding=[0.0] * 384)
+        store.delete_memory(last)
+        report = store.add_memories_bulk(["next"])
+        assert report.ids == [last + 1]
+
+    def test_failed_batch_rolls_back(self, store):
+        with pytest.raises(Exception):
+            store.add_memories_bulk([{"content": "bad", "importance": 5.0}])
+        assert store.conn.execute("SELECT COUNT(*) FROM semantic_memory").fetchone()[0] == 0
+        trigger = store.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'semantic_memory_ai'"
+        ).fetchone()
+        assert trigger is not None
+
+
+def _vector(rng: random.Random) -> list[float]:
+    # Coarse values so some distances tie exactly
+    return [rng.choice([0.0, 0.5, 1.0]) for _ in range(4)] + [0.0] * 380
+
+
+@pytest.fixture
+def populated(store):
+    rng = random.Random(7)
+    words = ["workout", "sleep", "protein", "recovery", "knee", "squat"]
+    store.add_memories_bulk(
+        {
+            "content": " ".join(rng.choice(words) for _ in range(3)),
+            "importance": rng.choice([0.2, 0.5, 0.9]),
+            "memory_type": rng.choice(["fact", "preference"]),
+            "embedding": _vector(rng),
+        }
+        for _ in range(300)
+    )
+    return store
+
+
+class TestHybridSearch:
+    """Test the single-statement RRF hybrid search."""
+
+    @pytest.mark.parametrize("query", ["workout", "sleep OR knee", "protein squat", "missing"])
+    @pytest.mark.parametrize("limit", [1, 5, 20])
+    def test_matches_python_fusion(self, populated, query, limit):
+        embedding = _vector(random.Random(query))
+        expected = populated._search_hybrid_python(query, embedding, limit=limit)
+        actual = populated.search_hybrid(query, embedding, limit=limit)
+        assert [(r.memory.id, r.score) for r in actual] == [(r.memory.id, r.score) for r in expected]
+        assert all(r.match_type == "hybrid" for r in actual)
+
+    def test_fts_only_matches_python_fusion(self, populated):
+        expected = populated._search_hybrid_python("recovery", None, limit=10)
+        actual = populated.search_hybrid("recovery", None, limit=10)
+        assert [(r.memory.id, r.score) for r in actual] == [(r.memory.id, r.score) for r in expected]
+
+    def test_weight_extremes(self, populated):
+        embedding = _vector(random.Random(1))
+        for weight in (0, 1):
+            expected = populated._search_hybrid_python("knee", embedding, vector_weight=weight)
+            actual = populated.search_hybrid("knee", embedding, vector_weight=weight)
+            assert [r.memory.id for r in actual] == [r.memory.id for r in expected]
+
+    def test_filters(self, populated):
+        results = populated.search_hybrid(
+            "workout", _vector(random.Random(2)), limit=50,
+            memory_type="preference", min_importance=0.5,
+        )
+        assert results
+        assert all(r.memory.memory_type == "preference" for r in results)
+        assert all(r.memory.importance >= 0.5 for r in results)
+
+    def test_date_range(self, populated):
+        memory_id = populated.add_memory("workout from last year", embedding=[0.0] * 384)
+        populated.conn.execute(
+            "UPDATE semantic_memory SET created_at = '2020-01-01 08:00:00' WHERE id = ?", (memory_id,)
+        )
+        old = populated.search_hybrid("workout", limit=500, created_before=datetime(2021, 1, 1))
+        assert [r.memory.id for r in old] == [memory_id]
+        recent = populated.search_hybrid(
+            "workout", limit=500, created_after=datetime.now() - timedelta(days=1)
+        )
+        assert memory_id not in [r.memory.id for r in recent]
+
+
+def _decay(store, memory_id):
+    return store.conn.execute(
+        "SELECT touched_at, frequency FROM memory_decay WHERE memory_id = ?", (memory_id,)
+    ).fetchone()
+
+
+class TestSalience:
+    """Test memory_decay maintenance and salience-ranked hybrid search."""
+
+    def test_decay_rows_follow_writes(self, store):
+        single = store.add_memory("knee felt fine", embedding=[0.0] * 384)
+        bulk = store.add_memories_bulk(["knee felt sore"]).ids[0]
+        for memory_id in (single, bulk):
+            touched_at, frequency = _decay(store, memory_id)
+            assert abs(touched_at - datetime.now().timestamp()) < 86400
+            assert frequency == 0
+        store.delete_memory(single)
+        assert _decay(store, single) is None
+
+    def test_access_refreshes_decay(self, store):
+        memory_id = store.add_memory("squat form notes", embedding=[0.0] * 384)
+        store.conn.execute("UPDATE memory_decay SET touched_at = 0 WHERE memory_id = ?", (memory_id,))
+        store.get_memory(memory_id)
+        store.flush_access_counts()
+        touched_at, frequency = _decay(store, memory_id)
+        assert touched_at > 0
+        assert frequency == pytest.approx(1 / 5)
+
+    def test_backfill_on_existing_database(self, store):
+        memory_id = store.add_memory("protein target", embedding=[0.0] * 384)
+        store.conn.executescript(
+            """
+            DROP TRIGGER memory_decay_ai;
+            DROP TRIGGER memory_decay_au;
+            DROP TRIGGER memory_decay_ad;
+            DROP TABLE memory_decay;
+            """
+        )
+        store.init_db()
+        assert _decay(store, memory_id) is not None
+
+    def test_default_mode_unchanged(self, populated):
+        embedding = _vector(random.Random(3))
+        plain = populated.search_hybrid("sleep", embedding, limit=10)
+        explicit = populated.search_hybrid("sleep", embedding, limit=10, salience=False)
+        assert [(r.memory.id, r.score) for r in plain] == [(r.memory.id, r.score) for r in explicit]
+
+    def test_importance_and_recency_break_relevance_ties(self, store):
+        stale = store.add_memory("recovery day plan", importance=0.9, embedding=[0.0] * 384)
+        low = store.add_memory("recovery day plan", importance=0.1, embedding=[0.0] * 384)
+        fresh = store.add_memory("recovery day plan", importance=0.9, embedding=[0.0] * 384)
+        store.conn.execute("UPDATE memory_decay SET touched_at = 0 WHERE memory_id = ?", (stale,))
+
+        results = store.search_hybrid("recovery", limit=3, salience=True)
+        assert [r.memory.id for r in results] == [fresh, stale, low]
+
+    def test_salience_reranks_beyond_limit(self, populated):
+        embedding = _vector(random.Random(4))
+        # Last of the FTS candidates a limit=5 search fuses
+        boosted = populated.search_fts("workout", limit=10)[-1].memory.id
+        assert boosted not in [r.memory.id for r in populated.search_hybrid("workout", embedding, limit=5)]
+        populated.conn.execute("UPDATE semantic_memory SET importance = 1.0 WHERE id = ?", (boosted,))
+        populated.conn.execute("UPDATE semantic_memory SET importance = 0.0 WHERE id != ?", (boosted,))
+
+        weights = SalienceWeights(relevance=0.1, importance=0.9, recency=0, frequency=0)
+        results = populated.search_hybrid("workout", embedding, limit=5, salience=weights)
+        assert len(results) == 5
+        assert results[0].memory.id == boosted
+
+
+def _stored_count(store, memory_id):
+    return store.conn.execute(
+        "SELECT access_count FROM semantic_memory WHERE id = ?", (memory_id,)
+    ).fetchone()[0]
+
+
+class TestAccessTracker:
+    """Test deferred get_memory access counting."""
+
+    def test_reads_do_not_write_until_due(self, store):
+        memory_id = store.add_memory("morning run", embedding=[0.0] * 384)
+        counts = [store.get_memory(memory_id).access_count for _ in range(3)]
+        assert counts == [1, 2, 3]
+        assert _stored_count(store, memory_id) == 0
+        assert not store.conn.in_transaction
+
+        assert store.flush_access_counts() == 1
+        assert _stored_count(store, memory_id) == 3
+        assert store.get_memory(memory_id).access_count == 4
+
+    def test_threshold_flushes_in_one_batch(self, store):
+        store.access_tracker = AccessTracker(max_pending=4)
+        ids = store.add_memories_bulk(["a", "b"]).ids
+        for memory_id in (ids[0], ids[1], ids[0]):
+            store.get_memory(memory_id)
+        assert _stored_count(store, ids[0]) == 0
+        store.get_memory(ids[1])
+        assert (_stored_count(store, ids[0]), _stored_count(store, ids[1])) == (2, 2)
+        assert store.access_tracker.pending(ids[0]) == 0
+
+    def test_interval_flushes_on_next_access(self, store, monkeypatch):
+        store.access_tracker = AccessTracker(flush_interval=5.0)
+        memory_id = store.add_memory("stretching", embedding=[0.0] * 384)
+        clock = [100.0]
+        monkeypatch.setattr("atlas.memory.store.time.monotonic", lambda: clock[0])
+        store.get_memory(memory_id)
+        assert _stored_count(store, memory_id) == 0
+        clock[0] += 5.0
+        store.get_memory(memory_id)
+        assert _stored_count(store, memory_id) == 2
+
+    def test_close_flushes(self, store):
+        memory_id = store.add_memory("hydration", embedding=[0.0] * 384)
+        store.get_memory(memory_id)
+        store.close()
+        with MemoryStore(store.db_path) as reopened:
+            assert _stored_count(reopened, memory_id) == 1
+
+    def test_deleted_memory_is_dropped(self, store):
+        memory_id = store.add_memory("old note", embedding=[0.0] * 384)
+        store.get_memory(memory_id)
+        store.delete_memory(memory_id)
+        assert store.access_tracker.pending(memory_id) == 0
+        assert store.flush_access_counts() == 0
+
+    def test_access_update_skips_fts_reindex(self, store):
+        trigger = store.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'semantic_memory_au'"
+        ).fetchone()[0]
+        assert "UPDATE OF content" in trigger
@@ -1,4 +1,7 @@
 """Tests for hooks.py - ATLAS Hook Framework basics."""
+import asyncio
+from pathlib import Path
+
 import pytest
 
 
@@ -241,3 +244,136 @@ class TestRunHookFunction:
         from atlas.orchestrator.hooks import run_hook
 
         assert callable(run_hook)
+
+
+# =============================================================================
+# In-process / concurrent execution
+# =============================================================================
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CONTENT_HOOKS = ["qc_brief", "qc_safety", "qc_montessori", "qc_hook_token", "qc_script"]
+
+# One content pipeline item: brief fields plus the script scenes
+CONTENT_INPUT = {
+    "title": "Tummy Time for Newborns",
+    "hook_text": "Your baby can build core strength from day one!",
+    "age_range": "0-6m",
+    "target_length": "60s",
+    "montessori_principle": "freedom_of_movement",
+    "content_pillar": "movement",
+    "format_type": "60s",
+    "scenes": [
+        {"number": 1, "vo_text": "Your baby can build core strength from day one! Lay them on a soft mat."},
+        {"number": 2, "vo_text": "Stay close and watch as they lift their head, it's hard work for them."},
+        {"number": 3, "vo_text": "Start with a minute or two, a few times a day, and build up slowly."},
+    ],
+}
+
+
+@pytest.fixture
+def content_hooks(monkeypatch):
+    """Point the stdin content hooks at this checkout."""
+    import copy
+    from atlas.orchestrator.hooks import HookRunner
+
+    hooks = copy.deepcopy(HookRunner.HOOKS)
+    repo_hooks = {name: hooks["babybrains_content"][name] for name in CONTENT_HOOKS}
+    for config in repo_hooks.values():
+        config["cwd"] = str(REPO_ROOT)
+    monkeypatch.setattr(HookRunner, "HOOKS", {"babybrains_content": repo_hooks})
+    return repo_hooks
+
+
+def _run_all(runner, input_data=CONTENT_INPUT, **kwargs):
+    from atlas.orchestrator.hooks import HookTiming
+
+    return asyncio.run(runner.run_all_for_timing(
+        "babybrains_content", HookTiming.POST_EXECUTION, input_data=input_data, **kwargs
+    ))
+
+
+def _comparable(result):
+    issues = [(i.code, i.severity) for i in result.issues]
+    return result.hook_name, result.passed, result.blocking, result.exit_code, issues, result.raw_output
+
+
+class TestInProcessExecution:
+    """Test the in-process, concurrent hook execution mode."""
+
+    def test_same_results_as_subprocess(self, content_hooks):
+        """In-process hooks keep the JSON contract and blocking semantics."""
+        from atlas.orchestrator.hooks import HookExecution, HookRunner
+
+        spawned = _run_all(HookRunner(), stop_on_block=False)
+        in_process = _run_all(HookRunner(HookExecution.IN_PROCESS, max_concurrency=4), stop_on_block=False)
+
+        assert [_comparable(r) for r in in_process] == [_comparable(r) for r in spawned]
+        assert [r.hook_name for r in in_process] == CONTENT_HOOKS
+        assert all(r.duration_ms > 0 for r in spawned + in_process)
+
+    def test_stop_on_block_matches_sequential(self, content_hooks):
+        """Concurrent runs stop at the first blocking failure in definition order."""
+        from atlas.orchestrator.hooks import HookExecution, HookRunner
+
+        failing = dict(CONTENT_INPUT, title="", scenes=[])  # qc_brief and later hooks fail
+        sequential = _run_all(HookRunner(HookExecution.IN_PROCESS), input_data=failing)
+        concurrent = _run_all(HookRunner(HookExecution.IN_PROCESS, max_concurrency=4), input_data=failing)
+
+        assert [r.hook_name for r in sequential] == ["qc_brief"]
+        assert [_comparable(r) for r in concurrent] == [_comparable(r) for r in sequential]
+
+    def test_in_process_timeout(self, content_hooks):
+        """A slow in-process hook times out without blocking the others."""
+        import time
+        import types
+        from atlas.orchestrator.hooks import HookExecution, HookRunner
+
+        runner = HookRunner(HookExecution.IN_PROCESS, max_concurrency=4)
+        slow = types.ModuleType("slow_hook")
+        slow.run_hook = lambda input_json: time.sleep(0.5) or {"pass": True, "issues": []}
+        runner._modules["atlas.babybrains.content.hooks.qc_safety"] = slow
+
+        results = _run_all(runner, stop_on_block=False, timeout=0.1)
+
+        by_name = {r.hook_name: r for r in results}
+        assert [i.code for i in by_name["qc_safety"].issues] == ["TIMEOUT"]
+        assert by_name["qc_safety"].blocking is True
+        assert by_name["qc_brief"].passed is True
+
+    def test_args_hooks_still_spawned(self):
+        """Only stdin hooks that are atlas modules run in process."""
+        from atlas.orchestrator.hooks import HookExecution, HookRunner
+
+        runner = HookRunner(HookExecution.IN_PROCESS)
+        hooks = HookRunner.HOOKS
+        assert runner._in_process_module(hooks["babybrains_content"]["qc_brief"]) is not None
+        assert runner._in_process_module(hooks["babybrains_content"]["qc_audio"]) is None
+        assert runner._in_process_module(hooks["knowledge"]["activity_qc"]) is None
+        assert HookRunner()._in_process_module(hooks["babybrains_content"]["qc_brief"]) is None
+
+
+@pytest.mark.benchmark
+class TestQCLatencyBenchmark:
+    """Total QC latency for one content pipeline item, both execution modes.
+
+    Opt-in; run with output to see timings:
+        pytest tests/orchestrator/test_hooks.py -m benchmark -s
+    """
+
+    def test_benchmark_content_qc(self, content_hooks):
+        import time
+        from atlas.orchestrator.hooks import HookExecution, HookRunner
+
+        timings = {}
+        for label, runner in [
+            ("subprocess, sequential", HookRunner()),
+            ("in process, concurrent", HookRunner(HookExecution.IN_PROCESS, max_concurrency=4)),
+        ]:
+            _run_all(runner, stop_on_block=False)  # Warm up (imports, page cache)
+            start = time.perf_counter()
+            results = _run_all(runner, stop_on_block=False)
+            timings[label] = (time.perf_counter() - start) * 1000
+            per_hook = ", ".join(f"{r.hook_name} {r.duration_ms:.0f}ms" for r in results)
+            print(f"\n  [{label}] total {timings[label]:.0f}ms ({per_hook})")
+
+        assert timings["in process, concurrent"] * 3 < timings["subprocess, sequential"]
@@ -0,0 +1,199 @@
+"""
+Tests for concurrent batch conversion (run_batch with workers > 1).
+
+Runs the real conversion flow against FakeSkillExecutor (conftest.py),
+so no model is called.
+
+Tests cover:
+- Run state machine transitions
+- Skill call limiter: concurrency cap and start spacing
+- Concurrent results match sequential, recorded in pending order
+- Retries rejoin the back of the queue
+- Skill subprocesses stay under the global limit
+- Quit during review resets in-flight activities to PENDING
+- Throughput benchmark at 1, 4 and 8 workers
+
+The throughput benchmark is opt-in; run it with output to see throughput:
+    pytest tests/pipelines/test_batch_concurrency.py -m benchmark -s
+"""
+
+import asyncio
+import shutil
+import time
+
+import pytest
+
+from atlas.pipelines.activity_conversion import (
+    ActivityRun,
+    ActivityStatus,
+    RunState,
+    SkillCallLimiter,
+)
+from tests.pipelines.conftest import BATCH_SIZE, stage_activities
+
+RAW_IDS = [f"fake-{n:02d}" for n in range(1, BATCH_SIZE + 1)]
+
+
+def progress_statuses(pipeline) -> dict[str, str]:
+    """Statuses as written to the progress file (re-parsed from disk)."""
+    pipeline.progress_data = {}
+    pipeline._parse_progress_file()
+    return {raw_id: data["status"] for raw_id, data in pipeline.progress_data.items()}
+
+
+class TestRunState:
+    """Per-activity state machine."""
+
+    def test_retry_path(self):
+        run = ActivityRun(index=0, raw_id="fake-01", max_retries=2)
+        for state in (RunState.CONVERTING, RunState.REFLECTING, RunState.RETRY_QUEUED,
+                      RunState.CONVERTING, RunState.FINISHED, RunState.RECORDED):
+            run.advance(state)
+        assert run.history[0] is RunState.QUEUED
+        assert run.state is RunState.RECORDED
+
+    def test_invalid_transition(self):
+        run = ActivityRun(index=0, raw_id="fake-01", max_retries=2)
+        with pytest.raises(RuntimeError, match="queued -> finished"):
+            run.advance(RunState.FINISHED)
+
+
+@pytest.mark.asyncio
+class TestSkillCallLimiter:
+    """Global skill subprocess limit."""
+
+    async def test_concurrency_cap(self):
+        limiter = SkillCallLimiter(max_concurrent=2)
+
+        async def call():
+            async with limiter:
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert (limiter.calls, limiter.peak) == (6, 2)
+
+    async def test_start_spacing(self):
+        limiter = SkillCallLimiter(max_concurrent=4, calls_per_minute=1200)  # 50ms apart
+        starts = []
+
+        async def call():
+            async with limiter:
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(call() for _ in range(3)))
+        assert starts[2] - starts[0] >= 0.09
+
+    async def test_rejects_zero(self):
+        with pytest.raises(ValueError):
+            SkillCallLimiter(max_concurrent=0)
+
+
+@pytest.mark.asyncio
+class TestConcurrentBatch:
+    """run_batch with several workers."""
+
+    async def test_matches_sequential(self, batch_pipeline, fake_skill_executor, tmp_path):
+        fake_skill_executor.grades = {"fake-02": ["B", "A"], "fake-05": ["B"]}
+        sequential = await batch_pipeline.run_batch(limit=BATCH_SIZE, auto_approve=True)
+        sequential_progress = progress_statuses(batch_pipeline)
+
+        concurrent_root = tmp_path / "concurrent"
+        concurrent_root.mkdir()
+        stage_activities(batch_pipeline, concurrent_root, RAW_IDS)
+        shutil.rmtree(tmp_path / ".atlas")  # No cached transforms from the sequential run
+        fake_skill_executor.elevations.clear()
+        concurrent = await batch_pipeline.run_batch(
+            limit=BATCH_SIZE, auto_approve=True, workers=4, skill_calls_per_minute=0)
+
+        assert [r.activity_id for r in concurrent.results] == RAW_IDS
+        assert [r.status for r in concurrent.results] == [r.status for r in sequential.results]
+        assert progress_statuses(batch_pipeline) == sequential_progress
+        assert sequential_progress["fake-05"] == ActivityStatus.REVISION_NEEDED.value
+        assert (concurrent.completed, concurrent.revision_needed) == (BATCH_SIZE - 1, 1)
+        assert len(list((concurrent_root / "canonical" / "movement").glob("*.yaml"))) == BATCH_SIZE - 1
+
+    async def test_progress_recorded_in_pending_order(self, batch_pipeline, fake_skill_executor):
+        fake_skill_executor.latency_s = 0.001
+        fake_skill_executor.latency_for = {"fake-01": 0.1}  # Finishes last
+        written = []
+        update = batch_pipeline._update_progress_file
+
+        def record(raw_id, status, notes=""):
+            if status is not ActivityStatus.IN_PROGRESS:
+                written.append(raw_id)
+            return update(raw_id, status, notes)
+
+        batch_pipeline._update_progress_file = record
+        result = await batch_pipeline.run_batch(
+            limit=BATCH_SIZE, auto_approve=True, workers=4, skill_calls_per_minute=0)
+
+        finished = [raw_id for raw_id, stage in fake_skill_executor.calls
+                    if stage == "quality_audit"]
+        assert finished[-1] == "fake-01"
+        assert written == RAW_IDS
+        assert [r.activity_id for r in result.results] == RAW_IDS
+
+    async def test_retry_rejoins_queue(self, batch_pipeline, fake_skill_executor):
+        fake_skill_executor.latency_s = 0.001
+        fake_skill_executor.grades = {"fake-01": ["B", "A"]}
+        await batch_pipeline.run_batch(
+            limit=BATCH_SIZE, auto_approve=True, workers=2, skill_calls_per_minute=0)
+
+        calls = fake_skill_executor.calls
+        retry = [i for i, call in enumerate(calls) if call == ("fake-01", "elevate_voice_activity")][1]
+        last_start = calls.index((RAW_IDS[-1], "ingest_activity"))
+        # Every activity started its first attempt before the retry ran
+        assert last_start < retry
+        assert fake_skill_executor.elevations["fake-01"] == 2
+        assert progress_statuses(batch_pipeline)["fake-01"] == ActivityStatus.DONE.value
+
+    async def test_skill_calls_limited(self, batch_pipeline, fake_skill_executor):
+        fake_skill_executor.latency_s = 0.002
+        await batch_pipeline.run_batch(
+            limit=BATCH_SIZE, auto_approve=True, workers=8,
+            max_skill_calls=3, skill_calls_per_minute=0)
+        assert fake_skill_executor.max_in_flight == 3
+
+    async def test_quit_resets_in_flight(self, batch_pipeline, fake_skill_executor):
+        fake_skill_executor.latency_s = 0.001
+        decisions = iter(["approve", "quit"])
+        batch_pipeline.present_for_review = lambda result, content: next(decisions)
+
+        result = await batch_pipeline.run_batch(
+            limit=BATCH_SIZE, workers=4, skill_calls_per_minute=0)
+
+        statuses = progress_statuses(batch_pipeline)
+        assert statuses["fake-01"] == ActivityStatus.DONE.value
+        assert ActivityStatus.IN_PROGRESS.value not in statuses.values()
+        assert [r.activity_id for r in result.results] == ["fake-01"]
+        assert batch_pipeline._active_activity_ids == set()
+
+    async def test_workers_must_be_positive(self, batch_pipeline):
+        with pytest.raises(ValueError):
+            await batch_pipeline.run_batch(workers=0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestBatchThroughput:
+    """Batch throughput on the fake executor with skill-like latency."""
+
+    async def test_batch_throughput(self, batch_pipeline, fake_skill_executor, tmp_path):
+        fake_skill_executor.latency_s = 0.05
+        rates = {}
+        for workers in (1, 4, 8):
+            root = tmp_path / f"workers-{workers}"
+            root.mkdir()
+            # Fresh IDs each run so no cached transform is reused
+            stage_activities(batch_pipeline, root, [f"w{workers}-{raw_id}" for raw_id in RAW_IDS])
+            started = time.perf_counter()
+            result = await batch_pipeline.run_batch(
+                limit=BATCH_SIZE, auto_approve=True, workers=workers,
+                max_skill_calls=8, skill_calls_per_minute=0)
+            rates[workers] = BATCH_SIZE / (time.perf_counter() - started)
+            assert result.completed == BATCH_SIZE
+
+        print(f"\nBatch throughput: 1 worker {rates[1]:.1f}/s, "
+              f"4 workers {rates[4]:.1f}/s, 8 workers {rates[8]:.1f}/s")
+        assert rates[4] > rates[1] * 2
+        assert rates[8] > rates[4]
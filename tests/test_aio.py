@@ -0,0 +1,89 @@
+"""
+Tests for the long-lived event loop (atlas.aio).
+
+Tests:
+- Coroutines from sync code run on one persistent loop
+- Turn traces collect spans across the loop and executor threads
+- run() on the loop thread fails instead of deadlocking
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from atlas.aio import LoopThread, TurnTrace, current_trace, span
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread("test-loop")
+    yield loop
+    loop.close()
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+class TestLoopThread:
+    """Test running coroutines on the shared loop."""
+
+    def test_one_loop_for_every_call(self, loop):
+        assert loop.run(_running_loop()) is loop.run(_running_loop()) is loop.loop
+
+    def test_exceptions_propagate(self, loop):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            loop.run(fail())
+        assert loop.run(_running_loop()) is loop.loop  # loop survives
+
+    def test_run_on_loop_thread_raises(self, loop):
+        async def nested():
+            loop.run(_running_loop())
+
+        with pytest.raises(RuntimeError):
+            loop.run(nested())
+
+    def test_close_cancels_pending(self):
+        loop = LoopThread("test-close")
+        future = loop.submit(asyncio.sleep(60))
+        loop.close()
+        assert future.cancelled()
+        assert loop.loop.is_closed()
+
+
+class TestTurnTrace:
+    """Test per-turn spans."""
+
+    def test_spans_follow_the_turn_onto_the_loop(self, loop):
+        def blocking():
+            with span("executor"):
+                time.sleep(0.01)
+
+        async def handler():
+            with span("handler"):
+                await asyncio.to_thread(blocking)
+            return current_trace()
+
+        with loop.turn("PROCESS") as trace:
+            assert loop.run(handler()) is trace
+        assert loop.last_trace is trace
+        assert {s.name for s in trace.spans} == {"handler", "executor"}
+        assert trace.span_ms("handler") >= trace.span_ms("executor") >= 10
+        assert trace.format().startswith("PROCESS ")
+
+    def test_no_trace_outside_a_turn(self, loop):
+        with span("ignored"):
+            pass
+        assert loop.run(asyncio.sleep(0, current_trace())) is None
+
+    def test_format_orders_by_start(self):
+        trace = TurnTrace("turn")
+        start = trace.started
+        trace.add("b", start + 0.002, start + 0.003)
+        trace.add("a", start, start + 0.001)
+        trace.finish()
+        assert trace.format().split(": ")[1] == "a 1ms @0ms | b 1ms @2ms"
@@ -0,0 +1,142 @@
+"""
+Tests for the shared SQLite connection manager (atlas.db).
+
+Tests:
+- One cached connection per thread, database and mode
+- Uniform pragmas and read-only connections
+- close() ends a checkout; the last one rolls back open transactions
+- ATLAS_DB_POOL=0 falls back to a connection per call
+- Connections of exited threads are closed
+- connect() gives private connections
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from atlas import db
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    db.close_all()
+    yield
+    db.close_all()
+
+
+class TestConnectionManager:
+    """Test pooled per-thread connections."""
+
+    def test_same_thread_reuses_connection(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        assert db.get_connection(path) is db.get_connection(str(path))
+        assert db.get_connection(path, readonly=True) is not db.get_connection(path)
+
+    def test_threads_get_their_own_connection(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        main = db.get_connection(path)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.get_connection(path)))
+        thread.start()
+        thread.join()
+        assert other[0] is not main
+
+    def test_exited_thread_connections_closed(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        main = db.get_connection(path)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.get_connection(path)))
+        thread.start()
+        thread.join()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            other[0].execute("SELECT 1")
+        assert db._manager._open == [main]
+
+    def test_pragmas(self, tmp_path):
+        conn = db.get_connection(tmp_path / "atlas.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert conn.row_factory is sqlite3.Row
+
+    def test_readonly_rejects_writes(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        writer = db.get_connection(path)
+        writer.execute("CREATE TABLE t (x INTEGER)")
+        writer.execute("INSERT INTO t VALUES (1)")
+        writer.commit()
+
+        reader = db.get_connection(path, readonly=True)
+        assert reader.execute("SELECT x FROM t").fetchone()["x"] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO t VALUES (2)")
+
+    def test_close_keeps_connection_open(self, tmp_path):
+        conn = db.get_connection(tmp_path / "atlas.db")
+        conn.close()
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_last_close_rolls_back(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        outer = db.get_connection(path)
+        outer.execute("CREATE TABLE t (x INTEGER)")
+        outer.commit()
+        outer.execute("INSERT INTO t VALUES (1)")
+
+        # A nested checkout closing must not discard the outer transaction
+        inner = db.get_connection(path)
+        inner.close()
+        assert outer.in_transaction
+
+        outer.close()
+        assert not outer.in_transaction
+        assert outer.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_pooling_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ATLAS_DB_POOL", "0")
+        path = tmp_path / "atlas.db"
+        conn = db.get_connection(path)
+        assert conn is not db.get_connection(path)
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_close_all(self, tmp_path):
+        conn = db.get_connection(tmp_path / "atlas.db")
+        db.close_all()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert db.get_connection(tmp_path / "atlas.db") is not conn
+
+
+class TestConnect:
+    """Test private connections for long-lived holders."""
+
+    def test_not_pooled(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        conn = db.connect(path)
+        assert conn is not db.get_connection(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_transactions_independent_of_pool(self, tmp_path):
+        path = tmp_path / "atlas.db"
+        private = db.connect(path)
+        private.execute("CREATE TABLE t (x INTEGER)")
+        private.commit()
+        private.execute("INSERT INTO t VALUES (1)")
+
+        # Other code on the thread finishing its checkout must not touch it
+        pooled = db.get_connection(path)
+        pooled.execute("SELECT COUNT(*) FROM t").fetchone()
+        pooled.rollback()
+        pooled.close()
+
+        assert private.in_transaction
+        private.commit()
+        assert db.get_connection(path).execute("SELECT x FROM t").fetchone()["x"] == 1
+        private.close()
@@ -0,0 +1,123 @@
+"""
+Tests for the combined-regex PatternMatcher (atlas.patterns).
+
+Tests:
+- Each match kind agrees with the check it replaces
+- Overlapping labels (and phrases sharing a prefix) are all reported
+- Text normalisation, memoisation and recompilation on add()
+- Agreement with per-pattern matching over the recorded utterance corpus
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from atlas.patterns import PatternMatcher
+from tests.fixtures.utterances import expected_labels, load_utterances
+
+INTENT_PATTERNS_PATH = Path(__file__).parent.parent / "config" / "voice" / "intent_patterns.json"
+
+
+class TestPatternMatcher:
+    """Test the combined regex."""
+
+    def test_kinds(self):
+        matcher = PatternMatcher()
+        matcher.add("search", [r"sleep (score|hours)"])
+        matcher.add("contains", ["stop timer"], kind="contains")
+        matcher.add("prefix", ["log meal"], kind="prefix")
+        matcher.add("exact", ["go"], kind="exact")
+
+        assert matcher.match("what's my sleep score") == {"search"}
+        assert matcher.match("please stop timer") == {"contains"}
+        assert matcher.match("log meal eggs") == {"prefix"}
+        assert matcher.match("i want to log meal") == frozenset()
+        assert matcher.match("go") == {"exact"}
+        assert matcher.match("go now") == frozenset()
+
+    def test_overlapping_labels(self):
+        matcher = PatternMatcher()
+        matcher.add("local", [r"(set|start|stop|pause).*(timer|alarm)"])
+        matcher.add("pause", ["pause", "stop timer"], kind="contains")
+        matcher.add("safety", [r"(emergency|urgent)"])
+        assert matcher.match("Stop timer, urgent") == {"local", "pause", "safety"}
+
+    def test_phrases_sharing_a_prefix(self):
+        # The trie reports the longest phrase; shorter ones come from its prefixes
+        matcher = PatternMatcher()
+        matcher.add("skip", ["skip"], kind="contains")
+        matcher.add("skip_this", ["skip this"], kind="contains")
+        matcher.add("starts_skip", ["ski"], kind="prefix")
+        assert matcher.match("skip this one") == {"skip", "skip_this", "starts_skip"}
+        assert matcher.match("please skip") == {"skip"}
+        assert matcher.match("ski") == {"starts_skip"}
+
+    def test_normalises_text(self):
+        matcher = PatternMatcher()
+        matcher.add("ack", [r"^(yes|ok)$"])
+        matcher.add("go", ["go"], kind="exact")
+        assert matcher.match("  YES \n") == {"ack"}
+        assert matcher.match(" Go ") == {"go"}
+
+    def test_memoises_last_text(self):
+        matcher = PatternMatcher()
+        matcher.add("a", ["alpha"], kind="contains")
+        assert matcher.match("alpha") is matcher.match("alpha")
+        assert matcher.match("beta") == frozenset()
+
+    def test_anchors_and_newlines(self):
+        matcher = PatternMatcher()
+        matcher.add("start", [r"^play"])
+        matcher.add("line", [r"timer.*alarm"])
+        assert matcher.match("music\nplay") == frozenset()
+        assert matcher.match("timer\nalarm") == frozenset()
+        assert matcher.match("context\nset timer and alarm") == {"line"}
+
+    def test_add_recompiles(self):
+        matcher = PatternMatcher()
+        matcher.add("a", ["alpha"], kind="contains")
+        assert matcher.match("alpha beta") == {"a"}
+        matcher.add("b", ["beta"], kind="contains")
+        assert matcher.match("alpha beta") == {"a", "b"}
+        matcher.add("a", [], kind="contains")
+        assert matcher.match("alpha beta") == {"b"}
+
+    def test_copy_is_independent(self):
+        base = PatternMatcher()
+        base.add("a", ["alpha"], kind="contains")
+        extended = base.copy()
+        extended.add("b", ["beta"], kind="contains")
+        assert base.labels == ["a"]
+        assert extended.match("alpha beta") == {"a", "b"}
+
+    def test_first(self):
+        matcher = PatternMatcher()
+        matcher.add("green", ["green day"], kind="contains")
+        matcher.add("red", ["rest day"], kind="contains")
+        assert matcher.first("green day or rest day", ["red", "green"]) == "red"
+        assert matcher.first("normal day", ["red", "green"]) is None
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            PatternMatcher().add("x", ["x"], kind="fuzzy")
+
+
+class TestCorpus:
+    """Combined matching agrees with per-pattern matching on real utterances."""
+
+    def test_intent_config_patterns(self):
+        # Every list in the voice intent config, as regex and as substrings
+        config = json.loads(INTENT_PATTERNS_PATH.read_text())
+        matcher = PatternMatcher()
+        for section, keys in config.items():
+            if section == "metadata":
+                continue
+            for key, patterns in keys.items():
+                if isinstance(patterns, dict):
+                    patterns = [p for v in patterns.values() for p in (v if isinstance(v, list) else [v])]
+                kind = "search" if key.endswith("patterns") and section in ("general", "health") else "contains"
+                matcher.add(f"{section}.{key}", patterns, kind=kind)
+                matcher.add(f"{section}.{key}.prefix", patterns, kind="prefix")
+        for text in load_utterances():
+            assert matcher.match(text) == expected_labels(matcher, text), text
@@ -0,0 +1,119 @@
+"""
+Tests for the TTS audio cache and timer announcements.
+
+Tests:
+- Cache hits skip synthesis; key covers text, voice and speed
+- Entries persist across instances, memory-mapped
+- LRU eviction by total size
+- Pre-render covers the prompts the timer flows speak
+"""
+
+import pytest
+
+# atlas.voice imports the full voice stack
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.health.routine_runner import RoutineConfig  # noqa: E402
+from atlas.voice import announcements  # noqa: E402
+from atlas.voice.audio_cache import AudioCache  # noqa: E402
+from atlas.voice.tts import SynthesisResult  # noqa: E402
+
+
+class FakeTTS:
+    voice = "bm_lewis"
+
+    def __init__(self, samples: int = 2400):
+        self.samples = samples
+        self.calls = []
+
+    def synthesize(self, text, voice=None, speed=1.0):
+        self.calls.append((text, voice, speed))
+        audio = np.full(self.samples, len(text) / 100, dtype=np.float32)
+        return SynthesisResult(audio=audio, sample_rate=24000, duration_ms=150.0, text_length=len(text))
+
+
+class TestAudioCache:
+    """Test lookups, persistence and eviction."""
+
+    def test_hit_skips_synthesis(self, tmp_path):
+        cache = AudioCache(tmp_path)
+        tts = FakeTTS()
+
+        first = cache.synthesize(tts, "Switch sides.")
+        second = cache.synthesize(tts, "Switch sides.")
+        assert len(tts.calls) == 1
+        assert second.sample_rate == 24000
+        np.testing.assert_array_equal(np.asarray(second.audio), first.audio)
+        assert isinstance(second.audio, np.memmap)
+
+        cache.synthesize(tts, "Switch sides.", voice="bf_emma")
+        cache.synthesize(tts, "Switch sides.", speed=1.2)
+        assert len(tts.calls) == 3
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 3, 3)
+        assert stats.as_dict()["hit_rate"] == 0.25
+
+    def test_persists_across_instances(self, tmp_path):
+        AudioCache(tmp_path).synthesize(FakeTTS(), "Exercise complete.")
+        tts = FakeTTS()
+        cache = AudioCache(tmp_path)
+        assert len(cache) == 1
+        cache.synthesize(tts, "Exercise complete.")
+        assert tts.calls == []
+
+    def test_lru_eviction(self, tmp_path):
+        tts = FakeTTS(samples=1000)  # ~4KB per entry
+        cache = AudioCache(tmp_path, max_bytes=10_000)
+        cache.synthesize(tts, "one")
+        cache.synthesize(tts, "two")
+        cache.synthesize(tts, "one")  # two is now least recently used
+        cache.synthesize(tts, "three")
+
+        assert len(cache) == 2
+        assert cache.get("one", "bm_lewis") is not None
+        assert cache.get("two", "bm_lewis") is None
+        assert cache.stats().evictions == 1
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    def test_prerender(self, tmp_path):
+        cache = AudioCache(tmp_path)
+        tts = FakeTTS()
+        cache.synthesize(tts, "Switch sides.")
+        report = cache.prerender(tts, ["Switch sides.", "Exercise complete."])
+        assert (report["phrases"], report["rendered"], report["cached"]) == (2, 1, 1)
+        assert len(tts.calls) == 2
+
+
+class TestAnnouncements:
+    """Test the phrases enumerated for pre-rendering."""
+
+    ROUTINE = RoutineConfig.from_dict({"sections": [
+        {"name": "Feet", "exercises": [
+            {"id": "toe_yoga", "name": "Toe Yoga", "duration_seconds": 30, "cues": ["Big toe up"]},
+            {"id": "calf_stretch", "name": "Calf Stretch", "duration_seconds": 45, "per_side": True},
+        ]},
+        {"name": "Outside", "exercises": [{"id": "sunlight", "name": "Morning Sunlight", "type": "reminder"}]},
+    ]})
+    PROTOCOLS = {"strength_a": {"exercises": [
+        {"id": "goblet_squat", "name": "Goblet Squat", "sets": 3, "reps": 10, "rest_seconds": 90},
+        {"id": "zone2", "name": "Zone 2 Ride", "duration_minutes": 40},
+    ]}}
+    GUIDES = {"calf_stretch": {"name": "Calf Stretch", "setup": "Face a wall.", "cues": ["Heel down."]}}
+
+    def test_covers_timer_prompts(self):
+        phrases = announcements.prerender_phrases(self.ROUTINE, self.PROTOCOLS, self.GUIDES)
+
+        assert "Get ready. Next exercise: Calf Stretch. Face a wall." in phrases
+        assert ("Section complete. Next section: Outside. Get ready. Next exercise: Morning Sunlight."
+                in phrases)
+        assert announcements.routine_go(30) == "Go. 30 seconds." and "Go. 30 seconds." in phrases
+        assert "Go. Left side. 45 seconds." in phrases
+        assert announcements.no_timer_needed("Morning Sunlight") in phrases
+        assert "Next: Goblet Squat. 3 sets of 10. Say ready when set up." in phrases
+        assert "Next: Zone 2 Ride. 40 minutes continuous. Say ready to begin, done when finished." in phrases
+        assert announcements.rest_done(3) in phrases
+        assert announcements.set_complete_rest(2, 90) in phrases
+        assert "Heel down." in phrases and announcements.SWITCH_TO_RIGHT in phrases
+        assert len(phrases) == len(set(phrases))
@@ -0,0 +1,145 @@
+"""
+Tests for the autonomous speech scheduler.
+
+Tests:
+- Replies play ahead of timer prompts; nothing starts during a response
+- Superseded and stale prompts are dropped
+- PLAYBACK_DONE ends the playback wait early
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# atlas.voice imports the full voice stack
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.voice import audio_output  # noqa: E402
+from atlas.voice.audio_output import RESPONSE, AudioOutput  # noqa: E402
+
+RATE = 1000
+
+
+class FakeClient:
+    def __init__(self, seconds: float = 0.0):
+        self.seconds = seconds
+        self.events = []
+        self.lock = threading.Lock()
+
+    def synthesize(self, text):
+        return SimpleNamespace(audio=np.zeros(int(self.seconds * RATE), dtype=np.float32), sample_rate=RATE, text=text)
+
+    def write_audio(self, audio, rate):
+        with self.lock:
+            self.events.append(("audio", len(audio)))
+
+    def write_status(self, status):
+        with self.lock:
+            self.events.append(("status", status))
+
+
+class RecordingOutput(AudioOutput):
+    def __init__(self, client):
+        self.texts = []
+        super().__init__(self._synth(client), client.write_audio, client.write_status, name="test-audio")
+
+    def _synth(self, client):
+        def synthesize(text):
+            self.texts.append(text)
+            return client.synthesize(text)
+        return synthesize
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def output(client, monkeypatch):
+    monkeypatch.setattr(audio_output, "NO_ACK_BUFFER_S", 0.0)
+    output = RecordingOutput(client)
+    yield output
+    output.close()
+
+
+class TestOrdering:
+    """Test priority and the response gate."""
+
+    def test_responses_first(self, output):
+        with output.response():
+            output.speak("Rest done. Set 2.")
+            output.speak("Paused.", priority=RESPONSE)
+            time.sleep(0.05)
+            assert output.texts == []  # held while the response is produced
+        assert output.wait_idle(2)
+        assert output.texts == ["Paused.", "Rest done. Set 2."]
+
+    def test_statuses(self, output, client):
+        output.speak("Switch sides.")
+        assert output.wait_idle(2)
+        assert [e for e in client.events if e[0] == "status"] == [("status", "speaking"), ("status", "DONE")]
+
+
+class TestCoalescing:
+    """Test dropping superseded and stale prompts."""
+
+    def test_same_key_supersedes(self, output):
+        with output.response():
+            output.speak("Exercise complete.", key="routine")
+            output.speak("Go. 30 seconds.", key="routine")
+            output.speak("Rest done. Set 2.", key="workout")
+            output.speak("Skipping.", priority=RESPONSE, key="workout")
+            assert output.pending() == 2
+        assert output.wait_idle(2)
+        assert output.texts == ["Skipping.", "Go. 30 seconds."]
+        assert output.dropped == 2
+
+    def test_replies_are_not_superseded(self, output):
+        with output.response():
+            output.speak("Paused.", priority=RESPONSE, key="routine")
+            output.speak("Switch sides.", key="routine")
+        assert output.wait_idle(2)
+        assert output.texts == ["Paused.", "Switch sides."]
+
+    def test_stale_prompt_dropped(self, output, monkeypatch):
+        monkeypatch.setattr(audio_output, "STALE_AFTER_S", 0.01)
+        with output.response():
+            output.speak("Rest done. Set 2.")
+            output.speak("Paused.", priority=RESPONSE)
+            time.sleep(0.05)
+        assert output.wait_idle(2)
+        assert output.texts == ["Paused."]
+
+
+class TestCompletion:
+    """Test PLAYBACK_DONE acknowledgements."""
+
+    def test_ack_ends_wait(self):
+        client = FakeClient(seconds=5.0)
+        output = RecordingOutput(client)
+        try:
+            output.acks_seen = True
+            output.speak("Get ready. Next exercise: Cat-Cow.")
+            time.sleep(0.05)
+            start = time.monotonic()
+            output.playback_done()
+            assert output.wait_idle(2)
+            assert time.monotonic() - start < 1.0
+            assert client.events[-1] == ("status", "DONE")
+        finally:
+            output.close()
+
+    def test_no_ack_waits_for_duration(self, monkeypatch):
+        monkeypatch.setattr(audio_output, "NO_ACK_BUFFER_S", 0.0)
+        output = RecordingOutput(FakeClient(seconds=0.2))
+        try:
+            start = time.monotonic()
+            output.speak("Switch sides.")
+            assert output.wait_idle(2)
+            assert time.monotonic() - start >= 0.2
+        finally:
+            output.close()
@@ -0,0 +1,194 @@
+"""
+Tests for BridgeFileServer voice turns.
+
+Runs _process_turn against fake STT, TTS and router over a FileTransport
+in a temp directory, so no model is loaded.
+
+Tests:
+- Streamed turn that falls back to the local LLM after the cloud stream fails
+- Streamed turns keep TTS audio with cached answers and replay it as chunks
+- Answers given with conversation context are not cached
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+# atlas.voice imports the full voice stack (and the LLM router)
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk"):
+    pytest.importorskip(_module)
+
+from atlas.llm.response_cache import ResponseCache  # noqa: E402
+from atlas.voice.bridge_file_server import BridgeFileServer  # noqa: E402
+from atlas.voice.bridge_transport import FileTransport  # noqa: E402
+from atlas.voice.intent_dispatcher import _make_decision  # noqa: E402
+from atlas.voice.session_buffer import SessionBuffer  # noqa: E402
+from atlas.voice.streaming import chunk_path  # noqa: E402
+
+CLOUD_SENTENCE = "The cloud answer starts here."
+LOCAL_ANSWER = "Local answer."
+CACHED_ANSWER = "Once upon a time. The end."
+EMBEDDING = [1.0, 0.0, 0.0]
+
+
+@dataclass
+class _Text:
+    text: str = ""
+    content: str = ""
+
+
+@dataclass
+class _FakeResult:
+    audio: object
+    sample_rate: int = 24000
+
+
+class _FakeSTT:
+    def transcribe(self, audio, sample_rate):
+        return _Text(text="tell me a story")
+
+
+class _FakeTTS:
+    """One float32 sample per character, so chunk lengths identify sentences."""
+
+    def __init__(self):
+        self.spoken = []
+
+    def synthesize(self, text):
+        self.spoken.append(text)
+        return _FakeResult(np.ones(len(text), dtype=np.float32))
+
+
+class _FakeLocalLLM:
+    def generate(self, **kwargs):
+        return _Text(content=LOCAL_ANSWER)
+
+
+class _FailingRouter:
+    """Streams one sentence, waits until it is synthesized, then fails."""
+
+    response_cache = None
+
+    def __init__(self, tts: _FakeTTS):
+        self.tts = tts
+
+    def classify(self, text):
+        return _make_decision("HAIKU", confidence=0.9)
+
+    def lookup_cached(self, text):
+        return None
+
+    def cached_entry(self, text):
+        return None
+
+    async def route_and_stream(self, query, **kwargs):
+        yield CLOUD_SENTENCE + " "
+        yield "And then"
+        while CLOUD_SENTENCE not in self.tts.spoken:
+            await asyncio.sleep(0.01)
+        raise ConnectionError("stream dropped")
+
+
+class _CachingRouter:
+    """Streams CACHED_ANSWER and caches it, like the router does for Haiku answers."""
+
+    def __init__(self):
+        self.response_cache = ResponseCache()
+        self.streamed = 0
+
+    def classify(self, text):
+        return _make_decision("HAIKU", confidence=0.9)
+
+    def lookup_cached(self, text):
+        return self.response_cache.lookup(text, EMBEDDING)
+
+    def cached_entry(self, text):
+        return self.response_cache.entry_for(text)
+
+    async def route_and_stream(self, query, cache_key=None, **kwargs):
+        self.streamed += 1
+        for token in CACHED_ANSWER.split(" "):
+            yield token + " "
+        if cache_key is not None:
+            self.response_cache.store(cache_key, EMBEDDING, CACHED_ANSWER, tier="haiku", llm_ms=800)
+
+
+class _NoIntents:
+    async def dispatch(self, text):
+        return None
+
+
+@pytest.fixture
+def server(tmp_path):
+    # Just the state a PROCESS_STREAM turn touches, not the loaded models
+    server = object.__new__(BridgeFileServer)
+    server.transport = FileTransport(tmp_path, audio_wait_s=0)
+    server.transport.setup()
+    server.stt = _FakeSTT()
+    server.tts = _FakeTTS()
+    server.current_voice = "bf_emma"
+    server._refresh_voice_preference = lambda: None
+    server.router = _FailingRouter(server.tts)
+    server.intent_dispatcher = _NoIntents()
+    server.llm = _FakeLocalLLM()
+    server.session_buffer = SessionBuffer(db_path=str(tmp_path / "atlas.db"))
+    server._write_session_status = lambda **status: None
+    yield server
+    server.session_buffer.close()
+
+
+class TestStreamFallback:
+    """Streamed turn whose cloud LLM stream fails part-way."""
+
+    def test_local_answer_replaces_spoken_cloud_sentence(self, server, tmp_path):
+        asyncio.run(server._process_turn(np.zeros(16000, dtype=np.float32), stream=True))
+
+        # The cloud sentence was synthesized before the failure...
+        assert server.tts.spoken == [CLOUD_SENTENCE, LOCAL_ANSWER]
+        # ...but its unplayed chunk was emptied, and the local answer follows it
+        chunks = [np.fromfile(chunk_path(tmp_path, n), dtype=np.float32) for n in range(3)]
+        assert [len(chunk) for chunk in chunks[:2]] == [0, len(LOCAL_ANSWER)]
+        assert not chunks[2].any()  # Silence tail
+        assert not chunk_path(tmp_path, 3).exists()
+        assert [ex.atlas_response for ex in server.session_buffer.get_context()] == [LOCAL_ANSWER]
+        assert (tmp_path / "status.txt").read_text() == "DONE"
+
+
+class TestStreamCache:
+    """Cached answers in PROCESS_STREAM turns."""
+
+    def test_hit_replays_cached_audio_as_chunk(self, server, tmp_path):
+        server.router = _CachingRouter()
+        silence = np.zeros(16000, dtype=np.float32)
+
+        asyncio.run(server._process_turn(silence, stream=True))
+        entry = server.router.cached_entry("tell me a story")
+        audio, sample_rate, _ = entry.audio_for("bf_emma")
+        assert len(audio) == len(CACHED_ANSWER) - 1  # two sentences, space dropped
+
+        for chunk in tmp_path.glob("audio_out_*.raw"):
+            chunk.unlink()  # played by the client
+        server.tts.spoken.clear()
+        asyncio.run(server._process_turn(silence, stream=True))
+
+        assert server.router.streamed == 1
+        assert server.tts.spoken == []
+        assert np.array_equal(np.fromfile(chunk_path(tmp_path, 0), dtype=np.float32), audio)
+        tail = np.fromfile(chunk_path(tmp_path, 1), dtype=np.float32)
+        assert len(tail) == int(0.2 * sample_rate) and not tail.any()
+        assert not chunk_path(tmp_path, 2).exists()
+        assert not (tmp_path / "audio_out.raw").exists()
+        assert (tmp_path / "status.txt").read_text() == "DONE"
+
+    def test_answer_with_session_context_not_cached(self, server, tmp_path):
+        server.router = _CachingRouter()
+        server.session_buffer.add_exchange("who was Ada Lovelace", "A mathematician.")
+
+        asyncio.run(server._process_turn(np.zeros(16000, dtype=np.float32), stream=True))
+
+        assert server.router.streamed == 1
+        assert server.router.cached_entry("tell me a story") is None
+        assert (tmp_path / "status.txt").read_text() == "DONE"
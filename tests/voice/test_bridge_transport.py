@@ -0,0 +1,235 @@
+"""
+Tests for the bridge transports (file protocol and local socket).
+
+Tests:
+- Frame encoding round-trip (commands, audio)
+- Socket transport: commands, audio in, status/audio/session-status pushes
+- Session deltas only go to clients that have a whole document
+- Audio reset drops streamed frames the client has not played
+- Socket transport falls back to files with no client connected
+- Loopback harness: PING/PONG and PROCESS round-trip latency for both transports
+
+The harness is opt-in; run it with output to see the latency comparison:
+    pytest tests/voice/test_bridge_transport.py -m benchmark -s
+"""
+
+import json
+import statistics
+import time
+from threading import Event, Thread
+
+import pytest
+
+# atlas.voice imports the full voice stack
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.voice.bridge_transport import (  # noqa: E402
+    FileTransport,
+    SocketBridgeClient,
+    SocketTransport,
+    decode_audio,
+    encode_audio,
+)
+
+ROUNDS = 20
+
+
+@pytest.fixture
+def socket_transport(tmp_path):
+    transport = SocketTransport(FileTransport(tmp_path), host="127.0.0.1", port=0)
+    transport.setup()
+    yield transport
+    transport.close()
+
+
+def _connect(transport) -> SocketBridgeClient:
+    host, port = transport.address
+    client = SocketBridgeClient(host, port)
+    assert client.connect()
+    deadline = time.monotonic() + 2
+    while not transport.connected and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert transport.connected
+    return client
+
+
+class TestFraming:
+    """Test frame payload helpers."""
+
+    def test_audio_round_trip(self):
+        audio = np.linspace(-1, 1, 100, dtype=np.float32)
+        decoded, rate = decode_audio(encode_audio(audio, 24000))
+        assert rate == 24000
+        assert np.array_equal(decoded, audio)
+
+
+class TestSocketTransport:
+    """Test socket transport behaviour."""
+
+    def test_command_and_audio_from_client(self, socket_transport):
+        client = _connect(socket_transport)
+        client.send_audio(np.ones(16, dtype=np.float32), 16000)
+        client.send_command("PROCESS_STREAM")
+
+        assert socket_transport.wait_command(timeout=2) == "PROCESS_STREAM"
+        assert len(socket_transport.read_audio()) == 16
+        client.close()
+
+    def test_pushes_reach_client(self, socket_transport, tmp_path):
+        client = _connect(socket_transport)
+        socket_transport.publish_session_status({"timer": {"active": True}}, persist=False)
+        socket_transport.write_audio(np.zeros(8, dtype=np.float32), 24000)
+        socket_transport.write_status("DONE")
+
+        assert client.wait_status("DONE", timeout=2)
+        audio, rate = client.audio.get(timeout=2)
+        assert (len(audio), rate) == (8, 24000)
+        assert client.session_status == {"timer": {"active": True}}
+        # persist=False skips the file while a client is connected
+        assert not (tmp_path / "session_status.json").exists()
+        client.close()
+
+    def test_session_delta(self, socket_transport, tmp_path):
+        client = _connect(socket_transport)
+        delta = {"merge": {"timer": {"remaining_seconds": 29}}}
+        assert not socket_transport.publish_session_delta(delta)  # New client: document first
+
+        socket_transport.publish_session_status({"gpu": "CUDA", "timer": {"active": True}}, persist=False)
+        assert socket_transport.publish_session_delta(delta)
+        socket_transport.write_status("DONE")
+
+        assert client.wait_status("DONE", timeout=2)
+        assert client.session_status == {"gpu": "CUDA", "timer": {"active": True, "remaining_seconds": 29}}
+        assert not (tmp_path / "session_status.json").exists()
+        client.close()
+
+    def test_streamed_chunks_use_frames(self, socket_transport, tmp_path):
+        client = _connect(socket_transport)
+        writer = socket_transport.audio_writer()
+        writer.write(np.ones(4, dtype=np.float32), 24000)
+        writer.write_silence(0.001)
+
+        assert len(client.audio.get(timeout=2)[0]) == 4
+        assert len(client.audio.get(timeout=2)[0]) == 24
+        assert not list(tmp_path.glob("audio_out_*.raw"))
+        client.close()
+
+    def test_discard_drops_unplayed_frames(self, socket_transport):
+        client = _connect(socket_transport)
+        writer = socket_transport.audio_writer()
+        writer.write(np.ones(4, dtype=np.float32), 24000)  # Abandoned answer
+        writer.discard()
+        writer.write(np.ones(8, dtype=np.float32), 24000)  # Fallback
+        socket_transport.write_status("DONE")
+
+        # Frames are handled in order, so DONE means the reset was applied
+        assert client.wait_status("DONE", timeout=2)
+        assert len(client.audio.get(timeout=2)[0]) == 8
+        assert client.audio.empty()
+        client.close()
+
+    def test_file_fallback_without_client(self, socket_transport, tmp_path):
+        (tmp_path / "command.txt").write_text("PING")
+        assert socket_transport.wait_command(timeout=0.01) == "PING"
+
+        socket_transport.write_status("PONG")
+        socket_transport.publish_session_status({"session_cost": 0.1}, persist=False)
+        assert (tmp_path / "status.txt").read_text() == "PONG"
+        assert json.loads((tmp_path / "session_status.json").read_text())["session_cost"] == 0.1
+
+
+# =============================================================================
+# Loopback harness
+# =============================================================================
+
+def _serve(transport, stop: Event):
+    """Minimal bridge loop: PONG for PING, echo audio for PROCESS."""
+    while not stop.is_set():
+        cmd = transport.wait_command(timeout=0.1)
+        if cmd == "PING":
+            transport.write_status("PONG")
+        elif cmd == "PROCESS":
+            audio = transport.read_audio()
+            transport.write_audio(audio, 16000)
+            transport.write_status("DONE")
+
+
+def _file_round_trip(bridge_dir, cmd: str, expected: str, audio=None, poll_s: float = 0.1) -> float:
+    """One request/response as the launcher does it (100ms status polling)."""
+    status_file = bridge_dir / "status.txt"
+    status_file.unlink(missing_ok=True)
+    start = time.perf_counter()
+    if audio is not None:
+        audio.tofile(bridge_dir / "audio_in.raw")
+    (bridge_dir / "command.txt").write_text(cmd)
+    while not (status_file.exists() and status_file.read_text() == expected):
+        time.sleep(poll_s)
+    if audio is not None:
+        np.fromfile(bridge_dir / "audio_out.raw", dtype=np.float32)
+    return (time.perf_counter() - start) * 1000
+
+
+def _socket_round_trip(client, cmd: str, expected: str, audio=None) -> float:
+    start = time.perf_counter()
+    if audio is not None:
+        client.send_audio(audio, 16000)
+    client.send_command(cmd)
+    assert client.wait_status(expected, timeout=5)
+    if audio is not None:
+        client.audio.get(timeout=5)
+    return (time.perf_counter() - start) * 1000
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    return f"p50={statistics.median(ordered):6.1f}ms p95={p95:6.1f}ms"
+
+
+@pytest.mark.benchmark
+class TestLoopbackLatency:
+    """Round-trip latency for both transports over the same server loop."""
+
+    def test_loopback_round_trip(self, tmp_path):
+        audio = np.zeros(16000, dtype=np.float32)  # 1s utterance
+        results = {}
+
+        # File protocol
+        file_dir = tmp_path / "file"
+        file_dir.mkdir()
+        file_transport = FileTransport(file_dir)
+        stop = Event()
+        server = Thread(target=_serve, args=(file_transport, stop), daemon=True)
+        server.start()
+        results["file"] = {
+            "ping": [_file_round_trip(file_dir, "PING", "PONG") for _ in range(ROUNDS)],
+            "process": [_file_round_trip(file_dir, "PROCESS", "DONE", audio) for _ in range(ROUNDS)],
+        }
+        stop.set()
+        server.join()
+
+        # Socket
+        sock_dir = tmp_path / "socket"
+        sock_dir.mkdir()
+        socket_transport = SocketTransport(FileTransport(sock_dir), host="127.0.0.1", port=0)
+        socket_transport.setup()
+        client = _connect(socket_transport)
+        stop = Event()
+        server = Thread(target=_serve, args=(socket_transport, stop), daemon=True)
+        server.start()
+        results["socket"] = {
+            "ping": [_socket_round_trip(client, "PING", "PONG") for _ in range(ROUNDS)],
+            "process": [_socket_round_trip(client, "PROCESS", "DONE", audio) for _ in range(ROUNDS)],
+        }
+        stop.set()
+        server.join()
+        client.close()
+        socket_transport.close()
+
+        for kind, ops in results.items():
+            for op, samples in ops.items():
+                print(f"\n  [{kind:6s} {op:7s}] {_summary(samples)}")
+
+        assert statistics.median(results["socket"]["ping"]) < statistics.median(results["file"]["ping"])
+        assert statistics.median(results["socket"]["process"]) < statistics.median(results["file"]["process"])
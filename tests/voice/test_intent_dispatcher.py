@@ -0,0 +1,139 @@
+"""
+Tests for IntentDispatcher.
+
+Tests:
+- Priority table guards skip groups that cannot match
+- State guards (active session, pending reset) still take precedence
+- Per-predicate match timings
+- Handlers awaited on one loop, traced as spans
+"""
+
+import asyncio
+
+import pytest
+
+# atlas.voice imports the full voice stack (and the LLM router)
+pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk"):
+    pytest.importorskip(_module)
+
+from atlas.aio import LoopThread  # noqa: E402
+from atlas.voice.bridge_file_server import BridgeFileServer  # noqa: E402
+from atlas.voice.intent_dispatcher import IntentDispatcher  # noqa: E402
+from atlas.voice.state_models import AssessmentState, RoutineState, WorkoutState  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    # Just the state the dispatcher reads, not the loaded models
+    server = object.__new__(BridgeFileServer)
+    server.workout = WorkoutState()
+    server.routine = RoutineState()
+    server.assessment = AssessmentState()
+    server._pending_workout = None
+    server._phase_reset_pending = False
+    server._phase_reset_time = None
+    server._is_reflection_active = lambda: False
+    return server
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = LoopThread("test-dispatch")
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def dispatch(loop):
+    def run(dispatcher, text):
+        return loop.run(dispatcher.dispatch(text))
+    return run
+
+
+def _reply(text):
+    async def handler(*args, **kwargs):
+        return text
+    return handler
+
+
+class TestPriorityTable:
+    """Test group selection."""
+
+    def test_fall_through(self, server, dispatch):
+        dispatcher = IntentDispatcher(server)
+        assert dispatch(dispatcher, "tell me something about the roman empire") is None
+
+    def test_guarded_groups_are_skipped(self, server, dispatch):
+        called = []
+
+        def is_capture_intent(text):
+            called.append(text)
+            return False
+
+        is_capture_intent.__name__ = "_is_capture_intent"
+        server._is_capture_intent = is_capture_intent
+        dispatcher = IntentDispatcher(server)
+
+        dispatch(dispatcher, "what do you think about rome")
+        assert called == []  # no capture label, group skipped
+        dispatch(dispatcher, "remember the milk")
+        assert called == ["remember the milk"]
+
+    def test_start_group(self, server, dispatch):
+        server._handle_schedule_status = _reply("Week 2, Day 3.")
+        result = dispatch(IntentDispatcher(server), "schedule status")
+        assert result.response_text == "Week 2, Day 3."
+        assert result.tier_override == "SCHEDULE"
+
+    def test_pending_reset_takes_precedence(self, server, dispatch):
+        server._phase_reset_pending = True
+        server._handle_phase_cancel = _reply("Reset cancelled.")
+        result = dispatch(IntentDispatcher(server), "schedule status")
+        assert result.action_type == "phase_confirm"
+        assert result.response_text == "Say confirm to reset to Day 1, or cancel to keep current progress."
+
+
+class TestMatchTimings:
+    """Test per-predicate timing."""
+
+    def test_timings_accumulate_across_turns(self, server, dispatch):
+        dispatcher = IntentDispatcher(server)
+        dispatch(dispatcher, "how is the weather in rome")
+        dispatch(dispatcher, "what about paris")
+
+        timings = dispatcher.match_timings()
+        assert timings["_intent_labels"].calls == 2
+        assert timings["_is_health_intent"].calls == 2
+        assert "_is_meal_intent" not in timings  # meal group was skipped
+        totals = [t.total_ms for t in timings.values()]
+        assert totals == sorted(totals, reverse=True)
+        assert "_intent_labels" in dispatcher.format_timings(limit=50)
+
+        dispatcher.reset_timings()
+        assert dispatcher.match_timings() == {}
+
+
+class TestEventLoop:
+    """Test handlers running on the shared loop."""
+
+    def test_handlers_share_one_loop(self, server, loop):
+        loops = []
+
+        async def schedule_status(*args):
+            loops.append(asyncio.get_running_loop())
+            return "Week 2, Day 3."
+
+        server._handle_schedule_status = schedule_status
+        dispatcher = IntentDispatcher(server)
+        for _ in range(3):
+            loop.run(dispatcher.dispatch("schedule status"))
+        assert loops == [loop.loop] * 3
+
+    def test_handler_is_a_span(self, server, loop):
+        server._handle_schedule_status = _reply("Week 2, Day 3.")
+        server._handle_schedule_status.__name__ = "_handle_schedule_status"
+        with loop.turn("PROCESS") as trace:
+            loop.run(IntentDispatcher(server).dispatch("schedule status"))
+        assert [s.name for s in trace.spans] == ["_handle_schedule_status"]
@@ -0,0 +1,75 @@
+"""
+Tests for the bridge's combined intent matcher.
+
+Tests:
+- Every label agrees with per-pattern matching over the utterance corpus
+- Router reflex labels are part of the same matcher
+- Predicates read the shared labels (exclusions, negations, ordering)
+"""
+
+import pytest
+
+# atlas.voice imports the full voice stack (and the LLM router)
+pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+for _module in ("anthropic", "httpx", "tenacity", "pybreaker", "claude_agent_sdk"):
+    pytest.importorskip(_module)
+
+from atlas.voice.bridge_file_server import (  # noqa: E402
+    BridgeFileServer,
+    build_intent_matcher,
+)
+from tests.fixtures.utterances import expected_labels, load_utterances  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return build_intent_matcher()
+
+
+@pytest.fixture
+def server():
+    # Predicates only need the shared matcher, not the loaded models
+    return object.__new__(BridgeFileServer)
+
+
+class TestIntentMatcher:
+    """Test the combined matcher against the checks it replaced."""
+
+    def test_corpus_matches_reference(self, matcher):
+        for text in load_utterances():
+            assert matcher.match(text) == expected_labels(matcher, text), text
+
+    def test_includes_router_reflexes(self, matcher):
+        labels = matcher.match("Stop timer")
+        assert "local" in labels
+        assert "routine_pause" in labels
+        assert "safety" in matcher.match("question about my medication dosage")
+
+
+class TestPredicates:
+    """Test the _is_* predicates on top of the shared labels."""
+
+    def test_workout_start(self, server):
+        assert server._is_workout_start_intent("let's begin a strength workout")
+        assert server._is_workout_start_intent("do my daily workout")
+        assert not server._is_workout_start_intent("what's my workout today")
+        assert not server._is_workout_start_intent("begin stretch")
+        assert not server._is_workout_start_intent("finished my workout")
+
+    def test_stop_negation(self, server):
+        assert server._is_workout_stop_command("stop")
+        assert server._is_workout_stop_command("stop workout")
+        assert not server._is_workout_stop_command("don't stop")
+        assert not server._is_routine_stop_command("please don't stop the routine")
+
+    def test_traffic_override_order(self, server):
+        assert server._detect_traffic_override("force yellow") == "YELLOW"
+        assert server._detect_traffic_override("green light, not a rest day") == "GREEN"
+        assert server._detect_traffic_override("start workout") is None
+
+    def test_assessment(self, server):
+        assert server._is_assessment_info_intent("how long does the baseline assessment take")
+        assert not server._is_assessment_info_intent("start baseline assessment")
+        assert server._get_assessment_command("that's wrong") == "undo"
+        assert server._get_assessment_command("hello") is None
@@ -0,0 +1,85 @@
+"""
+Tests for SessionBuffer.
+
+Tests:
+- Context served from memory, bounded and TTL-filtered
+- Background persistence and rehydration on startup
+- clear() empties memory and the table
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+# atlas.voice imports the full voice stack
+pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas import db  # noqa: E402
+from atlas.voice.session_buffer import SessionBuffer  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    yield str(tmp_path / "atlas.db")
+    db.close_all()
+
+
+def _persisted(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT user_text FROM session_buffer ORDER BY timestamp")]
+    finally:
+        conn.close()
+
+
+class TestSessionBuffer:
+    """Test the in-memory buffer with write-behind persistence."""
+
+    def test_context_is_bounded_and_chronological(self, db_path):
+        buffer = SessionBuffer(db_path)
+        for i in range(7):
+            buffer.add_exchange(f"q{i}", f"a{i}")
+        assert [ex.user_text for ex in buffer.get_context()] == ["q2", "q3", "q4", "q5", "q6"]
+        assert [ex.user_text for ex in buffer.get_context(max_exchanges=2)] == ["q5", "q6"]
+        assert buffer.last_topic() == "query"
+        buffer.close()
+
+    def test_stale_exchanges_are_skipped(self, db_path):
+        buffer = SessionBuffer(db_path)
+        buffer.add_exchange("old", "a")
+        buffer._exchanges[0].timestamp = time.time() - 3600
+        buffer.add_exchange("new", "b")
+        assert buffer.format_for_llm() == "Recent conversation:\nUser: new\nAtlas: b"
+        buffer.close()
+
+    def test_context_does_not_touch_sqlite(self, db_path, monkeypatch):
+        buffer = SessionBuffer(db_path)
+        buffer.add_exchange("q", "a")
+        buffer.flush()
+        monkeypatch.setattr("atlas.voice.session_buffer.get_connection", None)
+        assert buffer.format_for_llm()
+        buffer.close()
+
+    def test_persists_and_rehydrates(self, db_path):
+        buffer = SessionBuffer(db_path)
+        for i in range(6):
+            buffer.add_exchange(f"q{i}", f"a{i}", "health")
+        buffer.flush()
+        assert _persisted(db_path) == ["q1", "q2", "q3", "q4", "q5"]
+        buffer.close()
+
+        restarted = SessionBuffer(db_path)
+        assert [ex.user_text for ex in restarted.get_context()] == ["q1", "q2", "q3", "q4", "q5"]
+        assert restarted.last_topic() == "health"
+        restarted.close()
+
+    def test_clear(self, db_path):
+        buffer = SessionBuffer(db_path)
+        buffer.add_exchange("q", "a")
+        buffer.clear()
+        assert buffer.get_context() == []
+        buffer.flush()
+        assert _persisted(db_path) == []
+        buffer.close()
@@ -0,0 +1,137 @@
+"""
+Tests for session status publishing.
+
+Tests:
+- A simulated timer minute publishes ~once a second, not every tick
+- Socket deltas carry only changed fields and rebuild the document
+- Mode changes and clears replace the timer block
+"""
+
+import time
+
+import pytest
+
+# atlas.voice imports the full voice stack
+pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.voice.bridge_transport import apply_session_delta  # noqa: E402
+from atlas.voice.session_status import SessionStatusPublisher, timer_delta  # noqa: E402
+from atlas.voice.timer_builders import TimerContext, get_timer_status  # noqa: E402
+
+TICK_S = 0.1  # _check_and_play_timers interval
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Recorder:
+    """Transport stand-in: counts documents and deltas."""
+
+    def __init__(self, deltas: bool):
+        self.accept_deltas = deltas
+        self.documents = []
+        self.deltas = []
+
+    def publish(self, status, persist):
+        self.documents.append(status)
+
+    def publish_delta(self, delta):
+        if self.accept_deltas:
+            self.deltas.append(delta)
+        return self.accept_deltas
+
+
+def routine_ctx(elapsed: float, exercise: str = "Calf Stretch", duration: int = 60) -> TimerContext:
+    return TimerContext(
+        routine_active=True,
+        routine_timer_active=True,
+        routine_timer_start=time.monotonic() - elapsed,
+        routine_timer_duration=duration,
+        routine_current_exercise={"id": exercise.lower().replace(" ", "_"), "name": exercise},
+        routine_current_section="Feet",
+        count_routine_exercises=lambda: 8,
+        get_routine_exercise_number=lambda: 3,
+    )
+
+
+def simulate(publisher, seconds: float, exercise_s: int = 60):
+    """Tick every 100ms through back-to-back routine exercises."""
+    for tick in range(int(seconds / TICK_S)):
+        t = tick * TICK_S
+        publisher._clock.now = t
+        n, elapsed = divmod(t, exercise_s)
+        publisher.update_timer(get_timer_status(routine_ctx(elapsed, f"Exercise {int(n)}", exercise_s)))
+
+
+@pytest.fixture
+def publisher_for():
+    def make(deltas: bool):
+        recorder = Recorder(deltas)
+        publisher = SessionStatusPublisher(recorder.publish, recorder.publish_delta, clock=FakeClock())
+        return publisher, recorder
+    return make
+
+
+class TestRate:
+    """Test writes per simulated minute."""
+
+    def test_file_writes_per_minute(self, publisher_for):
+        publisher, recorder = publisher_for(deltas=False)
+        publisher.publish({"session_cost": 0.25})
+        simulate(publisher, 180)
+
+        ticks = int(180 / TICK_S)
+        writes_per_minute = (len(recorder.documents) - 1) / 3
+        assert writes_per_minute <= 62  # Was one write per tick (600 a minute)
+        assert writes_per_minute >= 58  # Countdown still updates every second
+        assert publisher.skipped >= ticks * 0.85
+        # Written from memory: the exchange fields survive every tick
+        assert all(doc["session_cost"] == 0.25 for doc in recorder.documents)
+
+    def test_throttled_field_alone(self, publisher_for):
+        publisher, recorder = publisher_for(deltas=True)
+        timer = {"active": True, "remaining_seconds": 30, "progress_pct": 50.0}
+        publisher.update_timer(timer)
+        publisher._clock.now = 0.2
+        assert not publisher.update_timer({**timer, "progress_pct": 50.3})
+        assert publisher.update_timer({**timer, "progress_pct": 50.3}, force=True)
+        publisher._clock.now = 1.5
+        assert publisher.update_timer({**timer, "progress_pct": 52.0})
+
+
+class TestDeltas:
+    """Test delta contents."""
+
+    def test_deltas_rebuild_document(self, publisher_for):
+        publisher, recorder = publisher_for(deltas=True)
+        publisher.publish({"session_cost": 0.25, "gpu": "CUDA"})
+        client = dict(recorder.documents[-1])
+        simulate(publisher, 75)
+
+        assert len(recorder.documents) == 1
+        for delta in recorder.deltas:
+            apply_session_delta(client, delta)
+        assert client == publisher.document
+
+        ticks = [d["merge"]["timer"] for d in recorder.deltas if "merge" in d]
+        assert {"remaining_seconds", "elapsed_seconds"} <= ticks[5].keys()
+        # Unchanged fields are only sent when they change (next exercise at 60s)
+        assert sum("exercise_name" in fields for fields in ticks) == 1
+        assert client["timer"]["exercise_name"] == "Exercise 1"
+
+    def test_mode_change_and_clear(self, publisher_for):
+        publisher, recorder = publisher_for(deltas=True)
+        publisher.update_timer({"active": True, "mode": "routine", "remaining_seconds": 3})
+        publisher.update_timer({"active": True, "mode": "workout_pending", "pending_ready": True})
+        assert recorder.deltas[-1] == {"set": {"timer": publisher.document["timer"]}}
+
+        publisher.clear_timer()
+        assert "timer" not in publisher.document
+        assert recorder.documents[-1] == {}
+        assert timer_delta(None, None) is None
@@ -0,0 +1,182 @@
+"""
+Tests for sentence-level streaming in the file bridge.
+
+Tests:
+- Sentence segmentation over a token stream
+- Chunk file protocol (atomic numbered chunks, metadata, silence tail)
+- StreamingSpeaker ordering and first-audio timing
+- StreamingSpeaker cancel (LLM fallback mid-stream, after the client played some chunks)
+"""
+
+from dataclasses import dataclass
+from threading import Event
+
+import pytest
+
+# atlas.voice imports the full voice stack
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.voice.streaming import (  # noqa: E402
+    ChunkedAudioWriter,
+    SentenceSegmenter,
+    StreamingSpeaker,
+    chunk_path,
+    split_sentences,
+)
+
+
+class TestSentenceSegmenter:
+    """Test incremental sentence splitting."""
+
+    def test_emits_sentence_when_boundary_arrives(self):
+        seg = SentenceSegmenter()
+        assert seg.feed("Good morning") == []
+        assert seg.feed(", sir.") == []  # no trailing whitespace yet
+        assert seg.feed(" Ready") == ["Good morning, sir."]
+        assert seg.flush() == "Ready"
+
+    def test_decimal_not_split(self):
+        seg = SentenceSegmenter()
+        assert seg.feed("Use 32.5kg today. ") == ["Use 32.5kg today."]
+
+    def test_short_sentences_merged(self):
+        seg = SentenceSegmenter(min_chars=8)
+        assert seg.feed("Yes. Rest ninety seconds. ") == ["Yes. Rest ninety seconds."]
+
+    def test_reset_drops_buffer(self):
+        seg = SentenceSegmenter()
+        seg.feed("Half a sent")
+        seg.reset()
+        assert seg.flush() == ""
+
+    def test_split_sentences(self):
+        assert split_sentences("Done. Next is squats! Go") == ["Done.", "Next is squats!", "Go"]
+
+
+class TestChunkedAudioWriter:
+    """Test the chunk file protocol."""
+
+    def test_writes_numbered_chunks_and_metadata(self, tmp_path):
+        meta = tmp_path / "metadata.txt"
+        writer = ChunkedAudioWriter(tmp_path, meta)
+        writer.write(np.ones(10, dtype=np.float32), 24000)
+        writer.write(np.ones(5, dtype=np.float32), 24000)
+
+        assert meta.read_text() == "sample_rate=24000"
+        assert len(np.fromfile(chunk_path(tmp_path, 0), dtype=np.float32)) == 10
+        assert len(np.fromfile(chunk_path(tmp_path, 1), dtype=np.float32)) == 5
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_silence_tail(self, tmp_path):
+        writer = ChunkedAudioWriter(tmp_path, tmp_path / "metadata.txt")
+        assert writer.write_silence(0.2) is None  # nothing to pad yet
+        writer.write(np.ones(10, dtype=np.float32), 1000)
+        tail = np.fromfile(writer.write_silence(0.2), dtype=np.float32)
+        assert len(tail) == 200
+        assert not tail.any()
+
+    def test_discard_empties_unplayed_chunks(self, tmp_path):
+        writer = ChunkedAudioWriter(tmp_path, tmp_path / "metadata.txt")
+        for _ in range(3):
+            writer.write(np.ones(10, dtype=np.float32), 24000)
+        chunk_path(tmp_path, 0).unlink()  # Played by the client
+        writer.discard()
+
+        assert not chunk_path(tmp_path, 0).exists()
+        assert chunk_path(tmp_path, 1).stat().st_size == 0
+        assert chunk_path(tmp_path, 2).stat().st_size == 0
+        assert writer.write(np.ones(5, dtype=np.float32), 24000) == chunk_path(tmp_path, 3)
+
+    def test_clear_removes_stale_chunks(self, tmp_path):
+        chunk_path(tmp_path, 0).write_bytes(b"\x00" * 8)
+        writer = ChunkedAudioWriter(tmp_path, tmp_path / "metadata.txt")
+        writer.clear()
+        assert not chunk_path(tmp_path, 0).exists()
+
+
+@dataclass
+class _FakeResult:
+    audio: object
+    sample_rate: int = 24000
+
+
+class _FakeTTS:
+    def __init__(self):
+        self.spoken = []
+
+    def synthesize(self, text):
+        self.spoken.append(text)
+        return _FakeResult(np.full(len(text), len(self.spoken), dtype=np.float32))
+
+
+class TestStreamingSpeaker:
+    """Test the background TTS worker."""
+
+    def test_chunks_follow_sentence_order(self, tmp_path):
+        tts = _FakeTTS()
+        speaker = StreamingSpeaker(tts, ChunkedAudioWriter(tmp_path, tmp_path / "metadata.txt"))
+        speaker.start()
+        speaker.say("First sentence.")
+        speaker.say("")
+        speaker.say("Second one.")
+        stats = speaker.finish()
+
+        assert tts.spoken == ["First sentence.", "Second one."]
+        assert stats.sentences == 2
+        assert stats.chunks == 3  # two sentences + silence tail
+        assert stats.first_audio_at is not None
+        assert np.fromfile(chunk_path(tmp_path, 1), dtype=np.float32)[0] == 2.0
+
+    def test_cancel_after_client_played_chunks(self, tmp_path):
+        tts = _FakeTTS()
+        synthesizing, release = Event(), Event()
+        synthesize = tts.synthesize
+
+        def slow_synthesize(text):
+            if text == "Cloud sentence three.":
+                synthesizing.set()
+                release.wait(5)
+            return synthesize(text)
+
+        tts.synthesize = slow_synthesize
+        client = _ChunkClient(tmp_path)
+        speaker = StreamingSpeaker(tts, ChunkedAudioWriter(tmp_path, tmp_path / "metadata.txt"))
+        speaker.start()
+        for n in ("one", "two", "three"):
+            speaker.say(f"Cloud sentence {n}.")
+        assert synthesizing.wait(5)  # Chunks 000 and 001 are written
+        client.play(limit=1)  # ...and the client has played 000
+        speaker.cancel()
+        release.set()
+        speaker.say("Local answer.")
+        stats = speaker.finish()
+        client.play()
+
+        # Unplayed cloud audio (001, and the in-flight 002) is skipped
+        assert client.played == [len("Cloud sentence one."), len("Local answer."), 4800]
+        assert tts.spoken[-1] == "Local answer."
+        assert stats.sentences == 1
+        assert not list(tmp_path.glob("audio_out_*.raw"))
+
+
+class _ChunkClient:
+    """Plays chunks the way the Windows clients do (in order, delete after, skip empty)."""
+
+    def __init__(self, bridge_dir):
+        self.bridge_dir = bridge_dir
+        self.index = 0
+        self.played = []  # Sample counts of non-empty chunks
+
+    def play(self, limit=None):
+        while limit is None or limit > 0:
+            path = chunk_path(self.bridge_dir, self.index)
+            if not path.exists():
+                return
+            audio = np.fromfile(path, dtype=np.float32)
+            path.unlink()
+            self.index += 1
+            if len(audio):
+                self.played.append(len(audio))
+                if limit is not None:
+                    limit -= 1
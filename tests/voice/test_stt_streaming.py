@@ -0,0 +1,97 @@
+"""
+Tests for streaming transcription.
+
+Tests:
+- Overlapping windows commit each word once; finish() returns the utterance
+- Partials arrive while speaking; only the tail is left at end-of-speech
+- Windows advance when no word ends before the overlap
+"""
+
+import time
+
+import pytest
+
+# atlas.voice imports the full voice stack
+np = pytest.importorskip("numpy")
+pytest.importorskip("sounddevice")
+
+from atlas.voice.stt import StreamingTranscriber, Word  # noqa: E402
+
+RATE = StreamingTranscriber.SAMPLE_RATE
+CHUNK = 1024  # 64ms, the pipeline's VAD chunk
+
+
+class FakeWhisper:
+    """Each run of samples equal to k > 0 transcribes as the word "wk"."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe_words(self, audio):
+        self.calls.append(len(audio))
+        words, start = [], None
+        for i in range(len(audio) + 1):
+            value = audio[i] if i < len(audio) else 0
+            if start is not None and value != audio[start]:
+                words.append(Word(start / RATE, i / RATE, f"w{int(audio[start])}"))
+                start = None
+            if start is None and value > 0:
+                start = i
+        return words
+
+
+def utterance(n_words: int, word_s: float = 0.4, gap_s: float = 0.1) -> np.ndarray:
+    parts = []
+    for k in range(1, n_words + 1):
+        parts.append(np.full(int(word_s * RATE), k, dtype=np.float32))
+        parts.append(np.zeros(int(gap_s * RATE), dtype=np.float32))
+    return np.concatenate(parts)
+
+
+def speak(transcriber, audio):
+    for i in range(0, len(audio), CHUNK):
+        transcriber.feed(audio[i:i + CHUNK])
+        time.sleep(0.001)  # Real time is ~64ms per chunk; the window thread keeps up
+
+
+class TestStreamingTranscriber:
+    """Test windowed transcription."""
+
+    def test_words_committed_once(self):
+        stt = FakeWhisper()
+        partials = []
+        transcriber = StreamingTranscriber(stt, on_partial=partials.append, window_s=2.0, overlap_s=0.5)
+        speak(transcriber, utterance(12))
+
+        result = transcriber.finish(timeout=5)
+        assert result.text == " ".join(f"w{k}" for k in range(1, 13))
+        assert result.audio_duration_s == pytest.approx(6.0, abs=0.01)
+        assert partials and partials[0].startswith("w1")
+        assert transcriber.windows >= 2
+
+        # End-of-speech only transcribes the uncommitted tail (about a window)
+        assert stt.calls[-1] <= int(2.5 * RATE) + CHUNK
+
+    def test_short_utterance(self):
+        stt = FakeWhisper()
+        transcriber = StreamingTranscriber(stt, window_s=3.0, overlap_s=1.0)
+        speak(transcriber, utterance(3))
+        assert transcriber.finish(timeout=5).text == "w1 w2 w3"
+        assert transcriber.windows == 0
+        assert len(stt.calls) == 1
+
+    def test_advances_without_committed_words(self):
+        # One sound that never ends inside a window: nothing can be committed
+        stt = FakeWhisper()
+        transcriber = StreamingTranscriber(stt, window_s=2.0, overlap_s=0.5)
+        speak(transcriber, np.ones(10 * RATE, dtype=np.float32))
+
+        result = transcriber.finish(timeout=5)
+        assert result.text == "w1"
+        assert transcriber._commit_pos > 0
+        assert transcriber.windows <= 8  # About one per 1.5s stable part
+        assert stt.calls[-1] <= int(2.5 * RATE) + CHUNK
+
+    def test_overlap_must_be_shorter(self):
+        with pytest.raises(ValueError):
+            StreamingTranscriber(FakeWhisper(), window_s=1.0, overlap_s=1.0)